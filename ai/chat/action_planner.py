@@ -12,6 +12,7 @@ from ai.prompts.action_catalog import (
     ResponseIntent,
     get_action_catalog,
 )
+from ai.client.admission import AdmissionClass
 from ai.client.lm_studio_client import call_lm_studio_api
 from ai.prompts.command_interpreter import get_command_interpreter
 from core.config import (
@@ -174,6 +175,7 @@ class ActionPlanner:
             temperature=AI_COMMAND_TEMPERATURE,
             timeout=AI_COMMAND_PARSING_TIMEOUT,
             stop=_PLANNING_STOP_SEQUENCES,
+            request_class=AdmissionClass.PARSING,
         )
         if not raw_response or not str(raw_response).strip():
             logger.warning(
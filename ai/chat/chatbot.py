@@ -32,6 +32,7 @@ from core.config import (
     AI_CLARIFICATION_TEMPERATURE,
 )
 from core.response_tracking import store_chat_interaction
+from core.tracing import traced
 from user.context_manager import user_context_manager
 from ai.prompts.manager import (
     MINIMAL_CHAT_SYSTEM_PROMPT,
@@ -43,6 +44,8 @@ from ai.prompts.command_interpreter import get_command_interpreter
 from ai.fallback import get_fallback_responses
 from ai.chat.interaction_types import AIInteractionType, interaction_type_for_mode
 from ai.chat.response_generator import get_response_generator
+from ai.client.admission import AdmissionClass
+from ai.prompts.prefix_tracking import get_prompt_prefix_stats
 from ai.client.lm_studio_client import call_lm_studio_api, test_lm_studio_connection
 from ai.chat.action_boundaries import (
     UNCLEAR_USER_INPUT_REPLY,
@@ -70,6 +73,7 @@ from ai.chat.response_postprocess import (
     trim_verbose_reply_for_simple_prompt,
 )
 from core.error_handling import handle_errors
+from core.resource_monitor import get_resource_monitor
 
 
 ai_logger = get_component_logger("ai")
@@ -182,6 +186,7 @@ class AIChatBotSingleton:
         timeout: int | None = None,
         *,
         stop: list[str] | None = None,
+        request_class: AdmissionClass = AdmissionClass.INTERACTIVE,
     ) -> str | None:
         """Make an API call to LM Studio (delegates to ai.client.lm_studio_client)."""
         return call_lm_studio_api(
@@ -190,6 +195,7 @@ class AIChatBotSingleton:
             temperature=temperature,
             timeout=timeout,
             stop=stop,
+            request_class=request_class,
         )
 
     @handle_errors(
@@ -282,6 +288,16 @@ class AIChatBotSingleton:
                 user_prompt, user_id, mode
             )
 
+        if self._should_shed_load():
+            ai_logger.warning(
+                "AI response using fallback - local model overloaded",
+                user_id=user_id,
+                mode=mode,
+                interaction_type=AIInteractionType.FALLBACK.value,
+                prompt_length=len(user_prompt),
+            )
+            return get_fallback_responses().contextual(user_prompt, user_id)
+
         # Use per-user locks for better concurrency
         lock = self._locks_by_user[user_id or "__anon__"]
         lock_acquired = lock.acquire(blocking=True, timeout=3)
@@ -326,6 +342,7 @@ class AIChatBotSingleton:
                 temperature=temperature,
                 timeout=timeout,
                 stop=stop_sequences,
+                request_class=self._admission_class_for_mode(mode),
             )
 
             if result:
@@ -379,6 +396,18 @@ class AIChatBotSingleton:
             if lock_acquired:
                 lock.release()
 
+    @handle_errors(
+        "mapping response mode to admission class",
+        default_return=AdmissionClass.INTERACTIVE,
+    )
+    def _admission_class_for_mode(self, mode: str) -> AdmissionClass:
+        """Personalized (scheduled) messages queue behind parsing, which queues behind chat."""
+        if mode == "personalized":
+            return AdmissionClass.SCHEDULED
+        if mode.startswith("command"):
+            return AdmissionClass.PARSING
+        return AdmissionClass.INTERACTIVE
+
     @handle_errors("validating response timeout", default_return=False)
     def _is_valid_timeout(self, timeout: int | None) -> bool:
         """Validate timeout input type for response generation."""
@@ -472,6 +501,7 @@ class AIChatBotSingleton:
         "building response generation request",
         default_return=([], AI_MAX_RESPONSE_TOKENS, AI_CHAT_TEMPERATURE),
     )
+    @traced("context_assembly")
     def _build_response_generation_request(
         self, mode: str, user_prompt: str, user_id: str | None
     ) -> tuple[list, int, float]:
@@ -538,6 +568,7 @@ class AIChatBotSingleton:
         return messages, max_tokens, temperature
 
     @handle_errors("post-processing generated response", default_return="")
+    @traced("post_processing")
     def _post_process_generated_response(
         self, mode: str, result: str, user_prompt: str = ""
     ) -> str:
@@ -573,6 +604,7 @@ class AIChatBotSingleton:
         "finalizing contextual response",
         default_return="I'm having trouble generating a contextual response right now. Please try again in a moment.",
     )
+    @traced("post_processing")
     def _finalize_contextual_response(
         self,
         user_prompt: str,
@@ -594,6 +626,7 @@ class AIChatBotSingleton:
         return response
 
     @handle_errors("caching response when needed", default_return=None)
+    @traced("post_processing")
     def _cache_response_if_needed(
         self,
         mode: str,
@@ -609,6 +642,7 @@ class AIChatBotSingleton:
             )
 
     @handle_errors("storing chat mode interaction", default_return=None)
+    @traced("post_processing")
     def _store_chat_mode_interaction(
         self,
         mode: str,
@@ -708,6 +742,7 @@ class AIChatBotSingleton:
             "custom_prompt_loaded": prompt_manager.has_custom_prompt(),
             "prompt_length": prompt_manager.custom_prompt_length(),
             "prompt_file_exists": os.path.exists(AI_SYSTEM_PROMPT_PATH),
+            "prompt_prefix_cache": get_prompt_prefix_stats(),
         }
 
     @handle_errors(
@@ -879,6 +914,17 @@ class AIChatBotSingleton:
                 )
                 return response
 
+        if self._should_shed_load():
+            logger.warning("Local model overloaded, using contextual fallback")
+            fallback_response = get_fallback_responses().contextual(user_prompt, user_id)
+            response = self._finalize_contextual_response(
+                user_prompt, fallback_response, context, profile
+            )
+            self._record_contextual_interaction(
+                user_id, user_prompt, response, context_used=False
+            )
+            return response
+
         # Generate AI response with context
         # Use per-user locks for better concurrency
         lock = self._locks_by_user[user_id or "__anon__"]
@@ -1005,28 +1051,15 @@ class AIChatBotSingleton:
 
     @handle_errors("detecting resource constraints", default_return=False)
     def _detect_resource_constraints(self) -> bool:
-        """Detect if system is resource-constrained."""
-        import psutil
-
-        memory = psutil.virtual_memory()
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-
-        # Consider system constrained if:
-        # - Memory usage > 90%
-        # - Available memory < 2 GB
-        # - CPU usage > 80%
-        is_constrained = (
-            memory.percent > 90
-            or memory.available < (2 * 1024**3)  # 2 GB
-            or cpu_percent > 80
-        )
-
-        if is_constrained:
-            logger.warning(
-                f"System resource constraints detected: Memory {memory.percent}%, CPU {cpu_percent}%, Available RAM {memory.available / (1024**3):.1f}GB"
-            )
-
-        return is_constrained
+        """Detect if system is resource-constrained (reads the background monitor's snapshot)."""
+        monitor = get_resource_monitor()
+        return monitor is not None and monitor.snapshot().constrained
+
+    @handle_errors("checking AI load shedding", default_return=False)
+    def _should_shed_load(self) -> bool:
+        """True when the local model is saturated and the fallback should answer instead."""
+        monitor = get_resource_monitor()
+        return monitor is not None and monitor.should_shed_load()
 
     @handle_errors("cleaning system prompt leaks", default_return="")
     def _clean_system_prompt_leaks(self, response: str) -> str:
@@ -1,5 +1,10 @@
 """LM Studio client, cache, and connection management."""
 
+from ai.client.admission import (
+    AdmissionClass,
+    LLMAdmissionController,
+    get_llm_admission_controller,
+)
 from ai.client.cache_manager import (
     CacheEntry,
     ContextCache,
@@ -16,6 +21,9 @@ from ai.client.lm_studio_manager import (
 )
 
 __all__ = [
+    "AdmissionClass",
+    "LLMAdmissionController",
+    "get_llm_admission_controller",
     "CacheEntry",
     "ContextCache",
     "ResponseCache",
@@ -0,0 +1,227 @@
+# ai/client/admission.py
+
+"""Priority admission control for the local LM Studio server.
+
+LM Studio runs one model on local hardware. When interactive chat, command
+parsing, and a burst of scheduled personalized messages hit it at the same
+moment, they all slow each other down. ``LLMAdmissionController`` caps how many
+calls are in flight (``AI_MAX_CONCURRENT_REQUESTS``) and hands free slots out
+by priority class, then arrival order:
+
+    INTERACTIVE (chat replies) > PARSING (command/action parsing) > SCHEDULED
+
+Every request carries a deadline (its timeout). A request whose expected queue
+wait plus expected service time already exceeds the deadline is rejected
+up front. One that is still queued when only the expected service time is left
+gives up. In both cases the caller gets no ticket and uses its fallback
+response. An admitted request gets the remaining deadline as its HTTP timeout.
+Service time is an exponential moving average of how long slots are held.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+
+logger = get_component_logger("ai")
+
+# Shortest HTTP timeout an admitted call is given
+MIN_CALL_SECONDS = 2.0
+# Weight of the newest hold time in the service-time average
+SERVICE_TIME_SMOOTHING = 0.3
+# Waits kept per class for percentile reporting
+_RECENT_WAITS = 256
+
+_controller_lock = threading.Lock()
+_controller = None
+
+
+class AdmissionClass(IntEnum):
+    """Request priority (lower value is served first)"""
+
+    INTERACTIVE = 0
+    PARSING = 1
+    SCHEDULED = 2
+
+
+@dataclass
+class AdmissionTicket:
+    """A granted slot; pass back to ``release``"""
+
+    request_class: AdmissionClass
+    enqueued_at: float
+    admitted_at: float
+    deadline: float
+
+    @property
+    def waited_seconds(self) -> float:
+        return self.admitted_at - self.enqueued_at
+
+    # ERROR_HANDLING_EXCLUDE: trivial arithmetic on monotonic timestamps.
+    def remaining_seconds(self) -> float:
+        """Time left before the request's deadline (never below ``MIN_CALL_SECONDS``)"""
+        return max(MIN_CALL_SECONDS, self.deadline - time.monotonic())
+
+
+class _ClassStats:
+    """Wait-time counters for one admission class"""
+
+    def __init__(self):
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.recent_waits: deque[float] = deque(maxlen=_RECENT_WAITS)
+
+    def record_wait(self, waited: float) -> None:
+        self.admitted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        self.recent_waits.append(waited)
+
+    def as_dict(self) -> dict:
+        recent = sorted(self.recent_waits)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "avg_wait_seconds": round(self.total_wait / self.admitted, 3) if self.admitted else 0.0,
+            "p95_wait_seconds": round(p95, 3),
+            "max_wait_seconds": round(self.max_wait, 3),
+        }
+
+
+class LLMAdmissionController:
+    """Priority queue in front of the model server with a concurrency cap"""
+
+    def __init__(self, max_concurrent: int = 1):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self._cond = threading.Condition()
+        self._active = 0
+        self._waiting: list[tuple[int, int]] = []
+        self._sequence = itertools.count()
+        self._service_seconds: float | None = None
+        self._stats = {request_class: _ClassStats() for request_class in AdmissionClass}
+
+    def _expected_wait(self, request_class: AdmissionClass) -> float:
+        """Queue wait a new request of this class should expect (caller holds the lock)"""
+        if self._service_seconds is None:
+            return 0.0
+        ahead = sum(1 for priority, _ in self._waiting if priority <= request_class)
+        busy = max(0, self._active - self.max_concurrent + 1)
+        return self._service_seconds * (ahead + busy) / self.max_concurrent
+
+    @handle_errors("acquiring LLM admission", default_return=None)
+    def acquire(
+        self, request_class: AdmissionClass, deadline_seconds: float
+    ) -> AdmissionTicket | None:
+        """
+        Wait for a slot, served by priority then arrival.
+
+        Args:
+            request_class: Priority class of the request
+            deadline_seconds: Total time the caller can spend (queue + call)
+
+        Returns:
+            Ticket when admitted; None when the deadline cannot be met
+        """
+        enqueued_at = time.monotonic()
+        deadline = enqueued_at + max(0.0, float(deadline_seconds))
+        stats = self._stats[request_class]
+        with self._cond:
+            service = self._service_seconds or 0.0
+            # A free slot with nobody queued always admits: the estimate only moves
+            # on release, so one slow call would otherwise lock a class out for good
+            idle = self._active < self.max_concurrent and not self._waiting
+            if not idle and self._expected_wait(request_class) + service > deadline_seconds:
+                stats.rejected += 1
+                logger.info(
+                    f"LLM admission rejected {request_class.name.lower()} request: "
+                    f"expected wait {self._expected_wait(request_class):.1f}s + service {service:.1f}s "
+                    f"exceeds {deadline_seconds}s deadline"
+                )
+                return None
+
+            key = (int(request_class), next(self._sequence))
+            heapq.heappush(self._waiting, key)
+            give_up_at = max(enqueued_at, deadline - service)
+            while not (self._active < self.max_concurrent and self._waiting[0] == key):
+                remaining = give_up_at - time.monotonic()
+                if remaining <= 0:
+                    self._waiting.remove(key)
+                    heapq.heapify(self._waiting)
+                    stats.timed_out += 1
+                    # The head may have changed; let the next waiter check
+                    self._cond.notify_all()
+                    logger.info(
+                        f"LLM admission timed out for {request_class.name.lower()} request "
+                        f"after {time.monotonic() - enqueued_at:.1f}s in queue"
+                    )
+                    return None
+                self._cond.wait(remaining)
+
+            heapq.heappop(self._waiting)
+            self._active += 1
+            admitted_at = time.monotonic()
+            stats.record_wait(admitted_at - enqueued_at)
+            # Another slot may still be free for the new head
+            self._cond.notify_all()
+        return AdmissionTicket(request_class, enqueued_at, admitted_at, deadline)
+
+    @handle_errors("releasing LLM admission", default_return=None)
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free the slot and fold its hold time into the service-time average"""
+        held = time.monotonic() - ticket.admitted_at
+        with self._cond:
+            self._active = max(0, self._active - 1)
+            if self._service_seconds is None:
+                self._service_seconds = held
+            else:
+                self._service_seconds += SERVICE_TIME_SMOOTHING * (held - self._service_seconds)
+            self._cond.notify_all()
+
+    @handle_errors("getting LLM admission stats", default_return={})
+    def get_stats(self) -> dict:
+        """Queue depth, in-flight count, service estimate, and per-class wait metrics"""
+        with self._cond:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "active": self._active,
+                "queued": len(self._waiting),
+                "service_seconds": round(self._service_seconds or 0.0, 3),
+                "classes": {
+                    request_class.name.lower(): stats.as_dict()
+                    for request_class, stats in self._stats.items()
+                },
+            }
+
+
+@handle_errors("getting LLM admission controller", default_return=None)
+def get_llm_admission_controller() -> LLMAdmissionController:
+    """Process-wide controller sized by ``AI_MAX_CONCURRENT_REQUESTS``"""
+    global _controller
+    if _controller is None:
+        with _controller_lock:
+            if _controller is None:
+                from core import config
+
+                _controller = LLMAdmissionController(
+                    getattr(config, "AI_MAX_CONCURRENT_REQUESTS", 1)
+                )
+    return _controller
+
+
+@handle_errors("resetting LLM admission controller", default_return=None)
+def reset_llm_admission_controller() -> None:
+    """Drop the process-wide controller (tests and config reloads)"""
+    global _controller
+    with _controller_lock:
+        _controller = None
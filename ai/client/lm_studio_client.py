@@ -2,8 +2,12 @@
 
 """HTTP client helpers for LM Studio (OpenAI-compatible API)."""
 
+import time
+
 import requests
 
+from ai.client.admission import AdmissionClass, get_llm_admission_controller
+
 from core.config import (
     AI_API_CALL_TIMEOUT,
     AI_CONNECTION_TEST_TIMEOUT,
@@ -13,6 +17,8 @@ from core.config import (
 )
 from core.error_handling import handle_errors
 from core.logger import get_component_logger
+from core.resource_monitor import get_resource_monitor
+from core.tracing import traced
 
 logger = get_component_logger("ai")
 
@@ -43,6 +49,7 @@ def test_lm_studio_connection() -> bool:
 
 
 @handle_errors("calling LM Studio API", default_return=None)
+@traced("llm_wait")
 def call_lm_studio_api(
     messages: list,
     max_tokens: int = 100,
@@ -50,11 +57,52 @@ def call_lm_studio_api(
     timeout: int | None = None,
     *,
     stop: list[str] | None = None,
+    request_class: AdmissionClass = AdmissionClass.INTERACTIVE,
 ) -> str | None:
-    """Make a chat/completions request to LM Studio."""
+    """
+    Make a chat/completions request to LM Studio.
+
+    The call first waits for an admission slot (see ``ai.client.admission``);
+    ``timeout`` is the request's whole budget, queue wait included. Returns None
+    when admission cannot meet that deadline, so callers use their fallback.
+    """
     if timeout is None:
         timeout = AI_API_CALL_TIMEOUT
 
+    controller = get_llm_admission_controller()
+    ticket = controller.acquire(request_class, timeout) if controller is not None else None
+    if controller is not None and ticket is None:
+        return None
+
+    started = time.perf_counter()
+    content = None
+    try:
+        content = _post_chat_completion(
+            messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            timeout=ticket.remaining_seconds() if ticket is not None else timeout,
+            stop=stop,
+        )
+        return content
+    finally:
+        if ticket is not None:
+            controller.release(ticket)
+        monitor = get_resource_monitor()
+        if monitor is not None:
+            monitor.record_model_call(time.perf_counter() - started, ok=content is not None)
+
+
+@handle_errors("posting LM Studio chat completion", default_return=None)
+def _post_chat_completion(
+    messages: list,
+    *,
+    max_tokens: int,
+    temperature: float,
+    timeout: float,
+    stop: list[str] | None,
+) -> str | None:
+    """Send one chat/completions request and return the stripped content."""
     payload = {
         "model": LM_STUDIO_MODEL,
         "messages": messages,
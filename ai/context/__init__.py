@@ -11,6 +11,10 @@ from ai.context.history import (
     ConversationSession,
     get_conversation_history,
 )
+from ai.context.section_cache import (
+    clear_context_section_cache,
+    get_context_section_cache,
+)
 from ai.context.service import (
     AIContextEnvelope,
     AIContextSection,
@@ -29,4 +33,6 @@ __all__ = [
     "AIContextEnvelope",
     "AIContextSection",
     "build_ai_context_envelope",
+    "clear_context_section_cache",
+    "get_context_section_cache",
 ]
@@ -60,6 +60,72 @@ def build_context_parts(
     return parts
 
 
+@handle_errors("building layered conversational context", default_return=([], []))
+def build_context_layers(
+    user_id: str, envelope: AIContextEnvelope | None = None
+) -> tuple[list[str], list[str]]:
+    """
+    Split context lines into a slowly-changing profile layer and a volatile layer.
+
+    The profile layer (name, categories, personal context, feature availability,
+    schedule details) only changes when the user edits their settings, so it can
+    follow the cached instruction prefix. The volatile layer (current time,
+    check-ins, health, recent messages, tasks, then conversation) comes last.
+    """
+    envelope = envelope or build_ai_context_envelope(
+        user_id,
+        requested_intent="chat_response",
+        include_conversation_history=True,
+    )
+    if envelope is None:
+        return [], []
+
+    context = _profile_context_from_envelope(envelope)
+    structured = envelope.structured
+    profile: list[str] = []
+    append_profile_sections(profile, context)
+    _append_feature_enablement_from_envelope(profile, structured)
+    _append_schedule_details_from_envelope(profile, structured)
+
+    volatile: list[str] = []
+    append_current_datetime_context(volatile, user_id)
+    _append_checkin_summary_from_envelope(volatile, structured)
+    _append_health_guidance_from_envelope(volatile, structured)
+    _append_activity_and_mood_trends_from_envelope(volatile, structured)
+    _append_today_checkin_status_from_envelope(volatile, structured, user_id)
+    recent_sent_all = _append_recent_sent_messages_from_envelope(volatile, structured)
+    _append_task_reminder_from_messages(volatile, recent_sent_all)
+    _append_task_data_from_envelope(volatile, structured)
+    _append_conversation_history_from_envelope(volatile, structured, user_id=user_id)
+    return profile, volatile
+
+
+@handle_errors("building flow context view", default_return={})
+def _build_flow_context_view(
+    user_id: str, envelope: AIContextEnvelope | None
+) -> dict[str, Any]:
+    """Context view for ``compose_product_prompt`` in the configured prompt layout."""
+    from ai.prompts.manager import uses_stable_prompt_layout
+
+    structured = envelope.structured if envelope else {}
+    if uses_stable_prompt_layout():
+        profile_parts, volatile_parts = build_context_layers(user_id, envelope=envelope)
+        return {
+            "profile_text": (
+                "User Profile:\n" + "\n".join(profile_parts) if profile_parts else ""
+            ),
+            "prompt_text": "User Context:\n"
+            + ("\n".join(volatile_parts) if volatile_parts else "New user with no data"),
+            "structured": structured,
+        }
+
+    context_parts = build_context_parts(user_id, envelope=envelope)
+    context_str = (
+        "\n".join(context_parts) if context_parts else "New user with no data"
+    )
+    return {"prompt_text": "User Context:\n" + context_str, "structured": structured}
+
+
 @handle_errors(
     "assembling product AI flow messages",
     default_return=[
@@ -85,18 +151,10 @@ def _assemble_product_flow_messages(
         prompt_request=user_prompt,
         include_conversation_history=True,
     )
-    context_parts = build_context_parts(user_id, envelope=envelope)
-    context_str = (
-        "\n".join(context_parts) if context_parts else "New user with no data"
-    )
+    context_view = _build_flow_context_view(user_id, envelope)
 
     prompt_manager = get_prompt_manager()
-    compose_kwargs: dict[str, Any] = {
-        "context_view": {
-            "prompt_text": "User Context:\n" + context_str,
-            "structured": envelope.structured if envelope else {},
-        },
-    }
+    compose_kwargs: dict[str, Any] = {"context_view": context_view}
     if result_metadata is not None:
         compose_kwargs["result_metadata"] = result_metadata
 
@@ -105,10 +163,15 @@ def _assemble_product_flow_messages(
         if prompt_manager
         else None
     )
+    fallback_context = "\n\n".join(
+        text
+        for text in (context_view.get("profile_text"), context_view.get("prompt_text"))
+        if text
+    )
     instructions = (
         composed_prompt.content
         if composed_prompt
-        else f"{MINIMAL_CHAT_SYSTEM_PROMPT}\n\nUser Context:\n{context_str}"
+        else f"{MINIMAL_CHAT_SYSTEM_PROMPT}\n\n{fallback_context}"
     )
     return [
         {"role": "system", "content": instructions},
@@ -1,20 +1,47 @@
 # conversation_history.py
 
-from typing import Any
+"""
+Conversation sessions for AI interactions.
+
+Sessions live in memory in least-recently-used order. Once more than
+``CONVERSATION_HISTORY_MAX_MESSAGES`` messages are held across all users, the
+sessions of the users idle longest are evicted. For users with a data
+directory, every session event (start, message, end, delete) is also appended
+to ``conversation_history.json`` through ``core.interaction_log``. Events are
+queued per user while ``_lock`` is held and written after it is released, so
+one user's disk write never holds up another user's chat turn. An evicted
+user, or any user after a restart, is reloaded from that log on next access.
+Each session keeps per-role message counts, so statistics and summaries do not
+walk every stored message.
+"""
+
+import os
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from core.logger import get_component_logger
 from core.error_handling import handle_errors
-from core.time_utilities import now_timestamp_filename, now_datetime_full
+from core.time_utilities import (
+    TIMESTAMP_FULL,
+    format_timestamp,
+    now_datetime_full,
+    now_timestamp_filename,
+    parse_timestamp_full,
+)
 
 
 # Route conversation history logs to AI component
 history_logger = get_component_logger("ai")
 logger = history_logger
 
+# Messages the no-session summary covers
+_SUMMARY_MESSAGE_COUNT = 20
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversationMessage:
     """A single message in a conversation"""
 
@@ -31,7 +58,7 @@ class ConversationMessage:
             self.metadata = {}
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSession:
     """A conversation session with multiple messages"""
 
@@ -41,6 +68,8 @@ class ConversationSession:
     end_time: datetime | None = None
     messages: list[ConversationMessage] | None = None
     metadata: dict[str, Any] | None = None
+    # Messages per role currently in ``messages``
+    role_counts: dict[str, int] | None = None
 
     # not_duplicate: dataclass_post_init_defaults
     @handle_errors("post-initializing conversation session", default_return=None)
@@ -50,6 +79,85 @@ class ConversationSession:
             self.messages = []
         if self.metadata is None:
             self.metadata = {}
+        if self.role_counts is None:
+            self.role_counts = {}
+            for message in self.messages:
+                self.role_counts[message.role] = self.role_counts.get(message.role, 0) + 1
+
+
+@handle_errors("getting conversation history log path", default_return="")
+def _history_log_path(user_id: str) -> str:
+    """Per-user session log, or "" when the user has no data directory"""
+    from core.config import get_user_data_dir, get_user_file_path
+
+    user_dir = get_user_data_dir(user_id)
+    if not user_dir or not os.path.isdir(user_dir):
+        return ""
+    return get_user_file_path(user_id, "conversation_history")
+
+
+@handle_errors("recording conversation history event", default_return=None)
+def _record_event(user_id: str, row: dict[str, Any] | None) -> None:
+    """
+    Append one session event to the user's log, or delete the log when ``row``
+    is None (no-op without a data directory)
+    """
+    log_file = _history_log_path(user_id)
+    if not log_file:
+        return
+    from core import config
+    from core.interaction_log import append_interaction, delete_interaction_log
+
+    if row is None:
+        delete_interaction_log(log_file)
+        return
+    append_interaction(log_file, row, config.CHAT_INTERACTION_RETENTION_DAYS)
+
+
+@handle_errors("loading conversation sessions", default_return=([], None))
+def _load_sessions(
+    user_id: str, max_sessions: int, max_messages: int
+) -> tuple[list[ConversationSession], ConversationSession | None]:
+    """Rebuild a user's retained sessions (and the open one) by replaying their log"""
+    log_file = _history_log_path(user_id)
+    if not log_file:
+        return [], None
+    from core.interaction_log import load_all_interactions
+
+    sessions: OrderedDict[str, ConversationSession] = OrderedDict()
+    for row in load_all_interactions(log_file):
+        session_id = str(row.get("session_id") or "")
+        event = row.get("event")
+        when = parse_timestamp_full(str(row.get("timestamp") or "")) or datetime.min
+        if not session_id:
+            continue
+        if event == "delete":
+            sessions.pop(session_id, None)
+            continue
+        session = sessions.get(session_id)
+        if session is None:
+            session = ConversationSession(session_id=session_id, user_id=user_id, start_time=when)
+            sessions[session_id] = session
+        if event == "end":
+            session.end_time = when
+        elif event == "message":
+            role = str(row.get("role") or "")
+            session.messages.append(
+                ConversationMessage(
+                    role=role,
+                    content=str(row.get("content") or ""),
+                    timestamp=when,
+                    metadata=row.get("metadata") or {},
+                )
+            )
+            session.role_counts[role] = session.role_counts.get(role, 0) + 1
+            if len(session.messages) > max_messages:
+                dropped = session.messages.pop(0)
+                session.role_counts[dropped.role] -= 1
+
+    retained = list(sessions.values())[-max_sessions:] if max_sessions > 0 else []
+    active = retained[-1] if retained and retained[-1].end_time is None else None
+    return retained, active
 
 
 class ConversationHistory:
@@ -57,15 +165,159 @@ class ConversationHistory:
 
     @handle_errors("initializing conversation history", default_return=None)
     def __init__(
-        self, max_sessions_per_user: int = 10, max_messages_per_session: int = 50
+        self,
+        max_sessions_per_user: int = 10,
+        max_messages_per_session: int = 50,
+        max_cached_messages: int | None = None,
     ):
         """Initialize the conversation history manager"""
+        if max_cached_messages is None:
+            from core.config import CONVERSATION_HISTORY_MAX_MESSAGES
+
+            max_cached_messages = CONVERSATION_HISTORY_MAX_MESSAGES
         self.max_sessions_per_user = max_sessions_per_user
         self.max_messages_per_session = max_messages_per_session
-        self._sessions: dict[str, list[ConversationSession]] = {}  # user_id -> sessions
+        self.max_cached_messages = max_cached_messages
+        self._lock = threading.RLock()
+        # user_id -> sessions, least recently used user first
+        self._sessions: OrderedDict[str, list[ConversationSession]] = OrderedDict()
         self._active_sessions: dict[str, ConversationSession] = (
             {}
         )  # user_id -> active session
+        self._cached_messages = 0
+        # user_id -> events not yet written to the log, in order
+        self._pending_events: dict[str, deque[dict[str, Any] | None]] = {}
+        # user_id -> lock held while that user's events are written
+        self._writer_locks: dict[str, threading.Lock] = {}
+
+    @handle_errors("queueing conversation history event", default_return=None)
+    def _queue_event(self, user_id: str, event: str, session_id: str, **fields: Any) -> None:
+        """Queue one session event for the log; the caller holds ``self._lock``"""
+        row = {"event": event, "session_id": session_id, **fields}
+        row.setdefault("timestamp", format_timestamp(now_datetime_full(), TIMESTAMP_FULL))
+        self._pending_events.setdefault(user_id, deque()).append(row)
+
+    @handle_errors("writing conversation history events", default_return=None)
+    def _write_events(self, user_id: str) -> None:
+        """
+        Write a user's queued events in order. Called without ``self._lock``;
+        the per-user writer lock keeps concurrent writers from reordering them.
+        """
+        with self._lock:
+            if not self._pending_events.get(user_id):
+                return
+            writer = self._writer_locks.setdefault(user_id, threading.Lock())
+        with writer:
+            while True:
+                with self._lock:
+                    queue = self._pending_events.get(user_id)
+                    if not queue:
+                        self._pending_events.pop(user_id, None)
+                        return
+                    row = queue.popleft()
+                _record_event(user_id, row)
+
+    @handle_errors("getting cached user sessions", default_return=None)
+    def _user_sessions(
+        self, user_id: str, create: bool = False
+    ) -> list[ConversationSession] | None:
+        """
+        A user's sessions as most recently used, reloading them from the log
+        after eviction or a restart. The caller holds ``self._lock``.
+        """
+        sessions = self._sessions.get(user_id)
+        if sessions is not None:
+            self._sessions.move_to_end(user_id)
+            return sessions
+        if self._pending_events.get(user_id):
+            # The log is behind memory (a clear_history delete is still queued)
+            if not create:
+                return None
+            self._sessions[user_id] = []
+            return self._sessions[user_id]
+
+        loaded, active = _load_sessions(
+            user_id, self.max_sessions_per_user, self.max_messages_per_session
+        )
+        if not loaded and not create:
+            return None
+        self._sessions[user_id] = loaded
+        if active is not None:
+            self._active_sessions[user_id] = active
+        self._cached_messages += sum(len(session.messages or []) for session in loaded)
+        if loaded:
+            logger.debug(f"Reloaded {len(loaded)} conversation sessions for user {user_id}")
+        self._evict_idle_users(user_id)
+        return loaded
+
+    @handle_errors("evicting idle conversation sessions", default_return=None)
+    def _evict_idle_users(self, current_user_id: str) -> None:
+        """Drop the least recently used users' sessions until under the memory cap"""
+        if len(self._sessions) <= 1:
+            self._cached_messages = sum(
+                len(session.messages or [])
+                for sessions in self._sessions.values()
+                for session in sessions
+            )
+            return
+        while self._cached_messages > self.max_cached_messages:
+            # Users with queued events stay until the log has them
+            idle_user_id = next(
+                (
+                    uid
+                    for uid in self._sessions
+                    if uid != current_user_id and not self._pending_events.get(uid)
+                ),
+                None,
+            )
+            if idle_user_id is None:
+                break
+            evicted = self._sessions.pop(idle_user_id)
+            self._active_sessions.pop(idle_user_id, None)
+            self._cached_messages -= sum(len(session.messages or []) for session in evicted)
+            logger.debug(f"Evicted idle conversation sessions for user {idle_user_id}")
+
+    @handle_errors("starting conversation session", default_return=None)
+    def _start_session_locked(
+        self, user_id: str, session_id: str | None = None
+    ) -> ConversationSession:
+        """Open a session (ending any active one); the caller holds ``self._lock``"""
+        if session_id is None:
+            # Session IDs behave like identifiers/filenames: readable + Windows-safe
+            session_id = f"{user_id}_{now_timestamp_filename()}"
+        sessions = self._user_sessions(user_id, create=True)
+        self._end_session_locked(user_id)
+
+        session = ConversationSession(
+            session_id=session_id,
+            user_id=user_id,
+            start_time=now_datetime_full(),
+        )
+        sessions.append(session)
+        self._active_sessions[user_id] = session
+        self._queue_event(
+            user_id,
+            "start",
+            session_id,
+            timestamp=format_timestamp(session.start_time, TIMESTAMP_FULL),
+        )
+        self._cleanup_old_sessions(user_id)
+        return session
+
+    @handle_errors("ending conversation session", default_return=None)
+    def _end_session_locked(self, user_id: str) -> ConversationSession | None:
+        """Close the active session, if any; the caller holds ``self._lock``"""
+        session = self._active_sessions.pop(user_id, None)
+        if session is None:
+            return None
+        session.end_time = now_datetime_full()
+        self._queue_event(
+            user_id,
+            "end",
+            session.session_id,
+            timestamp=format_timestamp(session.end_time, TIMESTAMP_FULL),
+        )
+        return session
 
     @handle_errors("starting conversation session", default_return=None)
     def start_session(self, user_id: str, session_id: str | None = None) -> str:
@@ -80,28 +332,9 @@ class ConversationHistory:
             Session ID
         """
         try:
-            if session_id is None:
-                # Session IDs behave like identifiers/filenames: readable + Windows-safe
-                session_id = f"{user_id}_{now_timestamp_filename()}"
-
-            # End any existing active session
-            if user_id in self._active_sessions:
-                self.end_session(user_id)
-
-            # Create new session
-            session = ConversationSession(
-                session_id=session_id,
-                user_id=user_id,
-                start_time=now_datetime_full(),
-            )
-
-            # Store session
-            if user_id not in self._sessions:
-                self._sessions[user_id] = []
-            self._sessions[user_id].append(session)
-            self._active_sessions[user_id] = session
-
-            self._cleanup_old_sessions(user_id)
+            with self._lock:
+                session_id = self._start_session_locked(user_id, session_id).session_id
+            self._write_events(user_id)
 
             logger.debug(
                 f"Started conversation session {session_id} for user {user_id}"
@@ -124,17 +357,17 @@ class ConversationHistory:
             True if session was ended successfully
         """
         try:
-            if user_id in self._active_sessions:
-                session = self._active_sessions[user_id]
-                session.end_time = now_datetime_full()
-                del self._active_sessions[user_id]
-
-                logger.debug(
-                    f"Ended conversation session {session.session_id} for user {user_id}"
-                )
-                return True
+            with self._lock:
+                self._user_sessions(user_id)
+                session = self._end_session_locked(user_id)
+            if session is None:
+                return False
+            self._write_events(user_id)
 
-            return False
+            logger.debug(
+                f"Ended conversation session {session.session_id} for user {user_id}"
+            )
+            return True
 
         except Exception as e:
             logger.error(f"Error ending session for user {user_id}: {e}")
@@ -157,35 +390,44 @@ class ConversationHistory:
             True if message was added successfully
         """
         try:
-            # Ensure there's an active session
-            if user_id not in self._active_sessions:
-                self.start_session(user_id)
-
-            session = self._active_sessions[user_id]
-
-            # Create message
-            message = ConversationMessage(
-                role=role,
-                content=content,
-                timestamp=now_datetime_full(),
-                metadata=metadata or {},
-            )
+            with self._lock:
+                self._user_sessions(user_id, create=True)
+
+                # Ensure there's an active session
+                session = self._active_sessions.get(user_id)
+                if session is None:
+                    session = self._start_session_locked(user_id)
+
+                # Create message
+                message = ConversationMessage(
+                    role=role,
+                    content=content,
+                    timestamp=now_datetime_full(),
+                    metadata=metadata or {},
+                )
 
-            # Add to session
-            if session.messages is None:
-                session.messages = []
-            session.messages.append(message)
+                # Add to session
+                session.messages.append(message)
+                session.role_counts[role] = session.role_counts.get(role, 0) + 1
+                self._cached_messages += 1
 
-            # Clean up if too many messages
-            if (
-                session.messages
-                and len(session.messages) > self.max_messages_per_session
-            ):
                 # Keep only the most recent messages
-                session.messages = session.messages[-self.max_messages_per_session :]
-
-            # Note: store_chat_interaction is for check-ins/chat pairs, not generic chat history
-            # If you want a general chat log, create a dedicated writer later
+                while len(session.messages) > self.max_messages_per_session:
+                    dropped = session.messages.pop(0)
+                    session.role_counts[dropped.role] -= 1
+                    self._cached_messages -= 1
+
+                self._queue_event(
+                    user_id,
+                    "message",
+                    session.session_id,
+                    role=role,
+                    content=content,
+                    timestamp=format_timestamp(message.timestamp, TIMESTAMP_FULL),
+                    metadata=message.metadata,
+                )
+                self._evict_idle_users(user_id)
+            self._write_events(user_id)
 
             logger.debug(
                 f"Added {role} message to session {session.session_id} for user {user_id}"
@@ -212,37 +454,25 @@ class ConversationHistory:
             List of conversation messages
         """
         try:
-            history = []
-
-            # Get all sessions for user
-            sessions = self._sessions.get(user_id, [])
-
-            # Add messages from all sessions
-            for session in sessions:
-                if session.messages is None:
-                    continue
-                for message in session.messages:
-                    msg_dict: dict[str, Any] = {
-                        "role": message.role,
-                        "content": message.content,
-                        # NOTE: This uses ISO-8601 via datetime.isoformat().
-                        # This does not map cleanly to core/time_utilities.py without adding an ISO format/parser.
-                        # Leave as-is for now; requires an explicit project decision to standardize.
-                        "timestamp": message.timestamp.isoformat(),
-                        "session_id": session.session_id,
-                    }
-
-                    if include_metadata:
-                        msg_dict["metadata"] = message.metadata
-
-                    history.append(msg_dict)
+            with self._lock:
+                pairs = self._message_pairs(user_id, limit)
 
-            # Sort by timestamp
-            history.sort(key=lambda x: x["timestamp"])
-
-            # Apply limit
-            if limit:
-                history = history[-limit:]
+            history = []
+            for session, message in pairs:
+                msg_dict: dict[str, Any] = {
+                    "role": message.role,
+                    "content": message.content,
+                    # NOTE: This uses ISO-8601 via datetime.isoformat().
+                    # This does not map cleanly to core/time_utilities.py without adding an ISO format/parser.
+                    # Leave as-is for now; requires an explicit project decision to standardize.
+                    "timestamp": message.timestamp.isoformat(),
+                    "session_id": session.session_id,
+                }
+
+                if include_metadata:
+                    msg_dict["metadata"] = message.metadata
+
+                history.append(msg_dict)
 
             return history
 
@@ -250,6 +480,32 @@ class ConversationHistory:
             logger.error(f"Error getting history for user {user_id}: {e}")
             return []
 
+    @handle_errors("collecting conversation messages", default_return=[])
+    def _message_pairs(
+        self, user_id: str, limit: int | None
+    ) -> list[tuple[ConversationSession, ConversationMessage]]:
+        """
+        (session, message) pairs oldest first, the last ``limit`` when positive.
+
+        Sessions are kept in start order and messages in arrival order, so a
+        positive limit walks back from the newest message only. The caller
+        holds ``self._lock``.
+        """
+        sessions = self._user_sessions(user_id) or []
+        if limit and limit > 0:
+            newest: list[tuple[ConversationSession, ConversationMessage]] = []
+            for session in reversed(sessions):
+                for message in reversed(session.messages or []):
+                    newest.append((session, message))
+                    if len(newest) == limit:
+                        return newest[::-1]
+            return newest[::-1]
+
+        pairs = [
+            (session, message) for session in sessions for message in session.messages or []
+        ]
+        return pairs[-limit:] if limit else pairs
+
     @handle_errors("getting recent messages", default_return=[])
     def get_recent_messages(
         self, user_id: str, count: int = 10
@@ -277,7 +533,17 @@ class ConversationHistory:
         Returns:
             Active conversation session or None
         """
-        return self._active_sessions.get(user_id)
+        with self._lock:
+            self._user_sessions(user_id)
+            return self._active_sessions.get(user_id)
+
+    @handle_errors("finding conversation session", default_return=None)
+    def _find_session(self, user_id: str, session_id: str) -> ConversationSession | None:
+        """Session by ID; the caller holds ``self._lock``"""
+        for session in self._user_sessions(user_id) or []:
+            if session.session_id == session_id:
+                return session
+        return None
 
     @handle_errors("getting session messages", default_return=[])
     def get_session_messages(
@@ -294,14 +560,11 @@ class ConversationHistory:
             List of messages in the session
         """
         try:
-            sessions = self._sessions.get(user_id, [])
-            for session in sessions:
-                if session.session_id == session_id:
-                    if session.messages is None:
-                        return []
-                    return session.messages.copy()
-
-            return []
+            with self._lock:
+                session = self._find_session(user_id, session_id)
+                if session is None or session.messages is None:
+                    return []
+                return session.messages.copy()
 
         except Exception as e:
             logger.error(
@@ -312,7 +575,7 @@ class ConversationHistory:
     @handle_errors("clearing conversation history")
     def clear_history(self, user_id: str) -> bool:
         """
-        Clear all conversation history for a user
+        Clear all conversation history for a user, including their session log
 
         Args:
             user_id: User ID
@@ -321,13 +584,17 @@ class ConversationHistory:
             True if history was cleared successfully
         """
         try:
-            # End active session
-            if user_id in self._active_sessions:
-                self.end_session(user_id)
+            with self._lock:
+                # The log is deleted, so the active session needs no end event
+                self._active_sessions.pop(user_id, None)
+
+                # Clear sessions
+                sessions = self._sessions.pop(user_id, None) or []
+                self._cached_messages -= sum(len(s.messages or []) for s in sessions)
 
-            # Clear sessions
-            if user_id in self._sessions:
-                del self._sessions[user_id]
+                # Queued events are dropped; None deletes the log once earlier writes finish
+                self._pending_events[user_id] = deque([None])
+            self._write_events(user_id)
 
             logger.info(f"Cleared conversation history for user {user_id}")
             return True
@@ -349,24 +616,29 @@ class ConversationHistory:
             True if session was deleted successfully
         """
         try:
-            sessions = self._sessions.get(user_id, [])
-
-            # Find and remove session
-            for i, session in enumerate(sessions):
-                if session.session_id == session_id:
-                    # If this is the active session, end it
-                    if (
-                        user_id in self._active_sessions
-                        and self._active_sessions[user_id].session_id == session_id
-                    ):
-                        del self._active_sessions[user_id]
-
-                    # Remove from sessions list
-                    sessions.pop(i)
-                    logger.info(f"Deleted session {session_id} for user {user_id}")
-                    return True
-
-            return False
+            with self._lock:
+                sessions = self._user_sessions(user_id) or []
+
+                # Find and remove session
+                for i, session in enumerate(sessions):
+                    if session.session_id == session_id:
+                        # If this is the active session, end it
+                        if (
+                            user_id in self._active_sessions
+                            and self._active_sessions[user_id].session_id == session_id
+                        ):
+                            del self._active_sessions[user_id]
+
+                        # Remove from sessions list
+                        sessions.pop(i)
+                        self._cached_messages -= len(session.messages or [])
+                        self._queue_event(user_id, "delete", session_id)
+                        break
+                else:
+                    return False
+            self._write_events(user_id)
+            logger.info(f"Deleted session {session_id} for user {user_id}")
+            return True
 
         except Exception as e:
             logger.error(f"Error deleting session {session_id} for user {user_id}: {e}")
@@ -387,22 +659,19 @@ class ConversationHistory:
             Conversation summary string
         """
         try:
-            if session_id:
-                messages = self.get_session_messages(user_id, session_id)
-            else:
-                messages_data = self.get_recent_messages(user_id, count=20)
-                messages = []
-                for msg_data in messages_data:
-                    messages.append(
-                        ConversationMessage(
-                            role=msg_data["role"],
-                            content=msg_data["content"],
-                            # NOTE: This parses ISO-8601 produced by datetime.isoformat() above.
-                            # core/time_utilities.py intentionally does not (yet) include an ISO parser variant.
-                            # Leave as-is for now; requires an explicit project decision to standardize.
-                            timestamp=datetime.fromisoformat(msg_data["timestamp"]),
-                        )
-                    )
+            with self._lock:
+                if session_id:
+                    session = self._find_session(user_id, session_id)
+                    messages = list(session.messages or []) if session else []
+                    role_counts = dict(session.role_counts or {}) if session else {}
+                else:
+                    messages = [
+                        message
+                        for _, message in self._message_pairs(user_id, _SUMMARY_MESSAGE_COUNT)
+                    ]
+                    role_counts = {}
+                    for message in messages:
+                        role_counts[message.role] = role_counts.get(message.role, 0) + 1
 
             if not messages:
                 return "No conversation history available."
@@ -410,19 +679,20 @@ class ConversationHistory:
             # Create summary
             summary_parts = []
             summary_parts.append(f"Conversation Summary ({len(messages)} messages):")
-
-            # Group by role
-            user_messages = [msg for msg in messages if msg.role == "user"]
-            assistant_messages = [msg for msg in messages if msg.role == "assistant"]
-
-            summary_parts.append(f"- User messages: {len(user_messages)}")
-            summary_parts.append(f"- Assistant messages: {len(assistant_messages)}")
+            summary_parts.append(f"- User messages: {role_counts.get('user', 0)}")
+            summary_parts.append(f"- Assistant messages: {role_counts.get('assistant', 0)}")
 
             # Add recent topics (last few user messages)
-            if user_messages:
+            recent_user_messages: list[ConversationMessage] = []
+            for message in reversed(messages):
+                if message.role == "user":
+                    recent_user_messages.insert(0, message)
+                    if len(recent_user_messages) == 3:
+                        break
+            if recent_user_messages:
                 recent_topics = [
                     msg.content[:50] + "..." if len(msg.content) > 50 else msg.content
-                    for msg in user_messages[-3:]
+                    for msg in recent_user_messages
                 ]
                 summary_parts.append(f"- Recent topics: {', '.join(recent_topics)}")
 
@@ -438,6 +708,9 @@ class ConversationHistory:
         sessions = self._sessions.get(user_id, [])
         if len(sessions) > self.max_sessions_per_user:
             sessions_to_remove = len(sessions) - self.max_sessions_per_user
+            self._cached_messages -= sum(
+                len(s.messages or []) for s in sessions[:sessions_to_remove]
+            )
             sessions[:sessions_to_remove] = []
 
             logger.debug(
@@ -456,25 +729,18 @@ class ConversationHistory:
             Dictionary with conversation statistics
         """
         try:
-            sessions = self._sessions.get(user_id, [])
+            with self._lock:
+                sessions = list(self._user_sessions(user_id) or [])
+                active_session = self._active_sessions.get(user_id)
 
-            total_messages = sum(
-                len(s.messages) if s.messages is not None else 0 for s in sessions
-            )
+            total_messages = sum(len(s.messages or []) for s in sessions)
             total_sessions = len(sessions)
 
-            # Count messages by role
-            user_messages = 0
-            assistant_messages = 0
-
-            for session in sessions:
-                if session.messages is None:
-                    continue
-                for message in session.messages:
-                    if message.role == "user":
-                        user_messages += 1
-                    elif message.role == "assistant":
-                        assistant_messages += 1
+            # Count messages by role from the per-session counters
+            user_messages = sum((s.role_counts or {}).get("user", 0) for s in sessions)
+            assistant_messages = sum(
+                (s.role_counts or {}).get("assistant", 0) for s in sessions
+            )
 
             # Calculate average session length
             avg_session_length = (
@@ -482,7 +748,6 @@ class ConversationHistory:
             )
 
             # Get active session info
-            active_session = self._active_sessions.get(user_id)
             active_session_id = active_session.session_id if active_session else None
 
             return {
@@ -499,6 +764,16 @@ class ConversationHistory:
             logger.error(f"Error getting statistics for user {user_id}: {e}")
             return {}
 
+    @handle_errors("getting conversation memory stats", default_return={})
+    def get_memory_stats(self) -> dict[str, int]:
+        """Users and messages currently held in memory"""
+        with self._lock:
+            return {
+                "cached_users": len(self._sessions),
+                "cached_messages": self._cached_messages,
+                "max_cached_messages": self.max_cached_messages,
+            }
+
 
 # Global conversation history instance
 _conversation_history = None
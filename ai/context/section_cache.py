@@ -0,0 +1,170 @@
+"""
+Per-user memo of AI context envelope sections.
+
+``build_ai_context_envelope`` used to rebuild every section on every turn,
+re-reading the same files each time. Each cached section is now stored with
+a version key made from the files it was read from: ``os.stat`` mtime, size,
+and inode of each source file, or of every file directly inside a source
+directory. Date-dependent sections also add the user's local date to the key.
+A lookup re-stats the sources and reuses the section when nothing changed.
+``save_json_data`` writes through a temp file and ``os.replace``, so a write
+changes the inode even when it lands in the same mtime tick.
+
+Cached sections are shared between turns and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+from core.error_handling import handle_errors
+from core.file_operations import file_signature
+from core.logger import get_component_logger
+
+logger = get_component_logger("ai")
+
+# Files (or directories) under the user's data dir that each section reads.
+# Sections not listed here (temporal, analytics) are rebuilt every turn.
+SECTION_SOURCES: dict[str, tuple[str, ...]] = {
+    "account": ("account.json",),
+    "preferences": ("preferences.json",),
+    "personal_context": ("user_context.json",),
+    "schedules": ("schedules.json",),
+    "tasks": ("tasks", "account.json", "preferences.json"),
+    "checkins": ("checkins.json", "account.json", "preferences.json"),
+    "messages": ("messages", "account.json", "preferences.json"),
+    "notebooks": ("notebook",),
+    "health": ("health", "checkins.json", "account.json", "preferences.json"),
+    "conversation": ("chat_interactions.json", "chat_interactions.jsonl"),
+}
+# Sections whose content also depends on the user's current date
+DATE_SENSITIVE_SECTIONS = frozenset({"tasks", "checkins", "health"})
+# Bound on cached (user, section) pairs
+MAX_CACHED_SECTIONS = 1024
+
+_cache_lock = threading.Lock()
+_cache = None
+
+
+# ERROR_HANDLING_EXCLUDE: directory scan on the per-turn hot path; a missing directory is a valid version.
+def _stat_signature(path: str) -> tuple:
+    """Version of one file, or of each file directly inside a directory"""
+    if not os.path.isdir(path):
+        return file_signature(path)
+    try:
+        entries = []
+        for entry in os.scandir(path):
+            if entry.is_file():
+                entry_stat = entry.stat()
+                entries.append(
+                    (entry.name, entry_stat.st_mtime_ns, entry_stat.st_size, entry.inode())
+                )
+    except OSError:
+        return (path, None)
+    return (path, tuple(sorted(entries)))
+
+
+class ContextSectionCache:
+    """LRU of built sections keyed by (user data dir, section name)"""
+
+    def __init__(self, max_entries: int = MAX_CACHED_SECTIONS):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict[str, int]] = {}
+
+    @handle_errors("computing context section version", default_return=None)
+    def version_for(self, user_dir: str, name: str, extra: tuple = ()) -> tuple | None:
+        """Current version key for a section, or None when it is not cacheable"""
+        sources = SECTION_SOURCES.get(name)
+        if not sources or not user_dir:
+            return None
+        return (
+            tuple(_stat_signature(os.path.join(user_dir, source)) for source in sources),
+            extra,
+        )
+
+    @handle_errors("getting context section", default_return=(None, False))
+    def get_or_build(
+        self, user_id: str, name: str, builder: Callable[[], Any], extra: tuple = ()
+    ) -> tuple[Any, bool]:
+        """
+        Return the section, reusing the cached one when its sources are unchanged.
+
+        Returns:
+            tuple: (section, reused)
+        """
+        from core import config
+
+        if not getattr(config, "AI_CONTEXT_SECTION_CACHE", True):
+            return builder(), False
+        user_dir = config.get_user_data_dir(user_id)
+        version = self.version_for(user_dir, name, extra)
+        if version is None:
+            return builder(), False
+
+        key = (user_dir, name)
+        with self._lock:
+            counters = self._stats.setdefault(name, {"hits": 0, "misses": 0})
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == version:
+                self._entries.move_to_end(key)
+                counters["hits"] += 1
+                return cached[1], True
+            counters["misses"] += 1
+
+        section = builder()
+        if self.version_for(user_dir, name, extra) != version:
+            # Sources changed while building (lazy file creation or a concurrent
+            # write): the result may mix versions, so do not keep it
+            return section, False
+        with self._lock:
+            self._entries[key] = (version, section)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return section, False
+
+    @handle_errors("invalidating context sections", default_return=None)
+    def invalidate(self, user_id: str | None = None) -> None:
+        """Drop one user's sections, or everything"""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+                return
+            from core.config import get_user_data_dir
+
+            user_dir = get_user_data_dir(user_id)
+            for key in [key for key in self._entries if key[0] == user_dir]:
+                del self._entries[key]
+
+    @handle_errors("getting context section cache stats", default_return={})
+    def get_stats(self) -> dict:
+        """Per-section hit/miss counts and the number of cached sections"""
+        with self._lock:
+            return {
+                "cached": len(self._entries),
+                "sections": {name: dict(counts) for name, counts in self._stats.items()},
+            }
+
+
+@handle_errors("getting context section cache", default_return=None)
+def get_context_section_cache() -> ContextSectionCache:
+    """Process-wide section cache"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ContextSectionCache()
+    return _cache
+
+
+@handle_errors("clearing context section cache", default_return=None)
+def clear_context_section_cache(user_id: str | None = None) -> None:
+    """Drop cached sections (one user, or all)"""
+    if _cache is not None:
+        _cache.invalidate(user_id)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Callable, ItemsView, KeysView, ValuesView
 from dataclasses import dataclass, field
 from typing import Any
 
+from ai.context.section_cache import DATE_SENSITIVE_SECTIONS, get_context_section_cache
 from core import get_user_data
 from core.error_handling import handle_errors
 from core.health_context_builder import (
@@ -24,6 +27,11 @@ from core.time_utilities import (
 from scheduler.user_timezone import localized_now_for_user, resolve_user_timezone_str
 
 
+# Sections that change only when the user edits their settings; stable prompt
+# layouts place them ahead of the volatile sections
+PROFILE_PROMPT_SECTIONS = ("account", "preferences", "personal_context", "schedules")
+
+
 @dataclass(frozen=True)
 class AIContextSection:
     """One normalized context section and its AI-facing prompt text."""
@@ -36,6 +44,72 @@ class AIContextSection:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+class _LazyDict(dict):
+    """
+    ``dict`` whose values are computed on the first read of each key.
+
+    Keys are known up front; iteration, ``get``, ``items`` and friends
+    resolve through ``__getitem__``, so only the values actually read are
+    built. Values set directly are stored as-is.
+    """
+
+    def __init__(self, names, resolve: Callable[[str], Any]):
+        super().__init__()
+        self._names = list(names)
+        self._resolve = resolve
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        if not dict.__contains__(self, key):
+            if key not in self._names:
+                raise KeyError(key)
+            with self._lock:
+                if not dict.__contains__(self, key):
+                    dict.__setitem__(self, key, self._resolve(key))
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in self._names:
+            self._names.append(key)
+        dict.__setitem__(self, key, value)
+
+    def __contains__(self, key):
+        return key in self._names
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def __len__(self):
+        return len(self._names)
+
+    def __eq__(self, other):
+        return dict(self.items()) == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def get(self, key, default=None):
+        return self[key] if key in self._names else default
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        return ValuesView(self)
+
+    def items(self):
+        return ItemsView(self)
+
+    def copy(self):
+        return dict(self.items())
+
+    def resolved_keys(self) -> list[str]:
+        """Keys whose values have been built so far"""
+        return [name for name in self._names if dict.__contains__(self, name)]
+
+
 @dataclass(frozen=True)
 class AIContextEnvelope:
     """Structured product-AI context for a single user request."""
@@ -46,28 +120,33 @@ class AIContextEnvelope:
     @property
     @handle_errors("getting structured AI context", default_return={})
     def structured(self) -> dict[str, Any]:
-        """Return structured data keyed by section name."""
-        return {name: section.data for name, section in self.sections.items()}
+        """Return structured data keyed by section name (built on first read)."""
+        return _LazyDict(self.sections, lambda name: self.sections[name].data)
+
+    @handle_errors("listing candidate prompt sections", default_return=[])
+    def _candidate_sections(self) -> list[str]:
+        """Section names that may contribute prompt text, without building excluded ones."""
+        included = self.metadata.get("included_sections")
+        if included is None:
+            return list(self.sections)
+        return [name for name in included if name in self.sections]
 
     @property
     @handle_errors("getting AI prompt sections", default_return={})
     def prompt_sections(self) -> dict[str, str]:
         """Return compact prompt text for included sections."""
-        return {
-            name: section.prompt_text
-            for name, section in self.sections.items()
-            if section.included and section.prompt_text
-        }
+        prompt_sections = {}
+        for name in self._candidate_sections():
+            section = self.sections[name]
+            if section.included and section.prompt_text:
+                prompt_sections[name] = section.prompt_text
+        return prompt_sections
 
     @property
     @handle_errors("getting included AI context sections", default_return=[])
     def included_sections(self) -> list[str]:
         """Return included section names in insertion order."""
-        return [
-            name
-            for name, section in self.sections.items()
-            if section.included and section.prompt_text
-        ]
+        return list(self.prompt_sections)
 
     @handle_errors("joining AI prompt text", default_return="")
     def to_prompt_text(self) -> str:
@@ -84,80 +163,125 @@ def build_ai_context_envelope(
     include_conversation_history: bool = True,
     prompt_request: str | None = None,
 ) -> AIContextEnvelope | None:
-    """Build the canonical structured context envelope for product AI."""
-
-    user_data = get_user_data(user_id, "all", normalize_on_read=True) or {}
-    account = _unwrap_section(user_data, "account")
-    preferences = _unwrap_section(user_data, "preferences")
-    personal_context = _unwrap_section(user_data, "context")
-    schedules = _unwrap_section(user_data, "schedules")
-
-    sections: dict[str, AIContextSection] = {}
-    from ai.context.phraser import phrase_current_datetime_context
-
-    sections["temporal"] = _section(
-        "temporal",
-        _build_temporal_context(user_id),
-        prompt_text=phrase_current_datetime_context(user_id),
-        source="scheduler.user_timezone + core.time_utilities",
-    )
-    sections["account"] = _section(
-        "account",
-        account,
-        _format_account(account),
-        source='get_user_data("all").account',
-    )
-    sections["preferences"] = _section(
-        "preferences",
-        preferences,
-        _format_preferences(preferences),
-        source='get_user_data("all").preferences',
-    )
-    sections["personal_context"] = _section(
-        "personal_context",
-        personal_context,
-        _format_personal_context(personal_context),
-        source='get_user_data("all").context',
-    )
-    sections["schedules"] = _section(
+    """
+    Build the canonical structured context envelope for product AI.
+
+    Sections are built lazily: included sections when the prompt text is read,
+    excluded ones only if a caller reads their data. File-backed sections are
+    reused from the per-user section cache while their source files are
+    unchanged (``ai.context.section_cache``). ``metadata["section_cache"]``
+    lists which sections this turn reused and which it rebuilt.
+    """
+    loaded_user_data: list[dict[str, Any]] = []
+
+    def user_data_section(section_name: str) -> dict[str, Any]:
+        # One get_user_data("all") call serves every stale profile section
+        if not loaded_user_data:
+            loaded_user_data.append(
+                get_user_data(user_id, "all", normalize_on_read=True) or {}
+            )
+        return _unwrap_section(loaded_user_data[0], section_name)
+
+    temporal = _build_temporal_context(user_id)
+    builders: dict[str, Callable[[], AIContextSection]] = {}
+
+    def temporal_section() -> AIContextSection:
+        from ai.context.phraser import phrase_current_datetime_context
+
+        return _section(
+            "temporal",
+            temporal,
+            prompt_text=phrase_current_datetime_context(user_id),
+            source="scheduler.user_timezone + core.time_utilities",
+        )
+
+    def account_section() -> AIContextSection:
+        account = user_data_section("account")
+        return _section(
+            "account", account, _format_account(account), source='get_user_data("all").account'
+        )
+
+    def preferences_section() -> AIContextSection:
+        preferences = user_data_section("preferences")
+        return _section(
+            "preferences",
+            preferences,
+            _format_preferences(preferences),
+            source='get_user_data("all").preferences',
+        )
+
+    def personal_context_section() -> AIContextSection:
+        personal_context = user_data_section("context")
+        return _section(
+            "personal_context",
+            personal_context,
+            _format_personal_context(personal_context),
+            source='get_user_data("all").context',
+        )
+
+    builders["temporal"] = temporal_section
+    builders["account"] = account_section
+    builders["preferences"] = preferences_section
+    builders["personal_context"] = personal_context_section
+    builders["schedules"] = lambda: _section(
         "schedules",
-        _build_schedule_context(schedules),
+        _build_schedule_context(user_data_section("schedules")),
         source='get_user_data("all").schedules',
     )
-    sections["tasks"] = _section("tasks", _build_task_context(user_id), source="tasks.task_service")
-    sections["checkins"] = _section(
+    builders["tasks"] = lambda: _section(
+        "tasks", _build_task_context(user_id), source="tasks.task_service"
+    )
+    builders["checkins"] = lambda: _section(
         "checkins", _build_checkin_context(user_id), source="checkins.checkin_service"
     )
-    sections["messages"] = _section(
+    builders["messages"] = lambda: _section(
         "messages",
-        _build_message_context(user_id, preferences),
+        _build_message_context(user_id, sections["preferences"].data or {}),
         source="messages.message_data_manager",
     )
-    sections["notebooks"] = _section(
+    builders["notebooks"] = lambda: _section(
         "notebooks", _build_notebook_context(user_id), source="notebook.notebook_service"
     )
-    sections["health"] = _section(
+    builders["health"] = lambda: _section(
         "health", _build_health_context(user_id), source="core.health_context_builder"
     )
-    sections["analytics"] = _section("analytics", _build_analytics_context(sections))
-    sections["conversation"] = _section(
+    builders["analytics"] = lambda: _section("analytics", _build_analytics_context(sections))
+    builders["conversation"] = lambda: _section(
         "conversation",
         _build_conversation_context(user_id, include_conversation_history),
         source="core.response_tracking",
     )
-    sections["action_catalog"] = _section(
-        "action_catalog",
-        _build_action_catalog_context(),
-        source="ai.prompts.action_catalog",
-    )
-
-    selected_sections = _select_prompt_sections(prompt_request, sections)
-    if selected_sections is not None:
-        sections = {
-            name: _replace_included(section, name in selected_sections)
-            for name, section in sections.items()
-        }
+    builders["action_catalog"] = _get_action_catalog_section
 
+    selected_sections = _select_prompt_sections(prompt_request, builders)
+    included = {
+        name: selected_sections is None or name in selected_sections for name in builders
+    }
+    version_extras = {name: (temporal.get("date"),) for name in DATE_SENSITIVE_SECTIONS}
+    version_extras["conversation"] = (include_conversation_history,)
+    cache_report: dict[str, list[str]] = {"reused": [], "rebuilt": []}
+    cache = get_context_section_cache()
+
+    def resolve(name: str) -> AIContextSection:
+        if name == "action_catalog":
+            reused = _action_catalog_section is not None
+            section = builders[name]()
+        elif cache is None:
+            section, reused = builders[name](), False
+        else:
+            section, reused = cache.get_or_build(
+                user_id, name, builders[name], version_extras.get(name, ())
+            )
+        cache_report["reused" if reused else "rebuilt"].append(name)
+        if section is None:
+            return AIContextSection(name=name, data={}, included=False)
+        if section.included != included[name]:
+            section = _replace_included(section, included[name])
+        return section
+
+    sections = _LazyDict(builders, resolve)
+    account = sections["account"].data or {}
+    preferences = sections["preferences"].data or {}
     metadata = {
         "user_id": user_id,
         "current_timestamp": now_timestamp_full(),
@@ -165,13 +289,44 @@ def build_ai_context_envelope(
         "active_channel": active_channel,
         "requested_intent": requested_intent,
         "context_version": 1,
-        "included_sections": [
-            name for name, section in sections.items() if section.included
-        ],
+        "included_sections": [name for name in builders if included[name]],
+        "section_cache": cache_report,
     }
     return AIContextEnvelope(metadata=metadata, sections=sections)
 
 
+_action_catalog_lock = threading.Lock()
+_action_catalog_section: tuple[tuple[str, ...], AIContextSection] | None = None
+
+
+@handle_errors(
+    "getting action catalog section",
+    default_return=AIContextSection(name="action_catalog", data={}, included=False),
+)
+def _get_action_catalog_section() -> AIContextSection:
+    """
+    Action catalog section, built once per process.
+
+    Rebuilt only if the set of initialized command intents changes (e.g. the
+    parser finishes initializing after the first turn).
+    """
+    global _action_catalog_section
+    from ai.prompts.command_registry import get_initialized_command_intent_names
+
+    intents = tuple(get_initialized_command_intent_names() or ())
+    cached = _action_catalog_section
+    if cached is not None and cached[0] == intents:
+        return cached[1]
+    with _action_catalog_lock:
+        section = _section(
+            "action_catalog",
+            _build_action_catalog_context(),
+            source="ai.prompts.action_catalog",
+        )
+        _action_catalog_section = (intents, section)
+    return section
+
+
 @handle_errors(
     "creating AI context section",
     default_return=AIContextSection(name="", data={}, included=False),
@@ -458,7 +613,7 @@ def _default_prompt_text(name: str, data: Any) -> str:
 
 @handle_errors("selecting prompt sections", default_return=None)
 def _select_prompt_sections(
-    prompt_request: str | None, sections: dict[str, AIContextSection]
+    prompt_request: str | None, sections: dict[str, Any]
 ) -> set[str] | None:
     """Select prompt sections relevant to the current user request."""
     if not prompt_request:
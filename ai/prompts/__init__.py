@@ -22,6 +22,11 @@ from ai.prompts.flows import (
     get_product_ai_prompt_flow,
 )
 from ai.prompts.manager import PromptManager, PromptTemplate, get_prompt_manager
+from ai.prompts.prefix_tracking import (
+    PromptPrefixTracker,
+    get_prompt_prefix_stats,
+    get_prompt_prefix_tracker,
+)
 
 __all__ = [
     "AIActionCatalog",
@@ -43,4 +48,7 @@ __all__ = [
     "PromptManager",
     "PromptTemplate",
     "get_prompt_manager",
+    "PromptPrefixTracker",
+    "get_prompt_prefix_stats",
+    "get_prompt_prefix_tracker",
 ]
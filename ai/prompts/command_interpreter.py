@@ -329,18 +329,14 @@ class CommandInterpreter:
                 include_conversation_history=False,
             )
 
+        format_instructions = self._prompt_manager.get_command_format_instructions()
         composed = self._prompt_manager.compose_product_prompt(
             "action_interpretation",
             context_view=context_view,
             action_catalog=catalog,
+            extra_instructions=format_instructions or None,
         )
-        format_instructions = self._prompt_manager.get_command_format_instructions()
-        system_sections = []
-        if composed and composed.content:
-            system_sections.append(composed.content)
-        if format_instructions:
-            system_sections.append(format_instructions)
-        system_content = "\n\n".join(system_sections)
+        system_content = composed.content if composed and composed.content else ""
         if not system_content:
             system_content = self._prompt_manager.get_prompt("command")
         if clarification:
@@ -117,6 +117,40 @@ def _extract_context_prompt_text(context_view: Any) -> str:
     return str(context_view)
 
 
+@handle_errors("checking prompt layout", default_return=True)
+def uses_stable_prompt_layout() -> bool:
+    """True when prompts are composed stable-prefix first (``AI_PROMPT_LAYOUT``)"""
+    from core import config
+
+    return getattr(config, "AI_PROMPT_LAYOUT", "stable_prefix") == "stable_prefix"
+
+
+@handle_errors("extracting layered product AI context", default_return=("", ""))
+def _extract_context_layers(context_view: Any) -> tuple[str, str]:
+    """Return (profile_text, volatile_text) from a context view."""
+    if isinstance(context_view, dict) and "profile_text" in context_view:
+        return (
+            str(context_view.get("profile_text") or ""),
+            str(context_view.get("prompt_text") or ""),
+        )
+    prompt_sections = getattr(context_view, "prompt_sections", None)
+    if isinstance(prompt_sections, dict):
+        from ai.context.service import PROFILE_PROMPT_SECTIONS
+
+        profile = [
+            str(prompt_sections[name])
+            for name in PROFILE_PROMPT_SECTIONS
+            if prompt_sections.get(name)
+        ]
+        volatile = [
+            str(text)
+            for name, text in prompt_sections.items()
+            if text and name not in PROFILE_PROMPT_SECTIONS
+        ]
+        return "\n".join(profile), "\n".join(volatile)
+    return "", _extract_context_prompt_text(context_view)
+
+
 @handle_errors("extracting product AI action summary", default_return="")
 def _extract_action_summary(context_view: Any, action_catalog: Any) -> str:
     """Return generated action capability text from a catalog or context view."""
@@ -234,14 +268,25 @@ class PromptManager:
         context_view: Any = None,
         action_catalog: Any = None,
         result_metadata: dict[str, Any] | None = None,
+        extra_instructions: str | None = None,
     ) -> PromptTemplate | None:
-        """Compose a product-AI prompt from flow categories and supplied data."""
+        """
+        Compose a product-AI prompt from flow categories and supplied data.
+
+        With the ``stable_prefix`` layout (``AI_PROMPT_LAYOUT``) the content is
+        ordered from most to least stable so the model server can reuse its
+        prompt cache: flow categories, action catalog and ``extra_instructions``
+        (identical across turns and users), then the user's profile, then
+        volatile context and result metadata. ``extra_instructions`` is appended
+        after the context in the ``legacy`` layout, as callers used to do.
+        """
         from ai.prompts.flows import (
             RUNTIME_PROMPT_CATEGORIES,
             get_product_ai_prompt_flow,
         )
 
         flow = get_product_ai_prompt_flow(flow_name)
+        stable_layout = uses_stable_prompt_layout()
         content_sections: list[str] = [f"Product AI flow: {flow.name}"]
 
         for category in flow.categories:
@@ -260,16 +305,42 @@ class PromptManager:
             if category_text:
                 content_sections.append(f"[{category}]\n{category_text}")
 
-        context_text = _extract_context_prompt_text(context_view)
+        if stable_layout and extra_instructions:
+            content_sections.append(extra_instructions)
+        layers: list[tuple[str, list[str]]] = [("instructions", content_sections)]
+
+        if stable_layout:
+            profile_text, context_text = _extract_context_layers(context_view)
+            if profile_text:
+                layers.append(("profile", ["[user_profile]\n" + profile_text]))
+        else:
+            context_text = _extract_context_prompt_text(context_view)
+        volatile: list[str] = []
         if context_text:
-            content_sections.append("[selected_user_context]\n" + context_text)
-
+            volatile.append("[selected_user_context]\n" + context_text)
         if result_metadata:
-            content_sections.append("[action_result_metadata]\n" + str(result_metadata))
+            volatile.append("[action_result_metadata]\n" + str(result_metadata))
+        if not stable_layout and extra_instructions:
+            volatile.append(extra_instructions)
+        if volatile:
+            layers.append(("volatile", volatile))
+
+        # Each layer's text carries its leading separator so the joined layers
+        # are exactly the prompt content
+        layer_texts = [
+            (name, ("\n\n" if index else "") + "\n\n".join(parts))
+            for index, (name, parts) in enumerate(layers)
+        ]
+        if context_view is not None:
+            from ai.prompts.prefix_tracking import get_prompt_prefix_tracker
+
+            tracker = get_prompt_prefix_tracker()
+            if tracker is not None:
+                tracker.record(flow.name, layer_texts)
 
         return PromptTemplate(
             name=f"product_ai_{flow.name}",
-            content="\n\n".join(content_sections),
+            content="".join(text for _, text in layer_texts),
             description=f"Composed product-AI prompt for {flow.name}",
             max_tokens=_max_tokens_for_product_flow(flow.name),
             temperature=_temperature_for_product_flow(flow.name),
@@ -0,0 +1,128 @@
+# ai/prompts/prefix_tracking.py
+
+"""Prompt-prefix reuse tracking for LM Studio's prompt (KV) cache.
+
+LM Studio keeps the evaluated tokens of the previous prompt and only
+pre-fills from the first byte that differs. With the ``stable_prefix`` prompt
+layout (``AI_PROMPT_LAYOUT``) a composed system prompt is built in layers,
+ordered from most to least stable:
+
+    instructions (persona, rules, action catalog) -> profile -> volatile context
+
+``PromptPrefixTracker`` hashes each cumulative layer boundary and compares it
+with the previous composed prompt. A layer "hits" when everything up to and
+including it is byte-identical to the previous request, which is when the
+server can reuse its cache for that part. ``get_stats`` reports per-layer
+hit rates, how many distinct instruction prefixes each flow produced (one per
+flow when the layout is stable across turns and users), and the share of
+prompt characters covered by the reused prefix.
+"""
+
+import hashlib
+import threading
+from collections.abc import Sequence
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+
+logger = get_component_logger("ai")
+
+# Distinct instruction-prefix hashes remembered per flow
+_MAX_DISTINCT_PREFIXES = 64
+
+_tracker_lock = threading.Lock()
+_tracker = None
+
+
+class PromptPrefixTracker:
+    """Counts how often each prompt layer repeats the previous request's prefix"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._previous: list[str] = []
+        self._requests = 0
+        self._layer_hits: dict[str, int] = {}
+        self._layer_seen: dict[str, int] = {}
+        self._prefixes_by_flow: dict[str, set[str]] = {}
+        self._total_chars = 0
+        self._reused_chars = 0
+
+    @handle_errors("recording prompt prefix", default_return=None)
+    def record(self, flow_name: str, layers: Sequence[tuple[str, str]]) -> None:
+        """
+        Record one composed prompt.
+
+        Args:
+            flow_name: Product-AI flow the prompt was composed for
+            layers: ``(layer_name, text)`` pairs in prompt order
+        """
+        digest = hashlib.sha256()
+        cumulative: list[str] = []
+        lengths: list[int] = []
+        length = 0
+        for _, text in layers:
+            digest.update(text.encode("utf-8"))
+            cumulative.append(digest.hexdigest())
+            length += len(text)
+            lengths.append(length)
+
+        with self._lock:
+            self._requests += 1
+            self._total_chars += length
+            reused = 0
+            matching = True
+            for index, (name, _) in enumerate(layers):
+                self._layer_seen[name] = self._layer_seen.get(name, 0) + 1
+                matching = (
+                    matching
+                    and index < len(self._previous)
+                    and self._previous[index] == cumulative[index]
+                )
+                if matching:
+                    self._layer_hits[name] = self._layer_hits.get(name, 0) + 1
+                    reused = lengths[index]
+            self._reused_chars += reused
+            self._previous = cumulative
+            if cumulative:
+                prefixes = self._prefixes_by_flow.setdefault(flow_name, set())
+                if len(prefixes) < _MAX_DISTINCT_PREFIXES:
+                    prefixes.add(cumulative[0])
+
+    @handle_errors("getting prompt prefix stats", default_return={})
+    def get_stats(self) -> dict:
+        """Per-layer hit rates, distinct instruction prefixes per flow, reused share"""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "layers": {
+                    name: {
+                        "hits": self._layer_hits.get(name, 0),
+                        "hit_rate": round(self._layer_hits.get(name, 0) / seen, 3),
+                    }
+                    for name, seen in self._layer_seen.items()
+                },
+                "distinct_instruction_prefixes": {
+                    flow: len(prefixes) for flow, prefixes in self._prefixes_by_flow.items()
+                },
+                "reused_char_ratio": (
+                    round(self._reused_chars / self._total_chars, 3) if self._total_chars else 0.0
+                ),
+            }
+
+
+@handle_errors("getting prompt prefix tracker", default_return=None)
+def get_prompt_prefix_tracker() -> PromptPrefixTracker:
+    """Process-wide tracker"""
+    global _tracker
+    if _tracker is None:
+        with _tracker_lock:
+            if _tracker is None:
+                _tracker = PromptPrefixTracker()
+    return _tracker
+
+
+@handle_errors("getting prompt prefix stats", default_return={})
+def get_prompt_prefix_stats() -> dict:
+    """Prefix reuse stats for status displays"""
+    tracker = get_prompt_prefix_tracker()
+    return tracker.get_stats() if tracker is not None else {}
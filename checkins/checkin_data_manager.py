@@ -130,6 +130,10 @@ def store_checkin_response(user_id: str, response_data: dict[str, Any]) -> None:
     envelope["updated_at"] = now_timestamp_full()
     save_json_data(envelope, log_file)
     logger.debug(f"Stored v2 checkin response for user {user_id}")
+    # Pre-generated AI messages were built from the old check-in context
+    from messages.ai_outbox import invalidate_ai_outbox
+
+    invalidate_ai_outbox(user_id)
 
 
 @handle_errors("getting recent checkins", default_return=[])
@@ -12,6 +12,7 @@ from communication.communication_channels.discord.events.protocol import (
 from core import get_user_id_by_identifier
 from core.error_handling import handle_errors
 from core.logger import get_component_logger
+from core.tracing import start_trace, trace_span
 
 discord_logger = get_component_logger("discord")
 logger = discord_logger
@@ -156,17 +157,19 @@ async def _process_identified_user_message(
     discord_logger.info(
         f"DISCORD_BOT: Calling handle_user_message for user {internal_user_id} with message: '{message.content[:50]}...'"
     )
-    response = handle_user_message(internal_user_id, message.content, "discord")
-
-    if not response.message:
-        return
-
-    send_success = await bot._send_to_channel(
-        message.channel,
-        response.message,
-        response.rich_data,
-        response.suggestions,
-    )
+    with start_trace("discord_message", channel="discord"):
+        response = handle_user_message(internal_user_id, message.content, "discord")
+
+        if not response.message:
+            return
+
+        with trace_span("delivery"):
+            send_success = await bot._send_to_channel(
+                message.channel,
+                response.message,
+                response.rich_data,
+                response.suggestions,
+            )
 
     if send_success:
         discord_logger.info(
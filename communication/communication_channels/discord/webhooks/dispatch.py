@@ -0,0 +1,299 @@
+"""
+Discord Webhook Dispatch
+
+Bounded work queue and latency metrics for the Discord webhook server.
+
+The HTTP handler verifies, parses, and acknowledges each event on the fast path,
+then hands the slow part (welcome DMs, account lookups) to a small pool of
+worker threads through ``WebhookWorkQueue``. ``WebhookLatencyMetrics`` keeps
+per-endpoint and per-event-type timing so slow handlers are visible.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.logger import get_component_logger
+from core.error_handling import handle_errors
+
+logger = get_component_logger("discord")
+
+# Latency samples kept per metric key (bounded so long-running servers stay flat)
+LATENCY_SAMPLE_LIMIT = 512
+
+
+@dataclass
+class WebhookWorkItem:
+    """A deferred webhook event waiting for a worker"""
+
+    label: str
+    func: Callable[..., Any]
+    args: tuple = ()
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+@handle_errors("calculating latency percentile", default_return=0.0)
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile from already-sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+class WebhookLatencyMetrics:
+    """Thread-safe latency and status counters keyed by endpoint or event type"""
+
+    @handle_errors("initializing webhook latency metrics", default_return=None)
+    def __init__(self, sample_limit: int = LATENCY_SAMPLE_LIMIT):
+        self._sample_limit = max(1, int(sample_limit))
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+
+    @handle_errors("recording webhook latency", default_return=None)
+    def record(self, key: str, elapsed_seconds: float, status: int | None = None):
+        """
+        Record one timing sample.
+
+        Args:
+            key: Metric key (for example ``"POST /"`` or ``"worker:APPLICATION_AUTHORIZED"``)
+            elapsed_seconds: Measured duration in seconds
+            status: Optional HTTP status code; codes >= 400 count as errors
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = {
+                    "count": 0,
+                    "errors": 0,
+                    "total": 0.0,
+                    "max": 0.0,
+                    "samples": deque(maxlen=self._sample_limit),
+                    "status_counts": {},
+                }
+                self._entries[key] = entry
+            entry["count"] += 1
+            entry["total"] += elapsed_seconds
+            entry["max"] = max(entry["max"], elapsed_seconds)
+            entry["samples"].append(elapsed_seconds)
+            if status is not None:
+                status_key = str(status)
+                entry["status_counts"][status_key] = (
+                    entry["status_counts"].get(status_key, 0) + 1
+                )
+                if status >= 400:
+                    entry["errors"] += 1
+
+    @handle_errors("building webhook latency snapshot", default_return={})
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Summarize recorded metrics.
+
+        Returns:
+            Dict keyed by metric key with count, errors, mean/p50/p95/p99/max in
+            milliseconds, and per-status counts.
+        """
+        with self._lock:
+            copied = {
+                key: (
+                    entry["count"],
+                    entry["errors"],
+                    entry["total"],
+                    entry["max"],
+                    list(entry["samples"]),
+                    dict(entry["status_counts"]),
+                )
+                for key, entry in self._entries.items()
+            }
+
+        summary: dict[str, dict[str, Any]] = {}
+        for key, (count, errors, total, max_seen, samples, statuses) in copied.items():
+            samples.sort()
+            summary[key] = {
+                "count": count,
+                "errors": errors,
+                "mean_ms": round((total / count) * 1000, 3) if count else 0.0,
+                "p50_ms": round(_percentile(samples, 0.50) * 1000, 3),
+                "p95_ms": round(_percentile(samples, 0.95) * 1000, 3),
+                "p99_ms": round(_percentile(samples, 0.99) * 1000, 3),
+                "max_ms": round(max_seen * 1000, 3),
+                "status_counts": statuses,
+            }
+        return summary
+
+    @handle_errors("resetting webhook latency metrics", default_return=None)
+    def reset(self):
+        """Clear all recorded metrics"""
+        with self._lock:
+            self._entries.clear()
+
+
+class WebhookWorkQueue:
+    """Bounded queue drained by a fixed pool of daemon worker threads"""
+
+    @handle_errors("initializing webhook work queue", default_return=None)
+    def __init__(
+        self,
+        max_size: int = 100,
+        worker_count: int = 4,
+        metrics: WebhookLatencyMetrics | None = None,
+    ):
+        """
+        Initialize the work queue.
+
+        Args:
+            max_size: Maximum number of pending items; ``submit`` rejects beyond this
+            worker_count: Number of worker threads draining the queue
+            metrics: Optional metrics sink for queue wait and handling time
+        """
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(max_size)))
+        self._worker_count = max(1, int(worker_count))
+        self._workers: list[threading.Thread] = []
+        self._running = False
+        self._lock = threading.Lock()
+        self.metrics = metrics
+        self.submitted = 0
+        self.rejected = 0
+        self.processed = 0
+        self.failed = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of pending items"""
+        return self._queue.maxsize
+
+    @handle_errors("starting webhook workers", default_return=None)
+    def start(self):
+        """Start worker threads (idempotent)"""
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._workers = []
+            for index in range(self._worker_count):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"discord-webhook-worker-{index}",
+                    daemon=True,
+                )
+                worker.start()
+                self._workers.append(worker)
+        logger.debug(f"Started {self._worker_count} Discord webhook workers")
+
+    @handle_errors("stopping webhook workers", default_return=None)
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop worker threads after pending items drain.
+
+        Args:
+            timeout: Seconds to wait for each worker to exit
+        """
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            workers = list(self._workers)
+            self._workers = []
+        for _ in workers:
+            # Sentinels go in behind pending work so queued events still run
+            self._queue.put(None)
+        for worker in workers:
+            worker.join(timeout=timeout)
+        logger.debug("Discord webhook workers stopped")
+
+    @handle_errors("submitting webhook work", default_return=False)
+    def submit(self, label: str, func: Callable[..., Any], *args) -> bool:
+        """
+        Queue deferred work without blocking.
+
+        Args:
+            label: Metric label for the work (usually the event type)
+            func: Callable to run on a worker thread
+            *args: Positional arguments for ``func``
+
+        Returns:
+            bool: True if queued, False if the queue is full or stopped
+        """
+        if not self._running:
+            return False
+        try:
+            self._queue.put_nowait(WebhookWorkItem(label=label, func=func, args=args))
+        except queue.Full:
+            with self._lock:
+                self.rejected += 1
+            logger.warning(
+                f"Webhook work queue full ({self.capacity} pending) - rejecting {label}"
+            )
+            return False
+        with self._lock:
+            self.submitted += 1
+        return True
+
+    @handle_errors("waiting for webhook queue to drain", default_return=False)
+    def wait_until_idle(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until all queued work has been processed.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if the queue drained before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._queue.unfinished_tasks == 0:
+                return True
+            time.sleep(0.01)
+        return self._queue.unfinished_tasks == 0
+
+    @handle_errors("getting webhook queue stats", default_return={})
+    def get_stats(self) -> dict[str, int]:
+        """Return queue depth and lifetime counters"""
+        return {
+            "depth": self._queue.qsize(),
+            "capacity": self.capacity,
+            "workers": len(self._workers),
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "processed": self.processed,
+            "failed": self.failed,
+        }
+
+    def _worker_loop(self):
+        """Drain queued items until a stop sentinel arrives"""
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                self._run_item(item)
+            finally:
+                self._queue.task_done()
+
+    @handle_errors("running deferred webhook work", default_return=None)
+    def _run_item(self, item: WebhookWorkItem):
+        """Run one work item and record its wait and handling time"""
+        started = time.perf_counter()
+        success = False
+        try:
+            result = item.func(*item.args)
+            success = result is not False
+        except Exception as e:
+            logger.error(f"Deferred webhook work failed for {item.label}: {e}", exc_info=True)
+        finally:
+            finished = time.perf_counter()
+            with self._lock:
+                if success:
+                    self.processed += 1
+                else:
+                    self.failed += 1
+            if self.metrics is not None:
+                self.metrics.record(f"queue_wait:{item.label}", started - item.enqueued_at)
+                self.metrics.record(
+                    f"worker:{item.label}", finished - started, 200 if success else 500
+                )
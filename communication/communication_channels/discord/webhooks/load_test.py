@@ -0,0 +1,228 @@
+"""
+Discord Webhook Load Test
+
+Local harness that replays ed25519-signed webhook payloads against the webhook
+server and reports acknowledgement latency. By default it starts its own
+``WebhookServer`` on a free localhost port with a throwaway signing key and a
+simulated slow event handler, so it never touches real user data or Discord.
+
+Usage:
+    python -m communication.communication_channels.discord.webhooks.load_test \
+        --requests 200 --concurrency 20 --handler-delay 0.5
+"""
+
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from core.logger import get_component_logger
+from core.error_handling import handle_errors
+from communication.communication_channels.discord.webhooks.dispatch import (
+    WebhookLatencyMetrics,
+)
+
+logger = get_component_logger("discord")
+
+
+@handle_errors("building sample webhook payloads", default_return=[])
+def build_sample_payloads(count: int) -> list[dict[str, Any]]:
+    """
+    Build synthetic APPLICATION_AUTHORIZED payloads.
+
+    Args:
+        count: Number of payloads to build
+
+    Returns:
+        List of webhook event dicts with distinct fake user ids
+    """
+    return [
+        {
+            "type": 1,
+            "event": {
+                "type": "APPLICATION_AUTHORIZED",
+                "data": {
+                    "user": {
+                        "id": str(900000000000000000 + index),
+                        "username": f"loadtest_user_{index}",
+                    }
+                },
+            },
+        }
+        for index in range(count)
+    ]
+
+
+@handle_errors("signing webhook payload", default_return=None)
+def sign_payload(signing_key, payload: dict[str, Any], timestamp: str | None = None):
+    """
+    Sign a payload the way Discord does (ed25519 over timestamp + body).
+
+    Args:
+        signing_key: ``nacl.signing.SigningKey``
+        payload: Webhook event dict
+        timestamp: Signature timestamp (defaults to current epoch seconds)
+
+    Returns:
+        Tuple of (body bytes, headers dict)
+    """
+    body = json.dumps(payload).encode("utf-8")
+    timestamp = timestamp or str(int(time.time()))
+    signature = signing_key.sign(timestamp.encode("utf-8") + body).signature.hex()
+    headers = {
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+        "X-Signature-Ed25519": signature,
+        "X-Signature-Timestamp": timestamp,
+    }
+    return body, headers
+
+
+def _post_signed(url: str, body: bytes, headers: dict[str, str], timeout: float):
+    """POST one signed request and return (status, elapsed seconds)"""
+    request = urllib.request.Request(url, data=body, headers=headers, method="POST")
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:  # nosec B310 — local harness URL
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception as e:
+        logger.debug(f"Webhook load test request failed: {e}")
+        status = 0
+    return status, time.perf_counter() - started
+
+
+@handle_errors("replaying signed webhook payloads", default_return={})
+def replay_signed_payloads(
+    url: str,
+    signing_key,
+    payloads: list[dict[str, Any]],
+    concurrency: int = 10,
+    timeout: float = 10.0,
+) -> dict[str, Any]:
+    """
+    Replay signed payloads concurrently against a webhook URL.
+
+    Args:
+        url: Webhook endpoint URL
+        signing_key: ``nacl.signing.SigningKey`` matching the server's public key
+        payloads: Webhook event dicts to send
+        concurrency: Number of concurrent client threads
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Dict with total wall time, requests per second, and the client-side
+        latency summary (p50/p95/p99/max and status counts)
+    """
+    signed = [sign_payload(signing_key, payload) for payload in payloads]
+    client_metrics = WebhookLatencyMetrics(sample_limit=max(1, len(signed)))
+
+    def _send(item):
+        body, headers = item
+        status, elapsed = _post_signed(url, body, headers, timeout)
+        client_metrics.record("client POST", elapsed, status)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        list(pool.map(_send, signed))
+    wall_seconds = time.perf_counter() - started
+
+    return {
+        "requests": len(signed),
+        "concurrency": concurrency,
+        "wall_seconds": round(wall_seconds, 3),
+        "requests_per_second": (
+            round(len(signed) / wall_seconds, 1) if wall_seconds > 0 else 0.0
+        ),
+        "client": client_metrics.snapshot().get("client POST", {}),
+    }
+
+
+@handle_errors("running local webhook load test", default_return={})
+def run_local_load_test(
+    request_count: int = 100,
+    concurrency: int = 10,
+    handler_delay: float = 0.2,
+    worker_count: int = 4,
+    queue_size: int = 100,
+) -> dict[str, Any]:
+    """
+    Start a local webhook server and replay signed payloads against it.
+
+    Args:
+        request_count: Number of webhook events to send
+        concurrency: Concurrent client threads
+        handler_delay: Simulated slow handler time per event (seconds)
+        worker_count: Server deferred-work threads (0 = inline handling)
+        queue_size: Server work queue bound
+
+    Returns:
+        Dict with client results plus the server's endpoint/queue metrics
+    """
+    from nacl.signing import SigningKey
+
+    from communication.communication_channels.discord.webhooks.server import (
+        WebhookServer,
+    )
+
+    signing_key = SigningKey.generate()
+
+    def _slow_handler(event_type, event_data, bot_instance=None):
+        time.sleep(handler_delay)
+        return True
+
+    server = WebhookServer(
+        port=0,
+        host="127.0.0.1",
+        worker_count=worker_count,
+        queue_size=queue_size,
+        public_key=signing_key.verify_key.encode().hex(),
+        event_handler=_slow_handler,
+    )
+    if not server.start():
+        return {}
+    try:
+        results = replay_signed_payloads(
+            f"http://127.0.0.1:{server.port}/",
+            signing_key,
+            build_sample_payloads(request_count),
+            concurrency=concurrency,
+        )
+        if server.work_queue is not None:
+            server.work_queue.wait_until_idle(
+                timeout=max(5.0, handler_delay * request_count)
+            )
+        results["server"] = server.get_metrics()
+        return results
+    finally:
+        server.stop()
+
+
+def main() -> int:
+    """Command-line entry point; prints results as JSON"""
+    parser = argparse.ArgumentParser(description="Discord webhook server load test")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--handler-delay", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queue-size", type=int, default=100)
+    args = parser.parse_args()
+
+    results = run_local_load_test(
+        request_count=args.requests,
+        concurrency=args.concurrency,
+        handler_delay=args.handler_delay,
+        worker_count=args.workers,
+        queue_size=args.queue_size,
+    )
+    print(json.dumps(results, indent=2))
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,16 +2,27 @@
 Discord Webhook Server
 
 HTTP server to receive Discord webhook events for user-installable apps.
+
+Requests are served concurrently (one thread per connection). Signature
+verification, parsing, and acknowledgement happen on the request thread;
+event handling is deferred to a bounded ``WebhookWorkQueue`` so a slow welcome
+DM never delays the next event past Discord's response deadline.
 """
 
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from core.logger import get_component_logger
 from core.error_handling import handle_errors
 from communication.communication_channels.discord.webhooks.handler import (
     parse_webhook_event,
     handle_webhook_event,
 )
+from communication.communication_channels.discord.webhooks.dispatch import (
+    WebhookLatencyMetrics,
+    WebhookWorkQueue,
+)
 
 logger = get_component_logger("discord")
 
@@ -20,6 +31,28 @@ class DiscordWebhookHandler(BaseHTTPRequestHandler):
     """HTTP request handler for Discord webhook events"""
 
     bot_instance = None  # Will be set by WebhookServer
+    work_queue = None  # WebhookWorkQueue; None means handle events inline
+    metrics = None  # WebhookLatencyMetrics; None disables timing
+    public_key = None  # Overrides DISCORD_PUBLIC_KEY when set (load testing)
+    event_handler = None  # Overrides handle_webhook_event when set (load testing)
+
+    # not_duplicate: http_handler_send_response_status_tracking
+    def send_response(self, code, message=None):
+        """Remember the response status for latency metrics"""
+        self._response_status = code
+        super().send_response(code, message)
+
+    @handle_errors("recording webhook request latency", default_return=None)
+    def _record_latency(self, started: float):
+        """Record request latency for this endpoint if metrics are enabled"""
+        if self.metrics is None:
+            return
+        path = (getattr(self, "path", "") or "/").split("?", 1)[0]
+        self.metrics.record(
+            f"{self.command} {path}",
+            time.perf_counter() - started,
+            getattr(self, "_response_status", None),
+        )
 
     @handle_errors("logging webhook message", default_return=None)
     # not_duplicate: http_handler_log_message_stub
@@ -30,6 +63,15 @@ class DiscordWebhookHandler(BaseHTTPRequestHandler):
     @handle_errors("handling webhook request", default_return=None)
     def do_POST(self):
         """Handle POST requests (Discord webhook events) - accepts any path"""
+        started = time.perf_counter()
+        try:
+            self._handle_post()
+        finally:
+            self._record_latency(started)
+
+    @handle_errors("processing webhook POST", default_return=None)
+    def _handle_post(self):
+        """Verify, parse, and acknowledge a webhook event; defer handling to workers"""
         try:
             # Read request body
             content_length = int(self.headers.get("Content-Length", 0))
@@ -49,13 +91,16 @@ class DiscordWebhookHandler(BaseHTTPRequestHandler):
             # Verify ed25519 signature using PyNaCl (Discord's recommended method)
             from core.config import DISCORD_PUBLIC_KEY
 
-            if DISCORD_PUBLIC_KEY:
+            public_key = (
+                self.public_key if self.public_key is not None else DISCORD_PUBLIC_KEY
+            )
+            if public_key:
                 try:
                     from nacl.signing import VerifyKey
                     from nacl.exceptions import BadSignatureError
 
                     # Initialize verify key from public key (hex string)
-                    verify_key = VerifyKey(bytes.fromhex(DISCORD_PUBLIC_KEY))
+                    verify_key = VerifyKey(bytes.fromhex(public_key))
 
                     # Verify signature: Discord signs timestamp + body
                     # Note: body is already bytes, decode to string then encode for verification
@@ -143,8 +188,26 @@ class DiscordWebhookHandler(BaseHTTPRequestHandler):
                 f"Received webhook event: {event_type} (numeric type={event_type_raw})"
             )
 
-            # Handle the event
-            success = handle_webhook_event(event_type, event_data, self.bot_instance)
+            event_handler = self.event_handler or handle_webhook_event
+
+            # Fast path: acknowledge now and let a worker do the slow part
+            if self.work_queue is not None:
+                if self.work_queue.submit(
+                    event_type, event_handler, event_type, event_data, self.bot_instance
+                ):
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.end_headers()
+                    self.wfile.write(json.dumps({"received": True}).encode("utf-8"))
+                else:
+                    # Queue full - 503 lets Discord retry the delivery later
+                    self.send_response(503)
+                    self.send_header("Retry-After", "1")
+                    self.end_headers()
+                return
+
+            # Handle the event inline (no work queue attached)
+            success = event_handler(event_type, event_data, self.bot_instance)
 
             # Send response
             if success:
@@ -165,10 +228,14 @@ class DiscordWebhookHandler(BaseHTTPRequestHandler):
     @handle_errors("handling GET request", default_return=None)
     def do_GET(self):
         """Handle GET requests (health check)"""
-        self.send_response(200)
-        self.send_header("Content-Type", "text/plain")
-        self.end_headers()
-        self.wfile.write(b"Discord Webhook Server - OK")
+        started = time.perf_counter()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.end_headers()
+            self.wfile.write(b"Discord Webhook Server - OK")
+        finally:
+            self._record_latency(started)
 
     @handle_errors("handling OPTIONS request", default_return=None)
     def do_OPTIONS(self):
@@ -187,33 +254,80 @@ class WebhookServer:
     """HTTP server for receiving Discord webhook events"""
 
     @handle_errors("initializing webhook server", default_return=None)
-    def __init__(self, port: int = 8080, bot_instance=None):
+    def __init__(
+        self,
+        port: int = 8080,
+        bot_instance=None,
+        worker_count: int | None = None,
+        queue_size: int | None = None,
+        host: str = "0.0.0.0",  # nosec B104 — Discord inbound webhooks need a reachable bind
+        public_key: str | None = None,
+        event_handler=None,
+    ):
         """
         Initialize webhook server.
 
         Args:
-            port: Port to listen on
+            port: Port to listen on (0 picks a free port; ``port`` is updated on start)
             bot_instance: Discord bot instance (for sending DMs)
+            worker_count: Deferred-work threads (default DISCORD_WEBHOOK_WORKERS);
+                0 handles events inline on the request thread
+            queue_size: Max pending events before 503 (default DISCORD_WEBHOOK_QUEUE_SIZE)
+            host: Interface to bind
+            public_key: Signature key override (default DISCORD_PUBLIC_KEY)
+            event_handler: Event handler override (default handle_webhook_event)
         """
+        from core.config import DISCORD_WEBHOOK_QUEUE_SIZE, DISCORD_WEBHOOK_WORKERS
+
         self.port = port
+        self.host = host
         self.server = None
         self.bot_instance = bot_instance
+        self.worker_count = (
+            DISCORD_WEBHOOK_WORKERS if worker_count is None else worker_count
+        )
+        self.queue_size = (
+            DISCORD_WEBHOOK_QUEUE_SIZE if queue_size is None else queue_size
+        )
+        self.public_key = public_key
+        self.event_handler = event_handler
+        self.metrics = WebhookLatencyMetrics()
+        self.work_queue = None
         DiscordWebhookHandler.bot_instance = bot_instance
 
     @handle_errors("starting webhook server", default_return=False)
     def start(self) -> bool:
         """Start the webhook server"""
         try:
-            self.server = HTTPServer(
-                ("0.0.0.0", self.port),  # nosec B104 — Discord inbound webhooks need a reachable bind
+            self.server = ThreadingHTTPServer(
+                (self.host, self.port),
                 DiscordWebhookHandler,
             )
+            self.server.daemon_threads = True
+            self.port = self.server.server_address[1]
+
+            if self.worker_count > 0:
+                self.work_queue = WebhookWorkQueue(
+                    max_size=self.queue_size,
+                    worker_count=self.worker_count,
+                    metrics=self.metrics,
+                )
+                self.work_queue.start()
+
             DiscordWebhookHandler.bot_instance = self.bot_instance
-            logger.info(f"Discord webhook server started on port {self.port}")
+            DiscordWebhookHandler.work_queue = self.work_queue
+            DiscordWebhookHandler.metrics = self.metrics
+            DiscordWebhookHandler.public_key = self.public_key
+            # staticmethod keeps a plain function from binding to the handler instance
+            DiscordWebhookHandler.event_handler = (
+                staticmethod(self.event_handler) if self.event_handler else None
+            )
+            logger.info(
+                f"Discord webhook server started on port {self.port} "
+                f"({self.worker_count} workers, queue size {self.queue_size})"
+            )
 
             # Start server in a separate thread
-            import threading
-
             server_thread = threading.Thread(
                 target=self.server.serve_forever, daemon=True
             )
@@ -230,4 +344,26 @@ class WebhookServer:
         if self.server:
             self.server.shutdown()
             self.server.server_close()
+            self.server = None
             logger.info("Discord webhook server stopped")
+        if self.work_queue is not None:
+            self.work_queue.stop()
+            self.work_queue = None
+        DiscordWebhookHandler.work_queue = None
+        DiscordWebhookHandler.metrics = None
+        DiscordWebhookHandler.public_key = None
+        DiscordWebhookHandler.event_handler = None
+
+    @handle_errors("getting webhook server metrics", default_return={})
+    def get_metrics(self) -> dict:
+        """
+        Get per-endpoint latency and work-queue stats.
+
+        Returns:
+            Dict with ``endpoints`` (latency summaries keyed by endpoint or
+            ``worker:``/``queue_wait:`` event type) and ``queue`` stats.
+        """
+        return {
+            "endpoints": self.metrics.snapshot(),
+            "queue": self.work_queue.get_stats() if self.work_queue else {},
+        }
@@ -10,6 +10,7 @@ from typing import Any
 
 from core.error_handling import handle_errors
 from core.logger import get_component_logger
+from core.tracing import start_trace, trace_span
 
 logger = get_component_logger("email")
 
@@ -188,13 +189,17 @@ class EmailInboundProcessor:
                 handle_user_message,
             )
 
-            response = handle_user_message(user_id, email_body, "email")
-            if response and response.message:
-                self.send_email_response(
-                    sender_email, response.message, f"Re: {email_subject}"
-                )
-            else:
-                logger.warning(f"No response generated for email from user {user_id}")
+            with start_trace("email_message", channel="email"):
+                response = handle_user_message(user_id, email_body, "email")
+                if response and response.message:
+                    with trace_span("delivery"):
+                        self.send_email_response(
+                            sender_email, response.message, f"Re: {email_subject}"
+                        )
+                else:
+                    logger.warning(
+                        f"No response generated for email from user {user_id}"
+                    )
 
         except Exception as e:
             logger.error(f"Error processing incoming email: {e}", exc_info=True)
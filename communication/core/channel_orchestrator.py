@@ -1193,6 +1193,24 @@ class CommunicationManager:
             user_id, messaging_service, recipient
         )
 
+    @handle_errors("queueing AI message pre-generation", default_return=False)
+    def queue_ai_pregeneration(
+        self, user_id: str, category: str, send_at: float
+    ) -> bool:
+        """Pre-generate a planned AI send in idle model time (see messages.ai_outbox)."""
+        from messages.ai_outbox import queue_ai_pregeneration
+
+        return queue_ai_pregeneration(user_id, category, send_at)
+
+    @handle_errors("cancelling AI message pre-generation", default_return=0)
+    def cancel_ai_pregeneration(
+        self, user_id: str, slots: list[tuple[str, float]]
+    ) -> int:
+        """Drop pre-generation for planned AI sends a replan removed (see messages.ai_outbox)."""
+        from messages.ai_outbox import cancel_ai_pregeneration
+
+        return cancel_ai_pregeneration(user_id, slots)
+
     @handle_errors("sending AI-generated message", default_return=(False, None))
     def _send_ai_generated_message(
         self,
@@ -1210,23 +1228,19 @@ class CommunicationManager:
             tuple[bool, str | None]: (success, message_content) - True if sent successfully, and the message content that was sent
         """
         try:
-            from ai.chat.chatbot import get_ai_chatbot
-            from core.config import AI_PERSONALIZED_MESSAGE_TIMEOUT
-            from core.health_signals import get_message_guidance
-            from integrations.google_health.personalization_rules import (
-                build_scheduled_message_context_prefix,
+            from messages.ai_outbox import (
+                generate_scheduled_ai_message,
+                pop_pregenerated_message,
             )
 
-            ai_bot = get_ai_chatbot()
-
-            guidance = get_message_guidance(user_id)
-            prefix = build_scheduled_message_context_prefix(guidance)
-            message_to_send = ai_bot.generate_personalized_message(
-                user_id,
-                timeout=AI_PERSONALIZED_MESSAGE_TIMEOUT,
-                prompt_prefix=prefix or None,
-                skip_cache=skip_ai_cache,
+            # Pre-generated during idle model time when available (O(1) pop)
+            message_to_send = (
+                None if skip_ai_cache else pop_pregenerated_message(user_id, category)
             )
+            if not message_to_send:
+                message_to_send = generate_scheduled_ai_message(
+                    user_id, skip_cache=skip_ai_cache
+                )
 
             message_id = str(uuid.uuid4())
 
@@ -7,7 +7,13 @@ from typing import Any
 
 from core.error_handling import handle_errors
 from core.logger import get_component_logger
-from messages.message_data_manager import get_recent_messages, load_user_messages, store_sent_message
+from messages.message_data_manager import store_sent_message
+from messages.template_index import (
+    get_message_template_index,
+    get_recent_sent_texts,
+    message_schedule_fields,
+    normalize_message_text,
+)
 from core.schedule_runtime import (
     get_current_day_names,
     get_current_time_periods_with_validation,
@@ -44,13 +50,13 @@ class PredefinedMessageDispatcher:
     def load_predefined_messages_library(
         self, user_id: str, category: str
     ) -> dict | None:
-        messages = load_user_messages(user_id, category)
-        if not messages:
+        index = get_message_template_index(user_id, category)
+        if index is None or not index.messages:
             logger.error(
                 f"MESSAGE_SELECTION_ERROR: No messages found for category {category} and user {user_id}."
             )
             return None
-        return {"messages": messages}
+        return {"messages": index.messages, "index": index}
 
     @handle_errors("filtering messages by day and period", default_return=[])
     def filter_messages_by_day_and_period(
@@ -59,47 +65,25 @@ class PredefinedMessageDispatcher:
         current_days: list[str],
         matching_periods: list[str],
     ) -> list[dict]:
-        @handle_errors(
-            "extracting message schedule fields", default_return=(["ALL"], ["ALL"])
-        )
-        def _schedule_fields(msg: dict[str, Any]) -> tuple[list[str], list[str]]:
-            schedule = msg.get("schedule")
-            if not isinstance(schedule, dict):
-                return ["ALL"], ["ALL"]
-            days = schedule.get("days")
-            periods = schedule.get("periods")
-            days_list = [d for d in (days or ["ALL"]) if isinstance(d, str)] or ["ALL"]
-            periods_list = (
-                [p for p in (periods or ["ALL"]) if isinstance(p, str)] or ["ALL"]
-            )
-            return days_list, periods_list
-
         return [
             msg
             for msg in messages
             if (
                 lambda days, periods: ("ALL" in days or any(day in days for day in current_days))
                 and ("ALL" in periods or any(period in periods for period in matching_periods))
-            )(*_schedule_fields(msg))
+            )(*message_schedule_fields(msg))
         ]
 
     @handle_errors("deduplicating candidate messages", default_return=[])
     def deduplicate_candidate_messages(
         self, user_id: str, category: str, all_messages: list[dict]
     ) -> list[dict]:
-        recent_messages = get_recent_messages(
-            user_id, category=category, limit=50, days_back=60
-        )
-        recent_content = {
-            msg.get("sent_text", "").strip().lower()
-            for msg in recent_messages
-            if msg.get("sent_text")
-        }
+        recent_content = get_recent_sent_texts(user_id, category)
 
         available_messages = []
         for msg in all_messages:
-            message_content = msg.get("text", "").strip()
-            if message_content and message_content.lower() not in recent_content:
+            message_content = normalize_message_text(msg.get("text"))
+            if message_content and message_content not in recent_content:
                 available_messages.append(msg)
 
         if not available_messages:
@@ -156,7 +140,7 @@ class PredefinedMessageDispatcher:
         return False, None
 
     @handle_errors("selecting weighted message", default_return="")
-    def select_weighted_message(self, available_messages, matching_periods):
+    def select_weighted_message(self, available_messages, matching_periods, index=None):
         if not available_messages or not isinstance(available_messages, list):
             logger.error(f"Invalid available_messages: {available_messages}")
             return ""
@@ -168,20 +152,22 @@ class PredefinedMessageDispatcher:
         if not available_messages:
             return None
 
-        specific_period_messages = []
-        all_period_messages = []
-
-        for msg in available_messages:
-            sched = msg.get("schedule") if isinstance(msg.get("schedule"), dict) else {}
-            time_periods = sched.get("periods") or ["ALL"]
-            if not isinstance(time_periods, list):
-                time_periods = ["ALL"]
-            has_specific_periods = any(period != "ALL" for period in time_periods)
-
-            if has_specific_periods:
-                specific_period_messages.append(msg)
-            else:
-                all_period_messages.append(msg)
+        if index is not None:
+            specific_period_messages, all_period_messages = index.split_by_period_weighting(
+                available_messages
+            )
+        else:
+            specific_period_messages = []
+            all_period_messages = []
+            for msg in available_messages:
+                sched = msg.get("schedule") if isinstance(msg.get("schedule"), dict) else {}
+                time_periods = sched.get("periods") or ["ALL"]
+                if not isinstance(time_periods, list):
+                    time_periods = ["ALL"]
+                if any(period != "ALL" for period in time_periods):
+                    specific_period_messages.append(msg)
+                else:
+                    all_period_messages.append(msg)
 
         if specific_period_messages and random.random() < 0.7:
             selected_message = random.choice(specific_period_messages)
@@ -224,9 +210,13 @@ class PredefinedMessageDispatcher:
                 f"MESSAGE_SELECTION: Total messages in library: {len(data['messages'])}"
             )
 
-            all_messages = self.filter_messages_by_day_and_period(
-                data["messages"], current_days, matching_periods
-            )
+            index = data.get("index")
+            if index is not None:
+                all_messages = index.candidates(current_days, matching_periods)
+            else:
+                all_messages = self.filter_messages_by_day_and_period(
+                    data["messages"], current_days, matching_periods
+                )
 
             if not all_messages:
                 logger.warning(
@@ -254,7 +244,7 @@ class PredefinedMessageDispatcher:
                 )
 
             message_to_send = self.select_weighted_message(
-                available_messages, matching_periods
+                available_messages, matching_periods, index=index
             )
             logger.debug(
                 f"Selected message for user {user_id}, category {category} from {len(available_messages)} available messages"
@@ -16,6 +16,7 @@ from typing import Any
 from dataclasses import dataclass
 from core.logger import get_component_logger
 from core.error_handling import handle_errors
+from core.tracing import traced
 from core.config import (
     AI_RULE_BASED_HIGH_CONFIDENCE_THRESHOLD,
     AI_AI_ENHANCED_CONFIDENCE_THRESHOLD,
@@ -946,6 +947,7 @@ class EnhancedCommandParser:
             ParsedCommand("unknown", {}, 0.0, ""), 0.0, "fallback"
         ),
     )
+    @traced("parse")
     def parse(self, message: str, user_id: str | None = None) -> ParsingResult:
         """
         Parse a user message into a structured command.
@@ -12,6 +12,7 @@ from typing import Any
 from ai.chat.chatbot import get_ai_chatbot
 from core.error_handling import handle_errors
 from core.logger import get_component_logger
+from core.tracing import set_trace_attribute, start_trace, traced
 from communication.command_handlers.interaction_handlers import get_all_handlers
 from communication.command_handlers.shared_types import InteractionResponse
 from communication.message_processing.command_parser import get_enhanced_command_parser
@@ -104,11 +105,13 @@ class InteractionManager:
             user_id, message_stripped, user_state, self._command_definitions
         )
         if prefix_result.response is not None:
+            set_trace_attribute("intent", "prefix_command")
             return prefix_result.response
         message = prefix_result.message if prefix_result.message is not None else message
 
         flow_result = dispatch_flow_message(user_id, message, self.command_parser)
         if flow_result.response is not None:
+            set_trace_attribute("intent", "conversation_flow")
             return flow_result.response
         if flow_result.rule_based_override is not None:
             rule_based_override = flow_result.rule_based_override
@@ -126,6 +129,7 @@ class InteractionManager:
             augment_suggestions,
         )
         if shortcut_response is not None:
+            set_trace_attribute("intent", "shortcut")
             return shortcut_response
 
         if rule_based_override is not None:
@@ -147,6 +151,7 @@ class InteractionManager:
                 f"INTERACTION_MANAGER: Handling as structured command: "
                 f"{parsing_result.parsed_command.intent}"
             )
+            set_trace_attribute("intent", parsing_result.parsed_command.intent)
             resp = self._handle_structured_command(user_id, parsing_result, channel_type)
             return augment_suggestions(parsing_result.parsed_command, resp)
 
@@ -172,15 +177,19 @@ class InteractionManager:
                     command_definitions=self._command_definitions,
                 )
                 if planned_response is not None:
+                    set_trace_attribute("intent", "action_planner")
                     return planned_response
                 partial_response = self._try_partial_structured_command(
                     user_id, parsing_result, channel_type
                 )
                 if partial_response is not None:
+                    set_trace_attribute("intent", parsing_result.parsed_command.intent)
                     return partial_response
+            set_trace_attribute("intent", "chat")
             return self._handle_contextual_chat(user_id, message, channel_type)
 
         logger.debug("No fallback to chat, returning help")
+        set_trace_attribute("intent", "help")
         return get_help_response(
             user_id,
             message,
@@ -209,6 +218,7 @@ class InteractionManager:
             True,
         ),
     )
+    @traced("command_handler")
     def _handle_structured_command(self, user_id, parsing_result, channel_type):
         """Delegate structured command handling to the shared dispatcher."""
         return dispatch_structured_command(
@@ -354,4 +364,6 @@ def get_interaction_manager() -> InteractionManager:
 def handle_user_message(
     user_id: str, message: str, channel_type: str = "discord"
 ) -> InteractionResponse:
-    return get_interaction_manager().handle_message(user_id, message, channel_type)
+    # Joins the channel handler's trace when there is one (so delivery is included)
+    with start_trace("handle_user_message", channel=channel_type):
+        return get_interaction_manager().handle_message(user_id, message, channel_type)
@@ -0,0 +1,281 @@
+# backup_blob_store.py
+"""
+Content-addressed blob store for incremental backups.
+
+Incremental backups (``BackupManager.create_backup(incremental=True)``) do not copy
+files into the backup directory. Each file's bytes are stored once under
+``data/backups/_blobs/<aa>/<sha256>`` and the backup directory holds only a
+``manifest.json`` that maps relative paths to blob hashes. Unchanged files
+(same size and mtime as in the previous incremental manifest) are referenced
+without being read again, so a backup costs roughly the bytes that changed.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from core.logger import get_component_logger
+from core.error_handling import handle_errors
+
+logger = get_component_logger("file_ops")
+
+# Directory name under the backups dir; never treated as a backup artifact
+BLOB_STORE_DIRNAME = "_blobs"
+INCREMENTAL_BACKUP_FORMAT = "incremental"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+
+@handle_errors("getting backup blob store directory", default_return=None)
+def get_blob_store_dir(backup_dir: str | Path) -> Path:
+    """Return the blob store directory for a backups directory."""
+    return Path(backup_dir) / BLOB_STORE_DIRNAME
+
+
+@handle_errors("resolving backup blob path", default_return=None)
+def blob_path_for_hash(store_dir: str | Path, digest: str) -> Path:
+    """Return the on-disk path for a blob digest (two-character fan-out)."""
+    return Path(store_dir) / digest[:2] / digest
+
+
+@handle_errors("storing backup blob", default_return=None)
+def store_file_blob(source: str | Path, store_dir: str | Path) -> tuple[str, int, bool]:
+    """
+    Hash a file and store its bytes in the blob store if not already present.
+
+    The file is read once: bytes stream into a temp file in the store while the
+    SHA-256 is computed, then the temp file is atomically renamed into place
+    (or discarded when the blob already exists).
+
+    Args:
+        source: File to store
+        store_dir: Blob store directory
+
+    Returns:
+        Tuple of (sha256 hex digest, size in bytes, True if a new blob was written)
+    """
+    store_path = Path(store_dir)
+    store_path.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, temp_name = tempfile.mkstemp(prefix=".incoming_", dir=store_path)
+    try:
+        with os.fdopen(fd, "wb") as out_file, open(source, "rb") as in_file:
+            while True:
+                chunk = in_file.read(_HASH_CHUNK_BYTES)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out_file.write(chunk)
+                size += len(chunk)
+        hex_digest = digest.hexdigest()
+        target = blob_path_for_hash(store_path, hex_digest)
+        if target.exists():
+            # Refresh mtime so a concurrent prune treats the blob as in use
+            os.utime(target)
+            return hex_digest, size, False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(temp_name, target)
+        temp_name = None
+        return hex_digest, size, True
+    finally:
+        if temp_name and os.path.exists(temp_name):
+            os.remove(temp_name)
+
+
+@handle_errors("building incremental backup file entries", default_return=({}, {}))
+def build_incremental_entries(
+    sources: Iterable[tuple[str, Path]],
+    store_dir: str | Path,
+    previous_files: dict[str, dict] | None = None,
+) -> tuple[dict[str, dict], dict[str, int]]:
+    """
+    Store changed files as blobs and build manifest entries for all sources.
+
+    Args:
+        sources: Iterable of (relative backup path, absolute source path)
+        store_dir: Blob store directory
+        previous_files: ``files`` map from the previous incremental manifest; entries
+            whose size and mtime match (and whose blob still exists) are reused
+            without reading the source file
+
+    Returns:
+        Tuple of (files map for the manifest, stats dict with file/byte counters)
+    """
+    previous_files = previous_files or {}
+    files: dict[str, dict] = {}
+    stats = {
+        "files": 0,
+        "reused_files": 0,
+        "new_blobs": 0,
+        "total_bytes": 0,
+        "new_bytes": 0,
+    }
+    for rel_path, source in sources:
+        try:
+            stat_result = source.stat()
+        except OSError as e:
+            logger.warning(f"Skipping unreadable backup source {source}: {e}")
+            continue
+        entry = {
+            "size": stat_result.st_size,
+            "mtime_ns": stat_result.st_mtime_ns,
+        }
+        previous = previous_files.get(rel_path)
+        if (
+            previous
+            and previous.get("size") == entry["size"]
+            and previous.get("mtime_ns") == entry["mtime_ns"]
+            and previous.get("sha256")
+            and blob_path_for_hash(store_dir, previous["sha256"]).is_file()
+        ):
+            entry["sha256"] = previous["sha256"]
+            os.utime(blob_path_for_hash(store_dir, previous["sha256"]))
+            stats["reused_files"] += 1
+        else:
+            stored = store_file_blob(source, store_dir)
+            if not stored:
+                logger.warning(f"Failed to store backup blob for {source}")
+                continue
+            digest, size, is_new = stored
+            entry["sha256"] = digest
+            entry["size"] = size
+            if is_new:
+                stats["new_blobs"] += 1
+                stats["new_bytes"] += size
+        files[rel_path] = entry
+        stats["files"] += 1
+        stats["total_bytes"] += entry["size"]
+    return files, stats
+
+
+@handle_errors("validating incremental backup blobs", default_return=["Blob validation failed"])
+def validate_manifest_blobs(
+    files: dict[str, dict], store_dir: str | Path, verify_hashes: bool = False
+) -> list[str]:
+    """
+    Check that every blob referenced by a manifest exists with the recorded size.
+
+    Args:
+        files: ``files`` map from an incremental manifest
+        store_dir: Blob store directory
+        verify_hashes: Also re-hash each blob (slow; reads all referenced bytes)
+
+    Returns:
+        List of error strings (empty when valid)
+    """
+    errors: list[str] = []
+    for rel_path, entry in files.items():
+        digest = entry.get("sha256", "")
+        blob = blob_path_for_hash(store_dir, digest) if digest else None
+        if blob is None or not blob.is_file():
+            errors.append(f"Missing blob for {rel_path}")
+            continue
+        if blob.stat().st_size != entry.get("size"):
+            errors.append(f"Blob size mismatch for {rel_path}")
+            continue
+        if verify_hashes:
+            hasher = hashlib.sha256()
+            with open(blob, "rb") as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+                    hasher.update(chunk)
+            if hasher.hexdigest() != digest:
+                errors.append(f"Blob hash mismatch for {rel_path}")
+    return errors
+
+
+@handle_errors("materializing incremental backup files", default_return=0)
+def materialize_manifest_files(
+    files: dict[str, dict],
+    store_dir: str | Path,
+    prefix: str,
+    destination: str | Path,
+) -> int:
+    """
+    Copy blobs for manifest paths under ``prefix/`` into ``destination/prefix/``.
+
+    Blobs are copied (not linked) so later in-place edits to restored files
+    can never corrupt the shared blob store.
+
+    Args:
+        files: ``files`` map from an incremental manifest
+        store_dir: Blob store directory
+        prefix: Top-level backup section (``users``, ``config``, ``logs``, ``code``)
+        destination: Directory that receives ``prefix/...``
+
+    Returns:
+        Number of files written
+    """
+    destination_path = Path(destination).resolve()
+    written = 0
+    prefix_with_sep = f"{prefix}/"
+    for rel_path, entry in files.items():
+        if not rel_path.startswith(prefix_with_sep):
+            continue
+        target = (destination_path / rel_path).resolve()
+        if destination_path not in target.parents:
+            logger.warning(f"Skipping manifest path outside destination: {rel_path}")
+            continue
+        blob = blob_path_for_hash(store_dir, entry.get("sha256", ""))
+        if not blob.is_file():
+            logger.warning(f"Missing blob for {rel_path}; not restored")
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(blob, target)
+        mtime_ns = entry.get("mtime_ns")
+        if mtime_ns:
+            os.utime(target, ns=(mtime_ns, mtime_ns))
+        written += 1
+    return written
+
+
+@handle_errors("pruning unreferenced backup blobs", default_return=0)
+def prune_unreferenced_blobs(
+    store_dir: str | Path,
+    referenced: set[str],
+    *,
+    grace_seconds: int = 3600,
+) -> int:
+    """
+    Delete blobs that no remaining manifest references.
+
+    Blobs newer than ``grace_seconds`` are kept so a backup that is still
+    writing blobs (manifest not yet saved) is never pruned underneath itself.
+
+    Args:
+        store_dir: Blob store directory
+        referenced: Digests referenced by surviving manifests
+        grace_seconds: Minimum blob age before it can be pruned
+
+    Returns:
+        Number of blobs removed
+    """
+    store_path = Path(store_dir)
+    if not store_path.is_dir():
+        return 0
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for fan_out in store_path.iterdir():
+        if not fan_out.is_dir():
+            continue
+        for blob in fan_out.iterdir():
+            if blob.name in referenced:
+                continue
+            try:
+                if blob.stat().st_mtime > cutoff:
+                    continue
+                blob.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to prune backup blob {blob}: {e}")
+        try:
+            if not any(fan_out.iterdir()):
+                fan_out.rmdir()
+        except OSError:
+            pass
+    if removed:
+        logger.info(f"Pruned {removed} unreferenced backup blob(s)")
+    return removed
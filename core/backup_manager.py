@@ -15,6 +15,15 @@ from core.logger import get_logger, get_component_logger
 import core.config
 from core.error_handling import handle_errors
 from core import get_user_data, get_all_user_ids
+from core.backup_blob_store import (
+    BLOB_STORE_DIRNAME,
+    INCREMENTAL_BACKUP_FORMAT,
+    build_incremental_entries,
+    get_blob_store_dir,
+    materialize_manifest_files,
+    prune_unreferenced_blobs,
+    validate_manifest_blobs,
+)
 from core.time_utilities import (
     now_timestamp_filename,
     now_timestamp_full,
@@ -29,6 +38,31 @@ backup_logger = get_component_logger("main")
 # (manifest is written at end of BackupManager.create_backup; avoid removing in-progress dirs).
 MANIFEST_LESS_BACKUP_GRACE_SECONDS = 3600
 
+# Files and directories captured by the config/code backup sections
+BACKUP_CONFIG_FILES = [".env", "requirements.txt", "user_index.json"]
+BACKUP_CODE_DIRECTORIES = [
+    "core",
+    "communication",
+    "ai",
+    "ui",
+    "tasks",
+    "user",
+    "development_tools",
+    "scripts",
+    "resources",
+    "styles",
+]
+BACKUP_CODE_ROOT_FILES = [
+    "requirements.txt",
+    "pyproject.toml",
+    "README.md",
+    "HOW_TO_RUN.md",
+    "ARCHITECTURE.md",
+    "DEVELOPMENT_WORKFLOW.md",
+    "PROJECT_VISION.md",
+    ".env.example",
+]
+
 
 # devtools: ignore[facade-shims]: backup retention helper, not a legacy compatibility re-export
 @handle_errors("cleaning up manifest-less backup directories", default_return=0)
@@ -55,6 +89,8 @@ def cleanup_manifest_less_backup_directories(
     for child in backup_path.iterdir():
         if not child.is_dir():
             continue
+        if child.name == BLOB_STORE_DIRNAME:
+            continue
         if (child / "manifest.json").is_file():
             continue
         try:
@@ -205,11 +241,66 @@ def cleanup_old_backup_artifacts(
                 logger.warning(f"Failed to remove old backup {file_path}: {e}")
 
     removed_count += cleanup_manifest_less_backup_directories(resolved_dir)
+    prune_incremental_backup_blobs(resolved_dir)
     if removed_count > 0:
         logger.info(f"Backup cleanup: removed {removed_count} old backup file(s)")
     return True
 
 
+@handle_errors("checking incremental backup setting", default_return=False)
+def _backup_incremental_enabled() -> bool:
+    """Return True when BACKUP_INCREMENTAL selects incremental backups by default."""
+    return os.getenv("BACKUP_INCREMENTAL", "false").strip().lower() in (
+        "true",
+        "1",
+        "yes",
+    )
+
+
+@handle_errors("reading backup manifest", default_return={})
+def _read_backup_manifest(backup_root: str | Path) -> dict:
+    """Load manifest.json from a backup directory ({} when missing or invalid)."""
+    manifest_path = Path(backup_root) / "manifest.json"
+    if not manifest_path.is_file():
+        return {}
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+@handle_errors("pruning incremental backup blobs", default_return=0)
+def prune_incremental_backup_blobs(backup_dir: str | Path | None = None) -> int:
+    """
+    Remove blobs no longer referenced by any incremental backup manifest.
+
+    Retention deletes whole backup directories (manifests only, for incremental
+    backups); this sweep reclaims the blob bytes those manifests were holding.
+    """
+    resolved_dir = Path(
+        backup_dir if backup_dir is not None else core.config.get_backups_dir()
+    )
+    store_dir = get_blob_store_dir(resolved_dir)
+    if not store_dir.is_dir():
+        return 0
+    referenced: set[str] = set()
+    for child in resolved_dir.iterdir():
+        if not child.is_dir() or child.name == BLOB_STORE_DIRNAME:
+            continue
+        manifest = _read_backup_manifest(child)
+        if manifest.get("format") != INCREMENTAL_BACKUP_FORMAT:
+            continue
+        for entry in (manifest.get("files") or {}).values():
+            digest = entry.get("sha256") if isinstance(entry, dict) else None
+            if digest:
+                referenced.add(digest)
+    return prune_unreferenced_blobs(
+        store_dir, referenced, grace_seconds=MANIFEST_LESS_BACKUP_GRACE_SECONDS
+    )
+
+
 class BackupManager:
     """Manages automatic backups and rollback operations."""
 
@@ -233,6 +324,8 @@ class BackupManager:
         )
         # Backups are always directory-based; legacy BACKUP_FORMAT=zip support has been removed.
         self.backup_format = "directory"
+        # Incremental (content-addressed) mode is opt-in via BACKUP_INCREMENTAL
+        self.incremental_default = _backup_incremental_enabled()
 
     @handle_errors("ensuring backup directory exists", default_return=False)
     def ensure_backup_directory(self) -> bool:
@@ -302,6 +395,169 @@ class BackupManager:
             json.dump(manifest, f, indent=2)
         return True
 
+    @handle_errors("creating incremental backup payload", default_return=False)
+    def _create_backup__create_incremental_payload(
+        self,
+        backup_dir_path: str,
+        backup_name: str,
+        include_users: bool,
+        include_config: bool,
+        include_logs: bool,
+        include_code: bool = False,
+    ) -> bool:
+        """Create a manifest-only backup whose file bytes live in the blob store."""
+        backup_root = Path(backup_dir_path)
+        if backup_root.exists():
+            if backup_root.is_file():
+                backup_root.unlink()
+            else:
+                shutil.rmtree(backup_root, ignore_errors=True)
+        backup_root.mkdir(parents=True, exist_ok=True)
+
+        previous_manifest = self._get_latest_incremental_manifest()
+        files, stats = build_incremental_entries(
+            self._iter_backup_sources(
+                include_users, include_config, include_logs, include_code
+            ),
+            get_blob_store_dir(self.backup_dir),
+            previous_files=previous_manifest.get("files") or {},
+        )
+
+        manifest = {
+            "backup_name": backup_name,
+            "created_at": now_timestamp_full(),
+            "format": INCREMENTAL_BACKUP_FORMAT,
+            "base_backup": previous_manifest.get("backup_name"),
+            "includes": {
+                "users": include_users,
+                "config": include_config,
+                "logs": include_logs,
+                "code": include_code,
+            },
+            "system_info": {
+                "total_users": len(get_all_user_ids()),
+                "backup_size": stats.get("total_bytes", 0),
+                "new_bytes": stats.get("new_bytes", 0),
+                "file_count": stats.get("files", 0),
+                "reused_files": stats.get("reused_files", 0),
+                "new_blobs": stats.get("new_blobs", 0),
+            },
+            "files": files,
+        }
+        # Manifest is written last; its presence marks the backup complete
+        temp_manifest = backup_root / "manifest.json.tmp"
+        with open(temp_manifest, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_manifest, backup_root / "manifest.json")
+        logger.info(
+            f"Incremental backup {backup_name}: {stats.get('files', 0)} files, "
+            f"{stats.get('reused_files', 0)} unchanged, "
+            f"{stats.get('new_bytes', 0)} new bytes"
+        )
+        return True
+
+    @handle_errors("finding latest incremental backup manifest", default_return={})
+    def _get_latest_incremental_manifest(self) -> dict:
+        """Return the newest incremental manifest in the backup directory ({} if none)."""
+        backup_dir_path = Path(self.backup_dir)
+        if not backup_dir_path.is_dir():
+            return {}
+        latest: dict = {}
+        for child in backup_dir_path.iterdir():
+            if not child.is_dir() or child.name == BLOB_STORE_DIRNAME:
+                continue
+            manifest = _read_backup_manifest(child)
+            if manifest.get("format") != INCREMENTAL_BACKUP_FORMAT:
+                continue
+            if str(manifest.get("created_at", "")) >= str(latest.get("created_at", "")):
+                latest = manifest
+        return latest
+
+    @handle_errors("listing backup sources", default_return=[])
+    def _iter_backup_sources(
+        self,
+        include_users: bool,
+        include_config: bool,
+        include_logs: bool,
+        include_code: bool,
+    ) -> list[tuple[str, Path]]:
+        """Return (relative backup path, source path) pairs for the selected sections."""
+        sources: list[tuple[str, Path]] = []
+        if include_users:
+            user_info_path = Path(core.config.USER_INFO_DIR_PATH)
+            if user_info_path.exists():
+                for user_dir in user_info_path.iterdir():
+                    if not user_dir.is_dir():
+                        continue
+                    for source in user_dir.rglob("*"):
+                        if source.is_file():
+                            rel = source.relative_to(user_info_path).as_posix()
+                            sources.append((f"users/{rel}", source))
+            else:
+                logger.warning(
+                    f"User data directory does not exist: {core.config.USER_INFO_DIR_PATH}"
+                )
+        if include_config:
+            base_data_path = Path(core.config.BASE_DATA_DIR)
+            for config_file in BACKUP_CONFIG_FILES:
+                config_path = base_data_path / config_file
+                if config_path.is_file():
+                    sources.append((f"config/{config_file}", config_path))
+        if include_logs:
+            for log_name, log_path in self._get_log_backup_sources():
+                if os.path.isfile(log_path):
+                    sources.append((f"logs/{log_name}", Path(log_path)))
+        if include_code:
+            project_root = self._get_project_root()
+            for rel, source in self._iter_project_code_files(project_root):
+                sources.append((f"code/{rel}", source))
+        return sources
+
+    @handle_errors("getting log backup sources", default_return=[])
+    def _get_log_backup_sources(self) -> list[tuple[str, str]]:
+        """Return (backup file name, log path) pairs for log backups."""
+        from core.config import (
+            LOG_MAIN_FILE,
+            LOG_DISCORD_FILE,
+            LOG_AI_FILE,
+            LOG_USER_ACTIVITY_FILE,
+            LOG_ERRORS_FILE,
+        )
+
+        return [
+            ("app.log", LOG_MAIN_FILE),
+            ("discord.log", LOG_DISCORD_FILE),
+            ("ai.log", LOG_AI_FILE),
+            ("user_activity.log", LOG_USER_ACTIVITY_FILE),
+            ("errors.log", LOG_ERRORS_FILE),
+        ]
+
+    @handle_errors("getting project root for code backup", default_return=Path("."))
+    def _get_project_root(self) -> Path:
+        """Return the project root used by code backups."""
+        return (
+            Path(core.config.BASE_DATA_DIR).parent
+            if hasattr(core.config, "BASE_DATA_DIR")
+            else Path(".")
+        )
+
+    @handle_errors("listing project code files", default_return=[])
+    def _iter_project_code_files(self, project_root: Path) -> list[tuple[str, Path]]:
+        """Return (relative path, source path) pairs for code backups."""
+        files: list[tuple[str, Path]] = []
+        for root_file in BACKUP_CODE_ROOT_FILES:
+            file_path = project_root / root_file
+            if file_path.exists() and file_path.is_file():
+                files.append((root_file, file_path))
+        for code_dir in BACKUP_CODE_DIRECTORIES:
+            dir_path = project_root / code_dir
+            if dir_path.exists() and dir_path.is_dir():
+                for py_file in dir_path.rglob("*.py"):
+                    if "test" in str(py_file) or "generated" in str(py_file):
+                        continue
+                    files.append((py_file.relative_to(project_root).as_posix(), py_file))
+        return files
+
     @handle_errors("cleaning up old backups", default_return=None)
     def _create_backup__cleanup_old_backups(self) -> None:
         """Clean up old backups by count and age."""
@@ -315,10 +571,14 @@ class BackupManager:
         include_config: bool = True,
         include_logs: bool = False,
         include_code: bool = False,
+        incremental: bool | None = None,
     ) -> str | None:
         """
         Create a comprehensive backup with validation.
 
+        ``incremental=True`` stores file bytes in the shared content-addressed blob
+        store and writes only a manifest per backup; ``None`` uses BACKUP_INCREMENTAL.
+
         Returns:
             Optional[str]: Path to backup file, None if failed
         """
@@ -346,6 +606,12 @@ class BackupManager:
         if not isinstance(include_code, bool):
             logger.error(f"Invalid include_code: {include_code}")
             return None
+
+        if incremental is not None and not isinstance(incremental, bool):
+            logger.error(f"Invalid incremental: {incremental}")
+            return None
+        if incremental is None:
+            incremental = self.incremental_default
         """
         Create a comprehensive backup of the system.
         
@@ -355,12 +621,18 @@ class BackupManager:
             include_config: Whether to include configuration files
             include_logs: Whether to include log files
             include_code: Whether to include project code (Python files, etc.)
+            incremental: Store blobs by content hash instead of copying trees
         
         Returns:
             Path to the backup file, or None if failed
         """
         backup_name, backup_path = self._create_backup__setup_backup(backup_name)
-        created_ok = self._create_backup__create_directory_payload(
+        create_payload = (
+            self._create_backup__create_incremental_payload
+            if incremental
+            else self._create_backup__create_directory_payload
+        )
+        created_ok = create_payload(
             backup_path,
             backup_name,
             include_users,
@@ -425,11 +697,10 @@ class BackupManager:
     @handle_errors("backing up config files to directory")
     def _backup_config_files_to_directory(self, backup_root: Path) -> None:
         """Backup configuration files to a directory payload."""
-        config_files = [".env", "requirements.txt", "user_index.json"]
         target = backup_root / "config"
         target.mkdir(parents=True, exist_ok=True)
         base_data_path = Path(core.config.BASE_DATA_DIR)
-        for config_file in config_files:
+        for config_file in BACKUP_CONFIG_FILES:
             config_path = base_data_path / config_file
             if config_path.exists() and config_path.is_file():
                 shutil.copy2(config_path, target / config_file)
@@ -437,76 +708,21 @@ class BackupManager:
     @handle_errors("backing up log files to directory")
     def _backup_log_files_to_directory(self, backup_root: Path) -> None:
         """Backup log files to a directory payload."""
-        from core.config import (
-            LOG_MAIN_FILE,
-            LOG_DISCORD_FILE,
-            LOG_AI_FILE,
-            LOG_USER_ACTIVITY_FILE,
-            LOG_ERRORS_FILE,
-        )
-        log_files = [
-            ("app.log", LOG_MAIN_FILE),
-            ("discord.log", LOG_DISCORD_FILE),
-            ("ai.log", LOG_AI_FILE),
-            ("user_activity.log", LOG_USER_ACTIVITY_FILE),
-            ("errors.log", LOG_ERRORS_FILE),
-        ]
         target = backup_root / "logs"
         target.mkdir(parents=True, exist_ok=True)
-        for log_name, log_path in log_files:
+        for log_name, log_path in self._get_log_backup_sources():
             if os.path.exists(log_path):
                 shutil.copy2(log_path, target / log_name)
 
     @handle_errors("backing up project code to directory")
     def _backup_project_code_to_directory(self, backup_root: Path) -> None:
         """Backup project code files to a directory payload."""
-        import core.config as config
-
-        project_root = (
-            Path(config.BASE_DATA_DIR).parent
-            if hasattr(config, "BASE_DATA_DIR")
-            else Path(".")
-        )
         code_root = backup_root / "code"
         code_root.mkdir(parents=True, exist_ok=True)
-        code_directories = [
-            "core",
-            "communication",
-            "ai",
-            "ui",
-            "tasks",
-            "user",
-            "development_tools",
-            "scripts",
-            "resources",
-            "styles",
-        ]
-        root_files = [
-            "requirements.txt",
-            "pyproject.toml",
-            "README.md",
-            "HOW_TO_RUN.md",
-            "ARCHITECTURE.md",
-            "DEVELOPMENT_WORKFLOW.md",
-            "PROJECT_VISION.md",
-            ".env.example",
-        ]
-        for root_file in root_files:
-            file_path = project_root / root_file
-            if file_path.exists() and file_path.is_file():
-                target = code_root / root_file
-                target.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(file_path, target)
-        for code_dir in code_directories:
-            dir_path = project_root / code_dir
-            if dir_path.exists() and dir_path.is_dir():
-                for py_file in dir_path.rglob("*.py"):
-                    if "test" in str(py_file) or "generated" in str(py_file):
-                        continue
-                    rel = py_file.relative_to(project_root)
-                    target = code_root / rel
-                    target.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(py_file, target)
+        for rel, source in self._iter_project_code_files(self._get_project_root()):
+            target = code_root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source, target)
 
     @handle_errors("checking directory backup path", default_return=False)
     def _is_directory_backup_path(self, file_path: Path) -> bool:
@@ -519,6 +735,13 @@ class BackupManager:
         path = Path(backup_path)
         if path.is_file():
             return path.stat().st_size
+        manifest = _read_backup_manifest(path) if path.is_dir() else {}
+        if manifest.get("format") == INCREMENTAL_BACKUP_FORMAT:
+            # Disk cost of an incremental backup: its manifest plus blobs it added
+            manifest_size = (path / "manifest.json").stat().st_size
+            return manifest_size + int(
+                (manifest.get("system_info") or {}).get("new_bytes", 0)
+            )
         if path.is_dir():
             total = 0
             for child in path.rglob("*"):
@@ -589,6 +812,7 @@ class BackupManager:
                         "file_size": self._get_backup_artifact_size_bytes(backup_path),
                         "created_at": manifest.get("created_at"),
                         "backup_name": manifest.get("backup_name"),
+                        "format": manifest.get("format", "directory"),
                         "includes": manifest.get("includes", {}),
                         "system_info": manifest.get("system_info", {}),
                     }
@@ -751,6 +975,10 @@ class BackupManager:
         if user_info_path.exists():
             shutil.rmtree(user_info_path, ignore_errors=True)
         self._restore_backup_subdirectory(backup_root, "users", base_dir)
+        # Restored files bypass write-through; rebuild a STORAGE_BACKEND=sqlite mirror
+        from storage.backends import resync_backend_from_files
+
+        resync_backend_from_files()
 
     @handle_errors("restoring config files from directory")
     def _restore_config_files_from_directory(self, backup_root: Path) -> None:
@@ -764,6 +992,18 @@ class BackupManager:
     ) -> None:
         """Restore one top-level backup subdirectory into the data directory."""
         base_dir.mkdir(parents=True, exist_ok=True)
+        manifest = _read_backup_manifest(backup_root)
+        if manifest.get("format") == INCREMENTAL_BACKUP_FORMAT:
+            target = base_dir / subdirectory
+            if target.exists():
+                shutil.rmtree(target, ignore_errors=True)
+            materialize_manifest_files(
+                manifest.get("files") or {},
+                get_blob_store_dir(backup_root.parent),
+                subdirectory,
+                base_dir,
+            )
+            return
         source = backup_root / subdirectory
         if not source.exists() or not source.is_dir():
             return
@@ -777,6 +1017,14 @@ class BackupManager:
         self, backup_root: Path, prefix: str, destination: Path
     ) -> int:
         """Copy files from backup_root/<prefix> to destination/<prefix>."""
+        manifest = _read_backup_manifest(backup_root)
+        if manifest.get("format") == INCREMENTAL_BACKUP_FORMAT:
+            return materialize_manifest_files(
+                manifest.get("files") or {},
+                get_blob_store_dir(backup_root.parent),
+                prefix,
+                destination,
+            )
         source_root = backup_root / prefix
         if not source_root.exists() or not source_root.is_dir():
             return 0
@@ -824,6 +1072,22 @@ class BackupManager:
             if not manifest.get("backup_name"):
                 errors.append("Manifest missing backup name")
             includes = manifest.get("includes", {})
+            if manifest.get("format") == INCREMENTAL_BACKUP_FORMAT:
+                # Manifest-level check: referenced blobs exist with recorded sizes
+                files = manifest.get("files")
+                if not isinstance(files, dict):
+                    errors.append("Incremental manifest missing files map")
+                    return errors
+                if includes.get("users", False) and not any(
+                    rel.startswith("users/") for rel in files
+                ):
+                    errors.append(
+                        "Backup manifest indicates users should be included but no user data found"
+                    )
+                errors.extend(
+                    validate_manifest_blobs(files, get_blob_store_dir(backup_root.parent))
+                )
+                return errors
             if includes.get("users", False):
                 users_root = backup_root / "users"
                 has_user_files = users_root.exists() and any(
@@ -112,6 +112,9 @@ AI_SYSTEM_PROMPT_PATH = os.getenv(
     "AI_SYSTEM_PROMPT_PATH", "resources/prompts/assistant_system_prompt.txt"
 )
 AI_USE_CUSTOM_PROMPT = os.getenv("AI_USE_CUSTOM_PROMPT", "true").lower() == "true"
+AI_PROMPT_LAYOUT = os.getenv(
+    "AI_PROMPT_LAYOUT", "stable_prefix"
+).lower()  # stable_prefix: instructions, profile, then volatile context (prompt-cache friendly); legacy
 
 
 # AI Performance Configuration
@@ -123,6 +126,27 @@ AI_CUDA_WARMUP = (
     os.getenv("AI_CUDA_WARMUP", "false").lower() == "true"
 )  # Disabled for LM Studio
 AI_CACHE_RESPONSES = os.getenv("AI_CACHE_RESPONSES", "true").lower() == "true"
+AI_CONTEXT_SECTION_CACHE = (
+    os.getenv("AI_CONTEXT_SECTION_CACHE", "true").lower() == "true"
+)  # Reuse AI context envelope sections while their source files are unchanged
+# Background CPU/memory/model-latency sampling (core/resource_monitor.py)
+AI_RESOURCE_SAMPLE_INTERVAL = float(os.getenv("AI_RESOURCE_SAMPLE_INTERVAL", "5"))
+AI_LOAD_SHEDDING_ENABLED = (
+    os.getenv("AI_LOAD_SHEDDING_ENABLED", "true").lower() == "true"
+)  # Answer with fallback responses while the local model is saturated
+AI_LOAD_SHED_LATENCY_SECONDS = float(
+    os.getenv("AI_LOAD_SHED_LATENCY_SECONDS", "25")
+)  # Smoothed LM Studio latency at which requests are shed
+# Ahead-of-time generation of scheduled AI messages (messages/ai_outbox.py)
+AI_PREGENERATION_ENABLED = (
+    os.getenv("AI_PREGENERATION_ENABLED", "true").lower() == "true"
+)  # Generate planned AI sends during idle model time
+AI_PREGENERATION_LEAD_MINUTES = float(
+    os.getenv("AI_PREGENERATION_LEAD_MINUTES", "30")
+)  # How long before the send generation may start
+AI_OUTBOX_TTL_MINUTES = float(
+    os.getenv("AI_OUTBOX_TTL_MINUTES", "120")
+)  # How long a pre-generated message stays fresh
 
 # LM Studio AI Model Configuration - Centralized Timeouts and Confidence Thresholds
 AI_CONNECTION_TEST_TIMEOUT = int(
@@ -143,6 +167,9 @@ AI_CONTEXTUAL_RESPONSE_TIMEOUT = int(
 AI_QUICK_RESPONSE_TIMEOUT = int(
     os.getenv("AI_QUICK_RESPONSE_TIMEOUT", "8")
 )  # Shorter timeout for real-time interactions
+AI_MAX_CONCURRENT_REQUESTS = int(
+    os.getenv("AI_MAX_CONCURRENT_REQUESTS", "1")
+)  # LM Studio calls in flight at once (match the server's parallel slots)
 
 # Command Parsing Confidence Thresholds
 AI_RULE_BASED_HIGH_CONFIDENCE_THRESHOLD = float(
@@ -203,6 +230,34 @@ AI_RESPONSE_CACHE_TTL = int(os.getenv("AI_RESPONSE_CACHE_TTL", "300"))  # 5 minu
 # File Organization Settings
 AUTO_CREATE_USER_DIRS = os.getenv("AUTO_CREATE_USER_DIRS", "true").lower() == "true"
 
+# Chat interaction log (core/interaction_log.py)
+CHAT_HISTORY_TAIL_SIZE = int(
+    os.getenv("CHAT_HISTORY_TAIL_SIZE", "50")
+)  # Newest interactions kept in memory per log for conversation context
+CHAT_LOG_COMPACT_DELAY_SECONDS = float(
+    os.getenv("CHAT_LOG_COMPACT_DELAY_SECONDS", "30")
+)  # Delay before appended interactions are merged into the JSON document (0 = on write)
+CHAT_INTERACTION_RETENTION_DAYS = int(
+    os.getenv("CHAT_INTERACTION_RETENTION_DAYS", "0")
+)  # Drop chat interactions older than this at compaction (0 = keep all)
+# In-memory conversation sessions (ai/context/history.py)
+CONVERSATION_HISTORY_MAX_MESSAGES = int(
+    os.getenv("CONVERSATION_HISTORY_MAX_MESSAGES", "5000")
+)  # Messages kept in memory across all users; idle users are evicted first
+
+# user_index.json maintenance (storage/user_index_deltas.py)
+USER_INDEX_FLUSH_DELAY_SECONDS = float(
+    os.getenv("USER_INDEX_FLUSH_DELAY_SECONDS", "2")
+)  # Delay before recorded lookup changes are batched into user_index.json (0 = on change)
+
+# Storage backend (storage/backends/)
+STORAGE_BACKEND = (
+    os.getenv("STORAGE_BACKEND", "json").strip().lower()
+)  # json = per-user files only; sqlite = also write through to an indexed SQLite store
+STORAGE_SQLITE_PATH = _normalize_path(
+    os.getenv("STORAGE_SQLITE_PATH", str(Path(BASE_DATA_DIR) / "mhm.sqlite3"))
+)  # SQLite database file (WAL mode) used when STORAGE_BACKEND=sqlite
+
 # Service and Flag Files Configuration
 MHM_FLAGS_DIR = os.getenv(
     "MHM_FLAGS_DIR"
@@ -227,6 +282,12 @@ LOG_BACKUP_COUNT = int(
 LOG_COMPRESS_BACKUPS = (
     os.getenv("LOG_COMPRESS_BACKUPS", "false").lower() == "true"
 )  # Compress old logs
+LOG_ARCHIVE_WORKERS = int(
+    os.getenv("LOG_ARCHIVE_WORKERS", "2")
+)  # Background threads that move/compress rotated logs (0 = inline)
+LOG_ARCHIVE_MAX_TOTAL_MB = float(
+    os.getenv("LOG_ARCHIVE_MAX_TOTAL_MB", "500")
+)  # Archive directory size budget; oldest archives are evicted first (0 = unlimited)
 
 # New organized logging structure
 # In test mode, route all logs to tests/logs/ instead of logs/
@@ -285,6 +346,23 @@ LOG_AI_DEV_TOOLS_FILE = _normalize_path(
     os.getenv("LOG_AI_DEV_TOOLS_FILE", str(Path(LOGS_DIR) / "ai_dev_tools.log"))
 )  # AI development tools log
 
+# Hot-path tracing of inbound message handling (core/tracing.py)
+HOT_PATH_TRACING_ENABLED = (
+    os.getenv("HOT_PATH_TRACING_ENABLED", "false").lower() == "true"
+)  # Off by default; disabled spans cost one context lookup
+HOT_PATH_TRACE_SAMPLE_RATE = float(
+    os.getenv("HOT_PATH_TRACE_SAMPLE_RATE", "1.0")
+)  # Fraction of inbound messages traced when enabled (0.0-1.0)
+HOT_PATH_TRACE_BUFFER_SIZE = int(
+    os.getenv("HOT_PATH_TRACE_BUFFER_SIZE", "200")
+)  # Recent traces kept in the in-memory ring buffer
+HOT_PATH_TRACE_EXPORT_FILE = _normalize_path(
+    os.getenv("HOT_PATH_TRACE_EXPORT_FILE", str(Path(LOGS_DIR) / "hot_path_traces.json"))
+)  # JSON snapshot read by the admin UI health report
+HOT_PATH_TRACE_EXPORT_INTERVAL_SECONDS = float(
+    os.getenv("HOT_PATH_TRACE_EXPORT_INTERVAL_SECONDS", "30")
+)  # Minimum seconds between snapshot exports (0 = after every trace)
+
 # Stdlib logger avoids importing core.logger while config constants are initialized
 # (get_component_logger pulls paths from this module; bootstrap order matters).
 logger = logging.getLogger("mhm.main")
@@ -314,6 +392,12 @@ DISCORD_PUBLIC_KEY = os.getenv(
 DISCORD_WEBHOOK_PORT = int(
     os.getenv("DISCORD_WEBHOOK_PORT", "8080")
 )  # Port for webhook server
+DISCORD_WEBHOOK_WORKERS = int(
+    os.getenv("DISCORD_WEBHOOK_WORKERS", "4")
+)  # Deferred webhook event workers (0 = handle inline on the request thread)
+DISCORD_WEBHOOK_QUEUE_SIZE = int(
+    os.getenv("DISCORD_WEBHOOK_QUEUE_SIZE", "100")
+)  # Pending webhook events before the server answers 503
 # Auto-launch ngrok for webhook tunneling (development only)
 DISCORD_AUTO_NGROK = os.getenv("DISCORD_AUTO_NGROK", "false").lower() in (
     "true",
@@ -376,6 +460,8 @@ def get_channel_class_mapping() -> dict[str, str]:
 
 # Scheduler Configuration
 SCHEDULER_INTERVAL = int(os.getenv("SCHEDULER_INTERVAL", "60"))
+# Worker processes for per-user scheduling (0 or 1 = single scheduler thread)
+SCHEDULER_SHARDS = int(os.getenv("SCHEDULER_SHARDS", "0"))
 
 # Google Health API (read-only wellness integration)
 @handle_errors("checking google health enabled flag", default_return=False)
@@ -425,6 +511,13 @@ GOOGLE_HEALTH_SYNC_FAILURE_PAUSE_THRESHOLD = int(
 GOOGLE_HEALTH_OAUTH_CALLBACK_TIMEOUT_SECONDS = int(
     os.getenv("GOOGLE_HEALTH_OAUTH_CALLBACK_TIMEOUT_SECONDS", "300")
 )
+# Users synced in parallel per sync run, and data types fetched in parallel per user
+GOOGLE_HEALTH_SYNC_CONCURRENCY = int(os.getenv("GOOGLE_HEALTH_SYNC_CONCURRENCY", "4"))
+GOOGLE_HEALTH_FETCH_CONCURRENCY = int(os.getenv("GOOGLE_HEALTH_FETCH_CONCURRENCY", "5"))
+# Longest a single API request may wait on 429 Retry-After before it fails
+GOOGLE_HEALTH_RATE_LIMIT_MAX_WAIT_SECONDS = float(
+    os.getenv("GOOGLE_HEALTH_RATE_LIMIT_MAX_WAIT_SECONDS", "60")
+)
 GOOGLE_HEALTH_TOKEN_ENCRYPTION_KEY = os.getenv(
     "GOOGLE_HEALTH_TOKEN_ENCRYPTION_KEY", ""
 ).strip()
@@ -517,6 +610,25 @@ def validate_ai_configuration() -> tuple[bool, list[str], list[str]]:
                 "AI_TIMEOUT_SECONDS is very high (> 5 minutes), may cause long waits"
             )
 
+        if AI_RESOURCE_SAMPLE_INTERVAL < 0.5:
+            errors.append("AI_RESOURCE_SAMPLE_INTERVAL must be at least 0.5 seconds")
+        if AI_LOAD_SHED_LATENCY_SECONDS <= 0:
+            errors.append("AI_LOAD_SHED_LATENCY_SECONDS must be greater than 0")
+        if AI_MAX_CONCURRENT_REQUESTS < 1:
+            errors.append("AI_MAX_CONCURRENT_REQUESTS must be at least 1")
+        if AI_PREGENERATION_LEAD_MINUTES <= 0:
+            errors.append("AI_PREGENERATION_LEAD_MINUTES must be greater than 0")
+        if AI_OUTBOX_TTL_MINUTES <= 0:
+            errors.append("AI_OUTBOX_TTL_MINUTES must be greater than 0")
+        elif AI_OUTBOX_TTL_MINUTES < AI_PREGENERATION_LEAD_MINUTES:
+            warnings.append(
+                "AI_OUTBOX_TTL_MINUTES is shorter than AI_PREGENERATION_LEAD_MINUTES; "
+                "pre-generated messages may expire before their send"
+            )
+
+        if AI_PROMPT_LAYOUT not in ("stable_prefix", "legacy"):
+            errors.append("AI_PROMPT_LAYOUT must be 'stable_prefix' or 'legacy'")
+
         if AI_BATCH_SIZE < 1:
             errors.append("AI_BATCH_SIZE must be at least 1")
         elif AI_BATCH_SIZE > 20:
@@ -649,6 +761,13 @@ def validate_google_health_configuration() -> tuple[bool, list[str], list[str]]:
     if GOOGLE_HEALTH_TOKEN_REFRESH_MARGIN_MINUTES < 1:
         errors.append("GOOGLE_HEALTH_TOKEN_REFRESH_MARGIN_MINUTES must be at least 1")
 
+    if GOOGLE_HEALTH_SYNC_CONCURRENCY < 1:
+        errors.append("GOOGLE_HEALTH_SYNC_CONCURRENCY must be at least 1")
+    if GOOGLE_HEALTH_FETCH_CONCURRENCY < 1:
+        errors.append("GOOGLE_HEALTH_FETCH_CONCURRENCY must be at least 1")
+    if GOOGLE_HEALTH_RATE_LIMIT_MAX_WAIT_SECONDS < 0:
+        errors.append("GOOGLE_HEALTH_RATE_LIMIT_MAX_WAIT_SECONDS cannot be negative")
+
     if "include_granted_scopes" in GOOGLE_HEALTH_SCOPES.lower():
         warnings.append(
             "Do not embed include_granted_scopes in GOOGLE_HEALTH_SCOPES — "
@@ -742,6 +861,17 @@ def validate_logging_configuration() -> tuple[bool, list[str], list[str]]:
                 f"LOG_BACKUP_COUNT ({LOG_BACKUP_COUNT}) is very high, consider reducing"
             )
 
+        if LOG_ARCHIVE_WORKERS < 0:
+            errors.append("LOG_ARCHIVE_WORKERS must be 0 or greater")
+        if LOG_ARCHIVE_MAX_TOTAL_MB < 0:
+            errors.append("LOG_ARCHIVE_MAX_TOTAL_MB must be 0 or greater")
+        if not 0.0 <= HOT_PATH_TRACE_SAMPLE_RATE <= 1.0:
+            errors.append("HOT_PATH_TRACE_SAMPLE_RATE must be between 0.0 and 1.0")
+        if HOT_PATH_TRACE_BUFFER_SIZE < 1:
+            errors.append("HOT_PATH_TRACE_BUFFER_SIZE must be at least 1")
+        if HOT_PATH_TRACE_EXPORT_INTERVAL_SECONDS < 0:
+            errors.append("HOT_PATH_TRACE_EXPORT_INTERVAL_SECONDS must be 0 or greater")
+
         # Check current log file size if it exists
         if os.path.exists(LOG_MAIN_FILE):
             current_size = os.path.getsize(LOG_MAIN_FILE)
@@ -778,6 +908,13 @@ def validate_scheduler_configuration() -> tuple[bool, list[str], list[str]]:
                 "SCHEDULER_INTERVAL is very high (> 1 hour), may cause delayed responses"
             )
 
+        if SCHEDULER_SHARDS < 0:
+            errors.append("SCHEDULER_SHARDS must be 0 or greater")
+        elif SCHEDULER_SHARDS > (os.cpu_count() or 1) * 2:
+            warnings.append(
+                "SCHEDULER_SHARDS is more than twice the CPU count; extra shards add overhead without parallelism"
+            )
+
         return len(errors) == 0, errors, warnings
     except Exception as e:
         logger.error(f"Error validating scheduler configuration: {e}")
@@ -797,6 +934,19 @@ def validate_file_organization_settings() -> tuple[bool, list[str], list[str]]:
         if not isinstance(AUTO_CREATE_USER_DIRS, bool):
             errors.append("AUTO_CREATE_USER_DIRS must be a boolean value")
 
+        if CHAT_HISTORY_TAIL_SIZE < 1:
+            errors.append("CHAT_HISTORY_TAIL_SIZE must be at least 1")
+        if CHAT_LOG_COMPACT_DELAY_SECONDS < 0:
+            errors.append("CHAT_LOG_COMPACT_DELAY_SECONDS must not be negative")
+        if CHAT_INTERACTION_RETENTION_DAYS < 0:
+            errors.append("CHAT_INTERACTION_RETENTION_DAYS must not be negative")
+        if CONVERSATION_HISTORY_MAX_MESSAGES < 1:
+            errors.append("CONVERSATION_HISTORY_MAX_MESSAGES must be at least 1")
+        if USER_INDEX_FLUSH_DELAY_SECONDS < 0:
+            errors.append("USER_INDEX_FLUSH_DELAY_SECONDS must not be negative")
+        if STORAGE_BACKEND not in ("json", "sqlite"):
+            errors.append("STORAGE_BACKEND must be 'json' or 'sqlite'")
+
         # Check for potential conflicts
         if AUTO_CREATE_USER_DIRS:
             warnings.append(
@@ -38,7 +38,12 @@ def _thread_lock_for(path: str) -> threading.Lock:
 if sys.platform == "win32":
 
     @contextmanager
-    def file_lock(file_path: str, timeout: float = 30.0, retry_interval: float = 0.1):
+    def file_lock(
+        file_path: str,
+        timeout: float = 30.0,
+        retry_interval: float = 0.1,
+        remove_on_release: bool = False,
+    ):
         """
         Context manager for file locking on Windows.
 
@@ -49,6 +54,8 @@ if sys.platform == "win32":
             file_path: Path to the file to lock
             timeout: Maximum time to wait for lock (seconds)
             retry_interval: Time between lock attempts (seconds)
+            remove_on_release: Delete ``file_path`` before releasing (for files
+                that exist only to be locked)
 
         Yields:
             File handle (opened in 'r+b' mode)
@@ -106,6 +113,9 @@ if sys.platform == "win32":
             lock_file_path.touch(exist_ok=True)
             with open(lock_file_path, "r+b") as file_handle:
                 yield file_handle
+            if remove_on_release:
+                with suppress(OSError):
+                    lock_file_path.unlink()
 
         finally:
             # Release lock by removing lock file
@@ -117,18 +127,36 @@ else:
     # Unix/Linux file locking using fcntl
     import fcntl
 
+    @handle_errors("checking lock file identity", user_friendly=False, default_return=False)
+    def _lock_file_replaced(file_handle, lock_file_path: Path) -> bool:
+        """True when ``lock_file_path`` no longer names the file behind ``file_handle``"""
+        try:
+            current = os.stat(lock_file_path)
+        except FileNotFoundError:
+            return True
+        held = os.fstat(file_handle.fileno())
+        return (current.st_dev, current.st_ino) != (held.st_dev, held.st_ino)
+
     @contextmanager
-    def file_lock(file_path: str, timeout: float = 30.0, retry_interval: float = 0.1):
+    def file_lock(
+        file_path: str,
+        timeout: float = 30.0,
+        retry_interval: float = 0.1,
+        remove_on_release: bool = False,
+    ):
         """
         Context manager for file locking on Unix/Linux.
 
         Uses fcntl.flock() to acquire an exclusive lock on a file.
-        Retries if the file is locked by another process.
+        Retries if the file is locked by another process, or if the file was
+        deleted or replaced while waiting (the lock would then exclude nobody).
 
         Args:
             file_path: Path to the file to lock
             timeout: Maximum time to wait for lock (seconds)
             retry_interval: Time between lock attempts (seconds)
+            remove_on_release: Delete ``file_path`` before releasing (for files
+                that exist only to be locked)
 
         Yields:
             File handle (opened in 'r+b' mode for locking)
@@ -169,9 +197,17 @@ else:
                                 time.sleep(retry_interval)
                                 continue
 
+                        if _lock_file_replaced(file_handle, lock_file_path):
+                            fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
+                            lock_file_path.touch(exist_ok=True)
+                            continue
+
                         try:
                             yield file_handle
                         finally:
+                            if remove_on_release:
+                                with suppress(OSError):
+                                    lock_file_path.unlink()
                             with suppress(OSError):
                                 fcntl.flock(file_handle.fileno(), fcntl.LOCK_UN)
                     return
@@ -127,6 +127,20 @@ def determine_file_path(file_type, identifier):
     return str(path)
 
 
+# ERROR_HANDLING_EXCLUDE: stat helper for per-message cache checks; a missing file is a valid version.
+def file_signature(path: str) -> tuple:
+    """
+    Cache version of a file: (path, mtime_ns, size, inode), or (path, None)
+    when it does not exist. The inode catches atomic replaces that keep size
+    and mtime.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (path, None)
+    return (path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
 @handle_errors("loading JSON data", default_return={})
 def load_json_data(file_path):
     """
@@ -294,6 +308,10 @@ def save_json_data(data, file_path):
                 _record_created(str(file_path), reason="save_json_data")
         except Exception:
             pass
+        # STORAGE_BACKEND=sqlite mirrors user documents into the indexed store
+        from storage.backends import record_document_write
+
+        record_document_write(str(file_path), data)
         return True
     except Exception as e:
         # Clean up temp file if it exists and wasn't successfully moved/replaced
@@ -0,0 +1,398 @@
+# interaction_log.py
+"""
+Append-only interaction logs with a bounded in-memory tail.
+
+Chat interactions (and generic ``{type}_log`` responses) used to be stored by
+loading the whole JSON document, appending one row and rewriting it, and every
+chat turn's conversation context loaded and sorted the whole document again.
+This module splits each log in two files:
+
+- the canonical v2 JSON document (for example ``chat_interactions.json``),
+  which exports, summaries and the admin UI keep reading, and
+- a JSONL journal beside it (``chat_interactions.jsonl``). A write appends
+  one line under ``core.file_locking.file_lock``.
+
+A background compaction merges the journal into the document
+``CHAT_LOG_COMPACT_DELAY_SECONDS`` after the first pending append, applies
+retention, and truncates the journal. Documents are wrapped in the chat
+interactions envelope, except the logs named in ``_DOCUMENT_TYPES`` (the
+conversation session log), which have their own envelope. With a delay of 0 the merge happens on
+every write. Readers always see document plus journal, so pending rows are
+never lost, including across restarts.
+
+Each log also keeps the newest ``CHAT_HISTORY_TAIL_SIZE`` rows in memory, in
+the order ``get_recent_responses`` returns them (newest first, ties in write
+order). The writer keeps the tail warm, so ``recent_interactions`` serves up to that many
+rows without touching disk. The tail is validated against an ``os.stat``
+signature of both files; a write from another process (the admin UI) or a
+direct edit of the document reseeds it on the next read. At most
+``MAX_CACHED_TAILS`` tails are kept, so memory stays flat with many users.
+"""
+
+import bisect
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any
+
+from core.error_handling import handle_errors
+from core.file_operations import file_signature
+from core.logger import get_component_logger
+
+logger = get_component_logger("user_activity")
+
+# Logs whose tail stays in memory; the least recently used tail is dropped first
+MAX_CACHED_TAILS = 256
+
+_tails_lock = threading.Lock()
+# document path -> _LogTail, least recently used first
+_tails: "OrderedDict[str, _LogTail]" = OrderedDict()
+# document path -> pending compaction timer
+_pending_compactions: dict[str, threading.Timer] = {}
+
+# Document file name -> profile v2 document type; other logs are chat interactions
+_DOCUMENT_TYPES = {"conversation_history.json": "conversation_history"}
+# Profile v2 document type -> key of the row list in its envelope
+_ROWS_KEYS = {"chat_interactions": "interactions", "conversation_history": "events"}
+
+
+@handle_errors("getting interaction journal path", default_return="")
+def journal_path_for(log_file: str) -> str:
+    """JSONL journal path beside a log document (``x.json`` -> ``x.jsonl``)"""
+    root, _ = os.path.splitext(log_file)
+    return f"{root}.jsonl"
+
+
+@handle_errors("getting interaction log signature", default_return=None)
+def interaction_log_signature(log_file: str) -> tuple:
+    """
+    Combined signature of a log document and its journal.
+
+    The journal part leaves out mtime: ``file_lock`` touches the file it locks,
+    and the journal only ever grows or is truncated while the document is
+    replaced, so size and inode identify its content.
+    """
+    journal_path = journal_path_for(log_file)
+    try:
+        stat = os.stat(journal_path)
+        journal = (journal_path, stat.st_size, stat.st_ino)
+    except OSError:
+        journal = (journal_path, None)
+    return (file_signature(log_file), journal)
+
+
+@handle_errors("getting interaction sort key", default_return=0.0)
+def _sort_key(row: Any) -> float:
+    from core.time_utilities import timestamp_sort_key_from_dict
+
+    return timestamp_sort_key_from_dict(row, "timestamp")
+
+
+@handle_errors("getting interaction tail size", default_return=50)
+def _tail_size() -> int:
+    from core import config
+
+    return max(1, int(config.CHAT_HISTORY_TAIL_SIZE))
+
+
+class _LogTail:
+    """Newest rows of one log, newest first (ties keep write order)"""
+
+    def __init__(self, signature: tuple, rows: list[dict[str, Any]], size: int):
+        ordered = sorted(rows, key=_sort_key, reverse=True)
+        self.signature = signature
+        self.size = size
+        self.total = len(ordered)
+        self.rows = ordered[:size]
+        # Negated keys so the list is ascending for bisect
+        self._neg_keys = [-_sort_key(row) for row in self.rows]
+
+    def add(self, row: dict[str, Any]) -> None:
+        """Insert a newly written row (after existing rows with the same key)"""
+        neg_key = -_sort_key(row)
+        position = bisect.bisect_right(self._neg_keys, neg_key)
+        self.total += 1
+        if position >= self.size:
+            return
+        self._neg_keys.insert(position, neg_key)
+        self.rows.insert(position, row)
+        if len(self.rows) > self.size:
+            self.rows.pop()
+            self._neg_keys.pop()
+
+    def serves(self, limit: int) -> bool:
+        return limit <= len(self.rows) or self.total == len(self.rows)
+
+
+@handle_errors("caching interaction log tail", default_return=None)
+def _remember_tail(log_file: str, tail: "_LogTail") -> None:
+    """Store a tail as most recently used; the caller holds ``_tails_lock``"""
+    _tails[log_file] = tail
+    _tails.move_to_end(log_file)
+    while len(_tails) > MAX_CACHED_TAILS:
+        _tails.popitem(last=False)
+
+
+@handle_errors("reading interaction journal", default_return=[])
+def _read_journal(journal_path: str) -> list[dict[str, Any]]:
+    """Rows appended to a journal; a torn last line from a crash is skipped"""
+    if not os.path.exists(journal_path):
+        return []
+    rows: list[dict[str, Any]] = []
+    with open(journal_path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable line {line_number} in {journal_path}")
+                continue
+            if isinstance(row, dict):
+                rows.append(row)
+    return rows
+
+
+@handle_errors("getting interaction log document type", default_return="chat_interactions")
+def _document_type(log_file: str) -> str:
+    """Profile v2 document type of a log document"""
+    return _DOCUMENT_TYPES.get(os.path.basename(log_file), "chat_interactions")
+
+
+@handle_errors("loading interaction log document", default_return=[])
+def _load_document_rows(log_file: str) -> list[dict[str, Any]]:
+    from core.file_operations import load_json_data
+    from core.profile_v2_io import prepare_profile_raw_on_load
+
+    if not os.path.exists(log_file):
+        return []
+    rows = prepare_profile_raw_on_load(_document_type(log_file), load_json_data(log_file))
+    return rows if isinstance(rows, list) else []
+
+
+@handle_errors("loading interaction log", default_return=[])
+def load_all_interactions(log_file: str) -> list[dict[str, Any]]:
+    """Every row of a log (document rows, then pending journal rows), unsorted"""
+    return _load_document_rows(log_file) + _read_journal(journal_path_for(log_file))
+
+
+@handle_errors("seeding interaction log tail", default_return=None)
+def _seed_tail(log_file: str) -> "_LogTail | None":
+    """Load document and journal under the journal lock and cache their tail"""
+    from core.file_locking import file_lock
+
+    journal_path = journal_path_for(log_file)
+    if not os.path.exists(log_file) and not os.path.exists(journal_path):
+        tail = _LogTail(interaction_log_signature(log_file), [], _tail_size())
+    else:
+        with file_lock(journal_path):
+            signature = interaction_log_signature(log_file)
+            tail = _LogTail(signature, load_all_interactions(log_file), _tail_size())
+    with _tails_lock:
+        _remember_tail(log_file, tail)
+    return tail
+
+
+@handle_errors("reading recent interactions", default_return=[])
+def recent_interactions(log_file: str, limit: int) -> list[dict[str, Any]]:
+    """
+    Newest ``limit`` rows of a log, newest first.
+
+    Served from the in-memory tail while both files are unchanged and
+    ``limit`` fits in it; otherwise the log is reloaded once.
+    """
+    if limit <= 0:
+        return []
+    signature = interaction_log_signature(log_file)
+    with _tails_lock:
+        tail = _tails.get(log_file)
+        if tail is not None and tail.signature == signature and tail.serves(limit):
+            _tails.move_to_end(log_file)
+            return [dict(row) for row in tail.rows[:limit]]
+
+    if limit <= _tail_size():
+        tail = _seed_tail(log_file)
+        if tail is not None:
+            with _tails_lock:
+                return [dict(row) for row in tail.rows[:limit]]
+
+    # More rows than the tail keeps
+    rows = sorted(load_all_interactions(log_file), key=_sort_key, reverse=True)
+    return rows[:limit]
+
+
+@handle_errors("appending interaction", default_return=False)
+def append_interaction(log_file: str, row: dict[str, Any], retention_days: int = 0) -> bool:
+    """
+    Append one row to a log's journal and schedule its compaction.
+
+    Args:
+        log_file: Path of the canonical JSON document
+        row: Row to store (must already carry its ``timestamp``)
+        retention_days: Age past which compaction drops rows (0 keeps all)
+
+    Returns:
+        bool: True if the row was written
+    """
+    from core import config
+    from core.file_locking import file_lock
+
+    journal_path = journal_path_for(log_file)
+    line = json.dumps(row, ensure_ascii=False, default=str) + "\n"
+    with file_lock(journal_path):
+        previous_signature = interaction_log_signature(log_file)
+        with open(journal_path, "a", encoding="utf-8") as handle:
+            handle.write(line)
+            handle.flush()
+            os.fsync(handle.fileno())
+        signature = interaction_log_signature(log_file)
+        with _tails_lock:
+            tail = _tails.get(log_file)
+            if tail is not None and tail.signature == previous_signature:
+                tail.add(dict(row))
+                tail.signature = signature
+            elif tail is not None:
+                del _tails[log_file]
+
+        from storage.backends import record_log_append
+
+        record_log_append(log_file, row)
+        if config.CHAT_LOG_COMPACT_DELAY_SECONDS <= 0:
+            _compact_locked(log_file, retention_days)
+            return True
+
+    _schedule_compaction(log_file, config.CHAT_LOG_COMPACT_DELAY_SECONDS, retention_days)
+    return True
+
+
+@handle_errors("scheduling interaction log compaction", default_return=None)
+def _schedule_compaction(log_file: str, delay: float, retention_days: int) -> None:
+    with _tails_lock:
+        if log_file in _pending_compactions:
+            return
+        timer = threading.Timer(
+            delay, _run_scheduled_compaction, args=(log_file, retention_days)
+        )
+        timer.daemon = True
+        _pending_compactions[log_file] = timer
+    timer.start()
+
+
+@handle_errors("running scheduled interaction log compaction", default_return=None)
+def _run_scheduled_compaction(log_file: str, retention_days: int) -> None:
+    with _tails_lock:
+        _pending_compactions.pop(log_file, None)
+    compact_interaction_log(log_file, retention_days)
+
+
+@handle_errors("compacting interaction log", default_return=False)
+def compact_interaction_log(log_file: str, retention_days: int = 0) -> bool:
+    """Merge a log's journal into its document now"""
+    from core.file_locking import file_lock
+
+    journal_path = journal_path_for(log_file)
+    if not os.path.exists(journal_path):
+        return True
+    with file_lock(journal_path):
+        return _compact_locked(log_file, retention_days)
+
+
+@handle_errors("compacting interaction log", default_return=False)
+def _compact_locked(log_file: str, retention_days: int) -> bool:
+    """Compaction body; the caller holds the journal lock"""
+    from core.file_operations import save_json_data
+    from core.profile_v2_io import (
+        wrap_chat_interactions_for_save,
+        wrap_conversation_history_for_save,
+    )
+
+    journal_path = journal_path_for(log_file)
+    pending = _read_journal(journal_path)
+    rows = _load_document_rows(log_file)
+    if not pending and (not retention_days or not rows):
+        return True
+    rows.extend(pending)
+
+    if retention_days > 0:
+        cutoff = (datetime.now() - timedelta(days=retention_days)).timestamp()
+        kept = [row for row in rows if not 0.0 < _sort_key(row) < cutoff]
+        if len(kept) != len(rows):
+            logger.info(
+                f"Dropped {len(rows) - len(kept)} interactions older than "
+                f"{retention_days} days from {log_file}"
+            )
+        rows = kept
+
+    document_type = _document_type(log_file)
+    if document_type == "conversation_history":
+        document = wrap_conversation_history_for_save(rows)
+    else:
+        document = wrap_chat_interactions_for_save(rows)
+    if not save_json_data(document, log_file):
+        logger.warning(f"Could not compact {journal_path}; keeping journal")
+        return False
+    with open(journal_path, "w", encoding="utf-8"):
+        pass
+
+    merged = document.get(_ROWS_KEYS[document_type]) if isinstance(document, dict) else None
+    with _tails_lock:
+        _remember_tail(
+            log_file,
+            _LogTail(
+                interaction_log_signature(log_file),
+                merged if isinstance(merged, list) else rows,
+                _tail_size(),
+            ),
+        )
+    if pending:
+        logger.debug(f"Compacted {len(pending)} interactions into {log_file}")
+    return True
+
+
+@handle_errors("flushing interaction log", default_return=False)
+def flush_interaction_log(log_file: str, retention_days: int = 0) -> bool:
+    """Compact now and cancel any pending timer (before reading the document directly)"""
+    with _tails_lock:
+        timer = _pending_compactions.pop(log_file, None)
+    if timer is not None:
+        timer.cancel()
+    return compact_interaction_log(log_file, retention_days)
+
+
+@handle_errors("flushing interaction logs", default_return=0)
+def flush_all_interaction_logs() -> int:
+    """Compact every log with a pending compaction; returns how many were flushed"""
+    with _tails_lock:
+        pending = list(_pending_compactions)
+    return sum(1 for log_file in pending if flush_interaction_log(log_file))
+
+
+@handle_errors("deleting interaction log", default_return=False)
+def delete_interaction_log(log_file: str) -> bool:
+    """Remove a log's document and journal, including pending rows"""
+    from core.file_locking import file_lock
+
+    journal_path = journal_path_for(log_file)
+    with _tails_lock:
+        timer = _pending_compactions.pop(log_file, None)
+        _tails.pop(log_file, None)
+    if timer is not None:
+        timer.cancel()
+    if not os.path.exists(log_file) and not os.path.exists(journal_path):
+        return True
+    with file_lock(journal_path):
+        if os.path.exists(log_file):
+            os.remove(log_file)
+        with open(journal_path, "w", encoding="utf-8"):
+            pass
+    return True
+
+
+@handle_errors("clearing interaction log tails", default_return=None)
+def clear_interaction_log_tails() -> None:
+    """Drop every in-memory tail (pending compactions are kept)"""
+    with _tails_lock:
+        _tails.clear()
@@ -0,0 +1,170 @@
+"""
+Log Archival Benchmark
+
+Compares the old serial archival loop (``gzip.open`` + ``shutil.copyfileobj``
+one file at a time) with ``LogArchivalPipeline`` on a synthetic set of large
+log files. Everything runs in a temporary directory, so real logs are never
+touched.
+
+Usage:
+    python -m core.log_archive_benchmark --files 8 --size-mb 32 --workers 1 2 4
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from core.logger import get_component_logger
+from core.error_handling import handle_errors
+from core.log_archiver import LogArchivalPipeline
+
+logger = get_component_logger("file_ops")
+
+_COMPONENTS = ("mhm.scheduler", "mhm.discord", "mhm.ai", "mhm.message", "mhm.file_ops")
+_LEVELS = ("DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR")
+
+
+@handle_errors("writing synthetic log files", default_return=[])
+def write_synthetic_logs(
+    directory: str | Path, file_count: int, size_mb: float, seed: int = 7
+) -> list[Path]:
+    """
+    Write log-shaped files (timestamps, components, varied user ids).
+
+    Args:
+        directory: Where to write the files
+        file_count: Number of files
+        size_mb: Approximate size of each file in MB
+        seed: Random seed so runs are comparable
+
+    Returns:
+        List of written file paths
+    """
+    rng = random.Random(seed)
+    target_bytes = int(size_mb * 1024 * 1024)
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(file_count):
+        path = Path(directory) / f"bench_{index}.log.2026-01-{index % 28 + 1:02d}"
+        written = 0
+        with open(path, "w", encoding="utf-8") as f:
+            while written < target_bytes:
+                lines = [
+                    f"2026-01-{index % 28 + 1:02d} {rng.randrange(24):02d}:{rng.randrange(60):02d}:"
+                    f"{rng.randrange(60):02d} - {rng.choice(_COMPONENTS)} - {rng.choice(_LEVELS)} - "
+                    f"Processed message for user {rng.randrange(10**6):06d} in {rng.random() * 500:.1f}ms "
+                    f"(request {rng.getrandbits(64):016x})\n"
+                    for _ in range(1000)
+                ]
+                block = "".join(lines)
+                f.write(block)
+                written += len(block)
+        paths.append(path)
+    return paths
+
+
+def _copy_inputs(sources: list[Path], directory: Path) -> list[Path]:
+    """Copy benchmark inputs into a fresh directory (archival removes sources)"""
+    directory.mkdir(parents=True, exist_ok=True)
+    copies = []
+    for source in sources:
+        target = directory / source.name
+        shutil.copyfile(source, target)
+        copies.append(target)
+    return copies
+
+
+def _archive_serial(sources: list[Path], archive_dir: Path) -> int:
+    """The pre-pipeline loop: one file at a time on the calling thread"""
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    for source in sources:
+        with open(source, "rb") as f_in:
+            with gzip.open(archive_dir / f"{source.name}.gz", "wb") as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        os.remove(source)
+    return len(sources)
+
+
+@handle_errors("running log archival benchmark", default_return={})
+def run_archival_benchmark(
+    file_count: int = 8,
+    size_mb: float = 16,
+    worker_counts: tuple[int, ...] = (1, 2, 4),
+) -> dict[str, Any]:
+    """
+    Time serial archival against the pipeline at several pool sizes.
+
+    Args:
+        file_count: Number of synthetic log files
+        size_mb: Size of each file in MB
+        worker_counts: Pool sizes to measure
+
+    Returns:
+        Dict with input size, serial timing, and per-pool-size timing/speedup
+    """
+    with tempfile.TemporaryDirectory(prefix="mhm_log_archive_bench_") as temp_dir:
+        root = Path(temp_dir)
+        sources = write_synthetic_logs(root / "source", file_count, size_mb)
+        input_bytes = sum(path.stat().st_size for path in sources)
+
+        inputs = _copy_inputs(sources, root / "serial_in")
+        started = time.perf_counter()
+        _archive_serial(inputs, root / "serial_out")
+        serial_seconds = time.perf_counter() - started
+
+        results: dict[str, Any] = {
+            "files": file_count,
+            "input_mb": round(input_bytes / (1024 * 1024), 1),
+            "serial_seconds": round(serial_seconds, 3),
+            "pipeline": {},
+        }
+        for workers in worker_counts:
+            inputs = _copy_inputs(sources, root / f"pool_{workers}_in")
+            archive_dir = root / f"pool_{workers}_out"
+            pipeline = LogArchivalPipeline(max_workers=workers)
+            started = time.perf_counter()
+            archived = pipeline.archive_files(
+                [(path, archive_dir / f"{path.name}.gz", True) for path in inputs]
+            )
+            elapsed = time.perf_counter() - started
+            pipeline.shutdown()
+            stats = pipeline.get_stats()
+            results["pipeline"][str(workers)] = {
+                "archived": archived,
+                "seconds": round(elapsed, 3),
+                "speedup": round(serial_seconds / elapsed, 2) if elapsed > 0 else 0.0,
+                "compression_ratio": (
+                    round(stats["bytes_in"] / stats["bytes_out"], 1)
+                    if stats["bytes_out"]
+                    else 0.0
+                ),
+            }
+        return results
+
+
+def main() -> int:
+    """Command-line entry point; prints results as JSON"""
+    parser = argparse.ArgumentParser(description="Log archival benchmark")
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--size-mb", type=float, default=16)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    results = run_archival_benchmark(
+        file_count=args.files,
+        size_mb=args.size_mb,
+        worker_counts=tuple(args.workers),
+    )
+    print(json.dumps(results, indent=2))
+    return 0 if results else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,485 @@
+# log_archiver.py
+"""
+Background archival pipeline for rotated log files.
+
+Rotation (``BackupDirectoryRotatingFileHandler.doRollover``) only renames the
+active log file on the logging thread; moving it into ``LOG_BACKUP_DIR`` (and
+gzip-compressing it when ``LOG_COMPRESS_BACKUPS`` is on) runs on a small thread
+pool. The daily archival job (``compress_old_logs``) fans its files out over
+the same pool. Compression streams fixed-size chunks from the source straight
+into a temp file beside the final archive, which is then renamed into place, so
+no intermediate copy of the log is ever written. ``zlib`` releases the GIL while
+compressing, so threads scale across cores without a process pool.
+
+``LOG_ARCHIVE_MAX_TOTAL_MB`` caps the archive directory: the pipeline keeps a
+running byte total (seeded by one directory scan) and evicts the oldest
+archives whenever a new one pushes the total over the budget.
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from core.logger import get_component_logger
+from core.error_handling import handle_errors
+
+logger = get_component_logger("file_ops")
+
+ARCHIVE_CHUNK_BYTES = 1024 * 1024
+ARCHIVE_COMPRESS_LEVEL = 6
+PARTIAL_SUFFIX = ".partial"
+
+_archiver_lock = threading.Lock()
+_archiver = None
+
+
+@handle_errors("streaming log file into gzip archive", default_return=None)
+def stream_compress_file(
+    source: str | Path,
+    destination: str | Path,
+    *,
+    max_bytes: int | None = None,
+    remove_source: bool = True,
+    chunk_size: int = ARCHIVE_CHUNK_BYTES,
+    compresslevel: int = ARCHIVE_COMPRESS_LEVEL,
+) -> tuple[int, int] | None:
+    """
+    Gzip a file into ``destination`` one chunk at a time.
+
+    Output goes to a temp file in the destination directory and is atomically
+    renamed, so readers never see a half-written archive.
+
+    Args:
+        source: File to compress
+        destination: Final ``.gz`` path
+        max_bytes: Only read this many bytes (for files that are still growing)
+        remove_source: Delete the source after the archive is in place
+        chunk_size: Read size per chunk
+        compresslevel: gzip compression level
+
+    Returns:
+        Tuple of (bytes read, bytes written), or None on failure
+    """
+    source_path = Path(source)
+    destination_path = Path(destination)
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(
+        prefix=f".{destination_path.name}.",
+        suffix=PARTIAL_SUFFIX,
+        dir=destination_path.parent,
+    )
+    bytes_in = 0
+    try:
+        with os.fdopen(fd, "wb") as raw_out, open(source_path, "rb") as in_file:
+            with gzip.GzipFile(
+                filename=source_path.name,
+                mode="wb",
+                fileobj=raw_out,
+                compresslevel=compresslevel,
+            ) as gz_out:
+                while max_bytes is None or bytes_in < max_bytes:
+                    read_size = chunk_size
+                    if max_bytes is not None:
+                        read_size = min(chunk_size, max_bytes - bytes_in)
+                    chunk = in_file.read(read_size)
+                    if not chunk:
+                        break
+                    gz_out.write(chunk)
+                    bytes_in += len(chunk)
+        os.replace(temp_name, destination_path)
+        temp_name = None
+    finally:
+        if temp_name and os.path.exists(temp_name):
+            os.remove(temp_name)
+    if remove_source:
+        source_path.unlink(missing_ok=True)
+    return bytes_in, destination_path.stat().st_size
+
+
+@handle_errors("copying log file prefix", default_return=None)
+def stream_copy_prefix(
+    source: str | Path,
+    destination: str | Path,
+    max_bytes: int,
+    chunk_size: int = ARCHIVE_CHUNK_BYTES,
+) -> int | None:
+    """
+    Copy the first ``max_bytes`` of a file that may still be written to.
+
+    Returns:
+        Number of bytes copied, or None on failure
+    """
+    copied = 0
+    with open(source, "rb") as in_file, open(destination, "wb") as out_file:
+        while copied < max_bytes:
+            chunk = in_file.read(min(chunk_size, max_bytes - copied))
+            if not chunk:
+                break
+            out_file.write(chunk)
+            copied += len(chunk)
+    return copied
+
+
+@handle_errors("moving log file", default_return=None)
+def move_log_file(source: str | Path, destination: str | Path) -> int | None:
+    """
+    Move a file, renaming when possible and streaming across filesystems.
+
+    Returns:
+        Size of the moved file in bytes, or None on failure
+    """
+    destination_path = Path(destination)
+    destination_path.parent.mkdir(parents=True, exist_ok=True)
+    size = os.path.getsize(source)
+    try:
+        os.replace(source, destination_path)
+    except OSError:
+        shutil.move(str(source), str(destination_path))
+    return size
+
+
+@handle_errors("evicting logs over size budget", default_return=([], 0))
+def evict_oldest_until_within_budget(
+    entries: list[tuple[str, float, int]], total_bytes: int, max_bytes: int
+) -> tuple[list[str], int]:
+    """
+    Delete the oldest files until the running total fits the budget.
+
+    Args:
+        entries: ``(path, mtime, size)`` for files that may be deleted
+        total_bytes: Current total size the budget applies to
+        max_bytes: Budget in bytes
+
+    Returns:
+        Tuple of (removed paths, remaining total bytes)
+    """
+    removed: list[str] = []
+    if total_bytes <= max_bytes:
+        return removed, total_bytes
+    for path, _, size in sorted(entries, key=lambda entry: entry[1]):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to remove log file {path}: {e}")
+            continue
+        removed.append(path)
+        total_bytes -= size
+        if total_bytes <= max_bytes:
+            break
+    return removed, total_bytes
+
+
+class LogSizeBudget:
+    """Running byte total for an archive directory with oldest-first eviction"""
+
+    @handle_errors("initializing log size budget", default_return=None)
+    def __init__(self, directory: str | Path, max_bytes: int, pattern: str = "*.gz"):
+        """
+        Initialize the budget.
+
+        Args:
+            directory: Directory whose files count against the budget
+            max_bytes: Budget in bytes (0 or less disables eviction)
+            pattern: Glob for files that count against the budget
+        """
+        self.directory = Path(directory)
+        self.max_bytes = int(max_bytes)
+        self.pattern = pattern
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[float, int]] | None = None
+        self._total = 0
+
+    @property
+    def total_bytes(self) -> int:
+        """Tracked total in bytes (scans the directory on first use)"""
+        with self._lock:
+            self._ensure_seeded()
+            return self._total
+
+    def _ensure_seeded(self):
+        """Scan the directory once; later updates are incremental"""
+        if self._entries is not None:
+            return
+        self._entries = {}
+        self._total = 0
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.glob(self.pattern):
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            self._entries[str(path)] = (stat_result.st_mtime, stat_result.st_size)
+            self._total += stat_result.st_size
+
+    @handle_errors("recording archive in size budget", default_return=[])
+    def add(self, path: str | Path, size: int) -> list[str]:
+        """
+        Record a new archive and evict the oldest ones if over budget.
+
+        Returns:
+            List of evicted paths
+        """
+        with self._lock:
+            self._ensure_seeded()
+            key = str(path)
+            previous = self._entries.get(key)
+            if previous:
+                self._total -= previous[1]
+            self._entries[key] = (time.time(), size)
+            self._total += size
+            if self.max_bytes <= 0 or self._total <= self.max_bytes:
+                return []
+            # Never evict the archive that was just written
+            candidates = [
+                (entry_path, mtime, entry_size)
+                for entry_path, (mtime, entry_size) in self._entries.items()
+                if entry_path != key
+            ]
+            removed, self._total = evict_oldest_until_within_budget(
+                candidates, self._total, self.max_bytes
+            )
+            for removed_path in removed:
+                self._entries.pop(removed_path, None)
+        if removed:
+            logger.info(
+                f"Log archive budget: removed {len(removed)} oldest archive(s) to stay under {self.max_bytes} bytes"
+            )
+        return removed
+
+    @handle_errors("forgetting archive in size budget", default_return=None)
+    def discard(self, path: str | Path):
+        """Stop tracking a file that was removed outside the budget"""
+        with self._lock:
+            if self._entries is None:
+                return
+            previous = self._entries.pop(str(path), None)
+            if previous:
+                self._total -= previous[1]
+
+
+class LogArchivalPipeline:
+    """Thread pool that moves and compresses log files off the logging thread"""
+
+    @handle_errors("initializing log archival pipeline", default_return=None)
+    def __init__(
+        self,
+        max_workers: int = 2,
+        archive_dir: str | Path | None = None,
+        max_archive_bytes: int = 0,
+    ):
+        """
+        Initialize the pipeline.
+
+        Args:
+            max_workers: Pool size; 0 runs every job inline on the caller's thread
+            archive_dir: Directory governed by the archive size budget
+            max_archive_bytes: Archive size budget in bytes (0 = unlimited)
+        """
+        self.max_workers = max(0, int(max_workers))
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending: set[Future] = set()
+        self.budget = (
+            LogSizeBudget(archive_dir, max_archive_bytes)
+            if archive_dir and max_archive_bytes > 0
+            else None
+        )
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    @handle_errors("archiving rotated log file", default_return=False)
+    def archive_rotated_file(
+        self, source: str | Path, backup_path: str | Path, compress: bool = False
+    ) -> bool:
+        """
+        Queue a rotated file for transfer into the backup directory.
+
+        Never logs from the calling thread: this runs inside a logging handler.
+
+        Args:
+            source: Rotated file (already renamed away from the active log path)
+            backup_path: Destination in the backup directory (``.gz`` is appended when compressing)
+            compress: Gzip the file on the way into the backup directory
+
+        Returns:
+            bool: True if the job was queued or completed inline
+        """
+        destination = f"{backup_path}.gz" if compress else str(backup_path)
+        future = self._submit(self._transfer, str(source), destination, compress, False)
+        return future is not None
+
+    @handle_errors("archiving log files", default_return=0)
+    def archive_files(
+        self,
+        jobs: list[tuple[str | Path, str | Path, bool]],
+        timeout: float | None = None,
+    ) -> int:
+        """
+        Move or compress a batch of files in parallel and wait for the results.
+
+        Args:
+            jobs: ``(source, destination, compress)`` tuples; sources are removed
+                once their destination is in place
+            timeout: Maximum seconds to wait for the batch
+
+        Returns:
+            int: Number of files archived
+        """
+        futures = [
+            self._submit(self._transfer, str(source), str(destination), compress, True)
+            for source, destination, compress in jobs
+        ]
+        archived = 0
+        for future in futures:
+            if future is None:
+                continue
+            try:
+                if future.result(timeout=timeout):
+                    archived += 1
+            except Exception as e:
+                logger.warning(f"Log archival job failed: {e}")
+        return archived
+
+    @handle_errors("waiting for log archival jobs", default_return=False)
+    def wait_until_idle(self, timeout: float = 30.0) -> bool:
+        """
+        Wait for all queued jobs to finish.
+
+        Returns:
+            bool: True if the pipeline drained before the timeout
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if not self._pending:
+                    return True
+            time.sleep(0.01)
+        with self._lock:
+            return not self._pending
+
+    @handle_errors("getting log archival stats", default_return={})
+    def get_stats(self) -> dict[str, int]:
+        """Return pool size, pending jobs, and lifetime counters"""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "pending": len(self._pending),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+            }
+
+    @handle_errors("shutting down log archival pipeline", default_return=None)
+    def shutdown(self, wait: bool = True):
+        """Stop the pool; queued jobs still run when ``wait`` is True"""
+        with self._lock:
+            executor = self._executor
+            self._executor = None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def _submit(self, func, *args) -> Future | None:
+        """Run ``func`` on the pool (or inline without one) and track the future"""
+        with self._lock:
+            self.submitted += 1
+            if self.max_workers > 0 and self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="log-archiver"
+                )
+            executor = self._executor
+        if executor is None:
+            future: Future = Future()
+            try:
+                future.set_result(func(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        try:
+            future = executor.submit(func, *args)
+        except RuntimeError:
+            # Pool is shutting down (interpreter exit): finish the job here
+            future = Future()
+            future.set_result(func(*args))
+            return future
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._discard_pending)
+        return future
+
+    def _discard_pending(self, future: Future):
+        """Drop a finished future from the pending set"""
+        with self._lock:
+            self._pending.discard(future)
+
+    def _transfer(
+        self, source: str, destination: str, compress: bool, track_budget: bool
+    ) -> bool:
+        """Move or compress one file; runs on a pool thread"""
+        started = time.perf_counter()
+        if compress:
+            result = stream_compress_file(source, destination)
+            sizes = result if result else None
+        else:
+            moved = move_log_file(source, destination)
+            sizes = (moved, moved) if moved is not None else None
+        with self._lock:
+            if sizes is None:
+                self.failed += 1
+            else:
+                self.completed += 1
+                self.bytes_in += sizes[0]
+                self.bytes_out += sizes[1]
+        if sizes is None:
+            logger.warning(f"Failed to archive log file {source}; it will be retried by daily archival")
+            return False
+        if track_budget and self.budget is not None:
+            self.budget.add(destination, sizes[1])
+        logger.debug(
+            f"Archived {source} -> {destination} ({sizes[0]} -> {sizes[1]} bytes, "
+            f"{time.perf_counter() - started:.3f}s)"
+        )
+        return True
+
+
+@handle_errors("getting log archival pipeline", default_return=None)
+def get_log_archiver() -> LogArchivalPipeline:
+    """Return the process-wide archival pipeline, creating it from config on first use"""
+    global _archiver
+    with _archiver_lock:
+        if _archiver is None:
+            import core.config as config
+            from core.logger import _get_log_paths_for_environment
+
+            log_paths = _get_log_paths_for_environment()
+            _archiver = LogArchivalPipeline(
+                max_workers=getattr(config, "LOG_ARCHIVE_WORKERS", 2),
+                archive_dir=log_paths["archive_dir"],
+                max_archive_bytes=int(
+                    getattr(config, "LOG_ARCHIVE_MAX_TOTAL_MB", 0) * 1024 * 1024
+                ),
+            )
+        return _archiver
+
+
+@handle_errors("resetting log archival pipeline", default_return=None)
+def reset_log_archiver(wait: bool = True):
+    """Shut down the shared pipeline so the next use rebuilds it from config"""
+    global _archiver
+    with _archiver_lock:
+        archiver = _archiver
+        _archiver = None
+    if archiver is not None:
+        archiver.shutdown(wait=wait)
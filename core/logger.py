@@ -6,7 +6,6 @@ import shutil
 import sys
 import time
 import json
-import gzip
 from pathlib import Path
 from typing import Any
 from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
@@ -451,6 +450,18 @@ class ComponentLogger:
         self.logger.log(level, full_message)
 
 
+@handle_errors("getting rollover archiver", default_return=None)
+def _get_rollover_archiver():
+    """Return the background log archiver, or None when rotation should stay inline."""
+    import core.config as config
+
+    if getattr(config, "LOG_ARCHIVE_WORKERS", 0) <= 0:
+        return None
+    from core.log_archiver import get_log_archiver
+
+    return get_log_archiver()
+
+
 class BackupDirectoryRotatingFileHandler(TimedRotatingFileHandler):
     """
     Custom rotating file handler that moves rotated files to a backup directory.
@@ -505,6 +516,8 @@ class BackupDirectoryRotatingFileHandler(TimedRotatingFileHandler):
         self.backup_dir = backup_dir
         self.base_filename = filename
         self.maxBytes = maxBytes
+        # Set by the rotation helpers when the backup was queued or already verified
+        self._rollover_backup_handled = False
 
     @handle_errors("checking if rollover should occur")
     def shouldRollover(self, record):
@@ -633,6 +646,25 @@ class BackupDirectoryRotatingFileHandler(TimedRotatingFileHandler):
     ) -> bool:
         """Move or copy current log file into backup storage."""
         try:
+            archiver = _get_rollover_archiver()
+            if archiver is not None:
+                # Only the same-directory rename happens on the logging thread; the
+                # move (and optional compression) into backup_dir runs on the pool.
+                # A unique staged name keeps a queued file safe from the next rollover.
+                staged_path = f"{dfn}.{time.time_ns()}"
+                os.rename(self.baseFilename, staged_path)
+                import core.config as config
+
+                if not archiver.archive_rotated_file(
+                    staged_path,
+                    backup_path,
+                    compress=getattr(config, "LOG_COMPRESS_BACKUPS", False),
+                ):
+                    print(
+                        f"Warning: Could not queue rotated log for archival; left at {staged_path}"
+                    )
+                self._rollover_backup_handled = True
+                return True
             if os.path.exists(dfn):
                 os.unlink(dfn)
             os.rename(self.baseFilename, dfn)
@@ -686,10 +718,27 @@ class BackupDirectoryRotatingFileHandler(TimedRotatingFileHandler):
                     self.stream = self._open()
                 return False
 
-            shutil.copy2(self.baseFilename, backup_path)
-            if not (os.path.exists(backup_path) and os.path.getsize(backup_path) > 0):
+            # Stream only the bytes present now straight into the final backup file
+            # (compressed when enabled); the copy must finish before truncation.
+            import core.config as config
+            from core.log_archiver import stream_compress_file, stream_copy_prefix
+
+            if getattr(config, "LOG_COMPRESS_BACKUPS", False):
+                backup_path = f"{backup_path}.gz"
+                copied = stream_compress_file(
+                    self.baseFilename,
+                    backup_path,
+                    max_bytes=file_size,
+                    remove_source=False,
+                )
+            else:
+                copied = stream_copy_prefix(self.baseFilename, backup_path, file_size)
+            if not copied or not (
+                os.path.exists(backup_path) and os.path.getsize(backup_path) > 0
+            ):
                 print("Warning: Backup file was not created successfully, skipping truncation")
                 raise OSError("Backup verification failed")
+            self._rollover_backup_handled = True
 
             print(
                 f"Info: Copied log file to backup (original file is locked): {backup_path}"
@@ -710,7 +759,10 @@ class BackupDirectoryRotatingFileHandler(TimedRotatingFileHandler):
     def _finalize_rollover_stream(self, current_time: int, backup_path: str, dfn: str):
         """Reopen the active stream and restore files when post-rotation verification fails."""
         try:
-            if os.path.exists(backup_path) and os.path.getsize(backup_path) > 0:
+            if getattr(self, "_rollover_backup_handled", False) or (
+                os.path.exists(backup_path) and os.path.getsize(backup_path) > 0
+            ):
+                self._rollover_backup_handled = False
                 self.stream = self._open()
                 self.rolloverAt = self.computeRollover(current_time)
                 return
@@ -1512,48 +1564,32 @@ def cleanup_old_logs(max_total_size_mb=50):
     if log_info["total_size_mb"] <= max_total_size_mb:
         return False
 
-    # Get all backup log files sorted by modification time (oldest first)
-    import glob
-
-    backup_files = []
-    log_paths = _get_log_paths_for_environment()
-    if os.path.exists(log_paths["backup_dir"]):
-        backup_pattern = str(
-            Path(log_paths["backup_dir"]) / f"{Path(log_paths['main_file']).name}*"
-        )
-        backup_files = glob.glob(backup_pattern)
-
-    log_files_with_time = []
-
-    for log_file in backup_files:
-        if os.path.exists(log_file):
-            mtime = os.path.getmtime(log_file)
-            log_files_with_time.append((log_file, mtime))
-
-    # Sort by modification time (oldest first)
-    log_files_with_time.sort(key=lambda x: x[1])
+    # Budget is tracked incrementally: subtract each removed file's size instead
+    # of rescanning the log directories after every deletion.
+    from core.log_archiver import evict_oldest_until_within_budget
 
-    # Remove oldest files until we're under the limit
-    removed_count = 0
-    for log_file, _ in log_files_with_time:
+    backup_dir = Path(log_info["backup_directory"])
+    candidates = []
+    for backup_info in log_info["backup_files"]:
+        backup_file = backup_dir / backup_info["name"]
         try:
-            os.remove(log_file)
-            removed_count += 1
-            logging.getLogger(__name__).info(f"Removed old log file: {log_file}")
-
-            # Check if we're under the limit now
-            log_info = get_log_file_info()
-            if log_info and log_info["total_size_mb"] <= max_total_size_mb:
-                break
-
-        except Exception as e:
-            logging.getLogger(__name__).warning(
-                f"Failed to remove log file {log_file}: {e}"
+            candidates.append(
+                (str(backup_file), backup_file.stat().st_mtime, backup_info["size_bytes"])
             )
+        except OSError:
+            continue
+
+    removed_files, _ = evict_oldest_until_within_budget(
+        candidates,
+        log_info["total_size_bytes"],
+        int(max_total_size_mb * 1024 * 1024),
+    )
+    for log_file in removed_files:
+        logging.getLogger(__name__).info(f"Removed old log file: {log_file}")
 
-    if removed_count > 0:
+    if removed_files:
         logging.getLogger(__name__).info(
-            f"Log cleanup completed: removed {removed_count} files"
+            f"Log cleanup completed: removed {len(removed_files)} files"
         )
         return True
 
@@ -1565,60 +1601,53 @@ def compress_old_logs():
     """
     Compress log files older than 7 days and move them to archive directory.
 
+    Files are compressed in parallel on the log archival pool and streamed
+    directly into the archive directory. Backups that rotation already
+    compressed (``LOG_COMPRESS_BACKUPS``) are moved without recompressing.
+
     Returns:
         int: Number of files compressed and archived
     """
     try:
         import glob
 
-        compressed_count = 0
+        from core.log_archiver import PARTIAL_SUFFIX, get_log_archiver
 
         # Get environment-specific log paths
         log_paths = _get_log_paths_for_environment()
+        archive_dir = Path(log_paths["archive_dir"])
 
         # Get all log files in logs directory and backup directory
         log_patterns = [
-            str(Path(log_paths["base_dir"]) / "*.log.*"),  # Rotated log files
-            str(Path(log_paths["backup_dir"]) / "*.log*"),  # Backup log files
+            (str(Path(log_paths["base_dir"]) / "*.log.*"), False),  # Rotated log files
+            (str(Path(log_paths["backup_dir"]) / "*.log*"), True),  # Backup log files
         ]
 
         cutoff_time = time.time() - (7 * 24 * 3600)  # 7 days ago
 
-        for pattern in log_patterns:
-            if os.path.exists(os.path.dirname(pattern)):
-                log_files = glob.glob(pattern)
-
-                for log_file in log_files:
-                    if os.path.exists(log_file):
-                        mtime = os.path.getmtime(log_file)
-
-                        # Skip if already compressed or too recent
-                        if log_file.endswith(".gz") or mtime > cutoff_time:
-                            continue
+        jobs = []
+        for pattern, is_backup_dir in log_patterns:
+            if not os.path.exists(os.path.dirname(pattern)):
+                continue
+            for log_file in glob.glob(pattern):
+                try:
+                    mtime = os.path.getmtime(log_file)
+                except OSError:
+                    continue
+                # Skip too-recent files and in-progress archive writes
+                if mtime > cutoff_time or log_file.endswith(PARTIAL_SUFFIX):
+                    continue
+                filename = os.path.basename(log_file)
+                if log_file.endswith(".gz"):
+                    if is_backup_dir:
+                        jobs.append((log_file, archive_dir / filename, False))
+                    continue
+                jobs.append((log_file, archive_dir / f"{filename}.gz", True))
 
-                        # Compress the file
-                        try:
-                            with open(log_file, "rb") as f_in:
-                                # Create archive filename
-                                filename = os.path.basename(log_file)
-                                archive_file = str(
-                                    Path(log_paths["archive_dir"]) / f"{filename}.gz"
-                                )
-
-                                with gzip.open(archive_file, "wb") as f_out:
-                                    shutil.copyfileobj(f_in, f_out)
-
-                            # Remove original file
-                            os.remove(log_file)
-                            compressed_count += 1
-                            logging.getLogger(__name__).info(
-                                f"Compressed and archived: {log_file}"
-                            )
+        if not jobs:
+            return 0
 
-                        except Exception as e:
-                            logging.getLogger(__name__).warning(
-                                f"Failed to compress {log_file}: {e}"
-                            )
+        compressed_count = get_log_archiver().archive_files(jobs)
 
         if compressed_count > 0:
             logging.getLogger(__name__).info(
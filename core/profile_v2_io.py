@@ -15,6 +15,7 @@ from core.profile_v2_schemas import (
     validate_account_v2_document,
     validate_chat_interactions_v2_document,
     validate_context_v2_document,
+    validate_conversation_history_v2_document,
     validate_preferences_v2_document,
     validate_schedules_v2_document,
     validate_tags_v2_document,
@@ -37,6 +38,7 @@ ProfileDocumentType = Literal[
     "context",
     "tags",
     "chat_interactions",
+    "conversation_history",
 ]
 
 _V2_ENVELOPE_KEYS = frozenset({"schema_version", "updated_at"})
@@ -69,6 +71,7 @@ _VALIDATORS = {
     "context": validate_context_v2_document,
     "tags": validate_tags_v2_document,
     "chat_interactions": validate_chat_interactions_v2_document,
+    "conversation_history": validate_conversation_history_v2_document,
 }
 
 
@@ -179,7 +182,7 @@ def _empty_profile_payload(
     document_type: ProfileDocumentType,
 ) -> dict[str, Any] | list[dict[str, Any]]:
     """Return the in-memory empty shape for a profile document type after a failed v2 load."""
-    if document_type == "chat_interactions":
+    if document_type in ("chat_interactions", "conversation_history"):
         return []
     if document_type == "tags":
         return {"tags": [], "metadata": {}}
@@ -212,6 +215,13 @@ def unwrap_profile_document_on_load(
         interactions = raw.get("interactions")
         return interactions if isinstance(interactions, list) else []
 
+    if document_type == "conversation_history":
+        if not isinstance(raw, dict) or not is_profile_v2_envelope(raw):
+            _warn_non_v2_on_disk(document_type, raw)
+            return []
+        events = raw.get("events")
+        return events if isinstance(events, list) else []
+
     if not isinstance(raw, dict) or not is_profile_v2_envelope(raw):
         _warn_non_v2_on_disk(document_type, raw)
         return _empty_profile_payload(document_type)  # type: ignore[return-value]
@@ -359,6 +369,21 @@ def wrap_chat_interactions_for_save(interactions: list[dict[str, Any]]) -> dict[
     return normalized
 
 
+@handle_errors("wrapping conversation history for save", default_return={})
+def wrap_conversation_history_for_save(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """Wrap conversation session events in a validated v2 on-disk envelope."""
+    payload = {
+        "schema_version": SCHEMA_VERSION,
+        "updated_at": now_timestamp_full(),
+        "events": events,
+    }
+    normalized, errors = validate_conversation_history_v2_document(payload)
+    if errors:
+        logger.warning(f"conversation_history v2 validation failed: {errors[0]}")
+        return payload
+    return normalized
+
+
 @handle_errors("wrapping profile document for save", default_return={})
 def wrap_profile_document_for_save(
     document_type: ProfileDocumentType, inner: dict[str, Any]
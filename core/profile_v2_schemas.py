@@ -163,6 +163,22 @@ class ChatInteractionV2Model(BaseModel):
         return _validate_full_timestamp(value)
 
 
+class ConversationHistoryEventV2Model(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    event: Literal["start", "message", "end", "delete"]
+    session_id: str
+    timestamp: str
+    role: str = ""
+    content: str = ""
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+    @field_validator("timestamp")
+    @classmethod
+    def _validate_timestamp(cls, value: str) -> str:
+        return _validate_full_timestamp(value)
+
+
 class AccountV2EnvelopeModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -373,6 +389,19 @@ class ChatInteractionsV2EnvelopeModel(BaseModel):
         return _validate_full_timestamp(value)
 
 
+class ConversationHistoryV2EnvelopeModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    schema_version: Literal[2] = SCHEMA_VERSION
+    updated_at: str
+    events: list[ConversationHistoryEventV2Model] = Field(default_factory=list)
+
+    @field_validator("updated_at")
+    @classmethod
+    def _validate_updated_at(cls, value: str) -> str:
+        return _validate_full_timestamp(value)
+
+
 # error_handling_exclude: validation API returns Pydantic errors as data.
 def _validate_envelope(model_cls: type[BaseModel], data: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
     """Validate ``data`` against a profile v2 envelope model and return JSON-safe output."""
@@ -422,3 +451,8 @@ def validate_chat_interactions_v2_document(data: dict[str, Any]) -> tuple[dict[s
     """Validate a v2 chat_interactions.json envelope."""
     return _validate_envelope(ChatInteractionsV2EnvelopeModel, data)
 
+
+@handle_errors("validating conversation history v2 document", default_return=({}, ["Validation failed"]))
+def validate_conversation_history_v2_document(data: dict[str, Any]) -> tuple[dict[str, Any], list[str]]:
+    """Validate a v2 conversation_history.json envelope."""
+    return _validate_envelope(ConversationHistoryV2EnvelopeModel, data)
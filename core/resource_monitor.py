@@ -0,0 +1,262 @@
+# resource_monitor.py
+"""
+Background sampler for system load and local-model latency.
+
+A daemon thread samples CPU and memory every ``AI_RESOURCE_SAMPLE_INTERVAL``
+seconds (``psutil.cpu_percent(interval=None)`` measures since the previous
+sample, so nothing blocks). LM Studio calls report their latency through
+``record_model_call``. Both feed exponentially smoothed averages, and every
+update publishes a new frozen ``ResourceSnapshot``. Readers just take the
+current snapshot reference, so the AI request path never waits on a lock or
+a measurement.
+
+The snapshot answers two questions:
+
+- ``constrained``: the machine is busy, so AI calls get a longer timeout.
+- ``overloaded``: the local model is saturated (slow or repeatedly failing) or
+  memory is nearly exhausted, so interactive requests should use the fallback
+  responder instead of queuing. While overloaded, one probe call per
+  ``MODEL_PROBE_INTERVAL_SECONDS`` still goes through, so recovery is noticed.
+
+The same snapshot is the service's health surface: the scheduler loop and
+shard coordinator report it (``get_resource_health``). The readings live in
+the service process only.
+"""
+
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+
+logger = get_component_logger("main")
+
+# Thresholds for "constrained" (the old per-request check)
+CONSTRAINED_CPU_PERCENT = 80.0
+CONSTRAINED_MEMORY_PERCENT = 90.0
+CONSTRAINED_MIN_AVAILABLE_BYTES = 2 * 1024**3
+# Thresholds for "overloaded" (shed to fallback)
+OVERLOADED_MEMORY_PERCENT = 97.0
+OVERLOADED_CONSECUTIVE_FAILURES = 3
+MODEL_PROBE_INTERVAL_SECONDS = 30.0
+# Smoothing factors (weight of the newest sample)
+SYSTEM_SMOOTHING = 0.5
+LATENCY_SMOOTHING = 0.3
+
+_monitor_lock = threading.Lock()
+_monitor = None
+
+
+@dataclass(frozen=True)
+class ResourceSnapshot:
+    """Smoothed resource readings at one point in time"""
+
+    cpu_percent: float = 0.0
+    memory_percent: float = 0.0
+    memory_available_bytes: int = 0
+    model_latency_seconds: float | None = None
+    model_consecutive_failures: int = 0
+    model_calls: int = 0
+    sampled_at: float = 0.0
+
+    @property
+    def constrained(self) -> bool:
+        """Busy enough that AI calls should get a longer timeout"""
+        return (
+            self.cpu_percent > CONSTRAINED_CPU_PERCENT
+            or self.memory_percent > CONSTRAINED_MEMORY_PERCENT
+            or (
+                self.sampled_at > 0
+                and self.memory_available_bytes < CONSTRAINED_MIN_AVAILABLE_BYTES
+            )
+        )
+
+
+def _smooth(previous: float | None, sample: float, weight: float) -> float:
+    """Exponential moving average step (first sample is taken as-is)"""
+    if previous is None:
+        return sample
+    return previous + weight * (sample - previous)
+
+
+class ResourceMonitor:
+    """Publishes ``ResourceSnapshot`` values from a background thread"""
+
+    def __init__(self, interval_seconds: float, shed_latency_seconds: float, shedding_enabled: bool = True):
+        """
+        Args:
+            interval_seconds: Seconds between CPU/memory samples
+            shed_latency_seconds: Smoothed model latency at which requests are shed
+            shedding_enabled: ``False`` keeps the readings but never sheds
+        """
+        self.interval_seconds = max(0.5, float(interval_seconds))
+        self.shed_latency_seconds = float(shed_latency_seconds)
+        self.shedding_enabled = shedding_enabled
+        self._snapshot = ResourceSnapshot()
+        self._update_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_model_call = 0.0
+        self._shed_count = 0
+
+    @handle_errors("starting resource monitor", default_return=None)
+    def start(self) -> None:
+        """Take a first sample and start the sampling thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.sample_now()
+        self._thread = threading.Thread(
+            target=self._run, name="resource-monitor", daemon=True
+        )
+        self._thread.start()
+
+    @handle_errors("stopping resource monitor", default_return=None)
+    def stop(self, timeout: float = 5) -> None:
+        """Stop the sampling thread"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            self.sample_now()
+
+    @handle_errors("sampling system resources", default_return=None)
+    def sample_now(self) -> None:
+        """Read CPU and memory once and publish a new snapshot"""
+        import psutil
+
+        cpu = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        with self._update_lock:
+            current = self._snapshot
+            first = current.sampled_at == 0
+            updated = replace(
+                current,
+                cpu_percent=_smooth(None if first else current.cpu_percent, cpu, SYSTEM_SMOOTHING),
+                memory_percent=_smooth(
+                    None if first else current.memory_percent, memory.percent, SYSTEM_SMOOTHING
+                ),
+                memory_available_bytes=int(memory.available),
+                sampled_at=time.time(),
+            )
+            self._snapshot = updated
+        if updated.constrained and not current.constrained:
+            logger.warning(
+                f"System resource constraints detected: Memory {updated.memory_percent:.0f}%, "
+                f"CPU {updated.cpu_percent:.0f}%, Available RAM {updated.memory_available_bytes / (1024**3):.1f}GB"
+            )
+
+    @handle_errors("recording model call latency", default_return=None)
+    def record_model_call(self, elapsed_seconds: float, ok: bool) -> None:
+        """
+        Fold one LM Studio call into the latency average.
+
+        A fast successful call while overloaded (a probe) resets the average,
+        so one good response is enough to stop shedding.
+        """
+        with self._update_lock:
+            current = self._snapshot
+            self._last_model_call = time.monotonic()
+            if ok:
+                latency = current.model_latency_seconds
+                if latency is not None and latency >= self.shed_latency_seconds > elapsed_seconds:
+                    latency = elapsed_seconds
+                else:
+                    latency = _smooth(latency, elapsed_seconds, LATENCY_SMOOTHING)
+                failures = 0
+            else:
+                latency = current.model_latency_seconds
+                failures = current.model_consecutive_failures + 1
+            self._snapshot = replace(
+                current,
+                model_latency_seconds=latency,
+                model_consecutive_failures=failures,
+                model_calls=current.model_calls + 1,
+            )
+
+    def snapshot(self) -> ResourceSnapshot:
+        """Latest published snapshot (no locking)"""
+        return self._snapshot
+
+    @handle_errors("checking model overload", default_return=False)
+    def is_overloaded(self, snapshot: ResourceSnapshot | None = None) -> bool:
+        """True when the local model looks saturated or memory is nearly gone"""
+        snap = snapshot or self._snapshot
+        return (
+            snap.memory_percent >= OVERLOADED_MEMORY_PERCENT
+            or snap.model_consecutive_failures >= OVERLOADED_CONSECUTIVE_FAILURES
+            or (
+                snap.model_latency_seconds is not None
+                and snap.model_latency_seconds >= self.shed_latency_seconds
+            )
+        )
+
+    @handle_errors("deciding whether to shed AI load", default_return=False)
+    def should_shed_load(self) -> bool:
+        """
+        True when an interactive AI request should use the fallback responder.
+
+        While overloaded, a request is still let through (as a probe) once every
+        ``MODEL_PROBE_INTERVAL_SECONDS``.
+        """
+        if not self.shedding_enabled or not self.is_overloaded():
+            return False
+        if time.monotonic() - self._last_model_call >= MODEL_PROBE_INTERVAL_SECONDS:
+            # Claim the probe so concurrent requests keep shedding
+            self._last_model_call = time.monotonic()
+            return False
+        self._shed_count += 1
+        return True
+
+    @handle_errors("building resource health", default_return={})
+    def get_health(self) -> dict:
+        """Snapshot as a dict plus the derived flags, for status displays"""
+        snap = self._snapshot
+        health = asdict(snap)
+        health.update(
+            constrained=snap.constrained,
+            overloaded=self.is_overloaded(snap),
+            shed_requests=self._shed_count,
+            sampling=self._thread is not None and self._thread.is_alive(),
+        )
+        return health
+
+
+@handle_errors("getting resource monitor", default_return=None)
+def get_resource_monitor() -> ResourceMonitor:
+    """Process-wide monitor, started on first use"""
+    global _monitor
+    if _monitor is None:
+        with _monitor_lock:
+            if _monitor is None:
+                from core import config
+
+                monitor = ResourceMonitor(
+                    interval_seconds=getattr(config, "AI_RESOURCE_SAMPLE_INTERVAL", 5),
+                    shed_latency_seconds=getattr(config, "AI_LOAD_SHED_LATENCY_SECONDS", 25),
+                    shedding_enabled=getattr(config, "AI_LOAD_SHEDDING_ENABLED", True),
+                )
+                monitor.start()
+                _monitor = monitor
+    return _monitor
+
+
+@handle_errors("resetting resource monitor", default_return=None)
+def reset_resource_monitor() -> None:
+    """Stop and drop the process-wide monitor (tests and config reloads)"""
+    global _monitor
+    with _monitor_lock:
+        if _monitor is not None:
+            _monitor.stop()
+        _monitor = None
+
+
+@handle_errors("getting resource health", default_return={})
+def get_resource_health() -> dict:
+    """Shared health view for the scheduler and admin UI"""
+    monitor = get_resource_monitor()
+    return monitor.get_health() if monitor is not None else {}
@@ -1,7 +1,8 @@
 """Generic response tracking utilities.
 
 Check-in persistence lives in ``checkins.checkin_data_manager``. This module keeps
-chat-interaction storage and generic response logs in core.
+chat-interaction storage and generic response logs in core; both are
+append-only logs with an in-memory tail (``core.interaction_log``).
 """
 
 from __future__ import annotations
@@ -10,7 +11,12 @@ from typing import Any
 
 from core import get_user_data
 from core.error_handling import handle_errors
-from core.file_operations import get_user_file_path, load_json_data, save_json_data
+from core.file_operations import get_user_file_path
+from core.interaction_log import (
+    append_interaction,
+    flush_interaction_log,
+    recent_interactions,
+)
 from core.logger import get_component_logger
 from core.time_utilities import now_timestamp_full
 
@@ -28,6 +34,32 @@ def _get_response_log_filename(response_type: str) -> str:
     return filename_mapping.get(response_type, f"{response_type}_log.json")
 
 
+@handle_errors("getting response log path", default_return="")
+def _get_response_log_path(user_id: str, response_type: str) -> str:
+    """Canonical JSON document for a non-check-in response type."""
+    if response_type == "chat_interaction":
+        return get_user_file_path(user_id, "chat_interactions")
+    return get_user_file_path(user_id, f"{response_type}_log")
+
+
+@handle_errors("getting response retention", default_return=0)
+def _retention_days_for(response_type: str) -> int:
+    """Days of history compaction keeps (0 = all); only chat interactions expire."""
+    if response_type != "chat_interaction":
+        return 0
+    from core import config
+
+    return config.CHAT_INTERACTION_RETENTION_DAYS
+
+
+@handle_errors("flushing response log", default_return=False)
+def flush_response_log(user_id: str, response_type: str = "chat_interaction") -> bool:
+    """Merge pending appends into the JSON document before reading it directly."""
+    return flush_interaction_log(
+        _get_response_log_path(user_id, response_type), _retention_days_for(response_type)
+    )
+
+
 @handle_errors("storing user response")
 def store_user_response(
     user_id: str, response_data: dict[str, Any], response_type: str = "checkin"
@@ -39,26 +71,11 @@ def store_user_response(
         store_checkin_response(user_id, response_data)
         return
 
-    if response_type == "chat_interaction":
-        log_file = get_user_file_path(user_id, "chat_interactions")
-    else:
-        log_file = get_user_file_path(user_id, f"{response_type}_log")
-
-    from core.profile_v2_io import (
-        prepare_profile_raw_on_load,
-        wrap_chat_interactions_for_save,
-    )
-
-    raw = load_json_data(log_file)
-    existing_data = prepare_profile_raw_on_load("chat_interactions", raw)
-    if not isinstance(existing_data, list):
-        existing_data = []
+    log_file = _get_response_log_path(user_id, response_type)
     if "timestamp" not in response_data:
         response_data["timestamp"] = now_timestamp_full()
 
-    existing_data.append(response_data)
-
-    save_json_data(wrap_chat_interactions_for_save(existing_data), log_file)
+    append_interaction(log_file, response_data, _retention_days_for(response_type))
     logger.debug(f"Stored {response_type} response for user {user_id}")
 
 
@@ -89,18 +106,7 @@ def get_recent_responses(
 
         return get_recent_checkins(user_id, limit=limit)
 
-    if response_type == "chat_interaction":
-        log_file = get_user_file_path(user_id, "chat_interactions")
-    else:
-        log_file = get_user_file_path(user_id, f"{response_type}_log")
-
-    from core.profile_v2_io import prepare_profile_raw_on_load
-
-    raw = load_json_data(log_file)
-    data = prepare_profile_raw_on_load("chat_interactions", raw)
-    if not isinstance(data, list):
-        return []
-    return sorted(data, key=_get_response_timestamp_for_sorting, reverse=True)[:limit]
+    return recent_interactions(_get_response_log_path(user_id, response_type), limit)
 
 
 @handle_errors("getting recent chat interactions", default_return=[])
@@ -386,6 +386,24 @@ class MHMService:
             logger.info("Step 0.5: Checking logging system...")
             self.check_and_fix_logging()
 
+            # Finish user data transactions interrupted by a crash
+            try:
+                from storage.user_data_journal import recover_pending_transactions
+
+                recovered = recover_pending_transactions()
+                if recovered:
+                    logger.info(f"Recovered interrupted user data transactions: {recovered}")
+            except Exception as e:
+                logger.warning(f"User data transaction recovery failed: {e}")
+
+            # Apply user index changes recorded before the last shutdown
+            try:
+                from storage.user_index_deltas import flush_user_index
+
+                flush_user_index(str(Path(core.config.BASE_DATA_DIR) / "user_index.json"))
+            except Exception as e:
+                logger.warning(f"Applying pending user index changes failed: {e}")
+
             # Automatic cache cleanup (only if needed)
             try:
                 from core.auto_cleanup import (
@@ -453,9 +471,16 @@ class MHMService:
             # Step 3: Start the SchedulerManager
             for attempt in range(max_retries):
                 try:
-                    self.scheduler_manager = SchedulerManager(
-                        self.communication_manager
-                    )
+                    if core.config.SCHEDULER_SHARDS > 1:
+                        from scheduler.sharding import ShardedSchedulerCoordinator
+
+                        self.scheduler_manager = ShardedSchedulerCoordinator(
+                            self.communication_manager, core.config.SCHEDULER_SHARDS
+                        )
+                    else:
+                        self.scheduler_manager = SchedulerManager(
+                            self.communication_manager
+                        )
                     break
                 except Exception as e:
                     logger.error(
@@ -761,6 +786,13 @@ class MHMService:
 
             clear_scheduler_manager()
 
+        try:
+            from storage.user_index_deltas import flush_user_index
+
+            flush_user_index()
+        except Exception as e:
+            logger.warning(f"Could not apply pending user index changes: {e}")
+
         # Clean up shutdown request file if it exists
         shutdown_file = get_flags_dir() / "shutdown_request.flag"
         try:
@@ -20,8 +20,6 @@ Scheduler integration (naive vs timezone-aware):
   values with pytz (currently hardcoded to America/Regina in scheduler code) for aware
   comparisons and wake timers; `load_and_localize_datetime` is the bridge from persisted
   TIMESTAMP_MINUTE strings to aware datetimes.
-- `SchedulerManager.is_time_conflict` strips tzinfo before comparing to the `schedule`
-  library's naive `job.next_run` values (see scheduler/manager.py).
 - Scheduler code resolves account `timezone` via `scheduler.user_timezone` (fallback
   America/Regina) for aware comparisons and one-time task reminder scheduling.
 """
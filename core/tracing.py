@@ -0,0 +1,543 @@
+"""
+Hot-Path Tracing
+
+Span-based timing for inbound message handling.
+
+A trace covers one inbound message, from channel receipt to reply delivery.
+Stages along the way (parse, storage reads, context assembly, LLM wait,
+post-processing, delivery) open spans with ``trace_span`` or the ``traced``
+decorator; the active trace travels in a ``ContextVar`` so spans attach to the
+right message across threads of work and ``await`` points without being passed
+around. Finished traces feed per-stage and per-intent latency histograms and a
+bounded ring buffer of recent traces, exported as JSON for the admin UI.
+
+When tracing is disabled (the default) or a message is not sampled, every span
+is a shared no-op that costs one context lookup.
+"""
+
+import functools
+import itertools
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any
+
+from core.config import (
+    HOT_PATH_TRACE_BUFFER_SIZE,
+    HOT_PATH_TRACE_EXPORT_FILE,
+    HOT_PATH_TRACE_EXPORT_INTERVAL_SECONDS,
+    HOT_PATH_TRACE_SAMPLE_RATE,
+    HOT_PATH_TRACING_ENABLED,
+)
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+from core.time_utilities import now_timestamp_full
+
+logger = get_component_logger("main")
+
+# Stage recorded for the whole trace alongside the individual spans
+TOTAL_STAGE = "total"
+# Intent label used until the interaction manager classifies the message
+UNKNOWN_INTENT = "unknown"
+# Histogram bucket upper bounds in milliseconds; slower samples land in the overflow bucket
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# Latency samples kept per histogram for percentiles (bounded so long-running services stay flat)
+LATENCY_SAMPLE_LIMIT = 512
+# Spans kept per trace in the ring buffer; stage totals still count every span
+MAX_SPANS_PER_TRACE = 64
+
+_current_trace: ContextVar["_Trace | None"] = ContextVar("hot_path_trace", default=None)
+_trace_ids = itertools.count(1)
+
+
+class _NoopScope:
+    """Shared context manager used whenever nothing should be recorded"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SCOPE = _NoopScope()
+
+
+class _Trace:
+    """Timings collected for one inbound message"""
+
+    __slots__ = (
+        "trace_id",
+        "name",
+        "started",
+        "started_at",
+        "attributes",
+        "spans",
+        "stage_totals",
+        "open_stages",
+    )
+
+    def __init__(self, name: str, attributes: dict[str, Any]):
+        self.trace_id = next(_trace_ids)
+        self.name = name
+        self.started = time.perf_counter()
+        self.started_at = now_timestamp_full()
+        self.attributes = attributes
+        self.spans: list[tuple[str, float, float]] = []
+        self.stage_totals: dict[str, float] = {}
+        self.open_stages: set[str] = set()
+
+
+class _SpanScope:
+    """Times one stage of the active trace"""
+
+    __slots__ = ("_trace", "_stage", "_started")
+
+    def __init__(self, trace: _Trace, stage: str):
+        self._trace = trace
+        self._stage = stage
+        self._started = 0.0
+
+    def __enter__(self):
+        self._trace.open_stages.add(self._stage)
+        self._started = time.perf_counter()
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        ended = time.perf_counter()
+        trace = self._trace
+        elapsed = ended - self._started
+        trace.open_stages.discard(self._stage)
+        trace.stage_totals[self._stage] = trace.stage_totals.get(self._stage, 0.0) + elapsed
+        if len(trace.spans) < MAX_SPANS_PER_TRACE:
+            trace.spans.append((self._stage, self._started - trace.started, elapsed))
+        return False
+
+
+class _TraceScope:
+    """Installs a new trace as the active one and records it on exit"""
+
+    __slots__ = ("_tracer", "_trace", "_token")
+
+    def __init__(self, tracer: "HotPathTracer", trace: _Trace):
+        self._tracer = tracer
+        self._trace = trace
+        self._token = None
+
+    def __enter__(self):
+        self._token = _current_trace.set(self._trace)
+        return None
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._trace.started
+        _current_trace.reset(self._token)
+        if exc_type is not None:
+            self._trace.attributes.setdefault("error", exc_type.__name__)
+        self._tracer.record_trace(self._trace, elapsed)
+        return False
+
+
+@handle_errors("calculating trace percentile", default_return=0.0)
+def _percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Return the nearest-rank percentile from already-sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(fraction * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+@handle_errors("creating latency histogram", default_return={})
+def _new_histogram(sample_limit: int) -> dict[str, Any]:
+    """Return an empty histogram entry."""
+    return {
+        "count": 0,
+        "total": 0.0,
+        "max": 0.0,
+        "buckets": [0] * (len(LATENCY_BUCKETS_MS) + 1),
+        "samples": deque(maxlen=sample_limit),
+    }
+
+
+@handle_errors("summarizing latency histogram", default_return={})
+def _summarize_histogram(
+    count: int, total: float, max_seen: float, buckets: list[int], samples: list[float]
+) -> dict[str, Any]:
+    """Summarize copied histogram state in milliseconds."""
+    samples.sort()
+    bucket_counts = {
+        f"<={bound}ms": buckets[index] for index, bound in enumerate(LATENCY_BUCKETS_MS)
+    }
+    bucket_counts[f">{LATENCY_BUCKETS_MS[-1]}ms"] = buckets[-1]
+    return {
+        "count": count,
+        "mean_ms": round((total / count) * 1000, 3) if count else 0.0,
+        "p50_ms": round(_percentile(samples, 0.50) * 1000, 3),
+        "p95_ms": round(_percentile(samples, 0.95) * 1000, 3),
+        "p99_ms": round(_percentile(samples, 0.99) * 1000, 3),
+        "max_ms": round(max_seen * 1000, 3),
+        "buckets": bucket_counts,
+    }
+
+
+class HotPathTracer:
+    """Sampling decision, latency histograms and recent-trace ring buffer"""
+
+    @handle_errors("initializing hot-path tracer", default_return=None)
+    def __init__(
+        self,
+        enabled: bool = False,
+        sample_rate: float = 1.0,
+        buffer_size: int = HOT_PATH_TRACE_BUFFER_SIZE,
+        sample_limit: int = LATENCY_SAMPLE_LIMIT,
+        export_file: str = HOT_PATH_TRACE_EXPORT_FILE,
+        export_interval_seconds: float = HOT_PATH_TRACE_EXPORT_INTERVAL_SECONDS,
+    ):
+        self.enabled = bool(enabled)
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self.export_file = export_file
+        self.export_interval_seconds = max(0.0, float(export_interval_seconds))
+        self._sample_limit = max(1, int(sample_limit))
+        self._lock = threading.Lock()
+        self._recent: deque = deque(maxlen=max(1, int(buffer_size)))
+        self._stages: dict[str, dict[str, Any]] = {}
+        self._intents: dict[str, dict[str, dict[str, Any]]] = {}
+        self._started = 0
+        self._sampled = 0
+        self._last_export = 0.0
+
+    # ERROR_HANDLING_EXCLUDE: hot path; only returns a context manager object and cannot fail
+    def start_trace(self, name: str, **attributes: Any):
+        """
+        Begin a trace for one inbound message.
+
+        Joins the active trace when there is one, so nested entry points (a
+        channel handler calling ``handle_user_message``) produce a single trace.
+
+        Args:
+            name: Trace name (for example ``"discord_message"``)
+            **attributes: Initial attributes such as ``channel`` or ``user_id``
+
+        Returns:
+            A context manager; a shared no-op when disabled or not sampled.
+        """
+        if not self.enabled or _current_trace.get() is not None:
+            return _NOOP_SCOPE
+        with self._lock:
+            self._started += 1
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return _NOOP_SCOPE
+            self._sampled += 1
+        return _TraceScope(self, _Trace(name, attributes))
+
+    @handle_errors("recording hot-path trace", default_return=None)
+    def record_trace(self, trace: _Trace, elapsed_seconds: float):
+        """
+        Fold a finished trace into the histograms and the ring buffer.
+
+        Args:
+            trace: The finished trace
+            elapsed_seconds: Wall time of the whole trace
+        """
+        intent = str(trace.attributes.get("intent") or UNKNOWN_INTENT)
+        stage_totals = dict(trace.stage_totals)
+        stage_totals[TOTAL_STAGE] = elapsed_seconds
+        with self._lock:
+            intent_stages = self._intents.setdefault(intent, {})
+            for stage, seconds in stage_totals.items():
+                for table in (self._stages, intent_stages):
+                    entry = table.get(stage)
+                    if entry is None:
+                        entry = _new_histogram(self._sample_limit)
+                        table[stage] = entry
+                    self._add_sample(entry, seconds)
+            self._recent.append(
+                {
+                    "trace_id": trace.trace_id,
+                    "name": trace.name,
+                    "started_at": trace.started_at,
+                    "intent": intent,
+                    "attributes": {
+                        key: value
+                        for key, value in trace.attributes.items()
+                        if key != "intent"
+                    },
+                    "total_ms": round(elapsed_seconds * 1000, 3),
+                    "stages_ms": {
+                        stage: round(seconds * 1000, 3)
+                        for stage, seconds in trace.stage_totals.items()
+                    },
+                    "spans": [
+                        {
+                            "stage": stage,
+                            "start_ms": round(offset * 1000, 3),
+                            "duration_ms": round(seconds * 1000, 3),
+                        }
+                        for stage, offset, seconds in trace.spans
+                    ],
+                }
+            )
+            now = time.monotonic()
+            export_due = (
+                bool(self.export_file)
+                and now - self._last_export >= self.export_interval_seconds
+            )
+            if export_due:
+                self._last_export = now
+        if export_due:
+            self.export(self.export_file)
+
+    @staticmethod
+    @handle_errors("adding latency sample", default_return=None)
+    def _add_sample(entry: dict[str, Any], seconds: float):
+        """Add one sample to a histogram entry (caller holds the lock)."""
+        entry["count"] += 1
+        entry["total"] += seconds
+        entry["max"] = max(entry["max"], seconds)
+        entry["samples"].append(seconds)
+        elapsed_ms = seconds * 1000
+        for index, bound in enumerate(LATENCY_BUCKETS_MS):
+            if elapsed_ms <= bound:
+                entry["buckets"][index] += 1
+                return
+        entry["buckets"][-1] += 1
+
+    @handle_errors("building hot-path trace snapshot", default_return={})
+    def snapshot(self, include_recent: bool = True) -> dict[str, Any]:
+        """
+        Summarize recorded traces.
+
+        Args:
+            include_recent: Include the ring buffer of recent traces
+
+        Returns:
+            JSON-serializable dict with per-stage and per-intent histograms
+            (count, mean/p50/p95/p99/max in milliseconds, bucket counts) and,
+            optionally, the most recent traces oldest first.
+        """
+
+        def _copy(entry: dict[str, Any]) -> tuple:
+            return (
+                entry["count"],
+                entry["total"],
+                entry["max"],
+                list(entry["buckets"]),
+                list(entry["samples"]),
+            )
+
+        with self._lock:
+            stages = {stage: _copy(entry) for stage, entry in self._stages.items()}
+            intents = {
+                intent: {stage: _copy(entry) for stage, entry in table.items()}
+                for intent, table in self._intents.items()
+            }
+            recent = list(self._recent) if include_recent else None
+            started = self._started
+            sampled = self._sampled
+            buffer_size = self._recent.maxlen
+
+        snapshot: dict[str, Any] = {
+            "generated_at": now_timestamp_full(),
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "buffer_size": buffer_size,
+            "traces": {"started": started, "sampled": sampled},
+            "stages": {
+                stage: _summarize_histogram(*copied) for stage, copied in stages.items()
+            },
+            "intents": {
+                intent: {
+                    stage: _summarize_histogram(*copied)
+                    for stage, copied in table.items()
+                }
+                for intent, table in intents.items()
+            },
+        }
+        if recent is not None:
+            snapshot["recent_traces"] = recent
+        return snapshot
+
+    @handle_errors("exporting hot-path trace snapshot", default_return=None)
+    def export(self, path: str | None = None) -> str | None:
+        """
+        Write the current snapshot to a JSON file.
+
+        Args:
+            path: Destination file; defaults to ``HOT_PATH_TRACE_EXPORT_FILE``
+
+        Returns:
+            The written path, or None when the write failed.
+        """
+        from core.file_operations import save_json_data
+
+        target = str(path or self.export_file)
+        if not save_json_data(self.snapshot(), target):
+            return None
+        return target
+
+    @handle_errors("configuring hot-path tracer", default_return=None)
+    def configure(
+        self,
+        enabled: bool | None = None,
+        sample_rate: float | None = None,
+        buffer_size: int | None = None,
+        export_file: str | None = None,
+        export_interval_seconds: float | None = None,
+    ):
+        """Change tracer settings at runtime; unspecified settings are kept."""
+        with self._lock:
+            if enabled is not None:
+                self.enabled = bool(enabled)
+            if sample_rate is not None:
+                self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+            if buffer_size is not None:
+                self._recent = deque(self._recent, maxlen=max(1, int(buffer_size)))
+            if export_file is not None:
+                self.export_file = export_file
+            if export_interval_seconds is not None:
+                self.export_interval_seconds = max(0.0, float(export_interval_seconds))
+
+    @handle_errors("resetting hot-path tracer", default_return=None)
+    def reset(self):
+        """Clear histograms, counters and the ring buffer"""
+        with self._lock:
+            self._recent.clear()
+            self._stages.clear()
+            self._intents.clear()
+            self._started = 0
+            self._sampled = 0
+            self._last_export = 0.0
+
+
+_tracer = HotPathTracer(
+    enabled=HOT_PATH_TRACING_ENABLED, sample_rate=HOT_PATH_TRACE_SAMPLE_RATE
+)
+
+
+@handle_errors("getting hot-path tracer", default_return=None)
+def get_hot_path_tracer() -> HotPathTracer:
+    """Return the process-wide tracer."""
+    return _tracer
+
+
+# ERROR_HANDLING_EXCLUDE: hot path; delegates to HotPathTracer.start_trace
+def start_trace(name: str, **attributes: Any):
+    """Begin (or join) the trace for an inbound message; see ``HotPathTracer.start_trace``."""
+    return _tracer.start_trace(name, **attributes)
+
+
+# ERROR_HANDLING_EXCLUDE: hot path; a context lookup and at most one object allocation
+def trace_span(stage: str):
+    """
+    Time a stage of the active trace.
+
+    A stage already open in the trace is not timed again, so nested helpers
+    with the same stage (storage reads inside storage reads) count once.
+
+    Args:
+        stage: Stage name (for example ``"parse"`` or ``"llm_wait"``)
+
+    Returns:
+        A context manager; a shared no-op when there is no active trace.
+    """
+    trace = _current_trace.get()
+    if trace is None or stage in trace.open_stages:
+        return _NOOP_SCOPE
+    return _SpanScope(trace, stage)
+
+
+@handle_errors("building traced decorator", default_return=None)
+def traced(stage: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator form of ``trace_span`` for synchronous functions.
+
+    Place it under ``@handle_errors`` so the span also covers handled failures.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = _current_trace.get()
+            if trace is None or stage in trace.open_stages:
+                return func(*args, **kwargs)
+            with _SpanScope(trace, stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# ERROR_HANDLING_EXCLUDE: hot path; a context lookup and a dict write
+def set_trace_attribute(key: str, value: Any) -> None:
+    """Set an attribute (for example ``intent``) on the active trace, if any."""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.attributes[key] = value
+
+
+@handle_errors("getting hot-path trace snapshot", default_return={})
+def get_trace_snapshot(include_recent: bool = True) -> dict[str, Any]:
+    """Return the tracer snapshot; see ``HotPathTracer.snapshot``."""
+    return _tracer.snapshot(include_recent=include_recent)
+
+
+@handle_errors("exporting hot-path trace snapshot", default_return=None)
+def export_trace_snapshot(path: str | None = None) -> str | None:
+    """Write the tracer snapshot as JSON; see ``HotPathTracer.export``."""
+    return _tracer.export(path)
+
+
+@handle_errors("formatting hot-path trace summary", default_return=[])
+def format_trace_summary_lines(
+    snapshot: dict[str, Any], max_intents: int = 5
+) -> list[str]:
+    """
+    Render a snapshot as short report lines for the admin UI.
+
+    Args:
+        snapshot: Result of ``get_trace_snapshot`` or a loaded export file
+        max_intents: Intents listed, slowest total p95 first
+
+    Returns:
+        Human-readable lines, one per stage and per listed intent.
+    """
+    stages = snapshot.get("stages") or {}
+    if not stages:
+        return ["No traced messages recorded yet."]
+    traces = snapshot.get("traces") or {}
+    lines = [
+        f"Traced messages: {traces.get('sampled', 0)} of {traces.get('started', 0)} "
+        f"(sample rate {snapshot.get('sample_rate', 0)}, generated {snapshot.get('generated_at', 'unknown')})"
+    ]
+    ordered = [TOTAL_STAGE] + sorted(stage for stage in stages if stage != TOTAL_STAGE)
+    for stage in ordered:
+        stats = stages.get(stage)
+        if not stats:
+            continue
+        lines.append(
+            f"  {stage}: n={stats['count']} p50={stats['p50_ms']}ms "
+            f"p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms max={stats['max_ms']}ms"
+        )
+    intents = snapshot.get("intents") or {}
+    ranked = sorted(
+        (
+            (intent, table[TOTAL_STAGE])
+            for intent, table in intents.items()
+            if TOTAL_STAGE in table
+        ),
+        key=lambda item: item[1]["p95_ms"],
+        reverse=True,
+    )
+    if ranked:
+        lines.append("Slowest intents (total p95):")
+        for intent, stats in ranked[:max_intents]:
+            lines.append(
+                f"  {intent}: n={stats['count']} p50={stats['p50_ms']}ms "
+                f"p95={stats['p95_ms']}ms p99={stats['p99_ms']}ms"
+            )
+    return lines
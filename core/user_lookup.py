@@ -55,11 +55,36 @@ def get_user_id_by_identifier(identifier: str) -> str | None:
     """
     if not identifier:
         return None
+    from core import config
+
+    if config.STORAGE_BACKEND == "sqlite":
+        # Indexed identifiers table; fall through to the JSON index on a miss.
+        # A hit only counts while the user's files exist (the files are the
+        # working copy, so a mirror row can outlive a deleted user).
+        from storage.backends import IDENTIFIER_FIELDS, get_storage_backend
+
+        backend = get_storage_backend()
+        for field in IDENTIFIER_FIELDS:
+            user_id = backend.find_user_id(field, identifier)
+            if user_id and os.path.isdir(Path(config.USER_INFO_DIR_PATH) / user_id):
+                return user_id
     try:
         from core.config import BASE_DATA_DIR
         from core.file_locking import safe_json_read
 
+        from storage.user_index_deltas import pending_index_lookup
+
         index_file = str(Path(BASE_DATA_DIR) / "user_index.json")
+        # Changes recorded by this process but not yet batched into the file
+        for key in (
+            identifier,
+            f"email:{identifier}",
+            f"discord:{identifier}",
+            f"phone:{identifier}",
+        ):
+            pending = pending_index_lookup(key, index_file)
+            if pending:
+                return pending
         index_data = safe_json_read(index_file, default={})
         if identifier in index_data:
             mapped = index_data[identifier]
@@ -1649,6 +1649,33 @@ def get_backup_health_config():
     return BACKUP_HEALTH_DEFAULTS.copy()
 
 
+# Core-path benchmarks (Tier 3 post-test; analyze_core_benchmarks compares against a
+# stored baseline). Empty command by default (portable): projects point it at their
+# benchmark runner, which must accept --users/--years/--repeat/--warmup/--seed/--output.
+CORE_BENCHMARKS = {
+    "command": [],
+    "users": 20,
+    "years": 2.0,
+    "repeat": 5,
+    "warmup": 1,
+    "seed": 1337,
+    # A benchmark regresses when its median exceeds baseline by both thresholds
+    "regression_threshold_pct": 30.0,
+    "min_regression_ms": 0.5,
+    "timeout_seconds": 1800,
+    "baseline_file": "development_tools/tests/jsons/core_benchmark_baseline.json",
+}
+
+
+def get_core_benchmarks_config():
+    """Get core-path benchmark configuration (from external config if available, otherwise default)."""
+    external_config = _get_external_value("core_benchmarks", None)
+    result = CORE_BENCHMARKS.copy()
+    if external_config and isinstance(external_config, dict):
+        result.update(external_config)
+    return result
+
+
 # Auto document functions configuration
 # NOTE: Defaults are minimal. See development_tools_config.json.example for full examples.
 AUTO_DOCUMENT_FUNCTIONS = {
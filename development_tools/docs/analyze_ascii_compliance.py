@@ -32,9 +32,11 @@ from development_tools.shared.logging import get_dev_tools_logger
 if __name__ != "__main__" and __package__ and "." in __package__:
     from .. import config
     from ..shared.standard_exclusions import should_exclude_file
+    from .markdown_document import load_markdown_document
 else:
     from development_tools import config
     from development_tools.shared.standard_exclusions import should_exclude_file
+    from development_tools.docs.markdown_document import load_markdown_document
 
 # Load external config on module import (if not already loaded)
 try:
@@ -120,16 +122,12 @@ class ASCIIComplianceAnalyzer:
                 continue
 
             try:
-                with open(full_path, encoding="utf-8") as f:
-                    content = f.read()
+                document = load_markdown_document(
+                    full_path, self.project_root, use_cache=self.cache.use_cache
+                )
 
                 # Find ALL non-ASCII characters
-                non_ascii_chars = {}
-                for _i, char in enumerate(content):
-                    if ord(char) > 127:  # Non-ASCII
-                        if char not in non_ascii_chars:
-                            non_ascii_chars[char] = 0
-                        non_ascii_chars[char] += 1
+                non_ascii_chars = document.non_ascii
 
                 file_issues = []
                 if non_ascii_chars:
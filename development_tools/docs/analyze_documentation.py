@@ -33,6 +33,7 @@ try:
         PAIRED_DOCS,
     )
     from ..shared.standard_exclusions import should_exclude_file
+    from .markdown_document import load_markdown_document
 except ImportError:
     import sys
     from pathlib import Path
@@ -55,6 +56,7 @@ except ImportError:
         PAIRED_DOCS,
     )
     from development_tools.shared.standard_exclusions import should_exclude_file
+    from development_tools.docs.markdown_document import load_markdown_document
 
 # Load external config on module import
 config.load_external_config()
@@ -130,7 +132,11 @@ def load_documents(paths: Sequence[str]) -> tuple[dict[str, str], list[str]]:
         if not absolute.exists():
             missing.append(rel)
             continue
-        docs[rel] = load_text(absolute)
+        try:
+            # Shares the parsed model (and its on-disk cache) with the other docs analyzers
+            docs[rel] = load_markdown_document(absolute, PATHS.root).text
+        except UnicodeDecodeError:
+            docs[rel] = load_text(absolute)
     return docs, missing
 
 
@@ -39,9 +39,11 @@ from development_tools.shared.logging import get_dev_tools_logger
 if __name__ != "__main__" and __package__ and "." in __package__:
     from .. import config
     from ..shared.constants import DEFAULT_DOCS, PAIRED_DOCS
+    from .markdown_document import load_markdown_document
 else:
     from development_tools import config
     from development_tools.shared.constants import DEFAULT_DOCS, PAIRED_DOCS
+    from development_tools.docs.markdown_document import load_markdown_document
 
 logger = get_dev_tools_logger("development_tools")
 
@@ -149,18 +151,12 @@ class DocumentationSyncChecker:
             if human_path.exists() and ai_path.exists():
                 # Check for content synchronization issues
                 try:
-                    with open(human_path, encoding="utf-8") as f:
-                        human_content = f.read()
-                    with open(ai_path, encoding="utf-8") as f:
-                        ai_content = f.read()
+                    human_doc_model = load_markdown_document(human_path, self.project_root)
+                    ai_doc_model = load_markdown_document(ai_path, self.project_root)
 
                     # Simple content comparison (could be enhanced)
-                    human_sections = set(
-                        re.findall(r"^##\s+(.+)$", human_content, re.MULTILINE)
-                    )
-                    ai_sections = set(
-                        re.findall(r"^##\s+(.+)$", ai_content, re.MULTILINE)
-                    )
+                    human_sections = {h.text for h in human_doc_model.headings_at(2)}
+                    ai_sections = {h.text for h in ai_doc_model.headings_at(2)}
 
                     missing_in_ai = human_sections - ai_sections
                     missing_in_human = ai_sections - human_sections
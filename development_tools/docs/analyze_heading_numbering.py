@@ -32,9 +32,11 @@ from development_tools.shared.logging import get_dev_tools_logger
 if __name__ != "__main__" and __package__ and "." in __package__:
     from .. import config
     from ..shared.standard_exclusions import should_exclude_file
+    from .markdown_document import load_markdown_document
 else:
     from development_tools import config
     from development_tools.shared.standard_exclusions import should_exclude_file
+    from development_tools.docs.markdown_document import load_markdown_document
 
 # Load external config on module import (if not already loaded)
 try:
@@ -139,10 +141,9 @@ class HeadingNumberingAnalyzer:
                 continue
 
             try:
-                with open(full_path, encoding="utf-8") as f:
-                    content = f.read()
-
-                lines = content.split("\n")
+                document = load_markdown_document(
+                    full_path, self.project_root, use_cache=self.cache.use_cache
+                )
                 h2_counter = None  # Track expected H2 number
                 h3_counters = {}  # Track H3 counters per H2 section
                 current_h2_number = None
@@ -157,12 +158,12 @@ class HeadingNumberingAnalyzer:
 
                 in_quick_reference = False
 
-                for line_num, line in enumerate(lines, 1):
-                    # Match H2 headings
-                    h2_match = re.match(r"^##\s+(.+)$", line)
-                    if h2_match:
-                        heading_text = h2_match.group(1).strip()
+                for heading in document.headings_at(2, 3):
+                    line_num = heading.line
+                    heading_text = heading.text
 
+                    # H2 headings
+                    if heading.level == 2:
                         # Check if this is a Quick Reference section
                         if any(
                             re.match(pattern, heading_text, re.IGNORECASE)
@@ -270,11 +271,8 @@ class HeadingNumberingAnalyzer:
                             current_h2_number = h2_counter - 1
                             h3_counters[current_h2_number] = 0 if start_at_zero else 1
 
-                    # Match H3 headings
-                    h3_match = re.match(r"^###\s+(.+)$", line)
-                    if h3_match:
-                        heading_text = h3_match.group(1).strip()
-
+                    # H3 headings
+                    if heading.level == 3:
                         # Skip if in Quick Reference section
                         if in_quick_reference:
                             continue
@@ -30,8 +30,10 @@ from development_tools.shared.logging import get_dev_tools_logger
 # Handle both relative and absolute imports
 if __name__ != "__main__" and __package__ and "." in __package__:
     from .. import config
+    from .markdown_document import load_markdown_document
 else:
     from development_tools import config
+    from development_tools.docs.markdown_document import load_markdown_document
 
 # Load external config on module import (if not already loaded)
 try:
@@ -96,6 +98,7 @@ class MissingAddressAnalyzer:
             Dictionary mapping file paths to lists of issues
         """
         from development_tools.shared.exclusion_utilities import is_generated_file
+        from development_tools.shared.file_inventory import get_project_inventory
         from development_tools.shared.standard_exclusions import (
             ALL_GENERATED_FILES,
             HISTORICAL_PRESERVE_FILES,
@@ -104,10 +107,19 @@ class MissingAddressAnalyzer:
 
         missing_addresses = defaultdict(list)
 
-        # Find all documentation files (same logic as fix_add_addresses)
+        # Find all documentation files (same logic as fix_add_addresses);
+        # the inventory applies the standardized exclusion rules (BASE_EXCLUSIONS etc.)
+        inventory = get_project_inventory(self.project_root)
         files_to_check = []
-        for ext in ["*.md", "*.mdc"]:
-            files_to_check.extend(self.project_root.rglob(ext))
+        for ext in [".md", ".mdc"]:
+            files_to_check.extend(
+                inventory.iter_paths(
+                    extensions=(ext,),
+                    tool_type="documentation",
+                    context="development",
+                    exclude=should_exclude_file,
+                )
+            )
 
         generated_files = set(ALL_GENERATED_FILES)
         historical_preserve_files = set(HISTORICAL_PRESERVE_FILES)
@@ -117,10 +129,6 @@ class MissingAddressAnalyzer:
                 rel_path = file_path.relative_to(self.project_root)
                 rel_path_str = str(rel_path).replace("\\", "/")
 
-                # Skip anything matching standardized exclusion rules (BASE_EXCLUSIONS etc.).
-                if should_exclude_file(rel_path_str, "documentation", "development"):
-                    continue
-
                 # Skip generated files (authoritative list fast-path)
                 if rel_path_str in generated_files:
                     continue
@@ -153,8 +161,9 @@ class MissingAddressAnalyzer:
                 continue
 
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
+                content = load_markdown_document(
+                    file_path, self.project_root, use_cache=self.cache.use_cache
+                ).text
 
                 has_address = bool(
                     re.search(r"^>\s*\*\*File\*\*:\s*`", content[:2000], re.MULTILINE)
@@ -29,12 +29,18 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from development_tools.shared.file_inventory import get_project_inventory
 from development_tools.shared.logging import get_dev_tools_logger
 
 # Handle both relative and absolute imports
 if __name__ != "__main__" and __package__ and "." in __package__:
     from .. import config
     from ..shared.standard_exclusions import should_exclude_file
+    from .markdown_document import (
+        MARKDOWN_LINK_PATTERN,
+        MarkdownDocument,
+        load_markdown_document,
+    )
     from ..shared.constants import (
         COMMAND_PATTERNS,
         COMMON_CLASS_NAMES,
@@ -57,6 +63,11 @@ if __name__ != "__main__" and __package__ and "." in __package__:
 else:
     from development_tools import config
     from development_tools.shared.standard_exclusions import should_exclude_file
+    from development_tools.docs.markdown_document import (
+        MARKDOWN_LINK_PATTERN,
+        MarkdownDocument,
+        load_markdown_document,
+    )
     from development_tools.shared.constants import (
         COMMAND_PATTERNS,
         COMMON_CLASS_NAMES,
@@ -86,9 +97,6 @@ except (AttributeError, ImportError):
 
 logger = get_dev_tools_logger("development_tools")
 
-MARKDOWN_LINK_PATTERN = re.compile(r"(!?\[[^\]]+\]\()([^)]+)(\))")
-
-
 def is_external_or_anchor_href(href: str) -> bool:
     """Return True for hrefs that should not resolve to local files."""
     lower = href.lower()
@@ -116,31 +124,21 @@ def split_href_path_suffix(href: str) -> tuple[str, str]:
 
 def iter_markdown_files_for_link_targets(project_root: Path) -> Iterator[tuple[Path, str]]:
     """Yield Markdown files eligible for local link target checks."""
-    for md_file in project_root.rglob("*.md"):
-        try:
-            rel_path = str(md_file.relative_to(project_root)).replace("\\", "/")
-        except ValueError:
-            continue
-        if should_exclude_file(rel_path, tool_type="documentation", context="development"):
-            continue
-        if md_file.name.startswith("."):
+    for item in get_project_inventory(project_root).iter_files(
+        extensions=(".md",),
+        tool_type="documentation",
+        context="development",
+        exclude=should_exclude_file,
+    ):
+        if item.path.name.startswith("."):
             continue
-        yield md_file, rel_path
+        yield project_root / item.rel_path, item.rel_path
 
 
 def iter_markdown_link_hrefs(content: str) -> Iterator[tuple[int, str]]:
     """Yield Markdown link hrefs with 1-based line numbers, excluding code blocks."""
-    in_code_block = False
-    for line_num, line in enumerate(content.splitlines(), start=1):
-        if line.strip().startswith("```"):
-            in_code_block = not in_code_block
-            continue
-        if in_code_block:
-            continue
-        for match in MARKDOWN_LINK_PATTERN.finditer(line):
-            href = match.group(2).strip()
-            if href:
-                yield line_num, href
+    for link in MarkdownDocument.from_text(content).links:
+        yield link.line, link.href
 
 def _get_legacy_documentation_files() -> frozenset[str]:
     """Load legacy documentation file paths from config (path_drift.legacy_documentation_files).
@@ -592,13 +590,17 @@ class PathDriftAnalyzer:
         """Scan codebase for all file paths and imports."""
         paths = set()
 
+        inventory = get_project_inventory(self.project_root)
         for code_dir in self.code_dirs:
             code_path = self.project_root / code_dir
             if code_path.exists():
-                for py_file in code_path.rglob("*.py"):
-                    rel_path = str(py_file.relative_to(self.project_root)).replace("\\", "/")
-                    if should_exclude_file(rel_path, tool_type="analysis", context="development"):
-                        continue
+                for py_file in inventory.iter_paths(
+                    extensions=(".py",),
+                    directories=[code_dir],
+                    tool_type="analysis",
+                    context="development",
+                    exclude=should_exclude_file,
+                ):
                     try:
                         with open(py_file, encoding="utf-8") as f:
                             content = f.read()
@@ -628,13 +630,10 @@ class PathDriftAnalyzer:
 
         doc_paths = defaultdict(list)
 
-        for md_file in self.project_root.rglob("*.md"):
-            # Skip files that should be excluded
-            # Check path relative to project root to avoid matching parent directory exclusions
-            rel_path = str(md_file.relative_to(self.project_root))
-            if should_exclude_file(rel_path, "documentation"):
-                continue
-
+        # Exclusions are checked on project-relative paths so parent directories do not match
+        for md_file in get_project_inventory(self.project_root).iter_paths(
+            extensions=(".md",), tool_type="documentation", exclude=should_exclude_file
+        ):
             if md_file.name.startswith("."):
                 continue
 
@@ -653,21 +652,16 @@ class PathDriftAnalyzer:
                 continue
 
             try:
-                with open(md_file, encoding="utf-8") as f:
-                    content = f.read()
+                document = load_markdown_document(
+                    md_file, self.project_root, use_cache=self.cache.use_cache
+                )
 
                 # Extract all path references with context awareness
-                lines = content.split("\n")
-                in_code_block = False
+                lines = document.lines
 
                 for line_num, line in enumerate(lines):
-                    # Track code block state
-                    if line.strip().startswith("```"):
-                        in_code_block = not in_code_block
-                        continue
-
-                    # Skip extraction if we're inside a code block
-                    if in_code_block:
+                    # Skip fence lines and lines inside code blocks
+                    if document.in_code(line_num + 1):
                         continue
 
                     # Check if this line is in an example context
@@ -842,14 +836,17 @@ class PathDriftAnalyzer:
 
         for md_file, rel_path in iter_markdown_files_for_link_targets(self.project_root):
             try:
-                content = md_file.read_text(encoding="utf-8")
+                document = load_markdown_document(
+                    md_file, self.project_root, use_cache=self.cache.use_cache
+                )
             except Exception as e:
                 if logger:
                     logger.warning(f"Error reading {md_file}: {e}")
                 continue
 
             source_dir = md_file.parent
-            for line_num, raw_href in iter_markdown_link_hrefs(content):
+            for link in document.links:
+                line_num, raw_href = link.line, link.href
                 href = raw_href.strip("<>")
                 if is_external_or_anchor_href(href):
                     continue
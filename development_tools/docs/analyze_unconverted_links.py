@@ -32,8 +32,10 @@ from development_tools.shared.logging import get_dev_tools_logger
 # Handle both relative and absolute imports
 if __name__ != "__main__" and __package__ and "." in __package__:
     from .. import config
+    from .markdown_document import load_markdown_document
 else:
     from development_tools import config
+    from development_tools.docs.markdown_document import load_markdown_document
 
 # Load external config on module import (if not already loaded)
 try:
@@ -84,6 +86,8 @@ class UnconvertedLinkAnalyzer:
             domain="docs",
             tool_paths=[Path(__file__)],
         )
+        # Parsed model of the file being checked; fence lookups reuse its regions
+        self._document = None
 
     def _should_skip_generated_file(self, file_path: Path) -> bool:
         """
@@ -110,6 +114,8 @@ class UnconvertedLinkAnalyzer:
 
     def _is_in_code_block(self, lines: list[str], line_num: int) -> bool:
         """Check if a line is inside a code block."""
+        if self._document is not None and lines is self._document.lines:
+            return self._document.in_fence(line_num + 1)
         in_code = False
         for i in range(line_num + 1):
             if i < len(lines) and lines[i].strip().startswith("```"):
@@ -376,10 +382,10 @@ class UnconvertedLinkAnalyzer:
                 continue
 
             try:
-                with open(file_path, encoding="utf-8") as f:
-                    content = f.read()
-
-                lines = content.split("\n")
+                self._document = load_markdown_document(
+                    file_path, self.project_root, use_cache=self.cache.use_cache
+                )
+                lines = self._document.lines
                 metadata_linked_files = (
                     set()
                 )  # Track paths already linked in metadata section
@@ -21,21 +21,13 @@ import re
 from fnmatch import fnmatch
 from pathlib import Path
 
+from development_tools.docs.markdown_document import (
+    MarkdownDocument,
+    load_markdown_document,
+)
 from development_tools.shared.constants import EXAMPLE_MARKERS
 from development_tools.shared.standard_exclusions import HISTORICAL_PRESERVE_FILES
 
-# Headings that open an "example" region (content until the next ## heading).
-# Broad on purpose: include headings like "Command Examples" and "Example Code".
-_EXAMPLE_HEADING = re.compile(
-    r"^##+\s+.*\b(examples?|example usage|example code)\b", re.IGNORECASE
-)
-
-# Prose/bold openers that are not ATX headings (V6 §2.6).
-_EXAMPLE_PROSE_OPENER = re.compile(
-    r"^\s*(?:\*\*|__)?(?:examples?|example usage|example code)\s*:\s*(?:\*\*|__)?\s*$",
-    re.IGNORECASE,
-)
-
 # Paths in backticks: repo-style (contains /) with a known extension — skips bare `foo.md`
 # noise from short citations per §3.7 "full paths from project root".
 _PATH_IN_BACKTICKS = re.compile(
@@ -49,22 +41,6 @@ _CITATION_LINE = re.compile(
 )
 
 _MARKER_WINDOW = 2
-_FENCE_LINE = re.compile(r"^\s*```")
-
-
-def _is_example_heading(line: str) -> bool:
-    """True when heading should open an example scan region."""
-    if not _EXAMPLE_HEADING.match(line):
-        return False
-    # Changelog bullets like "(example markers)" are not runnable examples.
-    return "example markers" not in line.lower()
-
-
-def _is_example_region_opener(line: str) -> bool:
-    """True for ATX headings or standalone prose/bold ``Examples:`` openers."""
-    if _is_example_heading(line):
-        return True
-    return bool(_EXAMPLE_PROSE_OPENER.match(line))
 
 
 def _line_has_example_marker(line: str) -> bool:
@@ -106,51 +82,28 @@ def _is_excluded_example_marker_doc(relative_path: str) -> bool:
     return False
 
 
-def _is_atx_heading(line: str) -> bool:
-    """True for Markdown ATX headings (# … ######)."""
-    return bool(re.match(r"^\s*#{1,6}\s+\S", line))
-
-
-def find_unmarked_example_path_lines(content: str) -> list[tuple[int, str]]:
+def find_unmarked_example_path_lines(
+    content: str | MarkdownDocument,
+) -> list[tuple[int, str]]:
     """Return (1-based line number, line text) for advisory review only."""
-    lines = content.splitlines()
+    document = (
+        content
+        if isinstance(content, MarkdownDocument)
+        else MarkdownDocument.from_text(content)
+    )
+    lines = document.lines
     out: list[tuple[int, str]] = []
-    i = 0
-    in_fence = False
-    while i < len(lines):
-        line = lines[i]
-        if _FENCE_LINE.match(line):
-            in_fence = not in_fence
-            i += 1
-            continue
-        if in_fence:
-            i += 1
-            continue
-        is_heading_opener = _is_example_heading(line)
-        is_prose_opener = (not is_heading_opener) and _is_example_region_opener(line)
-        if is_heading_opener or is_prose_opener:
-            i += 1
-            while i < len(lines):
-                body = lines[i]
-                # Heading openers end at the next H2; prose openers end at any ATX
-                # heading so subsection lists are not treated as example bodies.
-                if is_heading_opener and body.startswith("## "):
-                    break
-                if is_prose_opener and _is_atx_heading(body):
-                    break
-                if _FENCE_LINE.match(body):
-                    in_fence = not in_fence
-                    i += 1
-                    continue
-                if not in_fence and (
-                    _PATH_IN_BACKTICKS.search(body)
-                    and not _CITATION_LINE.match(body)
-                    and not _marker_within_window(lines, i)
-                ):
-                    out.append((i + 1, body))
-                i += 1
-            continue
-        i += 1
+    for region in document.example_regions:
+        for line_num in range(region.start, region.end):
+            if document.in_code(line_num):
+                continue
+            body = lines[line_num - 1]
+            if (
+                _PATH_IN_BACKTICKS.search(body)
+                and not _CITATION_LINE.match(body)
+                and not _marker_within_window(lines, line_num - 1)
+            ):
+                out.append((line_num, body))
     return out
 
 
@@ -167,10 +120,10 @@ def scan_paths_for_example_marker_findings(
         if not path.is_file():
             continue
         try:
-            text = path.read_text(encoding="utf-8")
-        except OSError:
+            document = load_markdown_document(path, root)
+        except (OSError, UnicodeDecodeError):
             continue
-        hits = find_unmarked_example_path_lines(text)
+        hits = find_unmarked_example_path_lines(document)
         if hits:
             findings[rel] = [f"line {n}: {txt.strip()}" for n, txt in hits]
     return findings
@@ -24,6 +24,7 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from development_tools.shared.file_inventory import get_project_inventory
 from development_tools.shared.logging import get_dev_tools_logger
 
 # Handle both relative and absolute imports
@@ -62,9 +63,17 @@ class DocumentationAddressFixer:
         skipped = 0
         errors = 0
 
+        inventory = get_project_inventory(self.project_root)
         files_to_process = []
-        for ext in ["*.md", "*.mdc"]:
-            files_to_process.extend(self.project_root.rglob(ext))
+        for ext in [".md", ".mdc"]:
+            files_to_process.extend(
+                inventory.iter_paths(
+                    extensions=(ext,),
+                    tool_type="documentation",
+                    context="development",
+                    exclude=should_exclude_file,
+                )
+            )
 
         generated_files = set(ALL_GENERATED_FILES)
 
@@ -73,10 +82,6 @@ class DocumentationAddressFixer:
             try:
                 rel_path = file_path.relative_to(self.project_root)
                 rel_path_str = str(rel_path).replace("\\", "/")
-                if should_exclude_file(
-                    rel_path_str, tool_type="documentation", context="development"
-                ):
-                    continue
                 if rel_path_str in generated_files:
                     continue
 
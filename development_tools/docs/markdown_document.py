@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+# TOOL_TIER: core
+# TOOL_PORTABILITY: portable
+
+"""
+Parsed markdown document model shared by the docs analyzers.
+
+Heading numbering, ASCII compliance, documentation sync, unconverted links,
+path drift and example-marker validation each used to read the same docs
+and re-derive headings, fences and links with their own line loops. A
+``MarkdownDocument`` is parsed once per file content and exposes:
+
+- ``headings``: ATX headings with level, text, standard number (``2.1.``)
+  and parent heading index (headings inside code fences are kept, flagged);
+- ``fenced_regions``: ```` ``` ```` fenced code blocks;
+- ``links``: markdown links/images outside code fences;
+- ``example_regions``: bodies of "Examples" headings and ``Examples:`` openers;
+- ``non_ascii``: count of each non-ASCII character.
+
+``load_markdown_document`` memoizes models per file within the process
+(validated by size/mtime) and, with a ``project_root``, persists them under
+``development_tools/docs/jsons/scopes/<scope>/.markdown_documents/`` keyed by
+the file's path. Audit tools run as separate processes, so a model parsed by
+one analyzer is reused by the next; a persisted model whose stat changed is
+still reused when the content hash matches.
+
+Usage:
+    from development_tools.docs.markdown_document import load_markdown_document
+
+    document = load_markdown_document(project_root / "README.md", project_root)
+    for heading in document.headings_at(2):
+        ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+try:
+    from development_tools.shared.logging import get_dev_tools_logger
+
+    logger = get_dev_tools_logger("development_tools")
+except ImportError:
+    logger = None
+
+_MODEL_VERSION = 1
+_CACHE_DIR_NAME = ".markdown_documents"
+
+MARKDOWN_LINK_PATTERN = re.compile(r"(!?\[[^\]]+\]\()([^)]+)(\))")
+
+_HEADING_LINE = re.compile(r"^(#{1,6})\s+(.+)$")
+# Standard heading number: "2.1. Title" (trailing period and space)
+_HEADING_NUMBER = re.compile(r"^(\d+(?:\.\d+)*)\.\s+(.+)$")
+
+# Headings that open an "example" region (content until the next ## heading).
+# Broad on purpose: include headings like "Command Examples" and "Example Code".
+EXAMPLE_HEADING_PATTERN = re.compile(
+    r"^##+\s+.*\b(examples?|example usage|example code)\b", re.IGNORECASE
+)
+
+# Prose/bold openers that are not ATX headings (V6 §2.6).
+EXAMPLE_PROSE_OPENER_PATTERN = re.compile(
+    r"^\s*(?:\*\*|__)?(?:examples?|example usage|example code)\s*:\s*(?:\*\*|__)?\s*$",
+    re.IGNORECASE,
+)
+
+
+def is_fence_line(line: str) -> bool:
+    """True for lines that open or close a ``` code fence."""
+    return line.strip().startswith("```")
+
+
+def is_example_heading(line: str) -> bool:
+    """True when heading should open an example scan region."""
+    if not EXAMPLE_HEADING_PATTERN.match(line):
+        return False
+    # Changelog bullets like "(example markers)" are not runnable examples.
+    return "example markers" not in line.lower()
+
+
+def is_example_region_opener(line: str) -> bool:
+    """True for ATX headings or standalone prose/bold ``Examples:`` openers."""
+    if is_example_heading(line):
+        return True
+    return bool(EXAMPLE_PROSE_OPENER_PATTERN.match(line))
+
+
+def is_atx_heading(line: str) -> bool:
+    """True for Markdown ATX headings (# … ######)."""
+    return bool(re.match(r"^\s*#{1,6}\s+\S", line))
+
+
+@dataclass(frozen=True)
+class MarkdownHeading:
+    """One ATX heading; ``line`` is 1-based, ``parent`` indexes ``headings``."""
+
+    line: int
+    level: int
+    text: str
+    number: str | None
+    parent: int | None
+    in_fence: bool
+
+
+@dataclass(frozen=True)
+class MarkdownLink:
+    """One ``[label](href)`` / ``![label](href)`` outside code fences."""
+
+    line: int
+    label: str
+    href: str
+    image: bool
+
+
+@dataclass(frozen=True)
+class ExampleRegion:
+    """Example opener line and its body lines ``[start, end)`` (1-based)."""
+
+    opener_line: int
+    kind: str  # "heading" (ends at next "## ") or "prose" (ends at any ATX heading)
+    start: int
+    end: int
+
+
+class MarkdownDocument:
+    """Headings, fences, links, example regions and non-ASCII counts of one document."""
+
+    def __init__(
+        self,
+        text: str,
+        headings: list[MarkdownHeading],
+        fenced_regions: list[tuple[int, int]],
+        links: list[MarkdownLink],
+        example_regions: list[ExampleRegion],
+        non_ascii: dict[str, int],
+    ):
+        self.text = text
+        self.lines = text.split("\n")
+        self.headings = headings
+        # (opening fence line, closing fence line); unclosed fences close after the last line
+        self.fenced_regions = fenced_regions
+        self.links = links
+        self.example_regions = example_regions
+        self.non_ascii = non_ascii
+        self._line_states: bytearray | None = None
+
+    # Parsing -------------------------------------------------------------
+
+    @classmethod
+    def from_text(cls, text: str) -> MarkdownDocument:
+        lines = text.split("\n")
+        headings: list[MarkdownHeading] = []
+        fenced_regions: list[tuple[int, int]] = []
+        links: list[MarkdownLink] = []
+        non_ascii: dict[str, int] = {}
+        # Index of the latest heading per level, for parent lookup
+        open_headings: dict[int, int] = {}
+        fence_open: int | None = None
+
+        for line_num, line in enumerate(lines, 1):
+            if not line.isascii():
+                for char in line:
+                    if ord(char) > 127:
+                        non_ascii[char] = non_ascii.get(char, 0) + 1
+            if is_fence_line(line):
+                if fence_open is None:
+                    fence_open = line_num
+                else:
+                    fenced_regions.append((fence_open, line_num))
+                    fence_open = None
+                continue
+            if "#" in line:
+                heading_match = _HEADING_LINE.match(line)
+                if heading_match:
+                    level = len(heading_match.group(1))
+                    heading_text = heading_match.group(2).strip()
+                    number_match = _HEADING_NUMBER.match(heading_text)
+                    parent = max(
+                        (index for lvl, index in open_headings.items() if lvl < level),
+                        default=None,
+                    )
+                    open_headings = {
+                        lvl: index for lvl, index in open_headings.items() if lvl < level
+                    }
+                    open_headings[level] = len(headings)
+                    headings.append(
+                        MarkdownHeading(
+                            line=line_num,
+                            level=level,
+                            text=heading_text,
+                            number=number_match.group(1) if number_match else None,
+                            parent=parent,
+                            in_fence=fence_open is not None,
+                        )
+                    )
+            if fence_open is None and "](" in line:
+                for match in MARKDOWN_LINK_PATTERN.finditer(line):
+                    href = match.group(2).strip()
+                    if not href:
+                        continue
+                    prefix = match.group(1)
+                    image = prefix.startswith("!")
+                    links.append(
+                        MarkdownLink(
+                            line=line_num,
+                            label=prefix[2 if image else 1 : -2],
+                            href=href,
+                            image=image,
+                        )
+                    )
+        if fence_open is not None:
+            fenced_regions.append((fence_open, len(lines) + 1))
+
+        document = cls(text, headings, fenced_regions, links, [], non_ascii)
+        document.example_regions = document._find_example_regions()
+        return document
+
+    def _find_example_regions(self) -> list[ExampleRegion]:
+        lines = self.lines
+        regions: list[ExampleRegion] = []
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            if self.in_code(i + 1):
+                i += 1
+                continue
+            is_heading_opener = is_example_heading(line)
+            is_prose_opener = (not is_heading_opener) and is_example_region_opener(line)
+            if not (is_heading_opener or is_prose_opener):
+                i += 1
+                continue
+            opener = i
+            i += 1
+            while i < len(lines):
+                body = lines[i]
+                # Heading openers end at the next H2; prose openers end at any ATX
+                # heading so subsection lists are not treated as example bodies.
+                if is_heading_opener and body.startswith("## "):
+                    break
+                if is_prose_opener and is_atx_heading(body):
+                    break
+                i += 1
+            regions.append(
+                ExampleRegion(
+                    opener_line=opener + 1,
+                    kind="heading" if is_heading_opener else "prose",
+                    start=opener + 2,
+                    end=i + 1,
+                )
+            )
+        return regions
+
+    # Queries -------------------------------------------------------------
+
+    def _states(self) -> bytearray:
+        # 0 = outside fences, 1 = opening fence, 2 = inside a fence, 3 = closing fence
+        if self._line_states is None:
+            states = bytearray(len(self.lines) + 2)
+            for open_line, close_line in self.fenced_regions:
+                for line_num in range(open_line + 1, min(close_line, len(states))):
+                    states[line_num] = 2
+                states[open_line] = 1
+                if close_line < len(states):
+                    states[close_line] = 3
+            self._line_states = states
+        return self._line_states
+
+    def _state(self, line_num: int) -> int:
+        states = self._states()
+        return states[line_num] if 0 < line_num < len(states) else 0
+
+    def is_fence_line(self, line_num: int) -> bool:
+        """True when 1-based ``line_num`` opens or closes a code fence."""
+        return self._state(line_num) in (1, 3)
+
+    def in_fence(self, line_num: int) -> bool:
+        """True from a fence's opening line (inclusive) to its closing line (exclusive)."""
+        return self._state(line_num) in (1, 2)
+
+    def in_code(self, line_num: int) -> bool:
+        """True for fence lines and lines inside fences."""
+        return self._state(line_num) != 0
+
+    def headings_at(self, *levels: int, include_fenced: bool = True) -> list[MarkdownHeading]:
+        """Headings of the given levels in document order."""
+        return [
+            heading
+            for heading in self.headings
+            if heading.level in levels and (include_fenced or not heading.in_fence)
+        ]
+
+    # Serialization -------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "text": self.text,
+            "headings": [
+                [h.line, h.level, h.text, h.number, h.parent, h.in_fence]
+                for h in self.headings
+            ],
+            "fenced_regions": [list(region) for region in self.fenced_regions],
+            "links": [[link.line, link.label, link.href, link.image] for link in self.links],
+            "example_regions": [
+                [r.opener_line, r.kind, r.start, r.end] for r in self.example_regions
+            ],
+            "non_ascii": self.non_ascii,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MarkdownDocument:
+        return cls(
+            text=data["text"],
+            headings=[MarkdownHeading(*item) for item in data["headings"]],
+            fenced_regions=[tuple(region) for region in data["fenced_regions"]],
+            links=[MarkdownLink(*item) for item in data["links"]],
+            example_regions=[ExampleRegion(*item) for item in data["example_regions"]],
+            non_ascii=dict(data["non_ascii"]),
+        )
+
+
+# Caching -----------------------------------------------------------------
+
+_memo_lock = threading.Lock()
+# resolved path -> (size, mtime_ns, sha256, document)
+_memo: dict[str, tuple[int, int, str, MarkdownDocument]] = {}
+
+
+def _cache_file_for(project_root: Path, key: str) -> Path:
+    from development_tools.shared.audit_storage_scope import jsons_dir_for_scope
+
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+    return jsons_dir_for_scope(project_root, "docs") / _CACHE_DIR_NAME / f"{digest}.json"
+
+
+def _read_persisted(cache_file: Path, key: str) -> dict[str, Any] | None:
+    try:
+        with open(cache_file, encoding="utf-8") as handle:
+            entry = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(entry, dict)
+        or entry.get("version") != _MODEL_VERSION
+        or entry.get("path") != key
+    ):
+        return None
+    return entry
+
+
+def _write_persisted(cache_file: Path, entry: dict[str, Any]) -> None:
+    # Analyzers run in parallel processes: write a temp file and swap it in
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as handle:
+            json.dump(entry, handle, ensure_ascii=False)
+        os.replace(tmp_file, cache_file)
+    except OSError as exc:
+        if logger:
+            logger.debug(f"Could not persist markdown model {cache_file}: {exc}")
+
+
+def load_markdown_document(
+    path: Path | str,
+    project_root: Path | str | None = None,
+    use_cache: bool = True,
+) -> MarkdownDocument:
+    """
+    Parsed model of a UTF-8 markdown file, reusing a cached parse when possible.
+
+    Args:
+        path: Markdown file to load
+        project_root: Enables the on-disk model cache shared by audit processes
+        use_cache: False skips the on-disk cache (the in-process memo still applies)
+
+    Raises:
+        OSError / UnicodeDecodeError like ``Path.read_text(encoding="utf-8")``
+    """
+    file_path = Path(path).resolve()
+    key = str(file_path)
+    stat = file_path.stat()
+    size, mtime_ns = stat.st_size, stat.st_mtime_ns
+
+    with _memo_lock:
+        memo = _memo.get(key)
+    if memo and memo[0] == size and memo[1] == mtime_ns:
+        return memo[3]
+
+    cache_file = None
+    entry = None
+    if project_root is not None and use_cache:
+        root = Path(project_root).resolve()
+        try:
+            key_for_cache = file_path.relative_to(root).as_posix()
+        except ValueError:
+            key_for_cache = None
+        if key_for_cache is not None:
+            cache_file = _cache_file_for(root, key_for_cache)
+            entry = _read_persisted(cache_file, key_for_cache)
+            if entry and entry.get("size") == size and entry.get("mtime_ns") == mtime_ns:
+                try:
+                    document = MarkdownDocument.from_dict(entry["model"])
+                except (KeyError, TypeError, ValueError):
+                    entry = None
+                else:
+                    with _memo_lock:
+                        _memo[key] = (size, mtime_ns, entry.get("sha256", ""), document)
+                    return document
+
+    with open(file_path, "rb") as handle:
+        raw = handle.read()
+    sha256 = hashlib.sha256(raw).hexdigest()
+    document = None
+    if memo and memo[2] == sha256:
+        document = memo[3]
+    elif entry and entry.get("sha256") == sha256:
+        try:
+            document = MarkdownDocument.from_dict(entry["model"])
+        except (KeyError, TypeError, ValueError):
+            document = None
+    if document is None:
+        # Same newline translation as open(..., encoding="utf-8").read()
+        text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        document = MarkdownDocument.from_text(text)
+
+    with _memo_lock:
+        _memo[key] = (size, mtime_ns, sha256, document)
+    if cache_file is not None:
+        _write_persisted(
+            cache_file,
+            {
+                "version": _MODEL_VERSION,
+                "path": key_for_cache,
+                "size": size,
+                "mtime_ns": mtime_ns,
+                "sha256": sha256,
+                "model": document.to_dict(),
+            },
+        )
+    return document
+
+
+def clear_markdown_document_memo() -> None:
+    """Forget in-process models (tests)."""
+    with _memo_lock:
+        _memo.clear()
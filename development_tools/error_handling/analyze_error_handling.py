@@ -983,14 +983,16 @@ class ErrorHandlingAnalyzer:
         python_files = []
         
         # Scan configured directories (same approach as analyze_functions)
-        for scan_dir in scan_directories:
-            dir_path = self.project_root / scan_dir
-            if not dir_path.exists():
-                continue
-            for py_file in dir_path.rglob('*.py'):
-                # Use context-based exclusions
-                if not should_exclude_file(str(py_file), 'analysis', context):
-                    python_files.append(py_file)
+        from development_tools.shared.file_inventory import get_project_inventory
+
+        for item in get_project_inventory(self.project_root).iter_files(
+            extensions=('.py',),
+            directories=list(scan_directories),
+            tool_type='analysis',
+            context=context,
+            exclude=should_exclude_file,
+        ):
+            python_files.append(self.project_root / item.rel_path)
         
         # Also scan root directory for .py files (entry points)
         for py_file in self.project_root.glob('*.py'):
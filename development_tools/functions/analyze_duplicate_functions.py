@@ -517,27 +517,25 @@ def _gather_function_records(
     cached_files = 0
     scanned_files = 0
 
-    for scan_dir in scan_dirs:
-        dir_path = project_root / scan_dir
-        if not dir_path.exists():
-            continue
-        for py_file in dir_path.rglob("*.py"):
-            if should_exclude_file(str(py_file), "analysis", context):
-                continue
-            total_files += 1
-            cached_records = cache.get_cached(py_file)
-            if isinstance(cached_records, list):
-                cached_files += 1
-                records.extend(_deserialize_records(cached_records))
-                continue
-            file_records = _scan_file(py_file, consider_body_similarity=consider_body_similarity)
-            cache.cache_results(py_file, _serialize_records(file_records, include_body=include_body))
-            scanned_files += 1
-            records.extend(file_records)
-
-    for py_file in project_root.glob("*.py"):
-        if should_exclude_file(str(py_file), "analysis", context):
-            continue
+    from development_tools.shared.file_inventory import get_project_inventory
+
+    inventory = get_project_inventory(project_root)
+    nested_files = inventory.iter_paths(
+        extensions=(".py",),
+        directories=scan_dirs,
+        tool_type="analysis",
+        context=context,
+        exclude=should_exclude_file,
+    )
+    root_files = inventory.iter_paths(
+        extensions=(".py",),
+        directories=[""],
+        recursive=False,
+        tool_type="analysis",
+        context=context,
+        exclude=should_exclude_file,
+    )
+    for py_file in [*nested_files, *root_files]:
         total_files += 1
         cached_records = cache.get_cached(py_file)
         if isinstance(cached_records, list):
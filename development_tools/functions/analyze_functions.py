@@ -556,28 +556,28 @@ def scan_all_python_files(
     # Directories to scan from configuration
     scan_dirs = config.get_scan_directories()
 
-    for scan_dir in scan_dirs:
-        dir_path = project_root / scan_dir
-        if not dir_path.exists():
-            continue
-
-        for py_file in dir_path.rglob("*.py"):
-            # Use production context exclusions to match audit behavior
-            if should_exclude_file(str(py_file), "analysis", "production"):
-                continue
+    from development_tools.shared.file_inventory import get_project_inventory
+
+    # Use production context exclusions to match audit behavior
+    for item in get_project_inventory(project_root).iter_files(
+        extensions=(".py",),
+        directories=list(scan_dirs),
+        tool_type="analysis",
+        context="production",
+        exclude=should_exclude_file,
+    ):
+        py_file = project_root / item.rel_path
+        file_key = item.rel_path
 
-            relative_path = py_file.relative_to(project_root)
-            file_key = str(relative_path).replace("\\", "/")
-
-            functions = extract_functions_from_file(str(py_file))
-            classes = extract_classes_from_file(str(py_file))
+        functions = extract_functions_from_file(str(py_file))
+        classes = extract_classes_from_file(str(py_file))
 
-            results[file_key] = {
-                "functions": functions,
-                "classes": classes,
-                "total_functions": len(functions),
-                "total_classes": len(classes),
-            }
+        results[file_key] = {
+            "functions": functions,
+            "classes": classes,
+            "total_functions": len(functions),
+            "total_classes": len(classes),
+        }
 
     # Also scan root directory for .py files
     # Get key files from config (entry points that should be included)
@@ -693,23 +693,25 @@ def scan_all_functions(
     else:
         context = "production"  # Exclude tests and dev tools
 
-    # Scan configured directories
-    for scan_dir in scan_dirs:
-        dir_path = root / scan_dir
-        if not dir_path.exists():
-            continue
-        for py_file in dir_path.rglob("*.py"):
-            # Use context-based exclusions
-            if not should_exclude_file(str(py_file), "analysis", context):
-                if cache:
-                    cached = cache.get_cached(py_file)
-                    if cached is not None:
-                        all_functions.extend(cached)
-                        continue
-                functions = extract_functions(str(py_file))
-                if cache:
-                    cache.cache_results(py_file, functions)
-                all_functions.extend(functions)
+    from development_tools.shared.file_inventory import get_project_inventory
+
+    # Scan configured directories with context-based exclusions
+    for py_file in get_project_inventory(root).iter_paths(
+        extensions=(".py",),
+        directories=list(scan_dirs),
+        tool_type="analysis",
+        context=context,
+        exclude=should_exclude_file,
+    ):
+        if cache:
+            cached = cache.get_cached(py_file)
+            if cached is not None:
+                all_functions.extend(cached)
+                continue
+        functions = extract_functions(str(py_file))
+        if cache:
+            cache.cache_results(py_file, functions)
+        all_functions.extend(functions)
 
     # Also scan root directory
     for py_file in root.glob("*.py"):
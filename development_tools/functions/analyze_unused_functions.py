@@ -395,23 +395,21 @@ def _collect_python_files(
         scan_dirs.append("development_tools")
 
     context = "development" if include_tests or include_dev_tools else "production"
-    files: list[Path] = []
 
-    for scan_dir in scan_dirs:
-        dir_path = project_root / scan_dir
-        if not dir_path.exists():
-            continue
-        for py_file in dir_path.rglob("*.py"):
-            if apply_exclusions and should_exclude_file(
-                str(py_file), "analysis", context
-            ):
-                continue
-            files.append(py_file)
+    from development_tools.shared.file_inventory import get_project_inventory
 
-    for py_file in project_root.glob("*.py"):
-        if apply_exclusions and should_exclude_file(str(py_file), "analysis", context):
-            continue
-        files.append(py_file)
+    inventory = get_project_inventory(project_root)
+    filters = {
+        "extensions": (".py",),
+        "tool_type": "analysis",
+        "context": context,
+        "apply_exclusions": apply_exclusions,
+        "exclude": should_exclude_file,
+    }
+    files: list[Path] = [
+        *inventory.iter_paths(directories=scan_dirs, **filters),
+        *inventory.iter_paths(directories=[""], recursive=False, **filters),
+    ]
 
     return files
 
@@ -84,29 +84,24 @@ def collect_python_files(
     files: list[Path] = []
     seen: set[Path] = set()
 
-    for scan_dir in scan_dirs:
-        dir_path = root / scan_dir
-        if not dir_path.exists():
+    from development_tools.shared.file_inventory import get_project_inventory
+
+    inventory = get_project_inventory(root)
+    filters = {
+        "extensions": (".py",),
+        "tool_type": "analysis",
+        "context": context,
+        "apply_exclusions": apply_exclusions,
+        "exclude": should_exclude_file,
+    }
+    for py_file in [
+        *inventory.iter_paths(directories=scan_dirs, **filters),
+        *inventory.iter_paths(directories=[""], recursive=False, **filters),
+    ]:
+        if py_file in seen:
             continue
-        for py_file in dir_path.rglob("*.py"):
-            if apply_exclusions and should_exclude_file(
-                str(py_file), "analysis", context
-            ):
-                continue
-            resolved = py_file.resolve()
-            if resolved in seen:
-                continue
-            seen.add(resolved)
-            files.append(resolved)
-
-    for py_file in root.glob("*.py"):
-        if apply_exclusions and should_exclude_file(str(py_file), "analysis", context):
-            continue
-        resolved = py_file.resolve()
-        if resolved in seen:
-            continue
-        seen.add(resolved)
-        files.append(resolved)
+        seen.add(py_file)
+        files.append(py_file)
 
     return files
 
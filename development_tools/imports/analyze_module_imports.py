@@ -194,38 +194,36 @@ class ModuleImportAnalyzer:
         # Directories to scan from configuration
         scan_dirs = config.get_scan_directories()
 
-        for scan_dir in scan_dirs:
-            dir_path = self.project_root / scan_dir
-            if not dir_path.exists():
-                continue
-
-            for py_file in dir_path.rglob("*.py"):
-                # Use production context exclusions to match audit behavior
-                if standard_exclusions.should_exclude_file(
-                    str(py_file), "analysis", "production"
-                ):
+        from development_tools.shared.file_inventory import get_project_inventory
+
+        # Use production context exclusions to match audit behavior
+        for py_file in get_project_inventory(self.project_root).iter_paths(
+            extensions=(".py",),
+            directories=list(scan_dirs),
+            tool_type="analysis",
+            context="production",
+            exclude=standard_exclusions.should_exclude_file,
+        ):
+            relative_path = py_file.relative_to(self.project_root)
+            file_key = str(relative_path).replace("\\", "/")
+
+            if self.cache:
+                cached = self.cache.get_cached(py_file)
+                if cached is not None:
+                    results[file_key] = cached
                     continue
 
-                relative_path = py_file.relative_to(self.project_root)
-                file_key = str(relative_path).replace("\\", "/")
-
-                if self.cache:
-                    cached = self.cache.get_cached(py_file)
-                    if cached is not None:
-                        results[file_key] = cached
-                        continue
-
-                imports = self.extract_imports_from_file(str(py_file))
-
-                file_result = {
-                    "imports": imports,
-                    "total_imports": sum(
-                        len(imp_list) for imp_list in imports.values()
-                    ),
-                }
-                results[file_key] = file_result
-                if self.cache:
-                    self.cache.cache_results(py_file, file_result)
+            imports = self.extract_imports_from_file(str(py_file))
+
+            file_result = {
+                "imports": imports,
+                "total_imports": sum(
+                    len(imp_list) for imp_list in imports.values()
+                ),
+            }
+            results[file_key] = file_result
+            if self.cache:
+                self.cache.cache_results(py_file, file_result)
 
         # Also scan root directory for .py files
         for py_file in self.project_root.glob("*.py"):
@@ -27,6 +27,7 @@ project_root = Path(__file__).parent.parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+from development_tools.shared.file_inventory import get_project_inventory
 from development_tools.shared.logging import get_dev_tools_logger
 from development_tools.shared.exclusion_utilities import parse_devtools_markers
 
@@ -428,8 +429,11 @@ class LegacyReferenceAnalyzer:
         findings: dict[str, list[tuple[str, str, list[dict[str, Any]]]]],
         cache_stats: dict[str, int],
     ) -> None:
-        """Scan files matching *glob_pattern*, using mtime cache to skip unchanged I/O."""
-        for file_path in self.project_root.rglob(glob_pattern):
+        """Scan files matching *glob_pattern* (``*<suffix>``), using mtime cache to skip unchanged I/O."""
+        # run_tests.py is scanned despite base exclusions, so _path_should_skip filters
+        for file_path in get_project_inventory(self.project_root).iter_paths(
+            extensions=(glob_pattern.lstrip("*"),), apply_exclusions=False
+        ):
             rel_path_str = self._relative_path_str(file_path)
             if (
                 not rel_path_str.endswith("run_tests.py")
@@ -523,8 +527,10 @@ class LegacyReferenceAnalyzer:
             rf"`{re.escape(item_name)}`",
         ]
 
+        inventory = get_project_inventory(self.project_root)
+
         # Scan Python files
-        for py_file in self.project_root.rglob("*.py"):
+        for py_file in inventory.iter_paths(extensions=(".py",), apply_exclusions=False):
             if self.should_skip_file(py_file):
                 continue
 
@@ -598,7 +604,7 @@ class LegacyReferenceAnalyzer:
                     logger.warning(f"Error reading {py_file}: {e}")
 
         # Scan Markdown files
-        for md_file in self.project_root.rglob("*.md"):
+        for md_file in inventory.iter_paths(extensions=(".md",), apply_exclusions=False):
             if self.should_skip_file(md_file):
                 continue
 
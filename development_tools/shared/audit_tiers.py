@@ -79,6 +79,7 @@ TIER3_TOOL_NAMES = [
     "analyze_pip_audit",
     "analyze_vulture",
     "verify_process_cleanup",
+    "analyze_core_benchmarks",
 ]
 
 # Tools listed in flat membership but not scheduled by get_tier*_groups().
@@ -129,7 +130,7 @@ TIER3_GROUP_MAP: dict[str, list[str]] = {
         "analyze_pip_audit",
         "analyze_vulture",
     ],
-    "post_test": ["verify_process_cleanup"],
+    "post_test": ["verify_process_cleanup", "analyze_core_benchmarks"],
 }
 
 
@@ -198,6 +199,7 @@ def get_tier3_tool_names_dev_tools_only() -> list[str]:
         if name
         not in (
             "generate_legacy_reference_report",
+            "analyze_core_benchmarks",
         )
     ]
 
@@ -362,6 +364,8 @@ def get_tier3_groups(
     The test-suite group runs pytest without coverage. ``verify_process_cleanup`` runs in
     ``post_test_group`` after parallel work completes so orphan detection runs when workers
     may exist and does not contend with pytest subprocess startup (Windows SIGINT noise).
+    ``analyze_core_benchmarks`` follows it there so timings do not compete with the
+    parallel groups; it times product code and is skipped in dev-tools-only scope.
 
     Coverage regeneration, marker analysis, and coverage report generation are reserved for
     the explicit ``coverage`` command (``analyze_test_markers`` is in
@@ -378,5 +382,9 @@ def get_tier3_groups(
         )
     legacy_group = _names_to_runnables(service, legacy_names)
     static_analysis_group = _names_to_runnables(service, TIER3_GROUP_MAP["static_analysis"])
-    post_test_group = _names_to_runnables(service, TIER3_GROUP_MAP["post_test"])
+    post_test_names = list(TIER3_GROUP_MAP["post_test"])
+    if dev_tools_only:
+        post_test_names = [n for n in post_test_names if n != "analyze_core_benchmarks"]
+        logger.info("Skipping analyze_core_benchmarks (dev-tools-only scope).")
+    post_test_group = _names_to_runnables(service, post_test_names)
     return test_suite_group, legacy_group, static_analysis_group, post_test_group
@@ -854,6 +854,36 @@ def _trees_command(service: "AIToolsService", argv: Sequence[str]) -> int:
     return 0 if success else 1
 
 
+def _worker_command(service: "AIToolsService", argv: Sequence[str]) -> int:
+    """Start, stop or inspect the warm dev-tools worker for this project."""
+    parser = argparse.ArgumentParser(prog="worker", add_help=False)
+    parser.add_argument("action", nargs="?", choices=("start", "stop", "status", "serve"), default="status")
+    parser.add_argument("--mode", choices=("auto", "fork", "inprocess"), default="auto")
+    if any(arg in ("-h", "--help") for arg in argv):
+        _print_command_help(parser)
+        return 0
+    ns = parser.parse_args(list(argv))
+
+    from development_tools.shared.dev_tools_worker import main as worker_main
+
+    return int(worker_main([ns.action, "--project-root", str(service.project_root), "--mode", ns.mode]))
+
+
+def _watch_command(service: "AIToolsService", argv: Sequence[str]) -> int:
+    parser = argparse.ArgumentParser(prog="watch", add_help=False)
+    parser.add_argument("--interval", type=float, default=2.0, help="Seconds between change polls.")
+    parser.add_argument("--once", action="store_true", help="Run affected analyzers once and exit.")
+    parser.add_argument("--no-worker", action="store_true", help="Do not start the warm dev-tools worker.")
+    if any(arg in ("-h", "--help") for arg in argv):
+        _print_command_help(parser)
+        return 0
+    ns = parser.parse_args(list(argv))
+
+    from development_tools.shared.dev_tools_watch import watch
+
+    return watch(service, interval=ns.interval, once=ns.once, use_worker=not ns.no_worker)
+
+
 def _show_help_command(service: "AIToolsService", argv: Sequence[str]) -> int:
     service.show_help()
     return 0
@@ -1059,6 +1089,22 @@ COMMAND_REGISTRY = OrderedDict(
                 "trees", _trees_command, "Generate directory tree reports."
             ),
         ),
+        (
+            "worker",
+            CommandRegistration(
+                "worker",
+                _worker_command,
+                "Start/stop/status of the warm dev-tools worker that runs tools without new interpreters.",
+            ),
+        ),
+        (
+            "watch",
+            CommandRegistration(
+                "watch",
+                _watch_command,
+                "Re-run only the Tier 1/2 analyzers affected by file changes.",
+            ),
+        ),
         (
             "help",
             CommandRegistration(
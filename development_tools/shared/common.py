@@ -142,16 +142,31 @@ def iter_python_sources(
     if project_root is None:
         project_root = PROJECT_ROOT
 
+    from development_tools.shared.file_inventory import get_project_inventory
+
+    inventory = get_project_inventory(project_root)
     for directory in directories:
         base_path = (
             project_root / directory if isinstance(directory, str) else directory
         )
         if not base_path.exists():
             continue
-        for path in base_path.rglob("*.py"):
-            if should_exclude_file(str(path), tool_type=tool_type, context=context):
-                continue
-            yield path
+        try:
+            base_path.resolve().relative_to(inventory.project_root)
+        except ValueError:
+            # Outside the project: not covered by the inventory
+            for path in base_path.rglob("*.py"):
+                if should_exclude_file(str(path), tool_type=tool_type, context=context):
+                    continue
+                yield path
+            continue
+        yield from inventory.iter_paths(
+            extensions=(".py",),
+            directories=[base_path],
+            tool_type=tool_type,
+            context=context,
+            exclude=should_exclude_file,
+        )
 
 
 def run_cli(
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# TOOL_TIER: supporting
+# TOOL_PORTABILITY: portable
+
+"""
+Watch mode: re-run only the Tier 1/2 analyzers affected by changed files.
+
+Polls the project file inventory (``.py``, ``.md``, ``.mdc``, ``.json``), diffs
+size/mtime against the previous poll, maps the changed paths to the analyzers
+that read them, and runs just those through the service (and therefore through
+the warm dev-tools worker when one is running). Files written by the analyzers
+themselves are absorbed by taking a new snapshot after each cycle.
+
+Usage:
+    python development_tools/run_development_tools.py watch [--interval 2] [--once] [--no-worker]
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from development_tools.shared.logging import get_dev_tools_logger
+
+if TYPE_CHECKING:
+    from development_tools.shared.service.core import AIToolsService
+
+logger = get_dev_tools_logger("development_tools")
+
+WATCH_EXTENSIONS = (".py", ".md", ".mdc", ".json")
+
+DOC_TOOLS = ("analyze_documentation", "analyze_documentation_sync")
+CONFIG_TOOLS = ("analyze_config",)
+DEV_TOOLS_ONLY_TOOLS = ("analyze_dev_tools_import_boundaries",)
+CODE_TOOLS = (
+    "analyze_functions",
+    "analyze_function_patterns",
+    "decision_support",
+    "analyze_error_handling",
+    "analyze_package_exports",
+    "analyze_duplicate_functions",
+    "analyze_unused_functions",
+    "analyze_facade_shims",
+    "analyze_module_refactor_candidates",
+    "analyze_module_imports",
+    "analyze_dependency_patterns",
+    "analyze_module_dependencies",
+    "analyze_function_registry",
+    "analyze_documentation_sync",
+)
+
+# Analyzer output, caches and logs; changes there never trigger a cycle
+_IGNORED_PARTS = ("jsons", "reports", "logs", "__pycache__", ".pytest_cache")
+
+Snapshot = dict[str, tuple[int, int]]
+
+
+def take_snapshot(project_root: Path) -> Snapshot:
+    """Map project-relative paths of watched files to (size, mtime_ns)."""
+    from development_tools.shared.file_inventory import get_project_inventory
+
+    inventory = get_project_inventory(project_root)
+    snapshot: Snapshot = {}
+    for path in inventory.iter_paths(extensions=WATCH_EXTENSIONS):
+        rel_path = path.relative_to(project_root).as_posix()
+        if any(part in _IGNORED_PARTS for part in rel_path.split("/")[:-1]):
+            continue
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        snapshot[rel_path] = (stat.st_size, stat.st_mtime_ns)
+    return snapshot
+
+
+def changed_paths(before: Snapshot, after: Snapshot) -> list[str]:
+    """Paths added, removed or modified between two snapshots."""
+    return sorted(
+        path for path in before.keys() | after.keys() if before.get(path) != after.get(path)
+    )
+
+
+def affected_tools(paths: Iterable[str]) -> list[str]:
+    """Tier 1/2 analyzer names that read any of ``paths``, in audit order."""
+    from development_tools.shared.audit_tiers import TIER1_TOOL_NAMES, TIER2_TOOL_NAMES
+
+    selected: set[str] = set()
+    for path in paths:
+        suffix = Path(path).suffix
+        if path.startswith("development_tools/config/") or path == "pyproject.toml":
+            selected.update(CONFIG_TOOLS)
+        if suffix in (".md", ".mdc"):
+            selected.update(DOC_TOOLS)
+        elif suffix == ".py":
+            selected.update(CODE_TOOLS)
+            if path.startswith("development_tools/"):
+                selected.update(DEV_TOOLS_ONLY_TOOLS)
+    return [name for name in (*TIER1_TOOL_NAMES, *TIER2_TOOL_NAMES) if name in selected]
+
+
+def run_tools(service: AIToolsService, tool_names: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """Run the named Tier 1/2 tools through the service; returns per-tool outcome."""
+    from development_tools.shared.audit_tiers import get_tier_runnables
+
+    wanted = set(tool_names)
+    runnables = [
+        item
+        for tier in (1, 2)
+        for item in get_tier_runnables(service, tier, include_quick_status=False)
+        if item[0] in wanted
+    ]
+    outcomes: dict[str, dict[str, Any]] = {}
+    for name, runnable in runnables:
+        try:
+            result, elapsed = service._run_tool_with_timing(name, runnable)
+        except Exception as exc:
+            outcomes[name] = {"success": False, "elapsed": 0.0, "error": str(exc)}
+            continue
+        success = result.get("success", True) if isinstance(result, dict) else bool(result)
+        outcomes[name] = {"success": bool(success), "elapsed": elapsed}
+    return outcomes
+
+
+def _print_cycle(changed: list[str], outcomes: dict[str, dict[str, Any]]) -> None:
+    preview = ", ".join(changed[:3]) + (f" (+{len(changed) - 3} more)" if len(changed) > 3 else "")
+    if not outcomes:
+        print(f"[watch] {len(changed)} changed ({preview}); no analyzers affected", flush=True)
+        return
+    failed = [name for name, outcome in outcomes.items() if not outcome["success"]]
+    total = sum(outcome["elapsed"] for outcome in outcomes.values())
+    status = f"FAILED: {', '.join(failed)}" if failed else "ok"
+    print(
+        f"[watch] {len(changed)} changed ({preview}); "
+        f"ran {len(outcomes)} analyzers in {total:.1f}s: {status}",
+        flush=True,
+    )
+
+
+def watch(
+    service: AIToolsService,
+    *,
+    interval: float = 2.0,
+    once: bool = False,
+    use_worker: bool = True,
+) -> int:
+    """
+    Poll for changes and re-run affected analyzers until interrupted.
+
+    With ``once``, runs every analyzer that reads a watched file one time and
+    returns (useful as a warm pre-commit check).
+    """
+    from development_tools.shared import dev_tools_worker
+
+    project_root = Path(service.project_root).resolve()
+    started_worker = False
+    if use_worker and os.environ.get(dev_tools_worker.WORKER_ENV_FLAG, "1") != "0":
+        if dev_tools_worker.worker_status(project_root) is None:
+            started_worker = dev_tools_worker.start_worker(project_root) is not None
+            if not started_worker:
+                logger.warning("Dev-tools worker did not start; watch will use subprocesses")
+
+    previous = take_snapshot(project_root)
+    print(
+        f"[watch] watching {len(previous)} files under {project_root} "
+        f"(interval {interval:g}s{', worker' if use_worker else ''}); Ctrl+C to stop",
+        flush=True,
+    )
+    exit_code = 0
+    try:
+        while True:
+            if once:
+                changed = sorted(previous)
+            else:
+                time.sleep(interval)
+                current = take_snapshot(project_root)
+                changed = changed_paths(previous, current)
+                previous = current
+                if not changed:
+                    continue
+            outcomes = run_tools(service, affected_tools(changed))
+            _print_cycle(changed, outcomes)
+            if any(not outcome["success"] for outcome in outcomes.values()):
+                exit_code = 1
+            # Absorb files the analyzers wrote so they do not trigger the next cycle
+            previous = take_snapshot(project_root)
+            if once:
+                return exit_code
+            exit_code = 0
+    except KeyboardInterrupt:
+        print("[watch] stopped", flush=True)
+        return 0
+    finally:
+        if started_worker:
+            dev_tools_worker.stop_worker(project_root)
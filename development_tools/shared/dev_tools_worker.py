@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+# TOOL_TIER: supporting
+# TOOL_PORTABILITY: portable
+
+"""
+Warm, long-lived worker that runs registered dev-tools scripts without a new interpreter.
+
+``AIToolsService.run_script`` normally starts every analyzer as a fresh
+``sys.executable`` subprocess. Each one pays interpreter startup, imports of the
+``development_tools`` package, config loading, and cold file inventory and markdown
+caches before it does any real work. The worker is started once per project
+(``worker start``). It imports the analyzers, loads config, warms the shared file
+inventory and markdown models, and then listens on a localhost socket
+(``multiprocessing.connection``, authenticated with a per-run key). Each
+``run_script`` request is then executed:
+
+- ``fork`` mode (POSIX default): in a forked child of the warm worker, with
+  stdout/stderr captured at the file-descriptor level. Each request sees a clean
+  copy of the warm state, and requests run concurrently.
+- ``inprocess`` mode (default where ``os.fork`` is unavailable): in the worker
+  itself, one request at a time, with ``sys.stdout``/``sys.stderr`` redirected.
+  Scripts that spawn heavy subprocess trees run through the subprocess path.
+
+The worker records its pid, port and key in
+``development_tools/shared/jsons/.dev_tools_worker.json``. Clients that cannot
+reach it, and requests the worker declines, fall back to the normal subprocess
+path; set ``MHM_DEV_TOOLS_WORKER=0`` to bypass the worker entirely. When a
+development_tools module the worker has imported changes on disk, the worker
+declines the request and restarts itself so later requests run current code.
+
+Usage:
+    python development_tools/run_development_tools.py worker start
+    python development_tools/run_development_tools.py worker status
+    python development_tools/run_development_tools.py worker stop
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import os
+import runpy
+import secrets
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from multiprocessing.connection import Client, Connection, Listener
+from pathlib import Path
+from typing import Any
+
+from development_tools.shared.lock_state import is_pid_alive
+from development_tools.shared.logging import get_dev_tools_logger
+
+logger = get_dev_tools_logger("development_tools")
+
+WORKER_ENV_FLAG = "MHM_DEV_TOOLS_WORKER"
+WORKER_MODES = ("auto", "fork", "inprocess")
+_STATE_FILE_NAME = ".dev_tools_worker.json"
+_STATE_VERSION = 1
+_HOST = "127.0.0.1"
+# Extra time a client waits past the tool timeout before giving up on the worker
+_RESPONSE_GRACE_SECONDS = 10
+_REQUEST_READ_TIMEOUT_SECONDS = 5
+_INVENTORY_REFRESH_SECONDS = 2.0
+# Spawn their own pytest/static-analysis process trees; gain nothing from a warm
+# interpreter and must not hold the single in-process slot
+_SUBPROCESS_ONLY_SCRIPTS = frozenset(
+    {
+        "run_test_coverage",
+        "run_test_suite",
+        "flaky_detector",
+        "analyze_pyright",
+        "analyze_ruff",
+        "analyze_bandit",
+        "analyze_pip_audit",
+        "analyze_vulture",
+        "analyze_core_benchmarks",
+    }
+)
+_WARM_SCRIPT_PREFIXES = ("analyze_", "generate_", "quick_status", "decision_support")
+
+
+class _ToolTimeout(BaseException):
+    """Raised in a worker child when a tool exceeds its timeout."""
+
+
+def worker_state_path(project_root: Path | str) -> Path:
+    """``development_tools/shared/jsons/.dev_tools_worker.json`` for a project."""
+    from development_tools.shared.audit_storage_scope import legacy_flat_jsons_dir
+
+    return legacy_flat_jsons_dir(Path(project_root), "shared") / _STATE_FILE_NAME
+
+
+def read_worker_state(project_root: Path | str) -> dict[str, Any] | None:
+    """Published worker address for a project, or None when no live worker is recorded."""
+    path = worker_state_path(project_root)
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(state, dict) or state.get("version") != _STATE_VERSION:
+        return None
+    if not is_pid_alive(state.get("pid")):
+        return None
+    return state
+
+
+def resolve_worker_mode(mode: str = "auto") -> str:
+    if mode == "auto":
+        return "fork" if hasattr(os, "fork") else "inprocess"
+    if mode == "fork" and not hasattr(os, "fork"):
+        raise ValueError("fork mode is not available on this platform")
+    return mode
+
+
+def _exit_code(code: Any) -> int:
+    """Map ``SystemExit.code`` to a process return code like the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _execute_script(script_path: str, args: list[str], env: dict[str, str], cwd: str) -> int:
+    """Run a script as ``__main__`` in this process; returns its exit code."""
+    os.environ.clear()
+    os.environ.update(env)
+    # Scripts that call run_script themselves must not queue behind this request
+    os.environ[WORKER_ENV_FLAG] = "0"
+    os.chdir(cwd)
+    sys.argv = [script_path, *args]
+    sys.path.insert(0, str(Path(script_path).parent))
+    try:
+        runpy.run_path(script_path, run_name="__main__")
+    except SystemExit as exc:
+        return _exit_code(exc.code)
+    except _ToolTimeout:
+        raise
+    except BaseException:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+class DevToolsWorker:
+    """Socket server that runs ``run_script`` requests in a warm interpreter."""
+
+    def __init__(self, project_root: Path | str, mode: str = "auto"):
+        self.project_root = Path(project_root).resolve()
+        self.mode = resolve_worker_mode(mode)
+        self.started_at = time.time()
+        self.requests_served = 0
+        self._children: set[int] = set()
+        self._module_mtimes: dict[str, int] = {}
+        self._last_inventory_refresh = 0.0
+        self._listener: Listener | None = None
+
+    # Warm state ----------------------------------------------------------
+
+    def warm(self) -> None:
+        """Load config, import analyzers and prime the shared file/markdown caches."""
+        os.environ["MHM_DEV_TOOLS_RUN"] = "1"
+        os.chdir(self.project_root)
+        from development_tools import config
+        from development_tools.shared.tool_metadata import get_script_registry
+
+        config.load_external_config()
+        for name, rel_path in sorted(get_script_registry().items()):
+            if not name.startswith(_WARM_SCRIPT_PREFIXES):
+                continue
+            module_name = "development_tools." + rel_path[: -len(".py")].replace("/", ".")
+            try:
+                importlib.import_module(module_name)
+            except Exception as exc:
+                logger.debug(f"Worker could not pre-import {module_name}: {exc}")
+        self._refresh_inventory(force=True)
+        self._warm_markdown_documents()
+        self._module_mtimes = self._loaded_module_mtimes()
+        logger.info(
+            f"Dev-tools worker warmed {len(self._module_mtimes)} modules "
+            f"in {time.time() - self.started_at:.2f}s (mode={self.mode})"
+        )
+
+    def _refresh_inventory(self, force: bool = False) -> None:
+        if not force and time.time() - self._last_inventory_refresh < _INVENTORY_REFRESH_SECONDS:
+            return
+        try:
+            from development_tools.shared.file_inventory import get_project_inventory
+
+            get_project_inventory(self.project_root)
+        except Exception as exc:
+            logger.debug(f"Worker inventory refresh failed: {exc}")
+        self._last_inventory_refresh = time.time()
+
+    def _warm_markdown_documents(self) -> None:
+        try:
+            from development_tools.docs.markdown_document import load_markdown_document
+            from development_tools.shared.constants import DEFAULT_DOCS
+        except ImportError:
+            return
+        for rel_path in DEFAULT_DOCS:
+            path = self.project_root / rel_path
+            if path.is_file():
+                with contextlib.suppress(Exception):
+                    load_markdown_document(path, self.project_root)
+
+    def _loaded_module_mtimes(self) -> dict[str, int]:
+        package_dir = str(Path(__file__).resolve().parent.parent)
+        mtimes: dict[str, int] = {}
+        for module in list(sys.modules.values()):
+            module_file = getattr(module, "__file__", None)
+            if not module_file or not module_file.startswith(package_dir):
+                continue
+            with contextlib.suppress(OSError):
+                mtimes[module_file] = os.stat(module_file).st_mtime_ns
+        config_file = self.project_root / "development_tools" / "config" / "development_tools_config.json"
+        with contextlib.suppress(OSError):
+            mtimes[str(config_file)] = config_file.stat().st_mtime_ns
+        return mtimes
+
+    def code_changed(self) -> bool:
+        """True when a module or config file loaded into the worker changed on disk."""
+        for path, mtime_ns in self._module_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    # Serving -------------------------------------------------------------
+
+    def _write_state(self, port: int, authkey: bytes) -> None:
+        path = worker_state_path(self.project_root)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "version": _STATE_VERSION,
+            "pid": os.getpid(),
+            "host": _HOST,
+            "port": port,
+            "authkey": authkey.hex(),
+            "mode": self.mode,
+            "started_at": self.started_at,
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(state, handle)
+        os.replace(tmp_path, path)
+
+    def _clear_state(self) -> None:
+        path = worker_state_path(self.project_root)
+        state = None
+        with contextlib.suppress(OSError, ValueError):
+            state = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(state, dict) and state.get("pid") == os.getpid():
+            with contextlib.suppress(OSError):
+                path.unlink()
+
+    def serve(self) -> int:
+        """Accept requests until ``stop`` (or SIGTERM); returns the exit code."""
+        authkey = secrets.token_bytes(32)
+        self._listener = Listener((_HOST, 0), authkey=authkey)
+        port = self._listener.address[1]
+        self._write_state(port, authkey)
+
+        def _terminate(_signum, _frame):
+            raise SystemExit(0)
+
+        with contextlib.suppress(ValueError):
+            signal.signal(signal.SIGTERM, _terminate)
+        logger.info(f"Dev-tools worker listening on {_HOST}:{port} (pid {os.getpid()})")
+
+        restart = False
+        try:
+            while True:
+                self._reap_children()
+                try:
+                    conn = self._listener.accept()
+                except (OSError, EOFError) as exc:
+                    # Includes failed authentication from a stale client
+                    logger.debug(f"Worker rejected connection: {exc}")
+                    continue
+                outcome = self._handle_connection(conn)
+                if outcome == "stop":
+                    break
+                if outcome == "restart":
+                    restart = True
+                    break
+        except (KeyboardInterrupt, SystemExit):
+            pass
+        finally:
+            self._listener.close()
+            self._clear_state()
+            self._reap_children()
+
+        if restart:
+            logger.info("Dev-tools code changed; restarting worker")
+            os.execv(sys.executable, [sys.executable, *sys.orig_argv[1:]])
+        return 0
+
+    def _reap_children(self) -> None:
+        for pid in list(self._children):
+            try:
+                done, _status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done = pid
+            if done:
+                self._children.discard(pid)
+
+    def _handle_connection(self, conn: Connection) -> str | None:
+        try:
+            if not conn.poll(_REQUEST_READ_TIMEOUT_SECONDS):
+                return None
+            request = conn.recv()
+        except (OSError, EOFError):
+            conn.close()
+            return None
+        op = request.get("op") if isinstance(request, dict) else None
+
+        if op == "ping":
+            self._send_and_close(conn, self.status())
+            return None
+        if op == "stop":
+            self._send_and_close(conn, {"stopping": True})
+            return "stop"
+        if op != "run":
+            self._send_and_close(conn, {"fallback": f"unknown request {op!r}"})
+            return None
+
+        if self.code_changed():
+            self._send_and_close(conn, {"fallback": "development_tools code changed"})
+            return "restart"
+        script_name = request.get("script_name")
+        if self.mode == "inprocess" and script_name in _SUBPROCESS_ONLY_SCRIPTS:
+            self._send_and_close(conn, {"fallback": f"{script_name} runs as a subprocess"})
+            return None
+
+        self.requests_served += 1
+        self._refresh_inventory()
+        if self.mode == "fork":
+            self._run_forked(conn, request)
+        else:
+            self._send_and_close(conn, {"result": self._run_in_process(request)})
+        return None
+
+    @staticmethod
+    def _send_and_close(conn: Connection, payload: dict[str, Any]) -> None:
+        with contextlib.suppress(OSError, EOFError):
+            conn.send(payload)
+        conn.close()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "pid": os.getpid(),
+            "mode": self.mode,
+            "project_root": str(self.project_root),
+            "started_at": self.started_at,
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "requests_served": self.requests_served,
+            "active_children": len(self._children),
+        }
+
+    # Execution -----------------------------------------------------------
+
+    def _run_forked(self, conn: Connection, request: dict[str, Any]) -> None:
+        pid = os.fork()
+        if pid:
+            self._children.add(pid)
+            conn.close()
+            return
+        # Child: never return into the accept loop
+        exit_code = 0
+        try:
+            if self._listener is not None:
+                self._listener.close()
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            conn.send({"result": self._run_with_fd_capture(request)})
+        except BaseException:
+            exit_code = 1
+        finally:
+            with contextlib.suppress(Exception):
+                conn.close()
+            os._exit(exit_code)
+
+    def _run_with_fd_capture(self, request: dict[str, Any]) -> dict[str, Any]:
+        timeout = request.get("timeout")
+        with tempfile.TemporaryFile() as out_file, tempfile.TemporaryFile() as err_file:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            # fd-level redirect also captures output of subprocesses the tool starts
+            os.dup2(out_file.fileno(), 1)
+            os.dup2(err_file.fileno(), 2)
+
+            def _on_alarm(_signum, _frame):
+                raise _ToolTimeout()
+
+            timed_out = False
+            if timeout:
+                signal.signal(signal.SIGALRM, _on_alarm)
+                signal.alarm(max(1, int(timeout)))
+            try:
+                returncode = _execute_script(
+                    request["script_path"], list(request.get("args") or []),
+                    dict(request.get("env") or {}), request.get("cwd") or str(self.project_root),
+                )
+            except _ToolTimeout:
+                timed_out = True
+                returncode = None
+            finally:
+                if timeout:
+                    signal.alarm(0)
+                with contextlib.suppress(Exception):
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+            out_file.seek(0)
+            err_file.seek(0)
+            output = out_file.read().decode("utf-8", errors="replace")
+            error = err_file.read().decode("utf-8", errors="replace")
+        if timed_out:
+            return _timeout_result(request.get("script_name"), timeout)
+        return {
+            "success": returncode == 0,
+            "output": output,
+            "error": error,
+            "returncode": returncode,
+        }
+
+    def _run_in_process(self, request: dict[str, Any]) -> dict[str, Any]:
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        saved_argv = list(sys.argv)
+        saved_path = list(sys.path)
+        out, err = io.StringIO(), io.StringIO()
+        try:
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+                returncode = _execute_script(
+                    request["script_path"], list(request.get("args") or []),
+                    dict(request.get("env") or {}), request.get("cwd") or str(self.project_root),
+                )
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+            sys.argv = saved_argv
+            sys.path[:] = saved_path
+        return {
+            "success": returncode == 0,
+            "output": out.getvalue(),
+            "error": err.getvalue(),
+            "returncode": returncode,
+        }
+
+
+def _timeout_result(script_name: str | None, timeout: int | None) -> dict[str, Any]:
+    return {
+        "success": False,
+        "output": "",
+        "error": f"Script '{script_name}' timed out after {timeout // 60 if timeout else 'N/A'} minutes",
+        "returncode": None,
+    }
+
+
+# Client ------------------------------------------------------------------
+
+
+def _request(state: dict[str, Any], payload: dict[str, Any], wait: float | None) -> Any:
+    """Send one request to a worker; returns the response, or None when unreachable."""
+    try:
+        conn = Client((state["host"], int(state["port"])), authkey=bytes.fromhex(state["authkey"]))
+    except (OSError, EOFError, KeyError, ValueError) as exc:
+        logger.debug(f"Dev-tools worker unreachable: {exc}")
+        return None
+    try:
+        conn.send(payload)
+        if not conn.poll(wait):
+            return {"timed_out": True}
+        return conn.recv()
+    except (OSError, EOFError) as exc:
+        logger.debug(f"Dev-tools worker connection failed: {exc}")
+        return None
+    finally:
+        conn.close()
+
+
+def run_via_worker(
+    project_root: Path | str,
+    script_name: str,
+    script_path: Path | str,
+    args: list[str],
+    *,
+    env: dict[str, str],
+    timeout: int | None,
+) -> dict[str, Any] | None:
+    """
+    Run a registered script on the project's worker.
+
+    Returns:
+        The ``run_script`` result dict, or None when the caller should use a subprocess
+        (no worker, worker unreachable, or request declined)
+    """
+    if os.environ.get(WORKER_ENV_FLAG, "1") == "0":
+        return None
+    state = read_worker_state(project_root)
+    if state is None:
+        return None
+    payload = {
+        "op": "run",
+        "script_name": script_name,
+        "script_path": str(script_path),
+        "args": [str(arg) for arg in args],
+        "env": env,
+        "cwd": str(Path(project_root)),
+        "timeout": timeout,
+    }
+    wait = None if timeout is None else timeout + _RESPONSE_GRACE_SECONDS
+    response = _request(state, payload, wait)
+    if not isinstance(response, dict):
+        return None
+    if response.get("timed_out"):
+        return _timeout_result(script_name, timeout)
+    if "fallback" in response:
+        logger.debug(f"Worker declined {script_name}: {response['fallback']}")
+        return None
+    result = response.get("result")
+    return result if isinstance(result, dict) else None
+
+
+def worker_status(project_root: Path | str) -> dict[str, Any] | None:
+    """Status of the project's worker, or None when none is running."""
+    state = read_worker_state(project_root)
+    if state is None:
+        return None
+    response = _request(state, {"op": "ping"}, _REQUEST_READ_TIMEOUT_SECONDS)
+    return response if isinstance(response, dict) and "pid" in response else None
+
+
+def stop_worker(project_root: Path | str) -> bool:
+    """Ask the project's worker to exit; True when one was running."""
+    state = read_worker_state(project_root)
+    if state is None:
+        return False
+    response = _request(state, {"op": "stop"}, _REQUEST_READ_TIMEOUT_SECONDS)
+    return isinstance(response, dict) and bool(response.get("stopping"))
+
+
+def start_worker(project_root: Path | str, mode: str = "auto", wait_seconds: float = 30.0) -> dict[str, Any] | None:
+    """Start a detached worker (or return the running one); returns its status."""
+    running = worker_status(project_root)
+    if running is not None:
+        return running
+    resolve_worker_mode(mode)
+    cmd = [
+        sys.executable,
+        "-m",
+        "development_tools.shared.dev_tools_worker",
+        "serve",
+        "--project-root",
+        str(Path(project_root).resolve()),
+        "--mode",
+        mode,
+    ]
+    # Run as a module from the package's parent so development_tools/shared does not shadow stdlib logging
+    popen_kwargs: dict[str, Any] = {
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "cwd": str(Path(__file__).resolve().parents[2]),
+    }
+    if os.name == "nt":
+        popen_kwargs["creationflags"] = getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0) | getattr(
+            subprocess, "DETACHED_PROCESS", 0
+        )
+    else:
+        popen_kwargs["start_new_session"] = True
+    process = subprocess.Popen(cmd, **popen_kwargs)
+    deadline = time.time() + wait_seconds
+    while time.time() < deadline:
+        if process.poll() is not None:
+            return None
+        status = worker_status(project_root)
+        if status is not None:
+            return status
+        time.sleep(0.1)
+    return None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Warm dev-tools worker")
+    parser.add_argument("action", choices=("serve", "start", "stop", "status"))
+    parser.add_argument("--project-root", default=str(Path(__file__).resolve().parents[2]))
+    parser.add_argument("--mode", choices=WORKER_MODES, default="auto")
+    ns = parser.parse_args(argv)
+
+    if ns.action == "serve":
+        worker = DevToolsWorker(ns.project_root, mode=ns.mode)
+        worker.warm()
+        return worker.serve()
+    if ns.action == "start":
+        status = start_worker(ns.project_root, mode=ns.mode)
+    elif ns.action == "stop":
+        return 0 if stop_worker(ns.project_root) else 1
+    else:
+        status = worker_status(ns.project_root)
+    print(json.dumps(status, indent=2) if status else "No dev-tools worker running")
+    return 0 if status else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+# TOOL_TIER: core
+# TOOL_PORTABILITY: portable
+
+"""
+Single-walk project file inventory shared by development_tools scanners.
+
+Analyzers used to re-walk the tree with their own ``rglob``/``os.walk`` and
+re-apply ``standard_exclusions`` to every path. The inventory walks the
+project once per run with ``os.scandir`` and records, per directory, its
+files (size, mtime) and subdirectories. Directories excluded for every tool
+(``__pycache__``, ``.git``, venvs, ``tests/data`` ...) are recorded but not
+descended into.
+
+Between runs the listing is persisted in
+``development_tools/shared/jsons/scopes/<scope>/.file_inventory_cache.json``.
+On the next run every directory is stat'ed, and only directories whose mtime
+changed are listed again. File size/mtime therefore reflect the last time a
+file's directory was listed; content hashes are computed on demand and
+re-checked against the file's current stat.
+
+Usage:
+    from development_tools.shared.file_inventory import get_project_inventory
+
+    inventory = get_project_inventory(project_root)
+    for py_file in inventory.iter_paths(
+        extensions=(".py",), directories=("core", "tests"), tool_type="analysis"
+    ):
+        ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from development_tools.shared import standard_exclusions
+
+try:
+    from development_tools.shared.logging import get_dev_tools_logger
+
+    logger = get_dev_tools_logger("development_tools")
+except ImportError:
+    logger = None
+
+INVENTORY_TOOL_NAME = "file_inventory"
+INVENTORY_DOMAIN = "shared"
+_INVENTORY_VERSION = 1
+
+# Appended to a directory path to ask whether everything below it is excluded
+_PRUNE_PROBE = "__inventory_probe__.py"
+
+ExcludeFn = Callable[..., bool]
+
+
+class InventoryFile(NamedTuple):
+    """One file as recorded by the inventory."""
+
+    path: Path
+    rel_path: str
+    size: int
+    mtime_ns: int
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _exclusion_signature() -> str:
+    """Fingerprint of the patterns used to prune the walk."""
+    patterns = "\n".join(
+        list(standard_exclusions.BASE_EXCLUSIONS)
+        + list(standard_exclusions.GENERATED_FILE_PATTERNS)
+    )
+    return hashlib.sha256(patterns.encode("utf-8")).hexdigest()[:16]
+
+
+class ProjectFileInventory:
+    """Directory-mtime-validated listing of every file the audit tools may scan."""
+
+    def __init__(self, project_root: Path, use_cache: bool = True):
+        self.project_root = Path(project_root).resolve()
+        self.use_cache = use_cache
+        # rel dir -> {"mtime": ns, "files": {name: [size, mtime_ns]}, "subdirs": [...], "pruned": [...]}
+        self._dirs: dict[str, dict[str, Any]] = {}
+        # rel file -> [size, mtime_ns, sha256]
+        self._hashes: dict[str, list[Any]] = {}
+        self._exclusion_memo: dict[tuple[Any, str | None, str | None], dict[str, bool]] = {}
+        self._lock = threading.RLock()
+        self._dirty = False
+        self.stats = {"listed_dirs": 0, "reused_dirs": 0}
+        if self.use_cache:
+            self._load()
+
+    # Persistence ---------------------------------------------------------
+
+    def _load(self) -> None:
+        try:
+            from development_tools.shared.output_storage import load_tool_cache
+
+            data = load_tool_cache(
+                INVENTORY_TOOL_NAME, INVENTORY_DOMAIN, project_root=self.project_root
+            )
+        except Exception as exc:
+            if logger:
+                logger.debug(f"File inventory cache unavailable: {exc}")
+            return
+        if not isinstance(data, dict):
+            return
+        if (
+            data.get("version") != _INVENTORY_VERSION
+            or data.get("exclusions") != _exclusion_signature()
+        ):
+            return
+        dirs = data.get("dirs")
+        if isinstance(dirs, dict):
+            self._dirs = dirs
+        hashes = data.get("hashes")
+        if isinstance(hashes, dict):
+            self._hashes = hashes
+
+    def save(self) -> None:
+        """Persist the listing if it changed since it was loaded."""
+        if not self.use_cache or not self._dirty:
+            return
+        try:
+            from development_tools.shared.output_storage import save_tool_cache
+
+            with self._lock:
+                payload = {
+                    "version": _INVENTORY_VERSION,
+                    "exclusions": _exclusion_signature(),
+                    "dirs": self._dirs,
+                    "hashes": self._hashes,
+                }
+                save_tool_cache(
+                    INVENTORY_TOOL_NAME,
+                    INVENTORY_DOMAIN,
+                    payload,
+                    project_root=self.project_root,
+                )
+                self._dirty = False
+        except Exception as exc:
+            if logger:
+                logger.warning(f"Failed to save file inventory cache: {exc}")
+
+    # Walking -------------------------------------------------------------
+
+    def _is_pruned(self, rel_path: str, name: str) -> bool:
+        """True when the directory and everything below it is excluded for every tool."""
+        if name == "jsons" and rel_path.startswith("development_tools/"):
+            # Tool caches/results (including this inventory) are never scanned
+            return True
+        return standard_exclusions.should_exclude_file(
+            rel_path, tool_type=None, context=None
+        ) and standard_exclusions.should_exclude_file(
+            f"{rel_path}/{_PRUNE_PROBE}", tool_type=None, context=None
+        )
+
+    def _list_dir(self, rel_dir: str, abs_dir: str, mtime_ns: int) -> dict[str, Any]:
+        files: dict[str, list[int]] = {}
+        subdirs: list[str] = []
+        pruned: list[str] = []
+        with os.scandir(abs_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        child = _join(rel_dir, entry.name)
+                        (pruned if self._is_pruned(child, entry.name) else subdirs).append(
+                            entry.name
+                        )
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        files[entry.name] = [stat.st_size, stat.st_mtime_ns]
+                except OSError:
+                    continue
+        return {
+            "mtime": mtime_ns,
+            "files": files,
+            "subdirs": sorted(subdirs),
+            "pruned": sorted(pruned),
+        }
+
+    def refresh(self) -> ProjectFileInventory:
+        """Bring the listing up to date, listing only directories whose mtime changed."""
+        with self._lock:
+            listed = reused = 0
+            current: dict[str, dict[str, Any]] = {}
+            stack = [""]
+            while stack:
+                rel_dir = stack.pop()
+                abs_dir = os.path.join(self.project_root, rel_dir) if rel_dir else str(self.project_root)
+                try:
+                    mtime_ns = os.stat(abs_dir).st_mtime_ns
+                except OSError:
+                    continue
+                record = self._dirs.get(rel_dir)
+                if record is None or record.get("mtime") != mtime_ns:
+                    try:
+                        record = self._list_dir(rel_dir, abs_dir, mtime_ns)
+                    except OSError:
+                        continue
+                    listed += 1
+                else:
+                    reused += 1
+                current[rel_dir] = record
+                stack.extend(_join(rel_dir, name) for name in record["subdirs"])
+
+            if listed or current.keys() != self._dirs.keys():
+                self._dirs = current
+                self._exclusion_memo.clear()
+                self._dirty = True
+            self.stats = {"listed_dirs": listed, "reused_dirs": reused}
+            if logger:
+                logger.debug(
+                    f"File inventory refreshed: {listed} directories listed, {reused} reused"
+                )
+        return self
+
+    # Queries -------------------------------------------------------------
+
+    def is_excluded(
+        self,
+        rel_path: str,
+        tool_type: str | None = None,
+        context: str | None = "development",
+        exclude: ExcludeFn | None = None,
+    ) -> bool:
+        """Memoized exclusion verdict for a project-relative path."""
+        exclude_fn = exclude or standard_exclusions.should_exclude_file
+        memo = self._exclusion_memo.setdefault((exclude_fn, tool_type, context), {})
+        verdict = memo.get(rel_path)
+        if verdict is None:
+            verdict = memo[rel_path] = bool(exclude_fn(rel_path, tool_type, context))
+        return verdict
+
+    def _iter_dir_records(
+        self, directories: Sequence[str | Path] | None, recursive: bool
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        if directories is None:
+            roots = [""]
+        else:
+            roots = []
+            for directory in directories:
+                path = Path(directory)
+                if path.is_absolute():
+                    try:
+                        path = path.resolve().relative_to(self.project_root)
+                    except ValueError:
+                        continue
+                rel = path.as_posix().strip("/")
+                roots.append("" if rel == "." else rel)
+        seen: set[str] = set()
+        for root in roots:
+            stack = [root]
+            while stack:
+                rel_dir = stack.pop()
+                if rel_dir in seen:
+                    continue
+                record = self._dirs.get(rel_dir)
+                if record is None:
+                    continue
+                seen.add(rel_dir)
+                yield rel_dir, record
+                if recursive:
+                    stack.extend(_join(rel_dir, name) for name in reversed(record["subdirs"]))
+
+    def iter_files(
+        self,
+        *,
+        extensions: Sequence[str] | None = None,
+        directories: Sequence[str | Path] | None = None,
+        recursive: bool = True,
+        tool_type: str | None = None,
+        context: str | None = "development",
+        apply_exclusions: bool = True,
+        exclude: ExcludeFn | None = None,
+    ) -> Iterator[InventoryFile]:
+        """
+        Yield recorded files, optionally filtered by extension, directory and exclusions.
+
+        Args:
+            extensions: Suffixes to keep (e.g. ``(".py",)``); None keeps all files
+            directories: Project-relative (or absolute) directories to search; None searches the whole project
+            recursive: False lists only files directly inside ``directories``
+            tool_type: Tool type passed to the exclusion check
+            context: Context passed to the exclusion check
+            apply_exclusions: False skips the per-tool exclusion check
+            exclude: Exclusion callable (defaults to ``should_exclude_file``)
+        """
+        suffixes = tuple(ext.lower() for ext in extensions) if extensions else None
+        with self._lock:
+            records = list(self._iter_dir_records(directories, recursive))
+        for rel_dir, record in records:
+            for name in sorted(record["files"]):
+                if suffixes and not name.lower().endswith(suffixes):
+                    continue
+                rel_path = _join(rel_dir, name)
+                if apply_exclusions and self.is_excluded(rel_path, tool_type, context, exclude):
+                    continue
+                size, mtime_ns = record["files"][name]
+                yield InventoryFile(self.project_root / rel_path, rel_path, size, mtime_ns)
+
+    def iter_paths(self, **filters: Any) -> Iterator[Path]:
+        """``iter_files`` yielding absolute paths only."""
+        for item in self.iter_files(**filters):
+            yield item.path
+
+    def iter_dirs(self, *, name_contains: str | None = None, include_pruned: bool = True) -> Iterator[Path]:
+        """Yield recorded directories (pruned ones are listed but not descended)."""
+        with self._lock:
+            records = list(self._iter_dir_records(None, True))
+        for rel_dir, record in records:
+            names = list(record["subdirs"])
+            if include_pruned:
+                names.extend(record["pruned"])
+            for name in sorted(names):
+                if name_contains is None or name_contains in name:
+                    yield self.project_root / _join(rel_dir, name)
+
+    def content_hash(self, path: str | Path) -> str | None:
+        """SHA-256 of a file, reused while its size and mtime are unchanged."""
+        abs_path = Path(path) if Path(path).is_absolute() else self.project_root / path
+        try:
+            rel_path = abs_path.resolve().relative_to(self.project_root).as_posix()
+            stat = abs_path.stat()
+        except (OSError, ValueError):
+            return None
+        with self._lock:
+            cached = self._hashes.get(rel_path)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                return cached[2]
+        try:
+            digest = hashlib.sha256(abs_path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+        with self._lock:
+            self._hashes[rel_path] = [stat.st_size, stat.st_mtime_ns, digest]
+            self._dirty = True
+        return digest
+
+
+_inventories: dict[str, ProjectFileInventory] = {}
+_inventories_lock = threading.Lock()
+
+
+def get_project_inventory(
+    project_root: Path | str | None = None, use_cache: bool = True
+) -> ProjectFileInventory:
+    """
+    Shared, up-to-date inventory for a project root.
+
+    The first call in a process loads the persisted listing and re-lists only
+    changed directories; later calls re-stat directories, so files created or
+    removed by an earlier tool in the same run are seen.
+    """
+    if project_root is None:
+        from development_tools.shared.common import PROJECT_ROOT
+
+        project_root = PROJECT_ROOT
+    key = str(Path(project_root).resolve())
+    with _inventories_lock:
+        inventory = _inventories.get(key)
+        if inventory is None or inventory.use_cache != use_cache:
+            inventory = _inventories[key] = ProjectFileInventory(Path(key), use_cache=use_cache)
+    inventory.refresh()
+    inventory.save()
+    return inventory
+
+
+def reset_project_inventories() -> None:
+    """Forget in-process inventories (the persisted listing is kept)."""
+    with _inventories_lock:
+        _inventories.clear()
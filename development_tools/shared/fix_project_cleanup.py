@@ -21,7 +21,6 @@ Configuration is loaded from external config file (development_tools_config.json
 if available, making this tool portable across different projects.
 """
 
-import os
 import shutil
 import sys
 from pathlib import Path
@@ -37,6 +36,7 @@ try:
 except ImportError:
     from development_tools import config
 
+from development_tools.shared.file_inventory import get_project_inventory
 from development_tools.shared.logging import get_dev_tools_logger
 
 # Ensure external config is loaded
@@ -44,6 +44,8 @@ config.load_external_config()
 
 logger = get_dev_tools_logger("development_tools")
 
+_SKIPPED_DIR_NAMES = frozenset({".git", "venv", ".venv", "node_modules"})
+
 
 class ProjectCleanup:
     """Clean up project cache files, temporary directories, and artifacts."""
@@ -52,36 +54,28 @@ class ProjectCleanup:
         self.project_root = project_root or Path(config.get_project_root())
 
     def find_directories(self, pattern: str) -> list[Path]:
-        """Find all directories matching a pattern."""
-        directories = []
-        for root, dirs, _files in os.walk(self.project_root):
-            # Skip certain directories from being searched
-            dirs[:] = [
-                d for d in dirs if d not in [".git", "venv", ".venv", "node_modules"]
-            ]
-
-            for dir_name in dirs:
-                if pattern in dir_name:
-                    dir_path = Path(root) / dir_name
-                    directories.append(dir_path)
+        """Find all directories matching a pattern.
 
-        return directories
+        Uses the shared file inventory: directories excluded for every tool
+        (caches, venvs, tests/data, ...) are matched by name but not searched.
+        """
+        inventory = get_project_inventory(self.project_root)
+        return [
+            path
+            for path in inventory.iter_dirs(name_contains=pattern)
+            if not _SKIPPED_DIR_NAMES.intersection(
+                path.relative_to(inventory.project_root).parts
+            )
+        ]
 
     def find_files(self, pattern: str) -> list[Path]:
-        """Find all files matching a pattern."""
-        files = []
-        for root, dirs, filenames in os.walk(self.project_root):
-            # Skip certain directories from being searched
-            dirs[:] = [
-                d for d in dirs if d not in [".git", "venv", ".venv", "node_modules"]
-            ]
-
-            for filename in filenames:
-                if pattern in filename:
-                    file_path = Path(root) / filename
-                    files.append(file_path)
-
-        return files
+        """Find all files matching a pattern (see ``find_directories`` for scope)."""
+        inventory = get_project_inventory(self.project_root)
+        return [
+            path
+            for path in inventory.iter_paths(apply_exclusions=False)
+            if pattern in path.name
+        ]
 
     def get_size(self, path: Path) -> str:
         """Get human-readable size of file or directory."""
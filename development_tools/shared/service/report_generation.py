@@ -727,6 +727,42 @@ class ReportGenerationMixin(
             ]
         return ["- **Pytest process cleanup**: PASS (no candidate orphan workers)"]
 
+    def _lines_for_core_benchmarks_status_snapshot(
+        self, bench_data: dict[str, Any] | None
+    ) -> list[str]:
+        """1 line for AI_STATUS Snapshot: Tier 3 core-path benchmark comparison."""
+        if not bench_data or not isinstance(bench_data, dict):
+            return [
+                "- **Core Benchmarks**: No data (run `audit --full` Tier 3 to refresh)"
+            ]
+        details = bench_data.get("details", {}) or {}
+        summary = bench_data.get("summary", {}) or {}
+        if not details.get("tool_available", True):
+            return [f"- **Core Benchmarks**: Not run ({details.get('message', 'unavailable')})"]
+        regressions = details.get("regressions", []) or []
+        if regressions:
+            shown = ", ".join(
+                f"{item.get('benchmark')} +{item.get('change_pct')}%"
+                for item in regressions[:3]
+            )
+            return [
+                f"- **Core Benchmarks**: FAIL ({len(regressions)} regression(s): {shown})"
+            ]
+        if details.get("baseline_recorded"):
+            return ["- **Core Benchmarks**: Baseline recorded (no comparison this run)"]
+        if details.get("workload_mismatch"):
+            return [
+                "- **Core Benchmarks**: WARN (baseline workload differs; re-record with "
+                "`analyze_core_benchmarks.py --update-baseline`)"
+            ]
+        failed_checks = details.get("failed_checks", []) or []
+        if failed_checks:
+            return [
+                f"- **Core Benchmarks**: WARN (sanity checks failed: {', '.join(failed_checks)})"
+            ]
+        status = str(summary.get("status", "PASS") or "PASS").upper()
+        return [f"- **Core Benchmarks**: {status} (no median regressions against baseline)"]
+
     def _lines_for_verify_process_cleanup_consolidated_section(
         self, vpc_data: dict[str, Any] | None
     ) -> list[str]:
@@ -184,6 +184,9 @@ class AIPrioritiesDocumentMixin:
         verify_process_cleanup_priority_data = self._load_tool_data(
             "verify_process_cleanup", "tests"
         )
+        core_benchmarks_priority_data = self._load_tool_data(
+            "analyze_core_benchmarks", "tests", log_source=False
+        )
         dependency_patterns_data = self._load_tool_data(
             "analyze_dependency_patterns", "imports"
         )
@@ -779,6 +782,9 @@ class AIPrioritiesDocumentMixin:
                 "Review orphaned pytest worker processes (Windows)": self._scoped_tool_result_path(
                     "tests", "verify_process_cleanup"
                 ),
+                "Investigate core-path benchmark regressions": self._scoped_tool_result_path(
+                    "tests", "analyze_core_benchmarks"
+                ),
                 "Investigate possible duplicate functions/methods": self._scoped_tool_result_path(
                     "functions", "analyze_duplicate_functions"
                 ),
@@ -2028,6 +2034,35 @@ class AIPrioritiesDocumentMixin:
                         validate=False,
                     )
 
+        # Core-path benchmark regressions (Tier 3 post-test; full-repo audits only)
+        if (
+            core_benchmarks_priority_data
+            and isinstance(core_benchmarks_priority_data, dict)
+            and not self._is_dev_tools_scoped_report()
+        ):
+            bench_details = core_benchmarks_priority_data.get("details", {}) or {}
+            bench_regressions = bench_details.get("regressions", []) or []
+            if bench_regressions:
+                bench_bullets = [
+                    f"{item.get('benchmark')}: {item.get('median_ms')} ms median "
+                    f"(baseline {item.get('baseline_median_ms')} ms, +{item.get('change_pct')}%)"
+                    for item in bench_regressions[:5]
+                ]
+                bench_bullets.append(
+                    "Action: Profile the regressed path; if the slowdown is intended, "
+                    "re-record with `python development_tools/tests/analyze_core_benchmarks.py --update-baseline`."
+                )
+                add_priority(
+                    tier=2,
+                    title="Investigate core-path benchmark regressions",
+                    reason=(
+                        f"{len(bench_regressions)} core-path benchmark(s) exceed the stored "
+                        f"baseline by more than {bench_details.get('regression_threshold_pct')}%."
+                    ),
+                    bullets=bench_bullets,
+                    validate=False,
+                )
+
         # Duplicate functions priority
         if duplicate_functions_data and isinstance(duplicate_functions_data, dict):
             summary = duplicate_functions_data.get("summary", {})
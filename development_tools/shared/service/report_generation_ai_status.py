@@ -204,6 +204,9 @@ class AIStatusDocumentMixin:
         verify_process_cleanup_status_data = self._load_tool_data(
             "verify_process_cleanup", "tests"
         )
+        core_benchmarks_status_data = self._load_tool_data(
+            "analyze_core_benchmarks", "tests", log_source=False
+        )
 
         # Extract overlap analysis data
         details = analyze_docs_data.get("details", {})
@@ -817,6 +820,13 @@ class AIStatusDocumentMixin:
                 verify_process_cleanup_status_data
             )
         )
+        # Core benchmarks time product code; dev-tools-only audits skip them
+        if not self._is_dev_tools_scoped_report():
+            lines.extend(
+                self._lines_for_core_benchmarks_status_snapshot(
+                    core_benchmarks_status_data
+                )
+            )
 
         lines.append("")
         lines.append("## Documentation Signals")
@@ -29,6 +29,7 @@ import contextlib
 
 # Script registry - derived from tool_metadata._TOOLS (canonical source)
 from ..tool_metadata import get_script_registry
+from ..dev_tools_worker import run_via_worker
 
 SCRIPT_REGISTRY = get_script_registry()
 
@@ -127,6 +128,11 @@ class ToolWrappersMixin:
                     "to reduce console control-event propagation."
                 )
         try:
+            worker_result = run_via_worker(
+                self.project_root, script_name, script_path, list(args), env=env, timeout=timeout
+            )
+            if worker_result is not None:
+                return worker_result
             result = subprocess.run(cmd, **run_kwargs)
             return {
                 "success": result.returncode == 0,
@@ -1948,6 +1954,42 @@ class ToolWrappersMixin:
             )
         return result
 
+    def run_analyze_core_benchmarks(self) -> dict:
+        """Run core-path benchmarks and compare medians with the stored baseline."""
+        logger.debug("Running core-path benchmarks...")
+        timeout = int(dev_config.get_core_benchmarks_config().get("timeout_seconds", 1800))
+        result = self.run_script(
+            "analyze_core_benchmarks", "--json", timeout=timeout + 60
+        )
+        output = result.get("output", "")
+        data = None
+        if output:
+            try:
+                data = json.loads(output)
+            except json.JSONDecodeError:
+                data = None
+        if data is not None:
+            result["data"] = data
+            summary = data.get("summary", {}) if isinstance(data, dict) else {}
+            result["issues_found"] = bool(summary.get("total_issues", 0))
+            result["success"] = True
+            result["error"] = ""
+            self.results_cache["analyze_core_benchmarks"] = data
+            try:
+                save_tool_result(
+                    "analyze_core_benchmarks",
+                    "tests",
+                    data,
+                    project_root=self.project_root,
+                )
+            except Exception as e:
+                logger.warning(f"Failed to save analyze_core_benchmarks result: {e}")
+        else:
+            if not result.get("error"):
+                result["error"] = "No parseable JSON output from analyze_core_benchmarks"
+            result["success"] = False
+        return result
+
     def run_analyze_pip_audit(self) -> dict:
         """Run pip-audit with structured JSON handling (requirements-lock cache)."""
         logger.debug("Analyzing pip-audit dependency vulnerabilities...")
@@ -136,6 +136,14 @@ def _cache_entry(tool_name: str, domain: str) -> dict[str, str]:
             "artifact_glob": "development_tools/**/jsons/scopes/*/verify_process_cleanup*.json",
             "invalidation": "N/A — advisory probe; JSON is per-run output only",
         }
+    if tool_name == "analyze_core_benchmarks":
+        return {
+            "tool": tool_name,
+            "strategy": "stored_baseline_comparison",
+            "implementation": "development_tools/tests/analyze_core_benchmarks.py (runs core_benchmarks.command)",
+            "artifact_glob": "development_tools/tests/jsons/core_benchmark_baseline.json; development_tools/**/jsons/scopes/*/tests/*core_benchmarks*.json",
+            "invalidation": "N/A — live timings every run; re-record the baseline with --update-baseline after workload or hardware changes",
+        }
     if tool_name == "analyze_backup_health":
         return {
             "tool": tool_name,
@@ -275,6 +275,13 @@ _TOOLS: dict[str, ToolInfo] = {
         trust="advisory",
         description="Check for potential orphaned pytest/python processes after test runs.",
     ),
+    "analyze_core_benchmarks": ToolInfo(
+        name="analyze_core_benchmarks",
+        path="development_tools/tests/analyze_core_benchmarks.py",
+        tier="supporting",
+        trust="advisory",
+        description="Run core-path benchmarks and flag median regressions against the stored baseline.",
+    ),
     "cleanup_project": ToolInfo(
         name="cleanup_project",
         path="development_tools/shared/fix_project_cleanup.py",
@@ -535,6 +542,8 @@ COMMAND_GROUPS = OrderedDict(
                 "backup",
                 "export-code",
                 "export-docs",
+                "worker",
+                "watch",
                 "help",
             ],
         },
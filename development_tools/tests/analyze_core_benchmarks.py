@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# TOOL_TIER: supporting
+
+"""
+Run the configured core-path benchmarks and compare them with a stored baseline.
+
+The benchmark runner (``core_benchmarks.command`` in development_tools_config.json)
+writes per-benchmark timings to a JSON file; this tool compares each benchmark's
+median with the baseline file and reports a regression when the median exceeds the
+baseline by more than ``regression_threshold_pct`` percent *and* by more than
+``min_regression_ms`` milliseconds. The first run (or ``--update-baseline``) records
+the baseline. A baseline recorded with different workload parameters is not
+compared; re-record it after changing the workload.
+
+Usage:
+    python development_tools/tests/analyze_core_benchmarks.py --json
+    python development_tools/tests/analyze_core_benchmarks.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any
+
+try:
+    from .. import config
+except ImportError:
+    project_root = Path(__file__).resolve().parents[2]
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+    from development_tools import config
+
+try:
+    from development_tools.shared.logging import get_dev_tools_logger
+
+    _bench_log = get_dev_tools_logger("development_tools.tests.analyze_core_benchmarks")
+except ImportError:
+    _bench_log = None
+
+# Workload keys that must match for a baseline comparison to be meaningful
+_WORKLOAD_KEYS = ("users", "years", "repeat", "warmup", "seed")
+
+
+def _build_unavailable_result(message: str) -> dict[str, Any]:
+    return {
+        "summary": {"total_issues": 0, "files_affected": 0, "status": "WARN"},
+        "details": {
+            "tool": "core_benchmarks",
+            "tool_available": False,
+            "message": message,
+            "regressions": [],
+            "benchmarks": {},
+        },
+    }
+
+
+def _resolve_python_command(command: list[str]) -> list[str]:
+    if not command:
+        return command
+    first = str(command[0]).lower()
+    if first in {"python", "python3", "py", "python.exe"}:
+        return [sys.executable] + command[1:]
+    return command
+
+
+def _workload_args(bench_cfg: dict[str, Any]) -> list[str]:
+    args: list[str] = []
+    for key in _WORKLOAD_KEYS:
+        args.extend([f"--{key}", str(bench_cfg[key])])
+    return args
+
+
+def load_baseline(baseline_path: Path) -> dict[str, Any] | None:
+    """Return the stored baseline, or None when it is missing or unreadable."""
+    try:
+        data = json.loads(baseline_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) and isinstance(data.get("benchmarks"), dict) else None
+
+
+def save_baseline(baseline_path: Path, current: dict[str, Any]) -> None:
+    """Record ``current`` (a benchmark runner result) as the baseline."""
+    baseline_path.parent.mkdir(parents=True, exist_ok=True)
+    baseline_path.write_text(json.dumps(current, indent=2), encoding="utf-8")
+
+
+def compare_with_baseline(
+    current: dict[str, Any],
+    baseline: dict[str, Any] | None,
+    *,
+    regression_threshold_pct: float,
+    min_regression_ms: float,
+) -> dict[str, Any]:
+    """
+    Compare benchmark medians against the baseline.
+
+    Returns:
+        dict: Standard-format result. ``total_issues`` counts regressions
+        (status FAIL); failed runner sanity checks or a baseline recorded with a
+        different workload give WARN.
+    """
+    current_benchmarks = current.get("benchmarks", {}) or {}
+    failed_checks = list(current.get("failed_checks", []) or [])
+    baseline_benchmarks = (baseline or {}).get("benchmarks", {}) or {}
+    workload = current.get("workload", {}) or {}
+    baseline_workload = (baseline or {}).get("workload", {}) or {}
+    workload_mismatch = bool(baseline) and any(
+        workload.get(key) != baseline_workload.get(key) for key in _WORKLOAD_KEYS
+    )
+
+    comparisons: dict[str, dict[str, Any]] = {}
+    regressions: list[dict[str, Any]] = []
+    for name, stats in current_benchmarks.items():
+        median = float(stats.get("median_ms", 0.0))
+        entry: dict[str, Any] = {
+            "median_ms": median,
+            "p95_ms": stats.get("p95_ms"),
+            "baseline_median_ms": None,
+            "change_pct": None,
+            "status": "NEW",
+        }
+        base = baseline_benchmarks.get(name)
+        if base and not workload_mismatch:
+            base_median = float(base.get("median_ms", 0.0))
+            delta_ms = median - base_median
+            change_pct = (delta_ms / base_median * 100.0) if base_median > 0 else 0.0
+            entry["baseline_median_ms"] = base_median
+            entry["change_pct"] = round(change_pct, 1)
+            if delta_ms > min_regression_ms and change_pct > regression_threshold_pct:
+                entry["status"] = "REGRESSED"
+                regressions.append(
+                    {
+                        "benchmark": name,
+                        "median_ms": median,
+                        "baseline_median_ms": base_median,
+                        "change_pct": round(change_pct, 1),
+                    }
+                )
+            elif -delta_ms > min_regression_ms and -change_pct > regression_threshold_pct:
+                entry["status"] = "IMPROVED"
+            else:
+                entry["status"] = "OK"
+        comparisons[name] = entry
+
+    regressions.sort(key=lambda item: item["change_pct"], reverse=True)
+    if regressions:
+        status = "FAIL"
+    elif failed_checks or workload_mismatch:
+        status = "WARN"
+    else:
+        status = "PASS"
+    return {
+        "summary": {
+            "total_issues": len(regressions),
+            "files_affected": 0,
+            "status": status,
+        },
+        "details": {
+            "tool": "core_benchmarks",
+            "tool_available": True,
+            "baseline_available": bool(baseline),
+            "workload": workload,
+            "workload_mismatch": workload_mismatch,
+            "baseline_workload": baseline_workload,
+            "regression_threshold_pct": regression_threshold_pct,
+            "min_regression_ms": min_regression_ms,
+            "regressions": regressions,
+            "failed_checks": failed_checks,
+            "benchmarks": comparisons,
+            "population": current.get("population", {}),
+            "environment": current.get("environment", {}),
+        },
+    }
+
+
+def run_core_benchmarks(project_root: Path, update_baseline: bool = False) -> dict[str, Any]:
+    bench_cfg = config.get_core_benchmarks_config()
+    command = _resolve_python_command(list(bench_cfg.get("command") or []))
+    if not command:
+        return _build_unavailable_result(
+            "core_benchmarks.command is not configured; benchmarks skipped"
+        )
+    timeout_seconds = int(bench_cfg.get("timeout_seconds", 1800) or 1800)
+    baseline_path = project_root / str(bench_cfg["baseline_file"])
+
+    with tempfile.TemporaryDirectory(prefix="core_benchmarks_") as tmp_dir:
+        output_file = Path(tmp_dir) / "result.json"
+        try:
+            result = subprocess.run(
+                command + _workload_args(bench_cfg) + ["--output", str(output_file)],
+                cwd=str(project_root),
+                capture_output=True,
+                text=True,
+                timeout=timeout_seconds,
+            )
+        except FileNotFoundError:
+            return _build_unavailable_result("benchmark command not found")
+        except subprocess.TimeoutExpired:
+            return _build_unavailable_result("benchmark run timed out")
+        except Exception as exc:
+            return _build_unavailable_result(f"benchmark run failed: {exc}")
+        # The runner exits 1 when sanity checks fail but still writes its result
+        current = load_baseline(output_file)
+        if current is None:
+            message = (result.stderr or "").strip()[-2000:]
+            return _build_unavailable_result(
+                message or f"benchmark run failed with return code {result.returncode}"
+            )
+
+    baseline = None if update_baseline else load_baseline(baseline_path)
+    out = compare_with_baseline(
+        current,
+        baseline,
+        regression_threshold_pct=float(bench_cfg["regression_threshold_pct"]),
+        min_regression_ms=float(bench_cfg["min_regression_ms"]),
+    )
+    if baseline is None:
+        save_baseline(baseline_path, current)
+        out["details"]["baseline_recorded"] = True
+    out["details"]["baseline_file"] = str(bench_cfg["baseline_file"])
+    if _bench_log:
+        _bench_log.info(
+            f"analyze_core_benchmarks: status={out['summary']['status']} "
+            f"regressions={out['summary']['total_issues']} "
+            f"baseline_recorded={baseline is None}"
+        )
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Run core-path benchmarks and compare them with the stored baseline."
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON output.")
+    parser.add_argument(
+        "--project-root",
+        default=".",
+        help="Project root directory (default: current directory).",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record this run as the new baseline instead of comparing.",
+    )
+    ns = parser.parse_args(argv)
+
+    result = run_core_benchmarks(
+        Path(ns.project_root).resolve(), update_baseline=ns.update_baseline
+    )
+    if ns.json:
+        print(json.dumps(result, indent=2))
+    else:
+        summary = result.get("summary", {})
+        details = result.get("details", {})
+        print(
+            f"Core benchmarks status={summary.get('status', 'UNKNOWN')} "
+            f"regressions={summary.get('total_issues', 0)}"
+        )
+        for item in details.get("regressions", []):
+            print(
+                f"  {item['benchmark']}: {item['median_ms']:.3f} ms "
+                f"(baseline {item['baseline_median_ms']:.3f} ms, +{item['change_pct']}%)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
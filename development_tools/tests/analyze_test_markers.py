@@ -197,32 +197,33 @@ class TestMarkerAnalyzer:
         if not self.test_dir.exists():
             return test_files
 
-        for test_file in self.test_dir.rglob("test_*.py"):
-            if test_file.is_file():
-                file_str = str(test_file).replace("\\", "/")
-                relative_path = str(test_file.relative_to(self.project_root)).replace(
-                    "\\", "/"
-                )
+        from development_tools.shared.file_inventory import get_project_inventory
+
+        # Shared exclusions keep tests/data, scripts, caches, etc. consistent
+        # with other analyzer tools.
+        for test_file in get_project_inventory(self.project_root).iter_paths(
+            extensions=(".py",),
+            directories=[self.test_dir],
+            tool_type="analysis",
+            context="development",
+            exclude=should_exclude_file,
+        ):
+            if not test_file.name.startswith("test_"):
+                continue
+            file_str = str(test_file).replace("\\", "/")
+
+            # Skip AI test files if requested
+            if exclude_ai and any(token in file_str for token in self.ai_path_tokens):
+                continue
+
+            # Skip temporary test files in tests/data/ (pytest temporary directories)
+            if self._is_under_tests_data_dir(file_str) and any(
+                marker in file_str
+                for marker in self.transient_data_path_markers
+            ):
+                continue
 
-                # Apply shared exclusions so tests/data, scripts, caches, etc.
-                # stay consistent with other analyzer tools.
-                if should_exclude_file(
-                    relative_path, tool_type="analysis", context="development"
-                ):
-                    continue
-
-                # Skip AI test files if requested
-                if exclude_ai and any(token in file_str for token in self.ai_path_tokens):
-                    continue
-
-                # Skip temporary test files in tests/data/ (pytest temporary directories)
-                if self._is_under_tests_data_dir(file_str) and any(
-                    marker in file_str
-                    for marker in self.transient_data_path_markers
-                ):
-                    continue
-
-                test_files.append(test_file)
+            test_files.append(test_file)
 
         return sorted(test_files)
 
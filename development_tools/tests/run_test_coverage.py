@@ -307,6 +307,13 @@ class CoverageMetricsRegenerator:
                 resolved_core_modules = []
 
         self.core_modules = resolved_core_modules
+        # Per-test coverage contexts for the test impact map (coverage.record_test_contexts)
+        try:
+            self.record_test_contexts = bool(
+                (config.get_coverage_tool_config() or {}).get("record_test_contexts", True)
+            )
+        except Exception:
+            self.record_test_contexts = True
 
         # Test-file-based caching (optional)
         self.use_domain_cache = use_domain_cache
@@ -636,6 +643,53 @@ class CoverageMetricsRegenerator:
             log=logger,
         )
 
+    def _narrow_to_impacted_tests(self, test_files_to_run: list[Path]) -> list[Path]:
+        """Replace a domain-level test selection with the test impact map's, when one is recorded."""
+        try:
+            from development_tools.tests.test_impact_map import select_impacted_tests
+
+            selection = select_impacted_tests(self.project_root)
+        except Exception as exc:
+            if logger:
+                logger.debug(f"Test impact selection unavailable: {exc}")
+            return test_files_to_run
+        if selection.full_run:
+            if logger:
+                logger.info(f"Test impact map not used: {selection.reason}")
+            return test_files_to_run
+        impacted = [
+            self.project_root / rel_path
+            for rel_path in selection.selected_test_files()
+            if (self.project_root / rel_path).exists()
+        ]
+        if logger:
+            logger.info(
+                f"Test impact map: {len(impacted)} test file(s) affected by "
+                f"{len(selection.changed_files)} changed file(s) "
+                f"(domain selection: {len(test_files_to_run)})"
+            )
+        return impacted
+
+    def _update_test_impact_map(self, *, full_run: bool) -> None:
+        """Record this run's per-test coverage contexts in the test impact map."""
+        try:
+            from development_tools.tests.test_impact_map import (
+                update_impact_map_from_coverage,
+            )
+
+            recorded = update_impact_map_from_coverage(
+                self.project_root, self.coverage_data_file, full_run=full_run
+            )
+        except Exception as exc:
+            if logger:
+                logger.warning(f"Failed to update test impact map: {exc}")
+            return
+        if recorded and logger:
+            logger.info(
+                f"Updated test impact map with {recorded} test node(s) "
+                f"({'full' if full_run else 'partial'} run)"
+            )
+
     def run_coverage_analysis(  # pyright: ignore[reportGeneralTypeIssues]
         self,
     ) -> dict[str, dict[str, Any]]:
@@ -676,6 +730,10 @@ class CoverageMetricsRegenerator:
             # Check for full coverage cache first (from previous full run when no domains changed)
             full_coverage_cache = self.test_file_cache.get_full_coverage_cache()
 
+            # With a full baseline to merge into, rerun only tests whose executed lines changed
+            if changed_domains and test_files_to_run and full_coverage_cache:
+                test_files_to_run = self._narrow_to_impacted_tests(test_files_to_run)
+
             # Get cached coverage from test files that don't need to run (for selective runs)
             cached_test_file_coverage = self.test_file_cache.get_all_cached_coverage(
                 exclude_domains=changed_domains
@@ -864,6 +922,9 @@ class CoverageMetricsRegenerator:
                         logger.error(error_msg)
                     raise ValueError(error_msg)
                 cov_args.extend(["--cov", module.strip()])
+            if self.record_test_contexts:
+                # One coverage context per test node feeds the test impact map
+                cov_args.append("--cov-context=test")
 
             # Validate no empty --cov arguments were created
             if "--cov" in cov_args and cov_args.index("--cov") < len(cov_args) - 1:
@@ -2727,6 +2788,10 @@ class CoverageMetricsRegenerator:
                                     logger.info(
                                         "Regenerated coverage.json from combined coverage data"
                                     )
+                                if self.record_test_contexts:
+                                    self._update_test_impact_map(
+                                        full_run=not test_filter_args
+                                    )
 
                                 # Add timestamp metadata to coverage.json
                                 if coverage_output.exists():
@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+# TOOL_TIER: supporting
+# TOOL_PORTABILITY: portable
+
+"""
+Per-test coverage map for test impact selection.
+
+Coverage runs record one coverage context per test node (``--cov-context=test``).
+``TestImpactMap.update_from_coverage_data`` turns the combined ``.coverage`` data
+into a compact inverted index and stores it in
+``development_tools/tests/jsons/test_impact_map.json``. For each source file the
+index keeps:
+
+- the executed line -> test-set mapping (each distinct test set is stored once);
+- the lines executed at import time (module-level statements, no test context);
+- a fingerprint (size, mtime, git blob id) of the content the line numbers refer to.
+
+``select_impacted_tests`` compares the current tree with those fingerprints (an
+mtime/size pre-check, then the blob id), diffs each changed source file against its
+recorded content (``git cat-file``; the content is written to the object store with
+``git hash-object -w`` when the map is saved), and selects:
+
+- tests that executed a changed line;
+- every test that touched a module when a module-level line changed, when the old
+  content is not available, or when the file's line map is stale after a partial run;
+- changed or new test files as a whole, and everything under a changed ``conftest.py``;
+- for new source files, the test files of the file's domain (``DomainMapper``), like
+  ``TestFileCoverageCache``;
+- a full run when test helpers, ``pytest.ini`` or the root ``conftest.py`` change, or
+  when no map exists.
+
+Non-Python inputs (fixtures, JSON resources) are not tracked; run the full suite
+after changing them.
+
+Usage:
+    python -m development_tools.tests.test_impact_map select [--json]
+    python -m development_tools.tests.test_impact_map build --data-file development_tools/tests/.coverage
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+try:
+    from development_tools.shared.logging import get_dev_tools_logger
+
+    logger = get_dev_tools_logger("development_tools")
+except ImportError:
+    logger = None
+
+MAP_VERSION = 1
+MAP_FILE_NAME = "test_impact_map.json"
+# Above this many node ids, selections are passed to pytest as test files (command length)
+MAX_NODE_ID_ARGS = 200
+_FULL_RUN_FILES = frozenset({"pytest.ini", "tests/conftest.py", "conftest.py"})
+_CONTEXT_PHASE_SEPARATOR = "|"
+
+
+def git_blob_id(data: bytes) -> str:
+    """Git object id of ``data`` as a blob (``git hash-object --no-filters``)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def _fingerprint(path: Path) -> dict[str, Any] | None:
+    try:
+        stat = path.stat()
+        data = path.read_bytes()
+    except OSError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "blob": git_blob_id(data)}
+
+
+def _test_node_from_context(context: str) -> str | None:
+    """``tests/x/test_a.py::test_b|run`` -> node id; empty (import-time) context -> None."""
+    if not context:
+        return None
+    return context.split(_CONTEXT_PHASE_SEPARATOR, 1)[0] or None
+
+
+def _node_file(node_id: str) -> str:
+    return node_id.split("::", 1)[0]
+
+
+@dataclass
+class ImpactSelection:
+    """Tests selected for a set of changes."""
+
+    full_run: bool = False
+    reason: str = ""
+    changed_files: list[str] = field(default_factory=list)
+    # Node ids selected for line-level changes
+    tests: list[str] = field(default_factory=list)
+    # Test files selected as a whole (changed/new test files, conftest scope, domain fallback)
+    test_files: list[str] = field(default_factory=list)
+
+    def selected_test_files(self) -> list[str]:
+        """Every test file with at least one selected test."""
+        return sorted(set(self.test_files) | {_node_file(node) for node in self.tests})
+
+    def pytest_args(self, max_node_ids: int = MAX_NODE_ID_ARGS) -> list[str]:
+        """pytest path/node-id arguments (empty when nothing is selected or for a full run)."""
+        if self.full_run:
+            return []
+        whole_files = set(self.test_files)
+        node_ids = [node for node in self.tests if _node_file(node) not in whole_files]
+        if len(node_ids) > max_node_ids:
+            return self.selected_test_files()
+        return sorted(whole_files) + sorted(node_ids)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "full_run": self.full_run,
+            "reason": self.reason,
+            "changed_files": self.changed_files,
+            "tests": self.tests,
+            "test_files": self.test_files,
+        }
+
+
+class TestImpactMap:
+    """Line-to-test inverted index built from per-test coverage contexts."""
+
+    __test__ = False  # not a pytest class
+
+    def __init__(self, project_root: Path | str, map_file: Path | None = None):
+        self.project_root = Path(project_root).resolve()
+        self.map_file = map_file or (
+            self.project_root / "development_tools" / "tests" / "jsons" / MAP_FILE_NAME
+        )
+        self.tests: list[str] = []
+        self.sources: dict[str, dict[str, Any]] = {}
+        self.test_files: dict[str, dict[str, Any]] = {}
+        self.generated_at: str | None = None
+
+    # Persistence ---------------------------------------------------------
+
+    @classmethod
+    def load(cls, project_root: Path | str, map_file: Path | None = None) -> TestImpactMap | None:
+        """Stored map for a project, or None when missing or from another format version."""
+        impact_map = cls(project_root, map_file)
+        try:
+            data = json.loads(impact_map.map_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != MAP_VERSION:
+            return None
+        impact_map.tests = list(data.get("tests") or [])
+        impact_map.sources = dict(data.get("sources") or {})
+        impact_map.test_files = dict(data.get("test_files") or {})
+        impact_map.generated_at = data.get("generated_at")
+        return impact_map
+
+    def save(self) -> None:
+        self.generated_at = datetime.now().isoformat(timespec="seconds")
+        payload = {
+            "version": MAP_VERSION,
+            "generated_at": self.generated_at,
+            "tests": self.tests,
+            "sources": self.sources,
+            "test_files": self.test_files,
+        }
+        self.map_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.map_file.with_name(f"{self.map_file.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.map_file)
+        self._store_blobs(sorted(self.sources))
+
+    def _store_blobs(self, rel_paths: list[str]) -> None:
+        """Write current source contents to git's object store so later diffs are exact."""
+        if not rel_paths:
+            return
+        try:
+            subprocess.run(
+                ["git", "hash-object", "-w", "--no-filters", "--stdin-paths"],
+                input="\n".join(rel_paths) + "\n",
+                capture_output=True,
+                text=True,
+                cwd=self.project_root,
+                timeout=120,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError) as exc:
+            if logger:
+                logger.debug(f"Test impact map: could not store source blobs in git: {exc}")
+
+    # Project files -------------------------------------------------------
+
+    def _classify_python_files(self) -> tuple[list[str], list[str], list[str]]:
+        """(source files, test files incl. conftest.py, other helper modules under tests/)."""
+        from development_tools.shared.file_inventory import get_project_inventory
+
+        sources: list[str] = []
+        tests: list[str] = []
+        helpers: list[str] = []
+        inventory = get_project_inventory(self.project_root)
+        for item in inventory.iter_files(extensions=(".py",), tool_type="analysis"):
+            rel_path = item.rel_path
+            name = rel_path.rsplit("/", 1)[-1]
+            if rel_path.startswith("tests/"):
+                if name.startswith("test_") or name == "conftest.py":
+                    tests.append(rel_path)
+                else:
+                    helpers.append(rel_path)
+            else:
+                sources.append(rel_path)
+        return sources, tests, helpers
+
+    # Building ------------------------------------------------------------
+
+    def update_from_coverage_data(self, data_file: Path | str, *, full_run: bool) -> int:
+        """
+        Merge per-test contexts from a combined coverage data file into the map.
+
+        A full run replaces the map. A partial run replaces the entries of the tests
+        it ran; files whose line numbers may have shifted for tests that did not run
+        are marked stale (module-level selection until the next full run).
+
+        Returns:
+            Number of test nodes recorded from ``data_file``
+        """
+        from coverage import CoverageData
+
+        data = CoverageData(basename=str(data_file))
+        data.read()
+
+        run_tests: dict[str, int] = {}
+        file_lines: dict[str, dict[int, frozenset[str]]] = {}
+        file_import_lines: dict[str, list[int]] = {}
+        for measured in data.measured_files():
+            rel_path = self._rel(measured)
+            if rel_path is None:
+                continue
+            lines: dict[int, frozenset[str]] = {}
+            import_lines: list[int] = []
+            for lineno, contexts in (data.contexts_by_lineno(measured) or {}).items():
+                nodes = set()
+                for context in contexts:
+                    node = _test_node_from_context(context)
+                    if node is None:
+                        import_lines.append(lineno)
+                    else:
+                        nodes.add(node)
+                        run_tests.setdefault(node, 0)
+                if nodes:
+                    lines[lineno] = frozenset(nodes)
+            file_lines[rel_path] = lines
+            file_import_lines[rel_path] = sorted(set(import_lines))
+
+        previous = {} if full_run else self.sources
+        previous_tests = list(self.tests)
+        rerun = set(run_tests)
+        kept_tests = [] if full_run else [node for node in previous_tests if node not in rerun]
+        self.tests = kept_tests + sorted(rerun)
+        index = {node: i for i, node in enumerate(self.tests)}
+
+        source_files, test_files, helpers = self._classify_python_files()
+        new_sources: dict[str, dict[str, Any]] = {}
+        for rel_path in sorted(set(source_files) | set(file_lines) | set(previous)):
+            fingerprint = _fingerprint(self.project_root / rel_path)
+            if fingerprint is None:
+                continue
+            new_sources[rel_path] = self._merge_file_entry(
+                previous.get(rel_path),
+                previous_tests,
+                rerun,
+                index,
+                file_lines.get(rel_path, {}),
+                file_import_lines.get(rel_path),
+                fingerprint,
+            )
+        self.sources = new_sources
+        # Test-side files are fingerprinted only; they are selected (or force a full run) as a whole
+        self.test_files = {
+            rel_path: fingerprint
+            for rel_path in [*test_files, *helpers, *_FULL_RUN_FILES]
+            if (fingerprint := _fingerprint(self.project_root / rel_path)) is not None
+        }
+        return len(rerun)
+
+    def _merge_file_entry(
+        self,
+        old_entry: dict[str, Any] | None,
+        old_tests: list[str],
+        rerun: set[str],
+        index: dict[str, int],
+        lines: dict[int, frozenset[str]],
+        import_lines: list[int] | None,
+        fingerprint: dict[str, Any],
+    ) -> dict[str, Any]:
+        merged: dict[int, set[str]] = {lineno: set(nodes) for lineno, nodes in lines.items()}
+        module_nodes: set[str] = set().union(*lines.values()) if lines else set()
+        stale = False
+        if old_entry:
+            old_sets = old_entry.get("sets") or []
+            kept_any = False
+            for lineno_str, set_idx in (old_entry.get("lines") or {}).items():
+                for test_idx in old_sets[set_idx]:
+                    node = old_tests[test_idx] if test_idx < len(old_tests) else None
+                    if node is None or node in rerun or node not in index:
+                        continue
+                    merged.setdefault(int(lineno_str), set()).add(node)
+                    kept_any = True
+            for test_idx in old_entry.get("module_tests") or []:
+                node = old_tests[test_idx] if test_idx < len(old_tests) else None
+                if node is not None and node not in rerun and node in index:
+                    module_nodes.add(node)
+            if import_lines is None:
+                import_lines = list(old_entry.get("import_lines") or [])
+            # Kept entries refer to the old content's line numbers
+            content_changed = old_entry.get("blob") != fingerprint["blob"]
+            stale = bool(old_entry.get("stale")) or (kept_any and content_changed)
+        module_nodes.update(node for nodes in merged.values() for node in nodes)
+
+        set_ids: dict[tuple[int, ...], int] = {}
+        sets: list[list[int]] = []
+        line_map: dict[str, int] = {}
+        for lineno in sorted(merged):
+            key = tuple(sorted(index[node] for node in merged[lineno]))
+            if key not in set_ids:
+                set_ids[key] = len(sets)
+                sets.append(list(key))
+            line_map[str(lineno)] = set_ids[key]
+        entry = {
+            **fingerprint,
+            "sets": sets,
+            "lines": line_map,
+            "import_lines": import_lines or [],
+            "module_tests": sorted(index[node] for node in module_nodes),
+        }
+        if stale:
+            entry["stale"] = True
+        return entry
+
+    def _rel(self, measured: str) -> str | None:
+        try:
+            return Path(measured).resolve().relative_to(self.project_root).as_posix()
+        except ValueError:
+            return None
+
+    # Selecting -----------------------------------------------------------
+
+    def _changed(self, rel_path: str, entry: dict[str, Any]) -> bool:
+        path = self.project_root / rel_path
+        try:
+            stat = path.stat()
+        except OSError:
+            return True
+        if stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns"):
+            return False
+        fingerprint = _fingerprint(path)
+        return fingerprint is None or fingerprint["blob"] != entry.get("blob")
+
+    def _old_content(self, blob: str | None) -> bytes | None:
+        if not blob:
+            return None
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "blob", blob],
+                capture_output=True,
+                cwd=self.project_root,
+                timeout=30,
+                check=False,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def changed_old_lines(self, rel_path: str) -> set[int] | None:
+        """1-based line numbers of the recorded content touched by the current edit (None if unknown)."""
+        entry = self.sources.get(rel_path) or {}
+        old = self._old_content(entry.get("blob"))
+        if old is None:
+            return None
+        try:
+            new = (self.project_root / rel_path).read_bytes()
+        except OSError:
+            return None
+        old_lines = old.decode("utf-8", errors="replace").splitlines()
+        new_lines = new.decode("utf-8", errors="replace").splitlines()
+        changed: set[int] = set()
+        matcher = difflib.SequenceMatcher(a=old_lines, b=new_lines, autojunk=False)
+        for tag, i1, i2, _j1, _j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            if tag == "insert":
+                # Code inserted between old lines i1 and i1 + 1 runs with its neighbours
+                changed.update(line for line in (i1, i1 + 1) if line >= 1)
+            else:
+                changed.update(range(i1 + 1, i2 + 1))
+        return changed
+
+    def _tests_for_source_change(self, rel_path: str) -> set[str]:
+        entry = self.sources[rel_path]
+        module_tests = {self.tests[i] for i in entry.get("module_tests") or []}
+        if entry.get("stale"):
+            return module_tests
+        changed = self.changed_old_lines(rel_path)
+        if changed is None:
+            return module_tests
+        if changed & set(entry.get("import_lines") or []):
+            # Module-level statement (signature, constant, import) changed
+            return module_tests
+        sets = entry.get("sets") or []
+        line_map = entry.get("lines") or {}
+        selected: set[str] = set()
+        for lineno in changed:
+            set_idx = line_map.get(str(lineno))
+            if set_idx is not None:
+                selected.update(self.tests[i] for i in sets[set_idx])
+        return selected
+
+    def select(self) -> ImpactSelection:
+        """Tests affected by the differences between the tree and the recorded map."""
+        source_files, test_files, helpers = self._classify_python_files()
+        selection = ImpactSelection()
+        tests: set[str] = set()
+        whole_files: set[str] = set()
+        changed: list[str] = []
+
+        for rel_path in sorted(_FULL_RUN_FILES):
+            entry = self.test_files.get(rel_path)
+            if entry is None:
+                changed_now = (self.project_root / rel_path).exists()
+            else:
+                changed_now = self._changed(rel_path, entry)
+            if changed_now:
+                return ImpactSelection(full_run=True, reason=f"{rel_path} changed", changed_files=[rel_path])
+        changed_helpers = [
+            rel_path
+            for rel_path in helpers
+            if rel_path not in self.test_files or self._changed(rel_path, self.test_files[rel_path])
+        ]
+        if changed_helpers:
+            return ImpactSelection(
+                full_run=True,
+                reason="test helper module changed (not measured per test)",
+                changed_files=changed_helpers,
+            )
+
+        current_tests = set(test_files)
+        for rel_path in sorted(current_tests):
+            entry = self.test_files.get(rel_path)
+            if entry is not None and not self._changed(rel_path, entry):
+                continue
+            changed.append(rel_path)
+            if rel_path.endswith("/conftest.py"):
+                scope = rel_path.rsplit("/", 1)[0] + "/"
+                whole_files.update(
+                    path for path in current_tests if path.startswith(scope) and not path.endswith("conftest.py")
+                )
+            else:
+                whole_files.add(rel_path)
+
+        new_sources: list[str] = []
+        for rel_path in sorted(set(source_files) | set(self.sources)):
+            entry = self.sources.get(rel_path)
+            if entry is None:
+                new_sources.append(rel_path)
+                changed.append(rel_path)
+                continue
+            if not self._changed(rel_path, entry):
+                continue
+            changed.append(rel_path)
+            if not (self.project_root / rel_path).exists():
+                # Deleted module: everything that touched it
+                tests.update(self.tests[i] for i in entry.get("module_tests") or [])
+                continue
+            tests.update(self._tests_for_source_change(rel_path))
+
+        if new_sources:
+            fallback = self._domain_fallback(new_sources)
+            if fallback is None:
+                return ImpactSelection(
+                    full_run=True,
+                    reason="new source file outside any test domain",
+                    changed_files=sorted(changed),
+                )
+            whole_files.update(fallback)
+
+        # Tests removed since the map was built cannot be selected by node id
+        selection.tests = sorted(node for node in tests if _node_file(node) in current_tests)
+        selection.test_files = sorted(path for path in whole_files if not path.endswith("conftest.py"))
+        selection.changed_files = sorted(changed)
+        selection.reason = (
+            f"{len(selection.changed_files)} changed file(s)" if changed else "no changes since the map was built"
+        )
+        return selection
+
+    def _domain_fallback(self, new_sources: list[str]) -> set[str] | None:
+        """Test files of the new files' domains, as the domain cache would select."""
+        from development_tools.tests.domain_mapper import DomainMapper
+        from development_tools.tests.test_file_coverage_cache import TestFileCoverageCache
+
+        mapper = DomainMapper(self.project_root)
+        domains: set[str] = set()
+        for rel_path in new_sources:
+            domain = mapper.get_source_domain(rel_path)
+            if domain is None:
+                return None
+            domains.add(domain)
+        cache = TestFileCoverageCache(self.project_root)
+        return {
+            path.relative_to(self.project_root).as_posix()
+            for path in cache.get_test_files_to_run(domains)
+        }
+
+
+def select_impacted_tests(project_root: Path | str, map_file: Path | None = None) -> ImpactSelection:
+    """Select tests for the working tree; a full run when no map has been recorded yet."""
+    impact_map = TestImpactMap.load(project_root, map_file)
+    if impact_map is None:
+        return ImpactSelection(full_run=True, reason="no test impact map recorded yet (run coverage first)")
+    return impact_map.select()
+
+
+def update_impact_map_from_coverage(
+    project_root: Path | str, data_file: Path | str, *, full_run: bool, map_file: Path | None = None
+) -> int | None:
+    """Record a coverage run's per-test contexts; returns the node count or None on failure."""
+    impact_map = TestImpactMap.load(project_root, map_file) if not full_run else None
+    if impact_map is None:
+        impact_map = TestImpactMap(project_root, map_file)
+        full_run = True
+    try:
+        recorded = impact_map.update_from_coverage_data(data_file, full_run=full_run)
+    except ImportError:
+        if logger:
+            logger.debug("Test impact map: coverage package not available")
+        return None
+    except Exception as exc:
+        if logger:
+            logger.warning(f"Test impact map: could not read coverage contexts from {data_file}: {exc}")
+        return None
+    if recorded == 0:
+        if logger:
+            logger.info("Test impact map: coverage data has no per-test contexts; map not updated")
+        return 0
+    impact_map.save()
+    return recorded
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Per-test coverage map for test impact selection")
+    parser.add_argument("action", choices=("select", "build"))
+    parser.add_argument("--project-root", default=str(Path(__file__).resolve().parents[2]))
+    parser.add_argument("--data-file", help="Combined .coverage file recorded with --cov-context=test (build)")
+    parser.add_argument("--json", action="store_true", help="Print the selection as JSON (select)")
+    ns = parser.parse_args(argv)
+
+    if ns.action == "build":
+        if not ns.data_file:
+            parser.error("build requires --data-file")
+        recorded = update_impact_map_from_coverage(ns.project_root, ns.data_file, full_run=True)
+        print(f"Recorded {recorded or 0} test node(s)")
+        return 0 if recorded else 1
+
+    selection = select_impacted_tests(ns.project_root)
+    if ns.json:
+        print(json.dumps(selection.to_dict(), indent=2))
+    elif selection.full_run:
+        print(f"Full run: {selection.reason}")
+    else:
+        print(f"{selection.reason}: {len(selection.selected_test_files())} test file(s) impacted")
+        for arg in selection.pytest_args():
+            print(f"  {arg}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
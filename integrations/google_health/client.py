@@ -6,15 +6,25 @@ Fetches sleep, activity, and health metrics via health.googleapis.com/v4.
 
 from __future__ import annotations
 
+import threading
+import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Literal
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from core.config import GOOGLE_HEALTH_API_BASE_URL
+from core.config import (
+    GOOGLE_HEALTH_API_BASE_URL,
+    GOOGLE_HEALTH_FETCH_CONCURRENCY,
+    GOOGLE_HEALTH_RATE_LIMIT_MAX_WAIT_SECONDS,
+    GOOGLE_HEALTH_SYNC_CONCURRENCY,
+)
 from core.error_handling import CommunicationError, handle_errors
 from core.logger import get_component_logger
 from core.time_utilities import now_timestamp_full
@@ -46,6 +56,114 @@ DATA_TYPE_SPECS: dict[str, tuple[str, FilterMode]] = {
 
 DATA_TYPES = tuple(DATA_TYPE_SPECS.keys())
 
+# Daily summary field each data type fills (used for per-type high-water marks)
+SUMMARY_FIELD_BY_DATA_TYPE: dict[str, str] = {
+    "sleep": "sleep_duration_minutes",
+    "steps": "steps",
+    "active-zone-minutes": "active_minutes",
+    "daily-resting-heart-rate": "resting_hr_bpm",
+    "daily-heart-rate-variability": "hrv_rmssd_ms",
+}
+# Incremental fetches restart this many days before a type's high-water date,
+# so the partially recorded latest day is always refreshed
+_HIGH_WATER_OVERLAP_DAYS = 1
+
+# 429 handling: retries per request, and the backoff when Retry-After is absent
+_MAX_RATE_LIMIT_RETRIES = 4
+_DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+_http_session_lock = threading.Lock()
+_http_session: requests.Session | None = None
+
+
+@handle_errors("creating Google Health HTTP session", default_return=None)
+def _get_http_session() -> requests.Session:
+    """Shared keep-alive session sized for concurrent users x data types."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                pool_size = max(
+                    GOOGLE_HEALTH_SYNC_CONCURRENCY * GOOGLE_HEALTH_FETCH_CONCURRENCY, 1
+                )
+                session = requests.Session()
+                session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+                session.mount("http://", HTTPAdapter(pool_maxsize=pool_size))
+                _http_session = session
+    return _http_session
+
+
+@handle_errors("parsing Retry-After header", default_return=None)
+def _parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.replace(".", "", 1).isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class _RateLimitGate:
+    """
+    Process-wide pause after a 429.
+
+    Every concurrent request waits out the latest Retry-After instead of
+    hammering the API; a request whose wait would exceed its budget fails.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+
+    @handle_errors("deferring Google Health requests", default_return=None)
+    def defer(self, seconds: float) -> None:
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    @handle_errors("waiting on Google Health rate limit", default_return=None, re_raise=True)
+    def wait(self, deadline: float) -> None:
+        with self._lock:
+            blocked_until = self._blocked_until
+        if blocked_until > deadline:
+            raise CommunicationError("Google Health rate limit wait exceeds budget")
+        delay = blocked_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+
+_rate_limit_gate = _RateLimitGate()
+
+
+@handle_errors("sending Google Health API request", default_return=None, re_raise=True)
+def _send_request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """
+    Send one API request on the pooled session, honouring 429 Retry-After.
+
+    Returns the final response; callers handle non-200 statuses. Raises
+    CommunicationError when the rate-limit wait would exceed
+    GOOGLE_HEALTH_RATE_LIMIT_MAX_WAIT_SECONDS.
+    """
+    deadline = time.monotonic() + GOOGLE_HEALTH_RATE_LIMIT_MAX_WAIT_SECONDS
+    attempt = 0
+    while True:
+        _rate_limit_gate.wait(deadline)
+        response = _get_http_session().request(method, url, **kwargs)
+        if response.status_code != 429 or attempt >= _MAX_RATE_LIMIT_RETRIES:
+            return response
+        attempt += 1
+        delay = _parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = _DEFAULT_RETRY_AFTER_SECONDS * 2 ** (attempt - 1)
+        logger.info(f"Google Health rate limited; retrying in {delay:.1f}s ({url})")
+        _rate_limit_gate.defer(delay)
+
 
 @dataclass(frozen=True)
 class _Fetcher:
@@ -133,7 +251,7 @@ def list_data_points(
         elif "pageToken" in params:
             del params["pageToken"]
 
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = _send_request("GET", url, headers=headers, params=params, timeout=30)
         if response.status_code != 200:
             body_preview = (response.text or "")[:300]
             logger.warning(
@@ -220,7 +338,7 @@ def _list_daily_rollups_single(
         elif "pageToken" in body:
             del body["pageToken"]
 
-        response = requests.post(url, headers=headers, json=body, timeout=60)
+        response = _send_request("POST", url, headers=headers, json=body, timeout=60)
         if response.status_code != 200:
             body_preview = (response.text or "")[:300]
             logger.warning(
@@ -688,28 +806,63 @@ _FETCHERS: tuple[_Fetcher, ...] = (
 )
 
 
+@handle_errors("computing incremental fetch start", default_return=None)
+def _incremental_start(window_start: datetime, high_water_date: str | None) -> datetime:
+    """Start of the fetch window for one type given its high-water date."""
+    if not high_water_date:
+        return window_start
+    try:
+        marked = datetime.strptime(high_water_date[:10], "%Y-%m-%d")
+    except ValueError:
+        return window_start
+    resume = marked.replace(tzinfo=timezone.utc) - timedelta(days=_HIGH_WATER_OVERLAP_DAYS)
+    return max(window_start, resume)
+
+
 @handle_errors("fetching daily summaries from Google Health", default_return=[])
 def fetch_daily_summaries(
     access_token: str,
     *,
     lookback_days: int = 3,
+    since: dict[str, str] | None = None,
 ) -> list[dict[str, Any]]:
-    """Fetch and normalize daily summaries for the lookback window."""
+    """
+    Fetch and normalize daily summaries for the lookback window.
+
+    Data types are fetched concurrently (GOOGLE_HEALTH_FETCH_CONCURRENCY).
+    ``since`` maps a data type to its latest stored date; that type is only
+    re-fetched from the day before it, within the lookback window.
+    """
     if is_google_health_testing_mode():
         return []
 
     end = datetime.now(timezone.utc)
     start = end - timedelta(days=max(lookback_days, 1))
+    since = since or {}
     by_date: dict[str, dict[str, Any]] = {}
 
-    for fetcher in _FETCHERS:
-        try:
-            points = _fetch_points_for_type(
-                access_token,
+    workers = max(min(GOOGLE_HEALTH_FETCH_CONCURRENCY, len(_FETCHERS)), 1)
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="google-health-fetch"
+    ) as pool:
+        futures = [
+            (
                 fetcher,
-                start_time=start,
-                end_time=end,
+                pool.submit(
+                    _fetch_points_for_type,
+                    access_token,
+                    fetcher,
+                    start_time=_incremental_start(start, since.get(fetcher.endpoint)) or start,
+                    end_time=end,
+                ),
             )
+            for fetcher in _FETCHERS
+        ]
+
+    # Merge in _FETCHERS order so summaries do not depend on completion order
+    for fetcher, future in futures:
+        try:
+            points = future.result()
         except CommunicationError:
             logger.warning(f"Skipping data type {fetcher.endpoint} due to API error")
             continue
@@ -126,6 +126,8 @@ class SyncStateModel(BaseModel):
     reconnect_notice_sent: bool = False
     last_scheduled_slot: str = ""
     baseline_metadata: dict[str, Any] = Field(default_factory=dict)
+    # {"lookback_days": int, "types": {data type: latest YYYY-MM-DD with data}}
+    high_water: dict[str, Any] = Field(default_factory=dict)
 
 
 @handle_errors("creating empty auth document", default_return={})
@@ -6,6 +6,7 @@ Rule-based baselines and confidence — no medical inference.
 
 from __future__ import annotations
 
+import bisect
 import statistics
 from typing import Any
 
@@ -109,6 +110,40 @@ def _band_vs_median_ratio(
     return "normal"
 
 
+# Baseline metric name -> key in the baseline stats dict
+_BASELINE_METRICS = {
+    "sleep_minutes": "sleep_minutes_median",
+    "steps": "steps_median",
+    "resting_hr": "resting_hr_median",
+    "hrv": "hrv_median",
+    "sleep_efficiency": "sleep_efficiency_median",
+    "restorative_share": "restorative_share_median",
+    "active_minutes": "active_minutes_median",
+}
+
+
+@handle_errors("extracting baseline metric values", default_return={})
+def _baseline_metric_values(model: DailySummaryModel) -> dict[str, float]:
+    """Baseline metric values present in one validated daily summary."""
+    values: dict[str, float] = {}
+    if model.sleep_duration_minutes is not None:
+        values["sleep_minutes"] = float(model.sleep_duration_minutes)
+    if model.steps is not None:
+        values["steps"] = float(model.steps)
+    if model.resting_hr_bpm is not None:
+        values["resting_hr"] = float(model.resting_hr_bpm)
+    if model.hrv_rmssd_ms is not None:
+        values["hrv"] = float(model.hrv_rmssd_ms)
+    if model.sleep_efficiency_pct is not None:
+        values["sleep_efficiency"] = float(model.sleep_efficiency_pct)
+    share = _restorative_share(model.sleep_duration_minutes, model.sleep_stages)
+    if share is not None:
+        values["restorative_share"] = share
+    if model.active_minutes is not None:
+        values["active_minutes"] = float(model.active_minutes)
+    return values
+
+
 @handle_errors("computing baseline stats", default_return={})
 def compute_baseline_stats(
     summaries: list[dict[str, Any]],
@@ -116,13 +151,7 @@ def compute_baseline_stats(
     exclude_date: str | None = None,
 ) -> dict[str, Any]:
     """Rolling median baselines from prior daily summaries."""
-    sleep_minutes: list[float] = []
-    steps: list[float] = []
-    resting_hr: list[float] = []
-    hrv: list[float] = []
-    efficiency: list[float] = []
-    restorative_shares: list[float] = []
-    active_minutes: list[float] = []
+    columns: dict[str, list[float]] = {metric: [] for metric in _BASELINE_METRICS}
 
     for item in summaries:
         day = item.get("date")
@@ -132,33 +161,104 @@ def compute_baseline_stats(
             model = DailySummaryModel.model_validate(item)
         except Exception:
             continue
-        if model.sleep_duration_minutes is not None:
-            sleep_minutes.append(float(model.sleep_duration_minutes))
-        if model.steps is not None:
-            steps.append(float(model.steps))
-        if model.resting_hr_bpm is not None:
-            resting_hr.append(float(model.resting_hr_bpm))
-        if model.hrv_rmssd_ms is not None:
-            hrv.append(float(model.hrv_rmssd_ms))
-        if model.sleep_efficiency_pct is not None:
-            efficiency.append(float(model.sleep_efficiency_pct))
-        share = _restorative_share(model.sleep_duration_minutes, model.sleep_stages)
-        if share is not None:
-            restorative_shares.append(share)
-        if model.active_minutes is not None:
-            active_minutes.append(float(model.active_minutes))
+        for metric, value in _baseline_metric_values(model).items():
+            columns[metric].append(value)
 
     days_used = len({s.get("date") for s in summaries if s.get("date") != exclude_date})
-    return {
-        "days_used": days_used,
-        "sleep_minutes_median": _median(sleep_minutes),
-        "steps_median": _median(steps),
-        "resting_hr_median": _median(resting_hr),
-        "hrv_median": _median(hrv),
-        "sleep_efficiency_median": _median(efficiency),
-        "restorative_share_median": _median(restorative_shares),
-        "active_minutes_median": _median(active_minutes),
-    }
+    stats: dict[str, Any] = {"days_used": days_used}
+    for metric, key in _BASELINE_METRICS.items():
+        stats[key] = _median(columns[metric])
+    return stats
+
+
+@handle_errors("computing leave-out median", default_return=None)
+def _median_excluding(column: list[float], removed: list[float]) -> float | None:
+    """
+    Median of a sorted column with the ``removed`` values taken out.
+
+    Uses rank arithmetic on the sorted column instead of copying it, so each
+    lookup costs O(k log n) for k removed values.
+    """
+    size = len(column) - len(removed)
+    if size <= 0:
+        return None
+    skipped: list[int] = []
+    for value in removed:
+        index = bisect.bisect_left(column, value)
+        while index in skipped:
+            index += 1
+        skipped.append(index)
+    skipped.sort()
+
+    def value_at(rank: int) -> float:
+        for index in skipped:
+            if index <= rank:
+                rank += 1
+        return column[rank]
+
+    middle = size // 2
+    if size % 2:
+        return float(value_at(middle))
+    return float((value_at(middle - 1) + value_at(middle)) / 2)
+
+
+class HealthBaselineEngine:
+    """
+    Leave-one-out baselines for every date of a summary history.
+
+    Validates each summary once and keeps one sorted column per baseline
+    metric. ``baseline_stats(date)`` then matches
+    ``compute_baseline_stats(summaries, exclude_date=date)`` without rescanning
+    or revalidating the history, so rebuilding D dates costs O(D log D)
+    instead of O(D^2) validations.
+    """
+
+    def __init__(self, summaries: list[dict[str, Any]]):
+        self._dates: set[Any] = set()
+        # First summary per date (what build_signal_for_date reports on);
+        # None when that summary fails validation
+        self._targets: dict[Any, DailySummaryModel | None] = {}
+        self._values_by_date: dict[Any, dict[str, list[float]]] = {}
+        self._columns: dict[str, list[float]] = {metric: [] for metric in _BASELINE_METRICS}
+
+        for item in summaries:
+            day = item.get("date")
+            self._dates.add(day)
+            try:
+                model = DailySummaryModel.model_validate(item)
+            except Exception:
+                model = None
+            if day not in self._targets:
+                self._targets[day] = model
+            if model is None:
+                continue
+            day_values = self._values_by_date.setdefault(day, {})
+            for metric, value in _baseline_metric_values(model).items():
+                self._columns[metric].append(value)
+                day_values.setdefault(metric, []).append(value)
+
+        for column in self._columns.values():
+            column.sort()
+
+    @handle_errors("computing engine baseline stats", default_return={})
+    def baseline_stats(self, exclude_date: str | None = None) -> dict[str, Any]:
+        """Baseline medians over every date except ``exclude_date``."""
+        removed = self._values_by_date.get(exclude_date, {}) if exclude_date else {}
+        days_used = len(self._dates) - (1 if exclude_date in self._dates else 0)
+        stats: dict[str, Any] = {"days_used": days_used}
+        for metric, key in _BASELINE_METRICS.items():
+            stats[key] = _median_excluding(self._columns[metric], removed.get(metric, []))
+        return stats
+
+    @handle_errors("building engine signal", default_return=None)
+    def build_signal(self, target_date: str) -> dict[str, Any] | None:
+        """Derived signal for one date, or None when it has no valid summary."""
+        today = self._targets.get(target_date)
+        if today is None:
+            return None
+        return _build_signal_from_baselines(
+            target_date, today, self.baseline_stats(target_date)
+        )
 
 
 @handle_errors("mapping baseline days to confidence", default_return="low")
@@ -267,21 +367,16 @@ def build_signal_for_date(
     summaries: list[dict[str, Any]],
 ) -> dict[str, Any] | None:
     """Build derived health signal for one calendar date."""
-    today_summary: dict[str, Any] | None = None
-    for item in summaries:
-        if item.get("date") == target_date:
-            today_summary = item
-            break
+    return HealthBaselineEngine(summaries).build_signal(target_date)
 
-    if not today_summary:
-        return None
 
-    try:
-        today = DailySummaryModel.model_validate(today_summary)
-    except Exception:
-        return None
-
-    baselines = compute_baseline_stats(summaries, exclude_date=target_date)
+@handle_errors("building signal from baselines", default_return=None)
+def _build_signal_from_baselines(
+    target_date: str,
+    today: DailySummaryModel,
+    baselines: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Derive the signal for one validated summary against its baselines."""
     days_used = baselines.get("days_used") or 0
     confidence = _confidence_from_baseline_days(days_used)
 
@@ -391,11 +486,12 @@ def rebuild_signals_for_summaries(
         for summary in summaries
         if summary.get("date")
     )
+    engine = HealthBaselineEngine(summaries)
     signals: list[dict[str, Any]] = []
     for day in target_dates:
         if not day:
             continue
-        signal = build_signal_for_date(day, summaries)
+        signal = engine.build_signal(day)
         if signal:
             signals.append(signal)
     return signals
@@ -6,11 +6,13 @@ Automated polling path - idempotent daily upsert + signal rebuild.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from core import get_user_data, update_user_account
 from core.config import (
     GOOGLE_HEALTH_ENABLED,
+    GOOGLE_HEALTH_SYNC_CONCURRENCY,
     GOOGLE_HEALTH_SYNC_FAILURE_PAUSE_THRESHOLD,
     GOOGLE_HEALTH_SYNC_LOOKBACK_DAYS,
 )
@@ -22,7 +24,10 @@ from integrations.google_health.auth import (
     DEAD_REFRESH_TOKEN_ERROR,
     ensure_valid_access_token,
 )
-from integrations.google_health.client import fetch_daily_summaries
+from integrations.google_health.client import (
+    SUMMARY_FIELD_BY_DATA_TYPE,
+    fetch_daily_summaries,
+)
 from integrations.google_health.data_handlers import (
     has_valid_auth,
     load_daily_summaries,
@@ -112,6 +117,29 @@ def merge_health_signals(
     return sorted(by_date.values(), key=lambda x: x.get("date") or "")
 
 
+@handle_errors("computing health sync high-water marks", default_return={})
+def compute_high_water_marks(summaries: list[dict[str, Any]]) -> dict[str, str]:
+    """Latest date with data for each Google Health data type."""
+    marks: dict[str, str] = {}
+    for item in summaries:
+        day = item.get("date")
+        if not day:
+            continue
+        for data_type, field in SUMMARY_FIELD_BY_DATA_TYPE.items():
+            if item.get(field) is not None and day > marks.get(data_type, ""):
+                marks[data_type] = day
+    return marks
+
+
+@handle_errors("reading health sync high-water marks", default_return={})
+def _usable_high_water_marks(sync_state: dict[str, Any]) -> dict[str, str]:
+    """Stored marks, ignored when they were recorded for a different lookback window."""
+    high_water = sync_state.get("high_water") or {}
+    if high_water.get("lookback_days") != GOOGLE_HEALTH_SYNC_LOOKBACK_DAYS:
+        return {}
+    return dict(high_water.get("types") or {})
+
+
 @handle_errors("pausing google health feature", default_return=False)
 def pause_google_health_feature(user_id: str, *, reason: str = "") -> bool:
     account = get_user_data(user_id, "account").get("account") or {}
@@ -157,7 +185,9 @@ def sync_user_health_data(
             raise CommunicationError(DEAD_REFRESH_TOKEN_ERROR)
 
         incoming = fetch_daily_summaries(
-            token, lookback_days=GOOGLE_HEALTH_SYNC_LOOKBACK_DAYS
+            token,
+            lookback_days=GOOGLE_HEALTH_SYNC_LOOKBACK_DAYS,
+            since=_usable_high_water_marks(sync_state),
         )
         doc = load_daily_summaries(user_id) or {"summaries": []}
         merged = upsert_daily_summaries(doc.get("summaries") or [], incoming)
@@ -179,6 +209,10 @@ def sync_user_health_data(
                 "last_error": "",
                 "consecutive_failures": 0,
                 "reconnect_notice_sent": False,
+                "high_water": {
+                    "lookback_days": GOOGLE_HEALTH_SYNC_LOOKBACK_DAYS,
+                    "types": compute_high_water_marks(merged),
+                },
             }
         )
         if scheduled_slot_key:
@@ -210,6 +244,31 @@ def sync_user_health_data(
         return False
 
 
+@handle_errors("running scheduled health sync job", default_return=False)
+def _run_sync_job(job: tuple[str, str | None]) -> bool:
+    """Sync one (user_id, scheduled slot key) pair."""
+    user_id, slot_key = job
+    ok = sync_user_health_data(user_id, scheduled_slot_key=slot_key)
+    if ok and slot_key:
+        logger.debug(
+            f"Completed scheduled Google Health sync for user {user_id} (slot {slot_key})"
+        )
+    return ok
+
+
+@handle_errors("syncing health data for users", default_return=0)
+def _sync_users_concurrently(jobs: list[tuple[str, str | None]]) -> int:
+    """Run sync jobs on up to GOOGLE_HEALTH_SYNC_CONCURRENCY threads; count successes."""
+    if not jobs:
+        return 0
+    workers = max(min(GOOGLE_HEALTH_SYNC_CONCURRENCY, len(jobs)), 1)
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="google-health-sync"
+    ) as pool:
+        results = list(pool.map(_run_sync_job, jobs))
+    return sum(1 for ok in results if ok)
+
+
 @handle_errors("syncing all enabled users", default_return=0)
 def sync_all_enabled_users() -> int:
     """Run sync for every user with google_health enabled (ignores schedule slots)."""
@@ -218,11 +277,7 @@ def sync_all_enabled_users() -> int:
     if is_google_health_testing_mode():
         return 0
 
-    count = 0
-    for user_id in get_all_user_ids():
-        if sync_user_health_data(user_id):
-            count += 1
-    return count
+    return _sync_users_concurrently([(user_id, None) for user_id in get_all_user_ids()])
 
 
 @handle_errors("syncing users due for scheduled health sync", default_return=0)
@@ -235,7 +290,7 @@ def sync_users_due_for_schedule() -> int:
 
     from scheduler.health_sync_schedule import get_due_sync_slot_key
 
-    count = 0
+    jobs: list[tuple[str, str | None]] = []
     for user_id in get_all_user_ids():
         if not _google_health_feature_enabled(user_id):
             continue
@@ -247,16 +302,10 @@ def sync_users_due_for_schedule() -> int:
             user_id,
             last_scheduled_slot=str(sync_state.get("last_scheduled_slot") or ""),
         )
-        if not slot_key:
-            continue
+        if slot_key:
+            jobs.append((user_id, slot_key))
 
-        if sync_user_health_data(user_id, scheduled_slot_key=slot_key):
-            count += 1
-            logger.debug(
-                f"Completed scheduled Google Health sync for user {user_id} "
-                f"(slot {slot_key})"
-            )
-    return count
+    return _sync_users_concurrently(jobs)
 
 
 @handle_errors("running Google Health sync CLI", default_return=None)
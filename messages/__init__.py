@@ -17,7 +17,18 @@ from .message_data_manager import (
     store_sent_message,
     update_message,
 )
+from .ai_outbox import (
+    cancel_ai_pregeneration,
+    invalidate_ai_outbox,
+    pop_pregenerated_message,
+    queue_ai_pregeneration,
+)
 from .message_analytics import MessageAnalytics
+from .template_index import (
+    clear_message_template_index,
+    get_message_template_index,
+    invalidate_message_templates,
+)
 from .message_service import (
     get_predefined_message_preview_text,
     message_schedule_matches_current_window,
@@ -28,20 +39,27 @@ __all__ = [
     "MessageAnalytics",
     "add_message",
     "archive_old_messages",
+    "cancel_ai_pregeneration",
+    "clear_message_template_index",
     "create_message_file_from_defaults",
     "delete_message",
     "edit_message",
     "ensure_user_message_files",
     "get_message_categories",
+    "get_message_template_index",
     "get_predefined_message_preview_text",
     "get_recent_messages",
     "get_timestamp_for_sorting",
+    "invalidate_ai_outbox",
+    "invalidate_message_templates",
     "is_ai_generated_message_category",
     "is_automated_messages_enabled",
     "load_default_messages",
     "load_user_messages",
     "message_schedule_matches_current_window",
     "message_template_schedule_lists",
+    "pop_pregenerated_message",
+    "queue_ai_pregeneration",
     "store_sent_message",
     "update_message",
 ]
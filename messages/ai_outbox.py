@@ -0,0 +1,320 @@
+# ai_outbox.py
+"""
+Ahead-of-time generation of AI scheduled messages.
+
+When the scheduler plans a user's day, every planned send in an AI-generated
+category (``is_ai_generated_message_category``) is queued here with its send
+time. A background worker generates the text roughly
+``AI_PREGENERATION_LEAD_MINUTES`` before the send, but only while the model
+is idle. The LM Studio admission controller must have nothing in flight or
+queued, and the resource monitor must not report overload. Otherwise the job
+is retried a minute later, until shortly before the send. Generation runs in
+the ``SCHEDULED`` admission class, so it never delays chat.
+
+Generated text goes into a per-user outbox with a freshness TTL
+(``AI_OUTBOX_TTL_MINUTES``), one entry per planned send slot, so a category
+with several sends a day gets each of them pre-generated. A scheduled send
+pops the entry for the slot nearest to now and only generates synchronously
+on a miss. A new check-in or any saved user data
+drops the user's outbox, so a message is never based on stale context. When
+the scheduler replans, the slots it drops are cancelled, so no model time is
+spent on sends that will not happen.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+
+logger = get_component_logger("message")
+
+# Seconds between idle checks while the model is busy
+IDLE_RETRY_SECONDS = 60
+# Give up on pre-generation this close to the send (the send generates instead)
+MIN_LEAD_SECONDS = 60
+
+_outbox_lock = threading.Lock()
+_outbox = None
+
+
+@dataclass(frozen=True)
+class OutboxEntry:
+    """A generated message waiting for its send"""
+
+    text: str
+    generated_at: float
+    expires_at: float
+
+
+@handle_errors("generating scheduled AI message", default_return=None)
+def generate_scheduled_ai_message(user_id: str, *, skip_cache: bool = False) -> str | None:
+    """
+    Generate the personalized text for a scheduled AI send.
+
+    Applies the user's health guidance as a prompt prefix; used both at send
+    time and by pre-generation so the two produce the same kind of message.
+    """
+    from ai.chat.chatbot import get_ai_chatbot
+    from core.config import AI_PERSONALIZED_MESSAGE_TIMEOUT
+    from core.health_signals import get_message_guidance
+    from integrations.google_health.personalization_rules import (
+        build_scheduled_message_context_prefix,
+    )
+
+    guidance = get_message_guidance(user_id)
+    prefix = build_scheduled_message_context_prefix(guidance)
+    return get_ai_chatbot().generate_personalized_message(
+        user_id,
+        timeout=AI_PERSONALIZED_MESSAGE_TIMEOUT,
+        prompt_prefix=prefix or None,
+        skip_cache=skip_cache,
+    )
+
+
+@handle_errors("checking if model is idle", default_return=False)
+def _model_is_idle() -> bool:
+    """No LM Studio calls in flight or queued, and the model is not overloaded"""
+    from ai.client.admission import get_llm_admission_controller
+    from core.resource_monitor import get_resource_monitor
+
+    controller = get_llm_admission_controller()
+    if controller is not None:
+        stats = controller.get_stats()
+        if stats.get("active") or stats.get("queued"):
+            return False
+    monitor = get_resource_monitor()
+    return monitor is None or not monitor.is_overloaded()
+
+
+class AIMessageOutbox:
+    """Per-user outbox of pre-generated messages plus the generation queue"""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        lead_seconds: float,
+        generator=generate_scheduled_ai_message,
+        idle_check=_model_is_idle,
+    ):
+        """
+        Args:
+            ttl_seconds: How long a generated message stays fresh
+            lead_seconds: How far ahead of the send to start generating
+            generator: ``user_id -> text`` (tests substitute a fake)
+            idle_check: ``() -> bool`` gate for running generation
+        """
+        self.ttl_seconds = float(ttl_seconds)
+        self.lead_seconds = float(lead_seconds)
+        self._generator = generator
+        self._idle_check = idle_check
+        # user_id -> {(category, send_at): entry}; one entry per planned send slot
+        self._entries: dict[str, dict[tuple[str, float], OutboxEntry]] = {}
+        # (run_at, seq, user_id, category, send_at); _pending dedupes by (user, category, send_at)
+        self._queue: list[tuple[float, int, str, str, float]] = []
+        self._pending: set[tuple[str, str, float]] = set()
+        self._sequence = itertools.count()
+        self._generations: dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._stats = {"generated": 0, "hits": 0, "misses": 0, "expired": 0, "invalidated": 0, "skipped": 0, "cancelled": 0}
+
+    @handle_errors("queueing AI message pre-generation", default_return=False)
+    def enqueue(self, user_id: str, category: str, send_at: float) -> bool:
+        """Queue generation ahead of a send at epoch time ``send_at``"""
+        key = (user_id, category, send_at)
+        with self._cond:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+            run_at = max(time.time(), send_at - self.lead_seconds)
+            heapq.heappush(self._queue, (run_at, next(self._sequence), user_id, category, send_at))
+            self._cond.notify()
+        self._ensure_worker()
+        return True
+
+    @handle_errors("popping pre-generated AI message", default_return=None)
+    def pop(self, user_id: str, category: str) -> str | None:
+        """Take the fresh pre-generated message for the send slot nearest to now, if any"""
+        now = time.time()
+        with self._cond:
+            user_entries = self._entries.get(user_id, {})
+            slots = [slot for slot in user_entries if slot[0] == category]
+            if not slots:
+                self._stats["misses"] += 1
+                return None
+            slot = min(slots, key=lambda item: abs(item[1] - now))
+            entry = user_entries.pop(slot)
+            if entry.expires_at <= now:
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            self._stats["hits"] += 1
+            return entry.text
+
+    @handle_errors("cancelling AI message pre-generation", default_return=0)
+    def cancel(self, user_id: str, slots: list[tuple[str, float]]) -> int:
+        """
+        Forget replanned-away send slots: their queued generation and any
+        stored message. ``slots`` are ``(category, send_at)`` pairs.
+
+        Returns:
+            int: Number of queued jobs and stored messages dropped
+        """
+        dropped = 0
+        with self._cond:
+            user_entries = self._entries.get(user_id, {})
+            for category, send_at in slots:
+                key = (user_id, category, send_at)
+                if key in self._pending:
+                    self._pending.discard(key)
+                    dropped += 1
+                if user_entries.pop((category, send_at), None) is not None:
+                    dropped += 1
+            if not user_entries:
+                self._entries.pop(user_id, None)
+            self._stats["cancelled"] += dropped
+        return dropped
+
+    @handle_errors("invalidating AI outbox", default_return=None)
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop stored messages and mark in-flight generations as stale"""
+        with self._cond:
+            self._generations[user_id] = self._generations.get(user_id, 0) + 1
+            dropped = self._entries.pop(user_id, None)
+            if dropped:
+                self._stats["invalidated"] += len(dropped)
+
+    @handle_errors("running due AI pre-generation", default_return=0)
+    def run_due(self, now: float | None = None) -> int:
+        """Generate every due job (worker loop body; callable directly in tests)"""
+        done = 0
+        while True:
+            current = time.time() if now is None else now
+            with self._cond:
+                if not self._queue or self._queue[0][0] > current:
+                    return done
+                _, _, user_id, category, send_at = heapq.heappop(self._queue)
+                key = (user_id, category, send_at)
+                if key not in self._pending:
+                    continue  # already generated for this slot
+                if send_at - current < MIN_LEAD_SECONDS:
+                    self._pending.discard(key)
+                    self._stats["skipped"] += 1
+                    continue
+                if not self._idle_check():
+                    retry_at = min(current + IDLE_RETRY_SECONDS, send_at - MIN_LEAD_SECONDS)
+                    heapq.heappush(self._queue, (retry_at, next(self._sequence), user_id, category, send_at))
+                    return done
+                generation = self._generations.get(user_id, 0)
+            text = self._generator(user_id)
+            with self._cond:
+                # A slot cancelled while generating is not stored
+                cancelled = key not in self._pending
+                self._pending.discard(key)
+                if text and not cancelled and self._generations.get(user_id, 0) == generation:
+                    self._entries.setdefault(user_id, {})[(category, send_at)] = OutboxEntry(
+                        text, current, current + self.ttl_seconds
+                    )
+                    self._stats["generated"] += 1
+                    done += 1
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ai-pregeneration", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self.run_due()
+            with self._cond:
+                wait = self._queue[0][0] - time.time() if self._queue else IDLE_RETRY_SECONDS
+                self._cond.wait(max(1.0, min(wait, IDLE_RETRY_SECONDS)))
+
+    @handle_errors("stopping AI pre-generation worker", default_return=None)
+    def stop(self, timeout: float = 5) -> None:
+        """Stop the background worker"""
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @handle_errors("getting AI outbox stats", default_return={})
+    def get_stats(self) -> dict:
+        """Hit/miss/generation counters and current sizes"""
+        with self._cond:
+            return {
+                **self._stats,
+                "queued": len(self._pending),
+                "stored": sum(len(entries) for entries in self._entries.values()),
+            }
+
+
+@handle_errors("getting AI message outbox", default_return=None)
+def get_ai_message_outbox() -> AIMessageOutbox:
+    """Process-wide outbox sized from config"""
+    global _outbox
+    if _outbox is None:
+        with _outbox_lock:
+            if _outbox is None:
+                from core import config
+
+                _outbox = AIMessageOutbox(
+                    ttl_seconds=getattr(config, "AI_OUTBOX_TTL_MINUTES", 120) * 60,
+                    lead_seconds=getattr(config, "AI_PREGENERATION_LEAD_MINUTES", 30) * 60,
+                )
+    return _outbox
+
+
+@handle_errors("queueing AI message pre-generation", default_return=False)
+def queue_ai_pregeneration(user_id: str, category: str, send_at: float) -> bool:
+    """Queue pre-generation for a planned send (no-op when disabled)"""
+    from core import config
+
+    if not getattr(config, "AI_PREGENERATION_ENABLED", True):
+        return False
+    outbox = get_ai_message_outbox()
+    return outbox is not None and outbox.enqueue(user_id, category, send_at)
+
+
+@handle_errors("cancelling AI message pre-generation", default_return=0)
+def cancel_ai_pregeneration(user_id: str, slots: list[tuple[str, float]]) -> int:
+    """Drop pre-generation for ``(category, send_at)`` slots a replan removed"""
+    if _outbox is None:
+        return 0
+    return _outbox.cancel(user_id, slots)
+
+
+@handle_errors("popping pre-generated AI message", default_return=None)
+def pop_pregenerated_message(user_id: str, category: str) -> str | None:
+    """Fresh pre-generated text for this send, or None (generate now)"""
+    if _outbox is None:
+        return None
+    return _outbox.pop(user_id, category)
+
+
+@handle_errors("invalidating AI outbox for user", default_return=None)
+def invalidate_ai_outbox(user_id: str) -> None:
+    """Drop a user's pre-generated messages after their data changes"""
+    if _outbox is not None:
+        _outbox.invalidate_user(user_id)
+
+
+@handle_errors("resetting AI message outbox", default_return=None)
+def reset_ai_message_outbox() -> None:
+    """Stop and drop the process-wide outbox (tests and config reloads)"""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is not None:
+            _outbox.stop()
+        _outbox = None
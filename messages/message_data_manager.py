@@ -259,30 +259,20 @@ def load_user_messages(user_id, category):
 def load_default_messages(category):
     """Load default messages for a specific category."""
     try:
-        # Add debug logging to see what path is being used
-        logger.info(f"Loading default messages for category: {category}")
-        logger.info(f"DEFAULT_MESSAGES_DIR_PATH: {DEFAULT_MESSAGES_DIR_PATH}")
-        logger.info(f"Current working directory: {os.getcwd()}")
-
         default_messages_file = Path(DEFAULT_MESSAGES_DIR_PATH) / f"{category}.json"
 
-        # Add debug logging to see what path is being used
-        logger.info(f"Looking for default messages file: {default_messages_file}")
-        logger.info(f"File exists: {default_messages_file.exists()}")
-        logger.info(f"Absolute path: {default_messages_file.absolute()}")
-
         try:
             with open(default_messages_file, encoding="utf-8") as f:
                 data = json.load(f)
                 messages = data.get("messages", [])
-                logger.info(
-                    f"Loaded {len(messages)} default messages for category {category}"
+                logger.debug(
+                    f"Loaded {len(messages)} default messages for category {category} "
+                    f"from {default_messages_file}"
                 )
                 return messages
         except FileNotFoundError:
             logger.error(f"Default messages file not found for category: {category}")
-            logger.error(f"Attempted path: {default_messages_file}")
-            logger.error(f"Absolute path: {default_messages_file.absolute()}")
+            logger.error(f"Attempted path: {default_messages_file.absolute()}")
             return []
         except json.JSONDecodeError as e:
             logger.error(
@@ -294,6 +284,14 @@ def load_default_messages(category):
         return []
 
 
+@handle_errors("invalidating message template index", default_return=None)
+def _invalidate_template_index(user_id: str, category: str) -> None:
+    """Drop the selection index for a category after its templates changed."""
+    from messages.template_index import invalidate_message_templates
+
+    invalidate_message_templates(user_id, category)
+
+
 @handle_errors("adding message")
 def add_message(user_id, category, message_data, index=None):
     """
@@ -330,6 +328,7 @@ def add_message(user_id, category, message_data, index=None):
         data = _ensure_v2_message_template_file(data, category)
     save_json_data(data, str(file_path))
 
+    _invalidate_template_index(user_id, category)
     try:
         importlib.import_module("storage.user_data_operations").update_user_index(user_id)
     except Exception as e:
@@ -387,6 +386,7 @@ def edit_message(user_id, category, message_id, updated_data):
         data = _ensure_v2_message_template_file(data, category)
     save_json_data(data, str(file_path))
 
+    _invalidate_template_index(user_id, category)
     try:
         importlib.import_module("storage.user_data_operations").update_user_index(user_id)
     except Exception as e:
@@ -433,6 +433,7 @@ def update_message(user_id, category, message_id, new_message_data):
             data["messages"][i] = _message_template_default_to_v2(normalized_new_data, category)
             data["updated_at"] = now_timestamp_full()
             save_json_data(data, file_path)
+            _invalidate_template_index(user_id, category)
             logger.info(
                 f"Updated message with ID {message_id} in category {category} for user {user_id}"
             )
@@ -489,6 +490,7 @@ def delete_message(user_id, category, message_id):
         data["updated_at"] = now_timestamp_full()
     save_json_data(data, str(file_path))
 
+    _invalidate_template_index(user_id, category)
     try:
         importlib.import_module("storage.user_data_operations").update_user_index(user_id)
     except Exception as e:
@@ -624,7 +626,10 @@ def store_sent_message(
         return False
 
     try:
+        from messages.template_index import record_sent_message, sent_log_signature
+
         file_path = determine_file_path("sent_messages", user_id)
+        previous_signature = sent_log_signature(user_id)
         data = load_json_data(file_path) or {}
 
         sent_at = now_timestamp_full()
@@ -652,6 +657,13 @@ def store_sent_message(
             "deliveries": deliveries,
         }
         save_json_data(data, file_path)
+        record_sent_message(
+            user_id,
+            category,
+            message,
+            _parse_message_timestamp(sent_at),
+            previous_signature,
+        )
         logger.debug(f"Stored v2 sent message delivery for user {user_id}, category {category}")
         return True
 
@@ -0,0 +1,230 @@
+# template_index.py
+"""
+In-memory selection index for predefined message templates.
+
+Every scheduled send used to reload and convert the whole category template
+file, filter it by day and period, and parse the sent-message log again for
+deduplication. This module keeps two per-user structures instead:
+
+- ``MessageTemplateIndex`` holds one category's runtime templates, with
+  template positions bucketed by every (day, period) pair the template
+  allows. Each template is also tagged with whether it targets specific
+  periods, which is the weighting ``select_weighted_message`` uses. A lookup
+  for the current days and periods touches only the matching candidates.
+- The recently-sent log holds, per category, the normalized texts of the
+  last ``RECENT_SENT_LIMIT`` sends. It is seeded once from
+  ``sent_messages.json``, and ``store_sent_message`` feeds it after each
+  send.
+
+Both are validated against an ``os.stat`` signature of their file, so edits
+made by another process (the admin UI) are picked up without reading the
+file on every send. ``add_message``, ``edit_message``, ``update_message`` and
+``delete_message`` also invalidate the index directly. Cached templates are
+shared between sends and must be treated as read-only.
+"""
+
+import os
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from core.error_handling import handle_errors
+from core.file_operations import file_signature
+from core.logger import get_component_logger
+
+logger = get_component_logger("message")
+
+# Matches the dedup window the dispatcher always used
+RECENT_SENT_LIMIT = 50
+RECENT_SENT_DAYS = 60
+
+_index_lock = threading.Lock()
+# (user_id, category) -> (template file signature, MessageTemplateIndex)
+_template_indexes: dict[tuple[str, str], tuple[tuple, "MessageTemplateIndex"]] = {}
+# (user_id, category) -> (sent log signature, deque[(sent_at, normalized text)])
+_recent_sent: dict[tuple[str, str], tuple[tuple, deque]] = {}
+
+
+@handle_errors("normalizing message text for dedup", default_return="")
+def normalize_message_text(text: Any) -> str:
+    """Key used to compare template text with sent text"""
+    return str(text or "").strip().lower()
+
+
+@handle_errors("reading message schedule fields", default_return=(["ALL"], ["ALL"]))
+def message_schedule_fields(message: dict[str, Any]) -> tuple[list[str], list[str]]:
+    """Days and periods a runtime template allows (``ALL`` when unset)"""
+    schedule = message.get("schedule")
+    if not isinstance(schedule, dict):
+        return ["ALL"], ["ALL"]
+    days = schedule.get("days")
+    periods = schedule.get("periods")
+    days_list = [d for d in (days or ["ALL"]) if isinstance(d, str)] or ["ALL"]
+    periods_list = [p for p in (periods or ["ALL"]) if isinstance(p, str)] or ["ALL"]
+    return days_list, periods_list
+
+
+class MessageTemplateIndex:
+    """One category's templates bucketed by (day, period)"""
+
+    def __init__(self, messages: list[dict[str, Any]]):
+        self.messages = messages
+        self._buckets: dict[tuple[str, str], list[int]] = {}
+        self._period_specific: list[bool] = []
+        for position, message in enumerate(messages):
+            days, periods = message_schedule_fields(message)
+            self._period_specific.append(any(period != "ALL" for period in periods))
+            for day in set(days):
+                for period in set(periods):
+                    self._buckets.setdefault((day, period), []).append(position)
+
+    @handle_errors("looking up message template candidates", default_return=[])
+    def candidates(
+        self, current_days: list[str], matching_periods: list[str]
+    ) -> list[dict[str, Any]]:
+        """Templates allowed on any of ``current_days`` in any of ``matching_periods``"""
+        days = set(current_days) | {"ALL"}
+        periods = set(matching_periods) | {"ALL"}
+        positions: set[int] = set()
+        for day in days:
+            for period in periods:
+                positions.update(self._buckets.get((day, period), ()))
+        return [self.messages[position] for position in sorted(positions)]
+
+    @handle_errors("splitting candidates by period weighting", default_return=([], []))
+    def split_by_period_weighting(
+        self, candidates: list[dict[str, Any]]
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """(period-specific, all-period) candidates using the precomputed tags"""
+        specific_ids = {
+            id(message)
+            for message, specific in zip(self.messages, self._period_specific)
+            if specific
+        }
+        specific: list[dict[str, Any]] = []
+        all_period: list[dict[str, Any]] = []
+        for message in candidates:
+            (specific if id(message) in specific_ids else all_period).append(message)
+        return specific, all_period
+
+
+@handle_errors("getting message template path", default_return="")
+def _template_path(user_id: str, category: str) -> str:
+    from core.config import get_user_data_dir
+
+    return os.path.join(get_user_data_dir(user_id), "messages", f"{category}.json")
+
+
+@handle_errors("getting message template index", default_return=None)
+def get_message_template_index(user_id: str, category: str) -> MessageTemplateIndex | None:
+    """Index for one user category, rebuilt only when its template file changed"""
+    if user_id is None:
+        return None
+    from messages.message_data_manager import load_user_messages
+
+    key = (user_id, category)
+    signature = file_signature(_template_path(user_id, category))
+    with _index_lock:
+        cached = _template_indexes.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    index = MessageTemplateIndex(load_user_messages(user_id, category) or [])
+    with _index_lock:
+        _template_indexes[key] = (signature, index)
+    logger.debug(
+        f"Indexed {len(index.messages)} message templates for user {user_id}, category {category}"
+    )
+    return index
+
+
+@handle_errors("invalidating message template index", default_return=None)
+def invalidate_message_templates(user_id: str, category: str | None = None) -> None:
+    """Drop a user's indexed templates (one category, or all)"""
+    with _index_lock:
+        for key in list(_template_indexes):
+            if key[0] == user_id and (category is None or key[1] == category):
+                del _template_indexes[key]
+
+
+@handle_errors("getting sent messages path", default_return="")
+def _sent_log_path(user_id: str) -> str:
+    from core.file_operations import determine_file_path
+
+    return determine_file_path("sent_messages", user_id)
+
+
+@handle_errors("getting recently sent message texts", default_return=set())
+def get_recent_sent_texts(user_id: str, category: str) -> set[str]:
+    """Normalized texts sent in ``category`` recently (last 50 within 60 days)"""
+    key = (user_id, category)
+    signature = file_signature(_sent_log_path(user_id))
+    with _index_lock:
+        cached = _recent_sent.get(key)
+    if cached is None or cached[0] != signature:
+        from messages.message_data_manager import (
+            _parse_message_timestamp,
+            get_recent_messages,
+        )
+
+        recent = get_recent_messages(
+            user_id, category=category, limit=RECENT_SENT_LIMIT, days_back=RECENT_SENT_DAYS
+        )
+        entries = deque(
+            (
+                (_parse_message_timestamp(str(msg.get("sent_at") or "")), normalize_message_text(text))
+                for msg in recent
+                if (text := msg.get("sent_text"))
+            ),
+            maxlen=RECENT_SENT_LIMIT,
+        )
+        cached = (signature, entries)
+        with _index_lock:
+            _recent_sent[key] = cached
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=RECENT_SENT_DAYS)
+    with _index_lock:
+        return {text for sent_at, text in cached[1] if sent_at >= cutoff}
+
+
+@handle_errors("recording sent message in recent log", default_return=None)
+def record_sent_message(
+    user_id: str,
+    category: str,
+    text: str,
+    sent_at: datetime,
+    previous_signature: tuple,
+) -> None:
+    """
+    Feed one send into the recent log after ``store_sent_message`` saved it.
+
+    ``previous_signature`` is the sent log's signature before the write. Only
+    entries that were current at that point are carried forward; anything
+    else is dropped and reseeded on the next lookup.
+    """
+    signature = file_signature(_sent_log_path(user_id))
+    with _index_lock:
+        for key in [key for key in _recent_sent if key[0] == user_id]:
+            entry_signature, entries = _recent_sent[key]
+            if entry_signature != previous_signature:
+                del _recent_sent[key]
+                continue
+            if key[1] == category and text:
+                entries.appendleft((sent_at, normalize_message_text(text)))
+            _recent_sent[key] = (signature, entries)
+
+
+@handle_errors("getting sent log signature", default_return=None)
+def sent_log_signature(user_id: str) -> tuple | None:
+    """Current signature of the user's sent messages file"""
+    return file_signature(_sent_log_path(user_id))
+
+
+@handle_errors("clearing message template index", default_return=None)
+def clear_message_template_index(user_id: str | None = None) -> None:
+    """Drop indexed templates and recent-send logs (one user, or all)"""
+    with _index_lock:
+        for store in (_template_indexes, _recent_sent):
+            for key in [key for key in store if user_id is None or key[0] == user_id]:
+                del store[key]
@@ -842,6 +842,27 @@ def tests_require_lm_studio(selected_test_paths: list[str], full_mode: bool) ->
     return os.environ.get("MHM_TESTS_REQUIRE_LM_STUDIO", "0") == "1"
 
 
+@handle_errors("selecting impacted tests", user_friendly=False, default_return=(None, "impact selection failed"))
+def select_impacted_test_args(test_paths: list[str]) -> tuple[list[str] | None, str]:
+    """
+    Narrow ``test_paths`` to tests affected by changes since the last coverage run.
+
+    Returns:
+        (pytest path/node-id args under ``test_paths``, reason); args is None when the
+        full selection must run (no impact map yet, or a change that affects every test)
+    """
+    from development_tools.tests.test_impact_map import select_impacted_tests
+
+    selection = select_impacted_tests(Path(__file__).resolve().parent)
+    if selection.full_run:
+        return None, selection.reason
+    roots = [path.replace("\\", "/").rstrip("/") + "/" for path in test_paths]
+    impacted = [
+        arg for arg in selection.pytest_args() if any(arg.startswith(root) for root in roots)
+    ]
+    return impacted, selection.reason
+
+
 @handle_errors("removing xdist flags for failure rerun", user_friendly=False, default_return=[])
 def remove_parallel_flags(cmd: list[str]) -> list[str]:
     """Return command copy without xdist worker flags."""
@@ -3138,6 +3159,11 @@ def main():
         default=1,
         help="Detailed rerun attempts per failed nodeid (default: 1)",
     )
+    parser.add_argument(
+        "--impacted",
+        action="store_true",
+        help="Run only tests affected by changes since the last coverage run (test impact map)",
+    )
     parser.add_argument(
         "--quick",
         action="store_true",
@@ -3432,6 +3458,29 @@ def main():
         if not full_phase_paths:
             cmd.extend(selected_test_paths)
 
+    if args.impacted:
+        if full_phase_paths:
+            narrowed_phases = []
+            for phase_name, phase_paths in full_phase_paths:
+                impacted, impact_reason = select_impacted_test_args(phase_paths)
+                if impacted is None:
+                    narrowed_phases.append((phase_name, phase_paths))
+                elif impacted:
+                    narrowed_phases.append((phase_name, impacted))
+            full_phase_paths = narrowed_phases
+            has_selection = bool(full_phase_paths)
+        else:
+            impacted, impact_reason = select_impacted_test_args(selected_test_paths)
+            if impacted is not None:
+                cmd = [arg for arg in cmd if arg not in selected_test_paths] + impacted
+                selected_test_paths = impacted
+            has_selection = bool(selected_test_paths)
+        print(f"[IMPACT] {impact_reason}")
+        if not has_selection:
+            print("[IMPACT] No tests affected by the current changes; nothing to run.")
+            return 0
+        description = f"{description} - impacted only"
+
     # Add marker filters (combine mode filter with no_parallel and e2e exclusion if needed)
     marker_parts = []
     if mode_marker_filter:
@@ -2,10 +2,8 @@
 
 import schedule
 import time
-import calendar
 import pytz
 import threading
-import random
 import subprocess
 import os  # Needed for test mocking (os.path.exists)
 from collections.abc import Callable
@@ -14,6 +12,7 @@ from typing import Any
 
 from core import get_all_user_ids
 from core.delivery import SchedulerDeliveryPort
+from core.resource_monitor import get_resource_health
 from core.schedule_runtime import get_schedule_time_periods
 from core.time_utilities import (
     now_datetime_full,
@@ -24,7 +23,6 @@ from core.time_utilities import (
     TIMESTAMP_MINUTE,
     format_timestamp,
     format_time_compact_hour_minute,
-    load_and_localize_datetime,
     parse_time_only_minute,
 )
 from core.logger import get_component_logger
@@ -34,6 +32,13 @@ from core import get_user_data
 from scheduler import jobs as scheduler_jobs
 from scheduler import maintenance as scheduler_maintenance
 from scheduler import task_reminders as scheduler_task_reminders
+from scheduler.send_plan import (
+    PlannedSend,
+    SendWindow,
+    build_send_windows,
+    daily_plan_seed,
+    plan_daily_sends,
+)
 from scheduler.user_timezone import (
     localized_now_for_user,
     resolve_user_timezone_str,
@@ -86,6 +91,9 @@ class SchedulerManager:
         )  # Add stop event for proper thread management
         # Track reminder selection state to provide smooth weighted scheduling across calls
         self._reminder_selection_state: dict[str, float] = {}
+        # Planned sends per user with their schedule jobs, so a replan can replace
+        # exactly the sends it covers and keep the others as fixed obstacles
+        self._daily_plans: dict[str, list[tuple[PlannedSend, Any]]] = {}
         logger.info("SchedulerManager ready")
 
     @handle_errors("getting active job count", default_return=0)
@@ -145,8 +153,11 @@ class SchedulerManager:
                                 elif job_func.func == self.handle_task_reminder:
                                     task_jobs += 1
 
+                        resources = get_resource_health()
                         logger.debug(
-                            f"Scheduler running: {active_jobs} total jobs ({system_jobs} system, {user_message_jobs} message, {task_jobs} task)"
+                            f"Scheduler running: {active_jobs} total jobs ({system_jobs} system, {user_message_jobs} message, {task_jobs} task); "
+                            f"CPU {resources.get('cpu_percent', 0):.0f}%, memory {resources.get('memory_percent', 0):.0f}%"
+                            f"{', model overloaded' if resources.get('overloaded') else ''}"
                         )
 
                 # Use wait instead of sleep to allow immediate shutdown
@@ -278,20 +289,11 @@ class SchedulerManager:
         log = logger.info if verbose else logger.debug
         scheduled = 0
 
+        plan_categories: list[str] = []
         prefs_result = get_user_data(user_id, "preferences")
         categories = prefs_result.get("preferences", {}).get("categories", [])
         if isinstance(categories, list):
-            for category in categories:
-                try:
-                    self.schedule_daily_message_job(user_id, category)
-                    scheduled += 1
-                    log(
-                        f"Scheduled messages for user {user_id}, category {category}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to schedule for user {user_id}, category {category}: {e}"
-                    )
+            plan_categories.extend(categories)
         else:
             logger.warning(
                 f"Expected list for categories, got {type(categories)} for user '{user_id}'"
@@ -306,14 +308,23 @@ class SchedulerManager:
             ):
                 time_periods = get_schedule_time_periods(user_id, "checkin")
                 if time_periods:
-                    self.schedule_daily_message_job(user_id, "checkin")
-                    scheduled += 1
-                    log(f"Scheduled check-ins for user {user_id}")
+                    plan_categories.append("checkin")
                 else:
                     logger.debug(f"No check-in schedule found for user {user_id}")
         except Exception as e:
             logger.error(f"Failed to schedule check-ins for user {user_id}: {e}")
 
+        # All categories (and check-ins) share one plan so sends never collide
+        if plan_categories:
+            try:
+                self.schedule_user_daily_plan(user_id, plan_categories)
+                scheduled += len(plan_categories)
+                log(
+                    f"Scheduled messages for user {user_id}, categories {plan_categories}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to schedule for user {user_id}: {e}")
+
         try:
             self.schedule_all_task_reminders(user_id)
             if verbose:
@@ -326,9 +337,10 @@ class SchedulerManager:
         return scheduled
 
     @handle_errors("scheduling all users immediately", default_return=None)
-    def schedule_all_users_immediately(self):
-        """Schedule daily messages immediately for all users"""
-        user_ids = get_all_user_ids()
+    def schedule_all_users_immediately(self, user_ids: list[str] | None = None):
+        """Schedule daily messages immediately for all users (or only ``user_ids``)"""
+        if user_ids is None:
+            user_ids = get_all_user_ids()
         if not user_ids:
             logger.warning("No users found for scheduling")
             return
@@ -417,11 +429,52 @@ class SchedulerManager:
             f"Full daily scheduler complete: {active_jobs} total active jobs scheduled"
         )
 
+    @handle_errors("scheduling user daily send plan", default_return=0)
+    def schedule_user_daily_plan(self, user_id, categories) -> int:
+        """
+        Plan one day of sends for several categories at once and schedule them.
+
+        Every active period of every category becomes a window; the planner
+        places one send per window with minimum spacing, and all jobs are then
+        registered together. Sends already planned for other categories are
+        kept and avoided.
+
+        Args:
+            user_id: The user to schedule
+            categories: Categories (including ``checkin``) to (re)plan
+
+        Returns:
+            int: Number of sends scheduled
+        """
+        categories = list(dict.fromkeys(categories))
+        tz = pytz.timezone(resolve_user_timezone_str(user_id))
+        now = localized_now_for_user(user_id)
+
+        windows: list[SendWindow] = []
+        for category in categories:
+            self.cleanup_old_tasks(user_id, category)
+            time_periods = get_schedule_time_periods(user_id, category)
+            if not time_periods:
+                logger.error(
+                    f"No time periods found for user {user_id}, category {category}."
+                )
+                continue
+            windows.extend(build_send_windows(category, time_periods, now, tz))
+
+        planned_categories = set(categories)
+        return self._schedule_send_plan(
+            user_id,
+            windows,
+            now,
+            replaces=lambda send: send.category in planned_categories,
+        )
+
     @handle_errors("scheduling daily message job")
     def schedule_daily_message_job(self, user_id, category):
         """
         Schedules daily messages immediately for the specified user and category.
-        Schedules one message per active period in the category.
+        Schedules one message per active period in the category, planned around
+        the user's other scheduled sends.
         """
         logger.info(
             f"Scheduling daily messages immediately for user {user_id}, category {category}."
@@ -438,56 +491,12 @@ class SchedulerManager:
             )
             return
 
-        # Schedule a message for each active period
-        scheduled_count = 0
-
-        # Avoid hardcoded weekday format strings.
-        # Use weekday index + calendar for a stable day-name.
-        today_name = calendar.day_name[now_datetime_full().weekday()]
-
-        for period_name, period_data in time_periods.items():
-            # Skip the "ALL" period - it should not be scheduled, only used as fallback
-            if period_name == "ALL":
-                logger.debug(
-                    f"Skipping ALL period scheduling for user {user_id}, category {category} - ALL is fallback only"
-                )
-                continue
-
-            # Check if this period is active (default to active if not specified)
-            if period_data.get("active", True):
-                # If 'days' is present, only schedule if today is in days or if days contains "ALL"
-                if "days" in period_data:
-                    days = period_data["days"]
-                    if "ALL" in days:
-                        # Schedule for all days
-                        logger.debug(
-                            f"Scheduling period {period_name} for user {user_id}, category {category} (ALL days)"
-                        )
-                    elif today_name in days:
-                        # Schedule for today
-                        logger.debug(
-                            f"Scheduling period {period_name} for user {user_id}, category {category} (today: {today_name})"
-                        )
-                    else:
-                        logger.debug(
-                            f"Skipping period {period_name} for user {user_id}, category {category} (not scheduled for today: {today_name})"
-                        )
-                        continue
-
-                try:
-                    self.schedule_message_for_period(user_id, category, period_name)
-                    scheduled_count += 1
-                    logger.debug(
-                        f"Scheduled message for user {user_id}, category {category}, period {period_name}"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to schedule message for user {user_id}, category {category}, period {period_name}: {e}"
-                    )
-            else:
-                logger.debug(
-                    f"Skipping inactive period {period_name} for user {user_id}, category {category}"
-                )
+        tz = pytz.timezone(resolve_user_timezone_str(user_id))
+        now = localized_now_for_user(user_id)
+        windows = build_send_windows(category, time_periods, now, tz)
+        scheduled_count = self._schedule_send_plan(
+            user_id, windows, now, replaces=lambda send: send.category == category
+        )
 
         logger.info(
             f"Scheduled {scheduled_count} messages for user {user_id}, category {category}"
@@ -496,87 +505,41 @@ class SchedulerManager:
     @handle_errors("scheduling message for specific period")
     def schedule_message_for_period(self, user_id, category, period_name):
         """
-        Schedules a message at a random time within a specific period for a user and category.
+        Schedules a message at a planned time within a specific period for a user and category.
         """
         logger.info(
             f"Scheduling message for period '{period_name}' for user {user_id}, category {category}."
         )
 
-        max_retries = 10
-        retry_count = 0
-
-        while retry_count < max_retries:
-            # Get a random time within the specified period
-            random_time_str = self.get_random_time_within_period(
-                user_id,
-                category,
-                period_name,
-                resolve_user_timezone_str(user_id),
+        time_periods = get_schedule_time_periods(user_id, category) or {}
+        if period_name not in time_periods:
+            logger.error(
+                f"Period '{period_name}' not found in time periods for user {user_id}, category {category}. Available periods: {list(time_periods.keys())}"
             )
-            if not random_time_str:
-                logger.error(
-                    f"Could not generate random time for user {user_id}, category {category}, period {period_name}."
-                )
-                return
-
-            # Try to schedule the message
-            try:
-                datetime_str = random_time_str
-                user_tz = resolve_user_timezone_str(user_id)
-                schedule_datetime = load_and_localize_datetime(datetime_str, user_tz)
-                if schedule_datetime is None:
-                    logger.error(
-                        f"Could not localize schedule time for user {user_id}, "
-                        f"category {category}, period {period_name}: {datetime_str}"
-                    )
-                    retry_count += 1
-                    continue
-                now = localized_now_for_user(user_id)
-
-                logger.info(
-                    f"Attempting to schedule message for user {user_id}, category {category}, period {period_name} at {schedule_datetime} (now is {now})"
-                )
-
-                if not self.is_time_conflict(user_id, schedule_datetime):
-                    if schedule_datetime <= now:
-                        schedule_datetime += timedelta(days=1)
-                        logger.info(
-                            f"Adjusted scheduling time to future for user {user_id}: {schedule_datetime}"
-                        )
-
-                    time_part = format_timestamp(schedule_datetime, TIME_ONLY_MINUTE)
-                    # Schedule as one-time job that will remove itself after execution
-                    schedule.every().day.at(time_part).do(
-                        self.handle_sending_scheduled_message,
-                        user_id=user_id,
-                        category=category,
-                    )
-                    logger.info(
-                        f"Successfully scheduled {category} message for user {user_id}, period {period_name} "
-                        f"at {time_part} on {format_timestamp(schedule_datetime, DATE_ONLY)}."
-                    )
-
-                    # Set the wake timer for the scheduled time
-                    self.set_wake_timer(
-                        schedule_datetime, user_id, category, period_name
-                    )
-                    break  # Exit the loop after successfully scheduling the message
-                else:
-                    logger.info(
-                        f"Conflict detected for user {user_id}, category {category}, period {period_name} at {schedule_datetime}. Retrying..."
-                    )
-                    retry_count += 1
-
-            except Exception as e:
-                logger.error(
-                    f"Error while scheduling {category} message for user {user_id}, period {period_name}: {str(e)}"
-                )
-                retry_count += 1
+            return
 
-        if retry_count == max_retries:
-            logger.warning(
-                f"Max retries reached. Could not find a suitable time for user {user_id}, category {category}, period {period_name}."
+        tz = pytz.timezone(resolve_user_timezone_str(user_id))
+        now = localized_now_for_user(user_id)
+        windows = build_send_windows(
+            category,
+            {period_name: time_periods[period_name]},
+            now,
+            tz,
+            apply_period_filters=False,
+        )
+        if not windows:
+            logger.error(
+                f"Could not build a send window for user {user_id}, category {category}, period {period_name}."
             )
+            return
+
+        self._schedule_send_plan(
+            user_id,
+            windows,
+            now,
+            replaces=lambda send: send.category == category
+            and send.period_name == period_name,
+        )
 
     @handle_errors("scheduling check-in at exact time")
     def schedule_checkin_at_exact_time(self, user_id, period_name):
@@ -646,7 +609,7 @@ class SchedulerManager:
     @handle_errors("scheduling message at random time")
     def schedule_message_at_random_time(self, user_id, category):
         """
-        Schedules a message at a random time within the user's preferred time periods.
+        Schedules a message at a planned time within the user's first preferred time period.
         """
         logger.info(
             f"Scheduling message at random time for user {user_id}, category {category}."
@@ -659,216 +622,108 @@ class SchedulerManager:
             )
             return
 
-        available_periods = list(time_periods.keys())
-        if not available_periods:
-            logger.error(
-                f"No available periods for user {user_id}, category {category}."
-            )
-            return
-
-        selected_period = available_periods[0]
+        selected_period = next(iter(time_periods))
         logger.info(
             f"Using period '{selected_period}' for user {user_id}, category {category}"
         )
+        self.schedule_message_for_period(user_id, category, selected_period)
 
-        max_retries = 10
-        retry_count = 0
-
-        while retry_count < max_retries:
-            random_time_str = self.get_random_time_within_period(
-                user_id,
-                category,
-                selected_period,
-                resolve_user_timezone_str(user_id),
-            )
-            if not random_time_str:
-                logger.error(
-                    f"Could not generate random time for user {user_id}, category {category}."
-                )
-                return
-
-            try:
-                user_tz = resolve_user_timezone_str(user_id)
-                schedule_datetime = load_and_localize_datetime(random_time_str, user_tz)
-                if schedule_datetime is None:
-                    logger.error(
-                        f"Could not localize schedule time for user {user_id}, "
-                        f"category {category}: {random_time_str}"
-                    )
-                    retry_count += 1
-                    continue
-                now = localized_now_for_user(user_id)
-
-                logger.info(
-                    f"Attempting to schedule message for user {user_id}, category {category} at {schedule_datetime} (now is {now})"
-                )
-
-                if not self.is_time_conflict(user_id, schedule_datetime):
-                    if schedule_datetime <= now:
-                        schedule_datetime += timedelta(days=1)
-                        logger.info(
-                            f"Adjusted scheduling time to future for user {user_id}: {schedule_datetime}"
-                        )
-
-                    time_part = format_timestamp(schedule_datetime, TIME_ONLY_MINUTE)
-                    schedule.every().day.at(time_part).do(
-                        self.handle_sending_scheduled_message,
-                        user_id=user_id,
-                        category=category,
-                    )
-                    logger.info(
-                        f"Successfully scheduled {category} message for user {user_id} at {time_part} "
-                        f"on {format_timestamp(schedule_datetime, DATE_ONLY)}."
-                    )
-
-                    self.set_wake_timer(
-                        schedule_datetime, user_id, category, selected_period
-                    )
-                    break
-                else:
-                    logger.info(
-                        f"Conflict detected for user {user_id}, category {category} at {schedule_datetime}. Retrying..."
-                    )
-                    retry_count += 1
-
-            except Exception as e:
-                logger.error(
-                    f"Error while scheduling {category} message for user {user_id}: {str(e)}"
-                )
-                retry_count += 1
-
-        if retry_count == max_retries:
-            logger.warning(
-                f"Max retries reached. Could not find a suitable time for user {user_id}, category {category}."
-            )
-
-    @handle_errors("checking time conflict", default_return=False)
-    def is_time_conflict(self, user_id, schedule_datetime):
+    @handle_errors("scheduling planned sends", default_return=0)
+    def _schedule_send_plan(
+        self,
+        user_id: str,
+        windows: list[SendWindow],
+        now: datetime,
+        replaces: Callable[[PlannedSend], bool],
+    ) -> int:
         """
-        Checks if there is a time conflict with any existing scheduled jobs for the user.
+        Replace the user's planned sends matched by ``replaces`` with a fresh plan.
 
-        NOTE:
-        The `schedule` library commonly uses naive datetimes for `job.next_run`.
-        Our schedule_datetime is often tz-aware (pytz). Subtracting naive/aware raises TypeError.
-        """
-        # Normalize schedule_datetime to naive for comparison against schedule's job.next_run.
-        # We intentionally drop tzinfo here because schedule's next_run is not reliably tz-aware.
-        if (
-            isinstance(schedule_datetime, datetime)
-            and schedule_datetime.tzinfo is not None
-        ):
-            schedule_dt_for_compare = schedule_datetime.replace(tzinfo=None)
-        else:
-            schedule_dt_for_compare = schedule_datetime
+        Remaining planned sends are passed to the planner as fixed times, so the
+        new sends keep the minimum spacing from them. All jobs are registered in
+        one batch after planning; wake timers are set afterwards.
 
-        for job in schedule.jobs:
-            job_func = job.job_func
-            if not job_func:
-                continue
-
-            job_args = getattr(job_func, "args", None)
-            if job_args and job_args[0] == user_id:
-                job_time = job.next_run
-                if not job_time:
-                    continue
-
-                # Normalize job_time too (defensive)
-                if isinstance(job_time, datetime) and job_time.tzinfo is not None:
-                    job_time_for_compare = job_time.replace(tzinfo=None)
-                else:
-                    job_time_for_compare = job_time
-
-                # Increase conflict window to 2 hours to prevent multiple messages at similar times
-                try:
-                    if (
-                        abs(
-                            (
-                                job_time_for_compare - schedule_dt_for_compare
-                            ).total_seconds()
-                        )
-                        < 7200
-                    ):
-                        return True
-                except TypeError as e:
-                    # Extremely defensive: if something weird slips through, log and treat as no conflict
-                    logger.debug(
-                        f"TypeError comparing job_time and schedule_datetime for conflict check: {e}"
-                    )
-                    continue
-
-        return False
-
-    @handle_errors("getting random time within period", default_return=None)
-    def get_random_time_within_period(
-        self, user_id, category, period, timezone_str="America/Regina"
-    ):
-        """Get a random time within a specified period for a given category."""
-        tz = pytz.timezone(timezone_str)
-        now_datetime = tz.localize(now_datetime_full())
-
-        time_periods = get_schedule_time_periods(user_id, category)
-
-        # Add validation for period existence
-        if period not in time_periods:
-            logger.error(
-                f"Period '{period}' not found in time periods for user {user_id}, category {category}. Available periods: {list(time_periods.keys())}"
-            )
-            return None
+        Returns:
+            int: Number of sends scheduled
+        """
+        kept: list[tuple[PlannedSend, Any]] = []
+        replaced: list[PlannedSend] = []
+        for send, job in self._daily_plans.get(user_id, []):
+            if replaces(send):
+                if job is not None and job in schedule.jobs:
+                    schedule.cancel_job(job)
+                replaced.append(send)
+            else:
+                kept.append((send, job))
 
-        # Use canonical keys with fallback to legacy keys
-        start_time = time_periods[period].get("start_time") or time_periods[period].get(
-            "start"
-        )
-        end_time = time_periods[period].get("end_time") or time_periods[period].get(
-            "end"
+        plan = plan_daily_sends(
+            windows,
+            seed=daily_plan_seed(user_id, now.date()),
+            fixed_times=[send.send_at for send, _ in kept],
         )
 
-        if not start_time or not end_time:
-            logger.error(
-                f"Missing start/end time for period {period} in user {user_id}, category {category}"
+        scheduled: list[tuple[PlannedSend, Any]] = []
+        for send in plan:
+            time_part = format_timestamp(send.send_at, TIME_ONLY_MINUTE)
+            job = schedule.every().day.at(time_part).do(
+                self.handle_sending_scheduled_message,
+                user_id=user_id,
+                category=send.category,
             )
-            return None
+            scheduled.append((send, job))
+        self._daily_plans[user_id] = kept + scheduled
 
-        start_dt = parse_time_only_minute(start_time)
-        end_dt = parse_time_only_minute(end_time)
-        if start_dt is None or end_dt is None:
-            logger.error(
-                f"Invalid time format for period {period} in user {user_id}, category {category}: start='{start_time}', end='{end_time}'"
+        for send in plan:
+            logger.info(
+                f"Successfully scheduled {send.category} message for user {user_id}, period {send.period_name} "
+                f"at {format_timestamp(send.send_at, TIME_ONLY_MINUTE)} on {format_timestamp(send.send_at, DATE_ONLY)}."
             )
-            return None
-
-        period_start_time = start_dt.time()
-        period_end_time = end_dt.time()
-
-        # Create timezone-aware datetime objects for today.
-        # IMPORTANT: with pytz, never pass tzinfo=tz directly; always localize a naive datetime.
-        start_datetime = tz.localize(
-            datetime.combine(now_datetime.date(), period_start_time)
-        )
-        end_datetime = tz.localize(
-            datetime.combine(now_datetime.date(), period_end_time)
-        )
+            self.set_wake_timer(send.send_at, user_id, send.category, send.period_name)
+        self._cancel_ai_pregeneration(user_id, replaced, plan)
+        self._queue_ai_pregeneration(user_id, plan)
+        return len(plan)
+
+    @handle_errors("cancelling AI pre-generation for replaced sends", default_return=None)
+    def _cancel_ai_pregeneration(
+        self, user_id: str, replaced: list[PlannedSend], plan: list[PlannedSend]
+    ) -> None:
+        """
+        Drop pre-generation for replaced AI sends the new plan does not keep.
 
-        # If the period has already ended today, schedule for tomorrow
-        if end_datetime <= now_datetime or start_datetime <= now_datetime + timedelta(minutes=30):
-            start_datetime += timedelta(days=1)
-            end_datetime += timedelta(days=1)
+        A slot the new plan reproduces (same category and time) keeps its queued
+        job or generated text. Optional on the delivery port, like queueing.
+        """
+        cancel = getattr(self.delivery, "cancel_ai_pregeneration", None)
+        if cancel is None or not replaced:
+            return
+        from messages.message_data_manager import is_ai_generated_message_category
 
-        total_seconds = (end_datetime - start_datetime).total_seconds()
-        if total_seconds <= 0:
-            logger.error("Invalid time range calculated.")
-            return None
+        planned = {(send.category, send.send_at.timestamp()) for send in plan}
+        slots = [
+            (send.category, send.send_at.timestamp())
+            for send in replaced
+            if is_ai_generated_message_category(send.category)
+        ]
+        slots = [slot for slot in slots if slot not in planned]
+        if slots:
+            cancel(user_id, slots)
 
-        random_seconds = random.randint(0, int(total_seconds))
-        random_datetime = start_datetime + timedelta(seconds=random_seconds)
+    @handle_errors("queueing AI pre-generation for planned sends", default_return=None)
+    def _queue_ai_pregeneration(self, user_id: str, plan: list[PlannedSend]) -> None:
+        """
+        Ask the delivery side to pre-generate planned AI sends in idle model time.
 
-        # Final safety check - ensure the time is in the future
-        if random_datetime <= now_datetime:
-            random_datetime += timedelta(days=1)
+        Optional on the delivery port: deliveries without ``queue_ai_pregeneration``
+        simply generate at send time.
+        """
+        queue = getattr(self.delivery, "queue_ai_pregeneration", None)
+        if queue is None:
+            return
+        from messages.message_data_manager import is_ai_generated_message_category
 
-        random_time_str = format_timestamp(random_datetime, TIMESTAMP_MINUTE)
-        logger.info(f"Scheduled random time: {random_time_str}")
-        return random_time_str
+        for send in plan:
+            if is_ai_generated_message_category(send.category):
+                queue(user_id, send.category, send.send_at.timestamp())
 
     @handle_errors("logging scheduled tasks")
     def log_scheduled_tasks(self):
@@ -1167,6 +1022,7 @@ class SchedulerManager:
 
         # Clear all jobs
         schedule.clear()
+        self._daily_plans.clear()
         logger.info("All scheduler jobs cleared")
 
         # Don't reschedule daily jobs here - the main scheduler loop will handle that
@@ -0,0 +1,228 @@
+# scheduler/send_plan.py
+"""Per-user daily send planning.
+
+Each active schedule period becomes a ``SendWindow`` (an interval in the user's
+timezone). ``plan_daily_sends`` places one send per window in a single pass:
+windows are ordered by end time, a backward pass computes the latest time each
+send may take while leaving room for the ones after it, and a forward pass
+samples each send uniformly between its earliest and latest allowed minute.
+Sends are therefore at least ``min_spacing`` apart by construction, and the
+sampler is seeded from the user id and date so a day's plan is reproducible.
+"""
+
+from __future__ import annotations
+
+import calendar
+import hashlib
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+from core.time_utilities import parse_time_only_minute
+
+logger = get_component_logger("scheduler")
+
+# Minimum gap between two of a user's planned sends (2 hours)
+DEFAULT_MIN_SEND_SPACING = timedelta(hours=2)
+# A period starting within this lead time is planned for tomorrow instead
+PERIOD_START_LEAD_TIME = timedelta(minutes=30)
+_MINUTE = timedelta(minutes=1)
+
+
+@dataclass(frozen=True)
+class SendWindow:
+    """One schedule period for one category, resolved to concrete datetimes"""
+
+    category: str
+    period_name: str
+    start: datetime
+    end: datetime
+
+
+@dataclass(frozen=True)
+class PlannedSend:
+    """A send time chosen for a window"""
+
+    category: str
+    period_name: str
+    send_at: datetime
+
+
+@handle_errors("computing daily send plan seed", default_return=0)
+def daily_plan_seed(user_id: str, plan_date: date) -> int:
+    """Stable seed for a user's plan on a given date (independent of PYTHONHASHSEED)."""
+    digest = hashlib.sha256(f"{user_id}:{plan_date.isoformat()}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+@handle_errors("building send windows", default_return=[])
+def build_send_windows(
+    category: str,
+    time_periods: dict,
+    now: datetime,
+    tz,
+    *,
+    apply_period_filters: bool = True,
+) -> list[SendWindow]:
+    """
+    Resolve schedule periods into send windows for the next occurrence.
+
+    A period that has ended, or starts within ``PERIOD_START_LEAD_TIME``, is
+    moved to tomorrow.
+
+    Args:
+        category: Category the periods belong to
+        time_periods: Period name -> period data (``start_time``/``end_time``, ``active``, ``days``)
+        now: Timezone-aware current time in the user's timezone
+        tz: pytz timezone for ``now``
+        apply_period_filters: Skip ``ALL``, inactive, and not-today periods
+
+    Returns:
+        List of windows (invalid periods are logged and skipped)
+    """
+    today_name = calendar.day_name[now.weekday()]
+    windows: list[SendWindow] = []
+    for period_name, period_data in (time_periods or {}).items():
+        if apply_period_filters:
+            # ALL is a fallback period only and is never scheduled
+            if period_name == "ALL" or not period_data.get("active", True):
+                continue
+            days = period_data.get("days")
+            if days and "ALL" not in days and today_name not in days:
+                logger.debug(
+                    f"Skipping period {period_name} for category {category} (not scheduled for today: {today_name})"
+                )
+                continue
+
+        # Use canonical keys with fallback to legacy keys
+        start_str = period_data.get("start_time") or period_data.get("start")
+        end_str = period_data.get("end_time") or period_data.get("end")
+        start_dt = parse_time_only_minute(start_str)
+        end_dt = parse_time_only_minute(end_str)
+        if start_dt is None or end_dt is None:
+            logger.error(
+                f"Invalid or missing time for period {period_name}, category {category}: start='{start_str}', end='{end_str}'"
+            )
+            continue
+
+        # IMPORTANT: with pytz, never pass tzinfo=tz directly; always localize a naive datetime.
+        start = tz.localize(datetime.combine(now.date(), start_dt.time()))
+        end = tz.localize(datetime.combine(now.date(), end_dt.time()))
+        if end <= start:
+            logger.error(
+                f"Period {period_name} for category {category} ends before it starts ({start_str}-{end_str})"
+            )
+            continue
+        if end <= now or start <= now + PERIOD_START_LEAD_TIME:
+            start += timedelta(days=1)
+            end += timedelta(days=1)
+        windows.append(SendWindow(category, period_name, start, end))
+    return windows
+
+
+def _allowed_segments(
+    lower: datetime, upper: datetime, fixed_times: list[datetime], spacing: timedelta
+) -> list[tuple[datetime, datetime]]:
+    """Cut ``[lower, upper]`` around fixed sends so nothing lands within ``spacing``"""
+    segments = [(lower, upper)]
+    if spacing <= timedelta(0):
+        return segments
+    for fixed in fixed_times:
+        blocked_start, blocked_end = fixed - spacing, fixed + spacing
+        next_segments = []
+        for seg_start, seg_end in segments:
+            if blocked_end <= seg_start or blocked_start >= seg_end:
+                next_segments.append((seg_start, seg_end))
+                continue
+            if seg_start <= blocked_start:
+                next_segments.append((seg_start, blocked_start))
+            if blocked_end <= seg_end:
+                next_segments.append((blocked_end, seg_end))
+        segments = next_segments
+    return segments
+
+
+def _sample_minute(segments: list[tuple[datetime, datetime]], rng: random.Random) -> datetime:
+    """Pick a whole minute uniformly across the segments"""
+    sizes = [int((seg_end - seg_start) // _MINUTE) + 1 for seg_start, seg_end in segments]
+    choice = rng.randrange(sum(sizes))
+    for (seg_start, _), size in zip(segments, sizes):
+        if choice < size:
+            return seg_start + choice * _MINUTE
+        choice -= size
+    return segments[-1][1]
+
+
+def _place_sends(
+    ordered: list[SendWindow],
+    seed: int,
+    spacing: timedelta,
+    fixed_times: list[datetime],
+) -> list[PlannedSend] | None:
+    """One backward + forward pass; None if the windows cannot hold this spacing"""
+    latest: list[datetime] = []
+    next_latest = None
+    for window in reversed(ordered):
+        bound = window.end if next_latest is None else min(window.end, next_latest - spacing)
+        latest.append(bound)
+        next_latest = bound
+    latest.reverse()
+
+    rng = random.Random(seed)
+    plan: list[PlannedSend] = []
+    previous = None
+    for window, upper in zip(ordered, latest):
+        lower = window.start if previous is None else max(window.start, previous + spacing)
+        if lower > upper:
+            return None
+        segments = _allowed_segments(lower, upper, fixed_times, spacing)
+        if not segments:
+            return None
+        previous = _sample_minute(segments, rng)
+        plan.append(PlannedSend(window.category, window.period_name, previous))
+    return plan
+
+
+@handle_errors("planning daily sends", default_return=[])
+def plan_daily_sends(
+    windows: Iterable[SendWindow],
+    *,
+    seed: int,
+    min_spacing: timedelta = DEFAULT_MIN_SEND_SPACING,
+    fixed_times: Iterable[datetime] = (),
+) -> list[PlannedSend]:
+    """
+    Place one send in every window, at least ``min_spacing`` apart.
+
+    If the windows are too tight for ``min_spacing`` the spacing is halved until
+    they fit, so every window still gets a send. Cost is dominated by the sort:
+    O(k log k) for k windows (plus O(k * f) when ``fixed_times`` are given).
+
+    Args:
+        windows: Windows to fill
+        seed: Sampler seed (see ``daily_plan_seed``)
+        min_spacing: Minimum gap between any two sends
+        fixed_times: Already-scheduled sends that new sends must also stay clear of
+
+    Returns:
+        Planned sends in chronological order
+    """
+    ordered = sorted(
+        windows, key=lambda w: (w.end, w.start, w.category, w.period_name)
+    )
+    if not ordered:
+        return []
+    fixed = list(fixed_times)
+    spacing = timedelta(minutes=int(min_spacing // _MINUTE))
+    while True:
+        plan = _place_sends(ordered, seed, spacing, fixed)
+        if plan is not None:
+            if spacing < min_spacing:
+                logger.debug(
+                    f"Send windows too tight for {min_spacing}; planned with {spacing} spacing"
+                )
+            return plan
+        spacing = timedelta(minutes=int(spacing // _MINUTE) // 2)
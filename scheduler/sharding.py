@@ -0,0 +1,642 @@
+# scheduler/sharding.py
+"""Sharded multi-process scheduling for large user populations.
+
+With ``SCHEDULER_SHARDS`` > 1 the service runs a ``ShardedSchedulerCoordinator``
+instead of a plain ``SchedulerManager``. Users are split across worker
+processes by a stable hash of their user id; each worker has its own
+``schedule`` job store (the module global is per-process) and plans, times,
+and retries only its own users' sends.
+
+Channels such as the Discord gateway live in the service process, so a
+worker's ``delivery`` is a proxy: each send goes over that worker's own reply
+lane to the coordinator, which runs it on a pool with one slot per shard.
+The coordinator keeps the system jobs (backups, log archival, cleanup), routes
+reschedule requests to the owning shard, restarts workers that die, and
+aggregates their health reports.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, field
+from typing import Any
+
+import schedule
+
+from core import get_all_user_ids
+from core.delivery import SchedulerDeliveryPort
+from core.error_handling import SchedulerError, handle_errors
+from core.logger import get_component_logger
+from core.resource_monitor import get_resource_health
+from scheduler.manager import SchedulerManager
+from user.user_context import UserContext
+
+logger = get_component_logger("scheduler")
+
+# How long a worker waits for the coordinator to finish one send
+SHARD_DELIVERY_TIMEOUT_SECONDS = 300
+# How often an idle worker reports health
+SHARD_HEALTH_INTERVAL_SECONDS = 30
+# A shard whose last report is older than this is flagged as stale
+SHARD_HEALTH_STALE_SECONDS = 3 * SHARD_HEALTH_INTERVAL_SECONDS
+# Timeouts for coordinator -> worker calls
+SHARD_CALL_TIMEOUT_SECONDS = 60
+SHARD_REPLAN_TIMEOUT_SECONDS = 900
+# A shard that keeps dying is left down after this many restarts
+SHARD_MAX_RESTARTS = 5
+# Worker loop poll interval (also bounds how late run_pending can be)
+_WORKER_POLL_SECONDS = 1.0
+
+
+@handle_errors("computing scheduler shard for user", default_return=0)
+def shard_for_user(user_id: str, shard_count: int) -> int:
+    """Stable shard index for a user (independent of PYTHONHASHSEED and process)."""
+    if shard_count <= 1:
+        return 0
+    digest = hashlib.sha256(str(user_id).encode()).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+@dataclass
+class ShardSendOutcome:
+    """Send result as carried back from the coordinator to a worker"""
+
+    status: str
+    user_id: str
+    category: str
+    sent_text: str | None = None
+
+    @handle_errors("matching shard send outcome", default_return=False)
+    def matches_request(self, user_id: str, category: str) -> bool:
+        """Return True when this result belongs to a request identity."""
+        return self.user_id == user_id and self.category == category
+
+
+class _ShardDeliveryProxy:
+    """``SchedulerDeliveryPort`` for a worker: forwards sends to the coordinator"""
+
+    def __init__(self, shard_index: int, event_queue, reply_queue):
+        self.shard_index = shard_index
+        self._event_queue = event_queue
+        self._reply_queue = reply_queue
+        self._request_ids = itertools.count(1)
+        self.sends = 0
+        self.failures = 0
+
+    def _forward(self, method: str, **kwargs) -> ShardSendOutcome:
+        """Send one delivery request and block until its reply (raises on failure)"""
+        request_id = next(self._request_ids)
+        self._event_queue.put(("deliver", self.shard_index, request_id, method, kwargs))
+        deadline = time.monotonic() + SHARD_DELIVERY_TIMEOUT_SECONDS
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.failures += 1
+                raise SchedulerError(
+                    f"Shard {self.shard_index} timed out waiting for {method}",
+                    details={"shard": self.shard_index, "method": method},
+                )
+            try:
+                reply_id, ok, payload = self._reply_queue.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if reply_id != request_id:
+                # Late reply to a send that already timed out
+                continue
+            self.sends += 1
+            if not ok:
+                self.failures += 1
+                raise SchedulerError(
+                    f"Shard {self.shard_index} {method} failed in coordinator: {payload}",
+                    details={"shard": self.shard_index, "method": method},
+                )
+            return ShardSendOutcome(**payload)
+
+    def handle_message_sending(
+        self,
+        user_id: str,
+        category: str,
+        is_scheduled_trigger: bool = False,
+        allow_deferral: bool = True,
+        skip_ai_cache: bool = False,
+    ) -> ShardSendOutcome:
+        """Send a category message through the coordinator's channels."""
+        return self._forward(
+            "handle_message_sending",
+            user_id=user_id,
+            category=category,
+            is_scheduled_trigger=is_scheduled_trigger,
+            allow_deferral=allow_deferral,
+            skip_ai_cache=skip_ai_cache,
+        )
+
+    def handle_task_reminder(self, user_id: str, task_identifier: str) -> ShardSendOutcome:
+        """Send a task reminder through the coordinator's channels."""
+        return self._forward(
+            "handle_task_reminder", user_id=user_id, task_identifier=task_identifier
+        )
+
+    def queue_ai_pregeneration(self, user_id: str, category: str, send_at: float) -> None:
+        """Ask the coordinator to pre-generate a planned AI send (fire-and-forget)."""
+        self._event_queue.put(("pregenerate", self.shard_index, user_id, category, send_at))
+
+    def cancel_ai_pregeneration(self, user_id: str, slots: list[tuple[str, float]]) -> None:
+        """Ask the coordinator to drop pre-generation for replanned sends (fire-and-forget)."""
+        self._event_queue.put(("cancel_pregeneration", self.shard_index, user_id, list(slots)))
+
+
+class ShardWorker:
+    """Scheduler state owned by one worker process"""
+
+    def __init__(self, shard_index: int, shard_count: int, event_queue, reply_queue):
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self._event_queue = event_queue
+        self.delivery = _ShardDeliveryProxy(shard_index, event_queue, reply_queue)
+        self.manager = SchedulerManager(self.delivery)
+        self.user_count = 0
+        self.last_replan: float | None = None
+        self.last_error: str | None = None
+        self._commands: dict[str, Callable[..., Any]] = {
+            "replan": self.replan,
+            "schedule_users": self.schedule_users,
+            "reset_and_reschedule_daily_messages": self.manager.reset_and_reschedule_daily_messages,
+            "schedule_all_task_reminders": self.manager.schedule_all_task_reminders,
+            "schedule_task_reminder_at_datetime": self.manager.schedule_task_reminder_at_datetime,
+            "cleanup_task_reminders": self.manager.cleanup_task_reminders,
+            "cleanup_orphaned_task_reminders": self.manager.cleanup_orphaned_task_reminders,
+            "health": self.health,
+        }
+
+    @handle_errors("listing users owned by scheduler shard", default_return=[])
+    def owned_user_ids(self) -> list[str]:
+        """User ids that hash to this shard"""
+        return [
+            user_id
+            for user_id in get_all_user_ids()
+            if shard_for_user(user_id, self.shard_count) == self.shard_index
+        ]
+
+    @handle_errors("replanning scheduler shard", default_return=0)
+    def replan(self) -> int:
+        """Drop this shard's jobs and plan the day for every owned user"""
+        user_ids = self.owned_user_ids()
+        self.manager.clear_all_accumulated_jobs()
+        self.manager.schedule_all_users_immediately(user_ids=user_ids)
+        self.user_count = len(user_ids)
+        self.last_replan = time.time()
+        logger.info(
+            f"Shard {self.shard_index}/{self.shard_count} planned {len(user_ids)} users "
+            f"({len(schedule.jobs)} jobs)"
+        )
+        return len(user_ids)
+
+    @handle_errors("scheduling users on scheduler shard", default_return=0)
+    def schedule_users(self, user_ids: list[str]) -> int:
+        """Schedule specific users without clearing the rest of the shard"""
+        scheduled = 0
+        for user_id in user_ids:
+            scheduled += self.manager._schedule_user_jobs(user_id)
+        return scheduled
+
+    @handle_errors("building scheduler shard health", default_return={})
+    def health(self) -> dict[str, Any]:
+        """Snapshot of this shard for the coordinator"""
+        return {
+            "shard": self.shard_index,
+            "pid": os.getpid(),
+            "users": self.user_count,
+            "jobs": len(schedule.jobs),
+            "sends": self.delivery.sends,
+            "send_failures": self.delivery.failures,
+            "last_replan": self.last_replan,
+            "last_error": self.last_error,
+            "reported_at": time.time(),
+        }
+
+    def handle(self, request_id: int, method: str, args: tuple, kwargs: dict) -> None:
+        """Run one coordinator command and post its result"""
+        handler = self._commands.get(method)
+        if handler is None:
+            ok, value = False, f"Unknown shard command: {method}"
+        else:
+            try:
+                ok, value = True, handler(*args, **kwargs)
+            except Exception as e:
+                ok, value = False, str(e)
+        if not ok:
+            self.last_error = value
+            logger.error(f"Shard {self.shard_index} command {method} failed: {value}")
+        self._event_queue.put(("result", self.shard_index, request_id, ok, value))
+
+    def report_health(self) -> None:
+        """Post a health snapshot to the coordinator"""
+        self._event_queue.put(("health", self.shard_index, self.health()))
+
+    def serve(self, command_queue) -> None:
+        """Run pending jobs and coordinator commands until told to stop"""
+        self.report_health()
+        next_report = time.monotonic() + SHARD_HEALTH_INTERVAL_SECONDS
+        while True:
+            schedule.run_pending()
+            try:
+                command = command_queue.get(timeout=_WORKER_POLL_SECONDS)
+            except queue.Empty:
+                command = False
+            if command is None:
+                break
+            if command:
+                self.handle(*command)
+                next_report = 0.0
+            if time.monotonic() >= next_report:
+                self.report_health()
+                next_report = time.monotonic() + SHARD_HEALTH_INTERVAL_SECONDS
+        logger.info(f"Shard {self.shard_index} worker stopped")
+
+
+def _run_shard_worker(shard_index, shard_count, command_queue, reply_queue, event_queue):
+    """Worker process entry point (module level so ``spawn`` can import it)"""
+    try:
+        ShardWorker(shard_index, shard_count, event_queue, reply_queue).serve(command_queue)
+    except Exception as e:
+        logger.error(f"Shard {shard_index} worker crashed: {e}", exc_info=True)
+        raise
+
+
+@dataclass
+class _ShardHandle:
+    """Coordinator-side view of one worker"""
+
+    index: int
+    process: Any
+    command_queue: Any
+    reply_queue: Any
+    restarts: int = 0
+    health: dict[str, Any] = field(default_factory=dict)
+
+
+class ShardedSchedulerCoordinator(SchedulerManager):
+    """
+    ``SchedulerManager`` that delegates per-user scheduling to worker processes.
+
+    The coordinator's own scheduler thread keeps only the system jobs. Its
+    01:00 full daily run clears those and asks every shard to replan, so
+    shards plan in parallel. User-level calls (new user, category reschedule,
+    task reminders) go to the shard that owns the user.
+    """
+
+    @handle_errors("initializing sharded scheduler coordinator")
+    def __init__(
+        self,
+        delivery: SchedulerDeliveryPort,
+        shard_count: int,
+        *,
+        mp_context=None,
+        worker_target: Callable[..., Any] | None = None,
+    ):
+        """
+        Args:
+            delivery: Delivery port that owns the real channels
+            shard_count: Number of worker processes
+            mp_context: multiprocessing context (default ``spawn``, same on every OS)
+            worker_target: Worker entry point (tests substitute an in-process fake)
+        """
+        super().__init__(delivery)
+        self.shard_count = max(1, int(shard_count))
+        self._mp_context = mp_context or multiprocessing.get_context("spawn")
+        self._worker_target = worker_target or _run_shard_worker
+        self._shards: list[_ShardHandle] = []
+        self._event_queue = None
+        self._pending: dict[int, Future] = {}
+        self._request_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._shards_stopping = threading.Event()
+        self._listener_thread: threading.Thread | None = None
+        self._delivery_pool: ThreadPoolExecutor | None = None
+        self._deliveries = 0
+        self._delivery_failures = 0
+
+    @handle_errors("starting scheduler shard", default_return=None)
+    def _start_shard(self, index: int, restarts: int = 0) -> _ShardHandle:
+        command_queue = self._mp_context.Queue()
+        reply_queue = self._mp_context.Queue()
+        process = self._mp_context.Process(
+            target=self._worker_target,
+            args=(index, self.shard_count, command_queue, reply_queue, self._event_queue),
+            name=f"scheduler-shard-{index}",
+        )
+        process.daemon = True
+        process.start()
+        logger.info(f"Started scheduler shard {index} (pid {getattr(process, 'pid', None)})")
+        return _ShardHandle(index, process, command_queue, reply_queue, restarts)
+
+    @handle_errors("starting scheduler shards", default_return=False)
+    def start_shards(self) -> bool:
+        """Start the worker processes, the event listener, and the delivery pool"""
+        if self._shards:
+            return True
+        self._shards_stopping.clear()
+        self._event_queue = self._mp_context.Queue()
+        self._delivery_pool = ThreadPoolExecutor(
+            max_workers=self.shard_count, thread_name_prefix="scheduler-shard-delivery"
+        )
+        self._shards = [self._start_shard(index) for index in range(self.shard_count)]
+        self._listener_thread = threading.Thread(
+            target=self._listen, name="scheduler-shard-events", daemon=True
+        )
+        self._listener_thread.start()
+        logger.info(f"Sharded scheduler running with {self.shard_count} shards")
+        return True
+
+    @handle_errors("stopping scheduler shards", default_return=None)
+    def stop_shards(self, timeout: float = 10) -> None:
+        """Ask every worker to exit, then stop the listener and delivery pool"""
+        if not self._shards:
+            return
+        self._shards_stopping.set()
+        for shard in self._shards:
+            shard.command_queue.put(None)
+        for shard in self._shards:
+            shard.process.join(timeout)
+            if shard.process.is_alive() and hasattr(shard.process, "terminate"):
+                logger.warning(f"Scheduler shard {shard.index} did not stop; terminating")
+                shard.process.terminate()
+        if self._listener_thread is not None:
+            self._listener_thread.join(timeout)
+            self._listener_thread = None
+        if self._delivery_pool is not None:
+            self._delivery_pool.shutdown(wait=True)
+            self._delivery_pool = None
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+        self._shards = []
+        logger.info("Scheduler shards stopped")
+
+    def _listen(self) -> None:
+        """Dispatch worker events until the shards are stopped"""
+        while not self._shards_stopping.is_set():
+            try:
+                event = self._event_queue.get(timeout=_WORKER_POLL_SECONDS)
+            except queue.Empty:
+                self._restart_dead_shards()
+                continue
+            try:
+                self._dispatch_event(event)
+            except Exception as e:
+                logger.error(f"Error handling scheduler shard event {event[:3]}: {e}")
+
+    def _dispatch_event(self, event: tuple) -> None:
+        kind, shard_index = event[0], event[1]
+        if kind == "result":
+            _, _, request_id, ok, value = event
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+            if future is None or future.cancelled():
+                return
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(
+                    SchedulerError(value, details={"shard": shard_index})
+                )
+        elif kind == "deliver":
+            _, _, request_id, method, kwargs = event
+            self._delivery_pool.submit(
+                self._deliver_for_shard, shard_index, request_id, method, kwargs
+            )
+        elif kind == "health":
+            self._shards[shard_index].health = event[2]
+        elif kind == "pregenerate":
+            # The outbox lives with the model client, in the coordinator process
+            queue_pregeneration = getattr(self.delivery, "queue_ai_pregeneration", None)
+            if queue_pregeneration is not None:
+                queue_pregeneration(*event[2:])
+        elif kind == "cancel_pregeneration":
+            cancel_pregeneration = getattr(self.delivery, "cancel_ai_pregeneration", None)
+            if cancel_pregeneration is not None:
+                cancel_pregeneration(*event[2:])
+
+    def _deliver_for_shard(self, shard_index: int, request_id: int, method: str, kwargs: dict) -> None:
+        """Run one worker's send against the real delivery port and reply"""
+        try:
+            if method not in ("handle_message_sending", "handle_task_reminder"):
+                raise SchedulerError(f"Unsupported shard delivery method: {method}")
+            outcome = getattr(self.delivery, method)(**kwargs)
+            payload = {
+                "status": getattr(outcome, "status", "failed"),
+                "user_id": getattr(outcome, "user_id", kwargs.get("user_id", "")),
+                "category": getattr(outcome, "category", kwargs.get("category", "")),
+                "sent_text": getattr(outcome, "sent_text", None),
+            }
+            reply = (request_id, True, payload)
+            with self._lock:
+                self._deliveries += 1
+        except Exception as e:
+            logger.error(f"Shard {shard_index} delivery {method} failed: {e}")
+            reply = (request_id, False, str(e))
+            with self._lock:
+                self._delivery_failures += 1
+        self._shards[shard_index].reply_queue.put(reply)
+
+    @handle_errors("restarting dead scheduler shards", default_return=None)
+    def _restart_dead_shards(self) -> None:
+        for position, shard in enumerate(self._shards):
+            if self._shards_stopping.is_set() or shard.process.is_alive():
+                continue
+            if shard.restarts >= SHARD_MAX_RESTARTS:
+                continue
+            logger.error(
+                f"Scheduler shard {shard.index} exited "
+                f"(exit code {getattr(shard.process, 'exitcode', None)}); restart "
+                f"{shard.restarts + 1}/{SHARD_MAX_RESTARTS}"
+            )
+            replacement = self._start_shard(shard.index, restarts=shard.restarts + 1)
+            if replacement is None:
+                continue
+            self._shards[position] = replacement
+            self._call(shard.index, "replan", wait=False)
+
+    @handle_errors("calling scheduler shard", default_return=None)
+    def _call(
+        self,
+        shard_index: int,
+        method: str,
+        *args,
+        wait: bool = True,
+        timeout: float = SHARD_CALL_TIMEOUT_SECONDS,
+        **kwargs,
+    ):
+        """Send a command to one shard; with ``wait`` return its result"""
+        future = self._submit(shard_index, method, args, kwargs)
+        if future is None or not wait:
+            return None
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.warning(f"Scheduler shard {shard_index} did not answer {method} within {timeout}s")
+            return None
+
+    def _submit(self, shard_index: int, method: str, args: tuple, kwargs: dict) -> Future | None:
+        if not self._shards:
+            logger.error(f"Scheduler shards are not running; dropping {method}")
+            return None
+        future: Future = Future()
+        request_id = next(self._request_ids)
+        with self._lock:
+            self._pending[request_id] = future
+        self._shards[shard_index].command_queue.put((request_id, method, args, kwargs))
+        return future
+
+    @handle_errors("broadcasting to scheduler shards", default_return=[])
+    def _broadcast(self, method: str, *args, timeout: float = SHARD_CALL_TIMEOUT_SECONDS) -> list:
+        """Send a command to every shard at once and collect the results"""
+        futures = [self._submit(shard.index, method, args, {}) for shard in self._shards]
+        deadline = time.monotonic() + timeout
+        results = []
+        for index, future in enumerate(futures):
+            if future is None:
+                results.append(None)
+                continue
+            try:
+                results.append(future.result(timeout=max(0.0, deadline - time.monotonic())))
+            except Exception as e:
+                logger.warning(f"Scheduler shard {index} {method} failed: {e}")
+                results.append(None)
+        return results
+
+    @handle_errors("getting shard for user", default_return=0)
+    def shard_for_user(self, user_id: str) -> int:
+        """Shard index that owns ``user_id``"""
+        return shard_for_user(user_id, self.shard_count)
+
+    @handle_errors("running sharded daily scheduler")
+    def run_daily_scheduler(self):
+        """Start the shards, then the coordinator's own (system-jobs) scheduler thread"""
+        self.start_shards()
+        super().run_daily_scheduler()
+
+    @handle_errors("stopping sharded scheduler", default_return=None)
+    def stop_scheduler(self):
+        """Stop the coordinator thread and every shard"""
+        super().stop_scheduler()
+        self.stop_shards()
+
+    @handle_errors("scheduling all users across shards", default_return=None)
+    def schedule_all_users_immediately(self, user_ids: list[str] | None = None):
+        """Replan every shard in parallel (or schedule ``user_ids`` on their shards)"""
+        if user_ids is None:
+            planned = self._broadcast("replan", timeout=SHARD_REPLAN_TIMEOUT_SECONDS)
+            logger.info(
+                f"Sharded scheduling complete: {sum(p or 0 for p in planned)} users across {self.shard_count} shards"
+            )
+            return
+        by_shard: dict[int, list[str]] = {}
+        for user_id in user_ids:
+            by_shard.setdefault(self.shard_for_user(user_id), []).append(user_id)
+        for shard_index, shard_users in by_shard.items():
+            self._call(shard_index, "schedule_users", shard_users, timeout=SHARD_REPLAN_TIMEOUT_SECONDS)
+
+    @handle_errors("routing user scheduling to shard", re_raise=True)
+    def _schedule_user_jobs(self, user_id: str, *, verbose: bool = False) -> int:
+        """Schedule one user on its shard (used by ``schedule_new_user``)"""
+        return self._call(self.shard_for_user(user_id), "schedule_users", [user_id]) or 0
+
+    @handle_errors("routing reschedule request to shard")
+    def reset_and_reschedule_daily_messages(self, category, user_id=None):
+        """Reschedule one user's category on the shard that owns the user"""
+        active_user_id = UserContext().get_user_id() if user_id is None else user_id
+        if not active_user_id:
+            logger.error("No active user found during reset and reschedule.")
+            return
+        self._call(
+            self.shard_for_user(active_user_id),
+            "reset_and_reschedule_daily_messages",
+            category,
+            active_user_id,
+        )
+
+    @handle_errors("routing task reminder scheduling to shard")
+    def schedule_all_task_reminders(self, user_id):
+        """Schedule a user's task reminders on their shard"""
+        self._call(self.shard_for_user(user_id), "schedule_all_task_reminders", user_id)
+
+    @handle_errors("routing task reminder to shard", default_return=False)
+    def schedule_task_reminder_at_datetime(self, user_id, task_identifier, date_str, time_str):
+        """Schedule one task reminder on the user's shard"""
+        return bool(
+            self._call(
+                self.shard_for_user(user_id),
+                "schedule_task_reminder_at_datetime",
+                user_id,
+                task_identifier,
+                date_str,
+                time_str,
+            )
+        )
+
+    @handle_errors("routing task reminder cleanup to shard", default_return=False)
+    def cleanup_task_reminders(self, user_id, task_identifier):
+        """Remove a task's reminders on the user's shard"""
+        return bool(
+            self._call(
+                self.shard_for_user(user_id), "cleanup_task_reminders", user_id, task_identifier
+            )
+        )
+
+    @handle_errors("cleaning up orphaned task reminders on shards", default_return=None)
+    def cleanup_orphaned_task_reminders(self):
+        """Run orphaned reminder cleanup on every shard"""
+        self._broadcast("cleanup_orphaned_task_reminders")
+
+    @handle_errors("getting active job count across shards", default_return=0)
+    def get_active_job_count(self) -> int:
+        """Coordinator system jobs plus each shard's last reported job count"""
+        return len(schedule.jobs) + sum(
+            shard.health.get("jobs", 0) for shard in self._shards
+        )
+
+    @handle_errors("getting sharded scheduler health", default_return={})
+    def get_health_status(self) -> dict[str, Any]:
+        """
+        Aggregate shard health.
+
+        Returns:
+            Dict with per-shard reports (plus ``alive``/``stale``/``restarts``)
+            and totals for users, jobs, and sends.
+        """
+        now = time.time()
+        with self._lock:
+            deliveries, delivery_failures = self._deliveries, self._delivery_failures
+        shards = []
+        for shard in self._shards:
+            report = dict(shard.health)
+            reported_at = report.get("reported_at")
+            report.update(
+                shard=shard.index,
+                alive=shard.process.is_alive(),
+                restarts=shard.restarts,
+                stale=reported_at is None or now - reported_at > SHARD_HEALTH_STALE_SECONDS,
+            )
+            shards.append(report)
+        return {
+            "shard_count": self.shard_count,
+            "healthy": bool(shards) and all(s["alive"] and not s["stale"] for s in shards),
+            "users": sum(s.get("users", 0) for s in shards),
+            "jobs": sum(s.get("jobs", 0) for s in shards),
+            "system_jobs": len(schedule.jobs),
+            "deliveries": deliveries,
+            "delivery_failures": delivery_failures,
+            "resources": get_resource_health(),
+            "shards": shards,
+        }
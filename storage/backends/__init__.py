@@ -0,0 +1,161 @@
+"""
+Pluggable storage backends for per-user documents and time-series logs.
+
+``STORAGE_BACKEND`` selects the engine:
+
+- ``json`` (default): the per-user JSON files under ``USER_INFO_DIR_PATH``.
+- ``sqlite``: the same files stay the working copy the app reads, and every
+  ``save_json_data`` / chat log append under the users directory is written
+  through to an embedded SQLite database (``STORAGE_SQLITE_PATH``, WAL mode).
+  Log range queries, appends and identifier lookups then run as indexed
+  operations instead of whole-file loads and account scans.
+
+``python -m storage.backends.migrate`` copies data between the two.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+from storage.backends.base import (
+    IDENTIFIER_FIELDS,
+    LOG_DOCUMENTS,
+    StorageBackend,
+    log_for_document,
+)
+from storage.backends.json_backend import JsonStorageBackend
+from storage.backends.sqlite_backend import SqliteStorageBackend
+
+logger = get_component_logger("file_ops")
+
+_backend_lock = threading.Lock()
+_backend: StorageBackend | None = None
+
+
+@handle_errors("opening storage backend", re_raise=True)
+def get_storage_backend() -> StorageBackend:
+    """Process-wide backend selected by ``STORAGE_BACKEND``"""
+    global _backend
+    from core import config
+
+    with _backend_lock:
+        if _backend is None:
+            if config.STORAGE_BACKEND == "sqlite":
+                _backend = SqliteStorageBackend(config.STORAGE_SQLITE_PATH)
+            else:
+                _backend = JsonStorageBackend(config.USER_INFO_DIR_PATH)
+        return _backend
+
+
+def reset_storage_backend() -> None:
+    """Close the current backend so the next call re-reads the configuration"""
+    global _backend
+    with _backend_lock:
+        backend, _backend = _backend, None
+    if backend is not None:
+        backend.close()
+
+
+def _write_through_enabled() -> bool:
+    from core import config
+
+    return config.STORAGE_BACKEND == "sqlite"
+
+
+def _split_user_path(file_path: str) -> tuple[str, str] | None:
+    """(user_id, doc_key) for a JSON file under the users directory"""
+    from core import config
+
+    try:
+        relative = Path(os.path.abspath(file_path)).relative_to(
+            os.path.abspath(config.USER_INFO_DIR_PATH)
+        )
+    except ValueError:
+        return None
+    if len(relative.parts) < 2 or relative.suffix != ".json":
+        return None
+    return relative.parts[0], Path(*relative.parts[1:]).as_posix()
+
+
+@handle_errors("writing document through to storage backend", default_return=False)
+def record_document_write(file_path: str, data: Any) -> bool:
+    """Mirror a saved user JSON file into the SQLite backend (no-op in json mode)"""
+    if not _write_through_enabled():
+        return False
+    target = _split_user_path(file_path)
+    if target is None:
+        return False
+    return get_storage_backend().save_document(target[0], target[1], data)
+
+
+@handle_errors("writing log row through to storage backend", default_return=False)
+def record_log_append(file_path: str, row: dict[str, Any]) -> bool:
+    """Mirror an appended log row into the SQLite backend (no-op in json mode)"""
+    if not _write_through_enabled():
+        return False
+    target = _split_user_path(file_path)
+    if target is None:
+        return False
+    log = log_for_document(target[1])
+    if log is None:
+        return False
+    return get_storage_backend().append_log_rows(target[0], log, [row])
+
+
+@handle_errors("removing document from storage backend", default_return=False)
+def record_document_delete(file_path: str) -> bool:
+    """Drop a removed user JSON file from the SQLite backend (no-op in json mode)"""
+    if not _write_through_enabled():
+        return False
+    target = _split_user_path(file_path)
+    if target is None:
+        return False
+    return get_storage_backend().delete_document(target[0], target[1])
+
+
+@handle_errors("removing user from storage backend", default_return=False)
+def record_user_deleted(user_id: str) -> bool:
+    """Drop a deleted user's documents and identifiers from the SQLite backend (no-op in json mode)"""
+    if not _write_through_enabled():
+        return False
+    return get_storage_backend().delete_user(user_id)
+
+
+@handle_errors("resyncing storage backend from user files", default_return=0)
+def resync_backend_from_files() -> int:
+    """
+    Rebuild the SQLite backend from the users directory (no-op in json mode).
+
+    For changes that replace user files wholesale, such as a backup restore,
+    where per-file write-through never ran. Returns documents copied.
+    """
+    if not _write_through_enabled():
+        return 0
+    from core import config
+    from storage.backends.migrate import copy_backend
+
+    backend = get_storage_backend()
+    for user_id in backend.list_user_ids():
+        backend.delete_user(user_id)
+    return copy_backend(JsonStorageBackend(config.USER_INFO_DIR_PATH), backend)["documents"]
+
+
+__all__ = [
+    "IDENTIFIER_FIELDS",
+    "LOG_DOCUMENTS",
+    "JsonStorageBackend",
+    "SqliteStorageBackend",
+    "StorageBackend",
+    "get_storage_backend",
+    "record_document_delete",
+    "record_document_write",
+    "record_log_append",
+    "record_user_deleted",
+    "reset_storage_backend",
+    "resync_backend_from_files",
+]
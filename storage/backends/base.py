@@ -0,0 +1,130 @@
+"""Storage backend interface shared by the JSON and SQLite engines."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from pathlib import PurePosixPath
+from typing import Any
+
+from core.time_utilities import timestamp_sort_key_from_dict
+
+# Time-series logs: name -> (document key, v2 row list key, row timestamp field)
+LOG_DOCUMENTS: dict[str, tuple[str, str, str]] = {
+    "checkins": ("checkins.json", "checkins", "submitted_at"),
+    "deliveries": ("messages/sent_messages.json", "deliveries", "sent_at"),
+    "chat_interactions": ("chat_interactions.json", "interactions", "timestamp"),
+    "notebook_entries": ("notebook/entries.json", "entries", "created_at"),
+}
+
+# Account fields that identify a user, as used by user_index.json
+IDENTIFIER_FIELDS = ("internal_username", "email", "discord_user_id", "phone")
+
+
+def log_for_document(doc_key: str) -> str | None:
+    """Log name stored in ``doc_key``, or None for a plain document"""
+    for log, (key, _rows_key, _ts_field) in LOG_DOCUMENTS.items():
+        if key == doc_key:
+            return log
+    return None
+
+
+def row_timestamp(log: str, row: Any) -> float:
+    """Epoch seconds of a log row (0.0 when missing or unparseable)"""
+    return timestamp_sort_key_from_dict(row, LOG_DOCUMENTS[log][2], default_when_missing="")
+
+
+def normalize_doc_key(doc_key: str) -> str:
+    """POSIX form of a document path relative to the user directory"""
+    key = str(PurePosixPath(str(doc_key).replace("\\", "/")))
+    if key.startswith("/") or ".." in PurePosixPath(key).parts:
+        raise ValueError(f"Document key must stay inside the user directory: {doc_key}")
+    return key
+
+
+def filter_log_rows(
+    log: str,
+    rows: list[dict[str, Any]],
+    *,
+    since: float | None = None,
+    until: float | None = None,
+    limit: int | None = None,
+    newest_first: bool = True,
+) -> list[dict[str, Any]]:
+    """Apply a ``query_log`` range and limit to rows already in memory"""
+    keyed = []
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        ts = row_timestamp(log, row)
+        if since is not None and ts < since:
+            continue
+        if until is not None and ts >= until:
+            continue
+        keyed.append((ts, row))
+    # Stable sort keeps write order for equal timestamps
+    keyed.sort(key=lambda item: item[0])
+    if newest_first:
+        keyed.reverse()
+    selected = [row for _ts, row in keyed]
+    return selected[:limit] if limit is not None else selected
+
+
+class StorageBackend(ABC):
+    """
+    Per-user documents plus time-series logs.
+
+    Documents are addressed by their path relative to the user directory
+    (``account.json``, ``messages/sent_messages.json``). The four logs in
+    ``LOG_DOCUMENTS`` are also documents, but can be appended to and queried
+    by time range without loading the whole history.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def load_document(self, user_id: str, doc_key: str) -> Any | None:
+        """Stored document, or None when it does not exist"""
+
+    @abstractmethod
+    def save_document(self, user_id: str, doc_key: str, data: Any) -> bool:
+        """Replace a document"""
+
+    @abstractmethod
+    def delete_document(self, user_id: str, doc_key: str) -> bool:
+        """Remove a document (True if it existed)"""
+
+    @abstractmethod
+    def delete_user(self, user_id: str) -> bool:
+        """Remove every document, log row and identifier of a user (True if any existed)"""
+
+    @abstractmethod
+    def list_user_ids(self) -> list[str]:
+        """Users with at least one stored document"""
+
+    @abstractmethod
+    def list_document_keys(self, user_id: str) -> list[str]:
+        """Document keys stored for one user, sorted"""
+
+    @abstractmethod
+    def append_log_rows(self, user_id: str, log: str, rows: list[dict[str, Any]]) -> bool:
+        """Append rows to one of ``LOG_DOCUMENTS``"""
+
+    @abstractmethod
+    def query_log(
+        self,
+        user_id: str,
+        log: str,
+        *,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+        newest_first: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Log rows with ``since <= timestamp < until`` (epoch seconds)"""
+
+    @abstractmethod
+    def find_user_id(self, field: str, value: str) -> str | None:
+        """User whose account ``field`` (one of ``IDENTIFIER_FIELDS``) equals ``value``"""
+
+    def close(self) -> None:
+        """Release connections or handles"""
@@ -0,0 +1,162 @@
+"""Storage backend over the existing per-user JSON file layout."""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+from core.time_utilities import now_timestamp_full
+from storage.backends.base import (
+    IDENTIFIER_FIELDS,
+    LOG_DOCUMENTS,
+    StorageBackend,
+    filter_log_rows,
+    normalize_doc_key,
+)
+from storage.user_data_v2_base import SCHEMA_VERSION
+
+logger = get_component_logger("file_ops")
+
+# user_index.json key prefix for each identifier field
+_INDEX_PREFIXES = {
+    "internal_username": "",
+    "email": "email:",
+    "discord_user_id": "discord:",
+    "phone": "phone:",
+}
+
+
+class JsonStorageBackend(StorageBackend):
+    """
+    One JSON document per file under ``<users_dir>/<user_id>/``.
+
+    This is the layout the rest of the app reads directly. Log queries load
+    and filter the whole document; chat appends go through the journal in
+    ``core.interaction_log``.
+    """
+
+    name = "json"
+
+    def __init__(self, users_dir: str | None = None) -> None:
+        from core import config
+
+        self.users_dir = str(users_dir or config.USER_INFO_DIR_PATH)
+
+    def _path(self, user_id: str, doc_key: str) -> str:
+        return str(Path(self.users_dir) / user_id / normalize_doc_key(doc_key))
+
+    @handle_errors("loading stored document", default_return=None)
+    def load_document(self, user_id: str, doc_key: str) -> Any | None:
+        path = self._path(user_id, doc_key)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    @handle_errors("saving stored document", default_return=False)
+    def save_document(self, user_id: str, doc_key: str, data: Any) -> bool:
+        from core.file_operations import save_json_data
+
+        return bool(save_json_data(data, self._path(user_id, doc_key)))
+
+    @handle_errors("deleting stored document", default_return=False)
+    def delete_document(self, user_id: str, doc_key: str) -> bool:
+        path = self._path(user_id, doc_key)
+        if not os.path.exists(path):
+            return False
+        os.remove(path)
+        return True
+
+    @handle_errors("deleting stored user", default_return=False)
+    def delete_user(self, user_id: str) -> bool:
+        user_dir = Path(self.users_dir) / user_id
+        if not user_dir.is_dir():
+            return False
+        shutil.rmtree(user_dir)
+        return True
+
+    @handle_errors("listing stored users", default_return=[])
+    def list_user_ids(self) -> list[str]:
+        if not os.path.isdir(self.users_dir):
+            return []
+        return sorted(entry.name for entry in os.scandir(self.users_dir) if entry.is_dir())
+
+    @handle_errors("listing stored documents", default_return=[])
+    def list_document_keys(self, user_id: str) -> list[str]:
+        user_dir = Path(self.users_dir) / user_id
+        if not user_dir.is_dir():
+            return []
+        return sorted(path.relative_to(user_dir).as_posix() for path in user_dir.rglob("*.json"))
+
+    def _load_log_rows(self, user_id: str, log: str) -> list[dict[str, Any]]:
+        doc_key, rows_key, _ts_field = LOG_DOCUMENTS[log]
+        if log == "chat_interactions":
+            from core.interaction_log import load_all_interactions
+
+            return load_all_interactions(self._path(user_id, doc_key))
+        document = self.load_document(user_id, doc_key)
+        rows = document.get(rows_key) if isinstance(document, dict) else None
+        return rows if isinstance(rows, list) else []
+
+    @handle_errors("appending log rows", default_return=False)
+    def append_log_rows(self, user_id: str, log: str, rows: list[dict[str, Any]]) -> bool:
+        doc_key, rows_key, _ts_field = LOG_DOCUMENTS[log]
+        if log == "chat_interactions":
+            from core.interaction_log import append_interaction
+
+            path = self._path(user_id, doc_key)
+            return all(append_interaction(path, row) for row in rows)
+
+        from core.file_locking import file_lock
+
+        path = self._path(user_id, doc_key)
+        with file_lock(path):
+            document = self.load_document(user_id, doc_key)
+            if not isinstance(document, dict):
+                document = {"schema_version": SCHEMA_VERSION, rows_key: []}
+            document.setdefault(rows_key, []).extend(rows)
+            document["updated_at"] = now_timestamp_full()
+            return self.save_document(user_id, doc_key, document)
+
+    @handle_errors("querying log rows", default_return=[])
+    def query_log(
+        self,
+        user_id: str,
+        log: str,
+        *,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+        newest_first: bool = True,
+    ) -> list[dict[str, Any]]:
+        return filter_log_rows(
+            log,
+            self._load_log_rows(user_id, log),
+            since=since,
+            until=until,
+            limit=limit,
+            newest_first=newest_first,
+        )
+
+    @handle_errors("finding user by identifier", default_return=None)
+    def find_user_id(self, field: str, value: str) -> str | None:
+        if field not in IDENTIFIER_FIELDS or not value:
+            return None
+        from core.file_locking import safe_json_read
+
+        index_file = str(Path(self.users_dir).parent / "user_index.json")
+        index_data = safe_json_read(index_file, default={}) or {}
+        mapped = index_data.get(f"{_INDEX_PREFIXES[field]}{value}")
+        if isinstance(mapped, str) and mapped:
+            return mapped
+        # Index missing or stale: scan every account
+        for user_id in self.list_user_ids():
+            account = self.load_document(user_id, "account.json")
+            if isinstance(account, dict) and str(account.get(field) or "") == str(value):
+                return user_id
+        return None
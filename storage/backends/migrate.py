@@ -0,0 +1,86 @@
+"""
+Copy user data between storage backends.
+
+    python -m storage.backends.migrate to-sqlite [--users-dir DIR] [--db PATH]
+    python -m storage.backends.migrate to-json [--users-dir DIR] [--db PATH]
+
+``to-sqlite`` seeds the database before switching ``STORAGE_BACKEND`` to
+``sqlite``; ``to-json`` writes the database back out as per-user files.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+from storage.backends.base import StorageBackend
+from storage.backends.json_backend import JsonStorageBackend
+from storage.backends.sqlite_backend import SqliteStorageBackend
+
+logger = get_component_logger("file_ops")
+
+
+@handle_errors("copying storage backend", default_return={"users": 0, "documents": 0})
+def copy_backend(source: StorageBackend, target: StorageBackend) -> dict[str, int]:
+    """Copy every document of every user; returns user and document counts"""
+    if isinstance(source, JsonStorageBackend):
+        # Pending chat journal rows belong in the documents being copied
+        from core.interaction_log import flush_all_interaction_logs
+
+        flush_all_interaction_logs()
+
+    users = documents = 0
+    for user_id in source.list_user_ids():
+        copied = 0
+        for doc_key in source.list_document_keys(user_id):
+            data = source.load_document(user_id, doc_key)
+            if data is not None and target.save_document(user_id, doc_key, data):
+                copied += 1
+        if copied:
+            users += 1
+            documents += copied
+    logger.info(f"Copied {documents} documents for {users} users from {source.name} to {target.name}")
+    return {"users": users, "documents": documents}
+
+
+def export_json_to_sqlite(users_dir: str | None = None, db_path: str | None = None) -> dict[str, int]:
+    """Load the JSON layout into a SQLite database"""
+    target = SqliteStorageBackend(db_path)
+    try:
+        return copy_backend(JsonStorageBackend(users_dir), target)
+    finally:
+        target.close()
+
+
+def export_sqlite_to_json(db_path: str | None = None, users_dir: str | None = None) -> dict[str, int]:
+    """Write a SQLite database out as the JSON layout"""
+    if db_path and not os.path.exists(db_path):
+        raise FileNotFoundError(db_path)
+    source = SqliteStorageBackend(db_path)
+    try:
+        return copy_backend(source, JsonStorageBackend(users_dir))
+    finally:
+        source.close()
+
+
+def main() -> int:
+    """Command-line entry point; prints counts as JSON"""
+    parser = argparse.ArgumentParser(description="Copy user data between storage backends")
+    parser.add_argument("direction", choices=["to-sqlite", "to-json"])
+    parser.add_argument("--users-dir", default=None, help="Defaults to USER_INFO_DIR_PATH")
+    parser.add_argument("--db", default=None, help="Defaults to STORAGE_SQLITE_PATH")
+    args = parser.parse_args()
+
+    if args.direction == "to-sqlite":
+        results = export_json_to_sqlite(args.users_dir, args.db)
+    else:
+        results = export_sqlite_to_json(args.db, args.users_dir)
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,282 @@
+"""Embedded SQLite (WAL) storage backend."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+from storage.backends.base import (
+    IDENTIFIER_FIELDS,
+    LOG_DOCUMENTS,
+    StorageBackend,
+    log_for_document,
+    normalize_doc_key,
+    row_timestamp,
+)
+from storage.user_data_v2_base import SCHEMA_VERSION
+
+logger = get_component_logger("file_ops")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    user_id TEXT NOT NULL,
+    doc_key TEXT NOT NULL,
+    body TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (user_id, doc_key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS log_rows (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    log TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    ts REAL NOT NULL,
+    body TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS log_rows_by_time ON log_rows (log, user_id, ts, seq);
+CREATE TABLE IF NOT EXISTS identifiers (
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    PRIMARY KEY (field, value)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS identifiers_by_user ON identifiers (user_id);
+"""
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class SqliteStorageBackend(StorageBackend):
+    """
+    All users in one SQLite database in WAL mode.
+
+    - ``documents`` holds profile documents keyed by (user, path). A log
+      document keeps only its envelope here.
+    - ``log_rows`` holds every row of the four ``LOG_DOCUMENTS`` logs with
+      its parsed timestamp, indexed by (log, user, ts), so appends are single
+      inserts and range queries read only the rows they return.
+    - ``identifiers`` maps username / email / Discord ID / phone to a user
+      and is kept in step with ``account.json`` saves.
+
+    WAL lets readers run alongside the single writer. Each thread gets its
+    own connection; writes are serialized by a lock.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str | None = None) -> None:
+        from core import config
+
+        self.db_path = str(db_path or config.STORAGE_SQLITE_PATH)
+        directory = os.path.dirname(os.path.abspath(self.db_path))
+        os.makedirs(directory, exist_ok=True)
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        with self._write_lock:
+            self._connection().executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("PRAGMA busy_timeout=30000")
+            self._local.connection = connection
+            with self._connections_lock:
+                self._connections.append(connection)
+        return connection
+
+    @handle_errors("loading stored document", default_return=None)
+    def load_document(self, user_id: str, doc_key: str) -> Any | None:
+        doc_key = normalize_doc_key(doc_key)
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT body FROM documents WHERE user_id = ? AND doc_key = ?",
+            (user_id, doc_key),
+        ).fetchone()
+        if row is None:
+            return None
+        document = json.loads(row[0])
+        log = log_for_document(doc_key)
+        if log is not None and isinstance(document, dict):
+            rows = connection.execute(
+                "SELECT body FROM log_rows WHERE log = ? AND user_id = ? ORDER BY seq",
+                (log, user_id),
+            ).fetchall()
+            document[LOG_DOCUMENTS[log][1]] = [json.loads(body) for (body,) in rows]
+        return document
+
+    @handle_errors("saving stored document", default_return=False)
+    def save_document(self, user_id: str, doc_key: str, data: Any) -> bool:
+        doc_key = normalize_doc_key(doc_key)
+        log = log_for_document(doc_key)
+        envelope = data
+        if log is not None and isinstance(data, dict):
+            rows_key = LOG_DOCUMENTS[log][1]
+            envelope = {key: value for key, value in data.items() if key != rows_key}
+        connection = self._connection()
+        with self._write_lock, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO documents (user_id, doc_key, body, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (user_id, doc_key, _dumps(envelope), time.time()),
+            )
+            if envelope is not data:
+                connection.execute(
+                    "DELETE FROM log_rows WHERE log = ? AND user_id = ?", (log, user_id)
+                )
+                self._insert_rows(connection, user_id, log, data.get(LOG_DOCUMENTS[log][1]))
+            if doc_key == "account.json":
+                self._replace_identifiers(connection, user_id, data)
+        return True
+
+    @handle_errors("deleting stored document", default_return=False)
+    def delete_document(self, user_id: str, doc_key: str) -> bool:
+        doc_key = normalize_doc_key(doc_key)
+        log = log_for_document(doc_key)
+        connection = self._connection()
+        with self._write_lock, connection:
+            deleted = connection.execute(
+                "DELETE FROM documents WHERE user_id = ? AND doc_key = ?", (user_id, doc_key)
+            ).rowcount
+            if log is not None:
+                connection.execute(
+                    "DELETE FROM log_rows WHERE log = ? AND user_id = ?", (log, user_id)
+                )
+            if doc_key == "account.json":
+                connection.execute("DELETE FROM identifiers WHERE user_id = ?", (user_id,))
+        return bool(deleted)
+
+    @handle_errors("deleting stored user", default_return=False)
+    def delete_user(self, user_id: str) -> bool:
+        connection = self._connection()
+        with self._write_lock, connection:
+            deleted = connection.execute(
+                "DELETE FROM documents WHERE user_id = ?", (user_id,)
+            ).rowcount
+            connection.execute("DELETE FROM log_rows WHERE user_id = ?", (user_id,))
+            connection.execute("DELETE FROM identifiers WHERE user_id = ?", (user_id,))
+        return bool(deleted)
+
+    @handle_errors("listing stored users", default_return=[])
+    def list_user_ids(self) -> list[str]:
+        rows = self._connection().execute(
+            "SELECT DISTINCT user_id FROM documents ORDER BY user_id"
+        ).fetchall()
+        return [user_id for (user_id,) in rows]
+
+    @handle_errors("listing stored documents", default_return=[])
+    def list_document_keys(self, user_id: str) -> list[str]:
+        rows = self._connection().execute(
+            "SELECT doc_key FROM documents WHERE user_id = ? ORDER BY doc_key", (user_id,)
+        ).fetchall()
+        return [doc_key for (doc_key,) in rows]
+
+    @handle_errors("appending log rows", default_return=False)
+    def append_log_rows(self, user_id: str, log: str, rows: list[dict[str, Any]]) -> bool:
+        doc_key, rows_key, _ts_field = LOG_DOCUMENTS[log]
+        from core.time_utilities import now_timestamp_full
+
+        envelope = {"schema_version": SCHEMA_VERSION, "updated_at": now_timestamp_full()}
+        connection = self._connection()
+        with self._write_lock, connection:
+            existing = connection.execute(
+                "SELECT body FROM documents WHERE user_id = ? AND doc_key = ?",
+                (user_id, doc_key),
+            ).fetchone()
+            if existing is not None:
+                stored = json.loads(existing[0])
+                if isinstance(stored, dict):
+                    envelope = {**stored, "updated_at": envelope["updated_at"]}
+            connection.execute(
+                "INSERT OR REPLACE INTO documents (user_id, doc_key, body, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (user_id, doc_key, _dumps(envelope), time.time()),
+            )
+            self._insert_rows(connection, user_id, log, rows)
+        return True
+
+    @handle_errors("querying log rows", default_return=[])
+    def query_log(
+        self,
+        user_id: str,
+        log: str,
+        *,
+        since: float | None = None,
+        until: float | None = None,
+        limit: int | None = None,
+        newest_first: bool = True,
+    ) -> list[dict[str, Any]]:
+        if log not in LOG_DOCUMENTS:
+            raise ValueError(f"Unknown log: {log}")
+        sql = "SELECT body FROM log_rows WHERE log = ? AND user_id = ?"
+        params: list[Any] = [log, user_id]
+        if since is not None:
+            sql += " AND ts >= ?"
+            params.append(since)
+        if until is not None:
+            sql += " AND ts < ?"
+            params.append(until)
+        direction = "DESC" if newest_first else "ASC"
+        sql += f" ORDER BY ts {direction}, seq {direction}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        rows = self._connection().execute(sql, params).fetchall()
+        return [json.loads(body) for (body,) in rows]
+
+    @handle_errors("finding user by identifier", default_return=None)
+    def find_user_id(self, field: str, value: str) -> str | None:
+        if field not in IDENTIFIER_FIELDS or not value:
+            return None
+        row = self._connection().execute(
+            "SELECT user_id FROM identifiers WHERE field = ? AND value = ?",
+            (field, str(value)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def close(self) -> None:
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
+
+    @staticmethod
+    def _insert_rows(
+        connection: sqlite3.Connection, user_id: str, log: str, rows: Any
+    ) -> None:
+        if not isinstance(rows, list):
+            return
+        connection.executemany(
+            "INSERT INTO log_rows (log, user_id, ts, body) VALUES (?, ?, ?, ?)",
+            [(log, user_id, row_timestamp(log, row), _dumps(row)) for row in rows],
+        )
+
+    @staticmethod
+    def _replace_identifiers(connection: sqlite3.Connection, user_id: str, account: Any) -> None:
+        connection.execute("DELETE FROM identifiers WHERE user_id = ?", (user_id,))
+        if not isinstance(account, dict):
+            return
+        # Later saves win if two accounts claim the same identifier
+        connection.executemany(
+            "INSERT OR REPLACE INTO identifiers (field, value, user_id) VALUES (?, ?, ?)",
+            [
+                (field, str(account[field]), user_id)
+                for field in IDENTIFIER_FIELDS
+                if account.get(field)
+            ],
+        )
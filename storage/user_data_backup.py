@@ -149,6 +149,10 @@ def export_user_data(user_id: str, export_format: str = "json") -> dict[str, Any
     if os.path.exists(sent_file):
         export_data["sent_messages"] = load_json_data(sent_file) or {}
 
+    from core.response_tracking import flush_response_log
+
+    # Chat appends wait in a journal until compaction; merge them first
+    flush_response_log(user_id, "chat_interaction")
     for log_type in ["checkins", "chat_interactions"]:
         log_file = get_user_file_path(user_id, log_type)
         if os.path.exists(log_file):
@@ -206,6 +210,20 @@ def delete_user_completely(
     except Exception as e:
         logger.warning(f"Error getting message files for user {user_id}: {e}")
 
+    try:
+        from storage.user_data_journal import discard_user_journal
+
+        discard_user_journal(user_id)
+    except Exception as e:
+        logger.warning(f"Error removing transaction journal for user {user_id}: {e}")
+
+    try:
+        from storage.backends import record_user_deleted
+
+        record_user_deleted(user_id)
+    except Exception as e:
+        logger.warning(f"Error removing user {user_id} from storage backend: {e}")
+
     try:
         remove_from_index(user_id, index_file=index_file)
     except Exception as e:
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import os
-import time
 from pathlib import Path
 from typing import Any
 
@@ -59,12 +58,20 @@ def _index_file_path(index_file: str | None = None) -> str:
 
 # not_duplicate: update_user_index
 @handle_errors("updating user index", default_return=False)
-def update_user_index(user_id: str, index_file: str | None = None) -> bool:
+def update_user_index(
+    user_id: str,
+    index_file: str | None = None,
+    account: dict[str, Any] | None = None,
+) -> bool:
     """
     Update the user index with current information for a specific user.
 
     Creates flat lookup mappings for fast O(1) user lookups:
     - {"internal_username": "UUID", "email:email": "UUID", "discord:discord_id": "UUID", "phone:phone": "UUID"}
+
+    Only records a delta when those entries changed; the index file itself is
+    rewritten in batches (see ``storage.user_index_deltas``). Pass ``account``
+    when the caller already holds the saved account to skip re-reading it.
     """
     if not user_id or not isinstance(user_id, str):
         logger.error(f"Invalid user_id: {user_id}")
@@ -74,77 +81,31 @@ def update_user_index(user_id: str, index_file: str | None = None) -> bool:
         logger.error("Empty user_id provided")
         return False
 
-    try:
-        from core.file_locking import safe_json_read, safe_json_write
-
-        index_path = _index_file_path(index_file)
-        index_data = safe_json_read(index_path, default={"last_updated": None})
-
-        user_data_result = None
-        user_account = {}
-        max_retries = 5
-        retry_delay = 0.2
-
-        for attempt in range(max_retries):
-            try:
-                user_data_result = get_user_data(user_id, "account")
-                user_account = user_data_result.get("account") or {}
-                if user_account and user_account.get("internal_username"):
-                    break
-            except Exception as e:
-                logger.debug(
-                    f"Attempt {attempt + 1}/{max_retries} to get account data for {user_id} failed: {e}"
-                )
-
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
+    from storage.user_index_deltas import record_index_entries
 
-        internal_username = user_account.get("internal_username", "")
-        if not internal_username:
-            if os.getenv("MHM_TESTING") == "1":
-                logger.debug(
-                    f"No internal_username found for user {user_id} after {max_retries} attempts (account keys: {list(user_account.keys())})"
-                )
-            else:
-                logger.warning(
-                    f"No internal_username found for user {user_id} after {max_retries} attempts (account keys: {list(user_account.keys())})"
-                )
-            return False
-
-        entries = _index_entries_for_account(user_id, user_account)
-        if (
-            internal_username not in index_data
-            or index_data[internal_username] == user_id
-        ):
-            index_data[internal_username] = user_id
-        for key, mapped_user_id in entries.items():
-            if key == internal_username:
-                continue
-            index_data[key] = mapped_user_id
-
-        index_data["last_updated"] = now_timestamp_full()
-
-        max_write_retries = 3
-        write_retry_delay = 0.15
-        for write_attempt in range(max_write_retries):
-            if safe_json_write(index_path, index_data, indent=4):
-                logger.debug(
-                    f"Updated user index for user {user_id} (internal_username: {internal_username})"
-                )
-                return True
-            if write_attempt < max_write_retries - 1:
-                logger.debug(
-                    f"Write attempt {write_attempt + 1}/{max_write_retries} failed for {user_id}, retrying..."
-                )
-                time.sleep(write_retry_delay)
+    user_account = account
+    if not isinstance(user_account, dict):
+        user_data_result = get_user_data(user_id, "account")
+        user_account = user_data_result.get("account") or {}
 
-        logger.error(
-            f"Failed to save user index for user {user_id} after {max_write_retries} attempts"
+    internal_username = user_account.get("internal_username", "")
+    if not internal_username:
+        message = (
+            f"No internal_username found for user {user_id} "
+            f"(account keys: {list(user_account.keys())})"
         )
+        if os.getenv("MHM_TESTING") == "1":
+            logger.debug(message)
+        else:
+            logger.warning(message)
         return False
-    except Exception as e:
-        logger.error(f"Error updating user index for user {user_id}: {e}")
-        return False
+
+    return record_index_entries(
+        user_id,
+        str(internal_username),
+        _index_entries_for_account(user_id, user_account),
+        _index_file_path(index_file),
+    )
 
 
 @handle_errors("removing from index", default_return=False)
@@ -158,123 +119,95 @@ def remove_from_index(user_id: str, index_file: str | None = None) -> bool:
         logger.error("Empty user_id provided")
         return False
 
-    try:
-        from core.file_locking import safe_json_read, safe_json_write
+    from storage.user_index_deltas import flush_user_index, record_index_entries
 
-        index_path = _index_file_path(index_file)
-        index_data = safe_json_read(index_path, default={"last_updated": None})
+    index_path = _index_file_path(index_file)
+    user_data_result = get_user_data(user_id, "account")
+    user_account = user_data_result.get("account") or {}
+    internal_username = user_account.get("internal_username")
 
-        user_data_result = get_user_data(user_id, "account")
-        user_account = user_data_result.get("account") or {}
-        internal_username = user_account.get("internal_username")
+    # Deletions are applied at once so the user is not found after this returns
+    if not record_index_entries(user_id, str(internal_username or ""), {}, index_path):
+        return False
+    if not flush_user_index(index_path):
+        logger.error(f"Failed to save user index after removing user {user_id}")
+        return False
 
-        for key in _index_entries_for_account(user_id, user_account):
-            if key in index_data:
-                del index_data[key]
+    logger.info(
+        f"Removed user {user_id} (internal_username: {internal_username}) from index"
+    )
+    return True
 
-        index_data["last_updated"] = now_timestamp_full()
 
-        if not safe_json_write(index_path, index_data, indent=4):
-            logger.error(f"Failed to save user index after removing user {user_id}")
-            return False
+@handle_errors("reading account for index rebuild", default_return={})
+def _read_account_for_index(user_id: str) -> dict[str, Any]:
+    """Account fields straight from account.json (safe to call from worker threads)"""
+    from core.file_locking import safe_json_read
 
-        logger.info(
-            f"Removed user {user_id} (internal_username: {internal_username}) from index"
-        )
-        return True
-
-    except Exception as e:
-        logger.error(f"Error removing user {user_id} from index: {e}")
-        return False
+    account_path = Path(get_user_data_dir(user_id)) / "account.json"
+    account = safe_json_read(str(account_path), default={})
+    return account if isinstance(account, dict) else {}
 
 
 @handle_errors("rebuilding full index", default_return=False)
 def rebuild_full_index(index_file: str | None = None) -> bool:
-    """Rebuild the complete user index from scratch."""
-    try:
-        logger.info("Starting full user index rebuild...")
-
-        user_ids = get_all_user_ids()
-        if not user_ids:
-            logger.warning("No users found during index rebuild")
-            return True
-
-        from core.file_locking import safe_json_write
+    """Rebuild the complete user index from scratch, reading accounts in parallel."""
+    from concurrent.futures import ThreadPoolExecutor
 
-        index_path = _index_file_path(index_file)
-        index_data = {"last_updated": now_timestamp_full()}
-        successful_count = 0
-        failed_count = 0
-        max_retries = 3
-        retry_delay = 0.2
+    from core.file_locking import file_lock, safe_json_write
+    from storage.user_index_deltas import delta_log_path_for, forget_user_index_entries
 
-        for user_id in user_ids:
-            if not user_id:
-                continue
+    logger.info("Starting full user index rebuild...")
 
-            user_account = {}
-            for attempt in range(max_retries):
-                try:
-                    user_data_result = get_user_data(user_id, "account")
-                    user_account = user_data_result.get("account") or {}
-                    if user_account and user_account.get("internal_username"):
-                        break
-                except Exception as e:
-                    logger.debug(
-                        f"Attempt {attempt + 1}/{max_retries} to get account data for {user_id} during rebuild failed: {e}"
-                    )
-
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-
-            if not user_account.get("internal_username"):
-                if os.getenv("MHM_TESTING") == "1":
-                    logger.debug(
-                        f"No internal_username found for user {user_id} after {max_retries} attempts, skipping"
-                    )
-                else:
-                    logger.warning(
-                        f"No internal_username found for user {user_id} after {max_retries} attempts, skipping"
-                    )
-                failed_count += 1
-                continue
+    user_ids = [user_id for user_id in get_all_user_ids() if user_id]
+    if not user_ids:
+        logger.warning("No users found during index rebuild")
+        return True
 
-            index_data.update(_index_entries_for_account(user_id, user_account))
-            successful_count += 1
+    index_path = _index_file_path(index_file)
+    with ThreadPoolExecutor(max_workers=min(16, len(user_ids))) as pool:
+        accounts = list(pool.map(_read_account_for_index, user_ids))
+
+    index_data: dict[str, Any] = {"last_updated": now_timestamp_full()}
+    known: dict[str, dict[str, str]] = {}
+    successful_count = 0
+    failed_count = 0
+    for user_id, user_account in zip(user_ids, accounts):
+        if not user_account.get("internal_username"):
+            message = f"No internal_username found for user {user_id}, skipping"
+            if os.getenv("MHM_TESTING") == "1":
+                logger.debug(message)
+            else:
+                logger.warning(message)
+            failed_count += 1
+            continue
+        entries = _index_entries_for_account(user_id, user_account)
+        index_data.update(entries)
+        known[user_id] = entries
+        successful_count += 1
 
-        max_write_retries = 3
-        write_retry_delay = 0.15
-        write_success = False
-        for write_attempt in range(max_write_retries):
-            if safe_json_write(index_path, index_data, indent=4):
-                write_success = True
-                break
-            if write_attempt < max_write_retries - 1:
-                logger.debug(
-                    f"Write attempt {write_attempt + 1}/{max_write_retries} failed during rebuild, retrying..."
-                )
-                time.sleep(write_retry_delay)
-
-        if not write_success:
-            logger.error("Failed to save rebuilt user index after retries")
+    log_path = delta_log_path_for(index_path)
+    with file_lock(log_path):
+        if not safe_json_write(index_path, index_data, indent=4):
+            logger.error("Failed to save rebuilt user index")
             return False
+        # The rebuild reflects every account, so pending deltas are obsolete
+        with open(log_path, "w", encoding="utf-8"):
+            pass
+        forget_user_index_entries(index_path, known)
 
-        if successful_count > 0:
-            logger.info(
-                f"Rebuilt user index with {successful_count} users (skipped {failed_count} users)"
-            )
-            return True
-        if failed_count > 0:
-            logger.error(
-                f"Failed to index any users during rebuild ({failed_count} users failed)"
-            )
-            return False
-        logger.info("Rebuilt user index (no users to index)")
+    if successful_count > 0:
+        logger.info(
+            f"Rebuilt user index with {successful_count} users (skipped {failed_count} users)"
+        )
         return True
-
-    except Exception as e:
-        logger.error(f"Error rebuilding full user index: {e}", exc_info=True)
+    if failed_count > 0:
+        logger.error(
+            f"Failed to index any users during rebuild ({failed_count} users failed)"
+        )
         return False
+    logger.info("Rebuilt user index (no users to index)")
+    return True
 
 
 @handle_errors("rebuilding user index", default_return=False)
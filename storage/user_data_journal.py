@@ -0,0 +1,253 @@
+"""
+Write-ahead undo journal for multi-document user data updates.
+
+A transaction records the current bytes (pre-images) of only the files it is
+about to change, in ``<BASE_DATA_DIR>/transactions/<user_id>.journal``:
+
+1. The journal is written to a temp file, fsynced, renamed into place and the
+   directory fsynced. From here on a crash rolls back.
+2. The new documents are written (``save_json_data`` fsyncs each one).
+3. The journal is marked committed (same write/rename/fsync order), then
+   removed. From the marker on, a crash rolls forward.
+
+``recover_pending_transactions`` runs at service start: a pending journal
+restores its pre-images, a committed one is just removed. A failed
+transaction rolls back immediately. Cost is proportional to the documents
+being changed; full zip backups stay with the scheduled backup manager.
+Each user's ``.journal.lock`` file exists only while a transaction holds it,
+and ``discard_user_journal`` clears a deleted user's leftovers.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from core.error_handling import handle_errors
+from core.logger import get_component_logger
+from core.time_utilities import now_timestamp_full
+
+logger = get_component_logger("file_ops")
+
+JOURNAL_SUFFIX = ".journal"
+
+_locks_guard = threading.Lock()
+_user_locks: dict[str, threading.RLock] = {}
+
+
+class TransactionAborted(Exception):
+    """Raised inside ``user_data_transaction`` to roll the transaction back"""
+
+
+def _journal_dir() -> Path:
+    from core import config
+
+    return Path(config.BASE_DATA_DIR) / "transactions"
+
+
+def journal_path_for_user(user_id: str) -> str:
+    """Journal file of one user's in-flight transaction"""
+    return str(_journal_dir() / f"{user_id}{JOURNAL_SUFFIX}")
+
+
+def _user_lock(user_id: str) -> threading.RLock:
+    with _locks_guard:
+        lock = _user_locks.get(user_id)
+        if lock is None:
+            lock = _user_locks[user_id] = threading.RLock()
+        return lock
+
+
+# ERROR_HANDLING_EXCLUDE: best-effort directory fsync; not supported on every platform.
+def _fsync_dir(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@handle_errors("writing journal file durably", re_raise=True)
+def _durable_write(path: str, payload: bytes) -> None:
+    """Write via temp file + fsync + rename + directory fsync"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    _fsync_dir(os.path.dirname(path) or ".")
+
+
+@handle_errors("reading document pre-image", re_raise=True)
+def _read_pre_image(path: str) -> dict[str, Any]:
+    if not os.path.exists(path):
+        return {"path": path, "existed": False, "data": None}
+    with open(path, "rb") as handle:
+        data = handle.read()
+    return {"path": path, "existed": True, "data": base64.b64encode(data).decode("ascii")}
+
+
+@handle_errors("writing transaction journal", re_raise=True)
+def _write_journal(journal_path: str, journal: dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(journal_path), exist_ok=True)
+    _durable_write(journal_path, json.dumps(journal).encode("utf-8"))
+
+
+@handle_errors("removing transaction journal", re_raise=True)
+def _remove_journal(journal_path: str) -> None:
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+        _fsync_dir(os.path.dirname(journal_path))
+
+
+@handle_errors("mirroring restored document", default_return=None)
+def _mirror_restored(path: str, payload: bytes) -> None:
+    """Keep a STORAGE_BACKEND=sqlite mirror in step with a restored file"""
+    from storage.backends import record_document_write
+
+    if path.endswith(".json"):
+        record_document_write(path, json.loads(payload.decode("utf-8")))
+
+
+@handle_errors("forgetting removed document", default_return=None)
+def _forget_restored(path: str) -> None:
+    """Drop a file that did not exist before the transaction from a STORAGE_BACKEND=sqlite mirror"""
+    from storage.backends import record_document_delete
+
+    if path.endswith(".json"):
+        record_document_delete(path)
+
+
+@handle_errors("restoring document pre-images", re_raise=True)
+def _restore_pre_images(journal: dict[str, Any]) -> int:
+    """Put every recorded file back as it was; returns files restored"""
+    restored = 0
+    for entry in journal.get("files", []):
+        path = entry.get("path")
+        if not path:
+            continue
+        if entry.get("existed"):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            payload = base64.b64decode(entry.get("data") or "")
+            _durable_write(path, payload)
+            _mirror_restored(path, payload)
+        elif os.path.exists(path):
+            os.remove(path)
+            _forget_restored(path)
+        restored += 1
+    return restored
+
+
+def _after_rollback(user_id: str) -> None:
+    from storage.user_data_registry import clear_user_caches
+
+    clear_user_caches(user_id)
+
+
+# ERROR_HANDLING_EXCLUDE: context manager; exceptions from the block must propagate after rollback.
+@contextmanager
+def user_data_transaction(user_id: str, file_paths: list[str]) -> Iterator[None]:
+    """
+    Journal ``file_paths`` and commit the writes made inside the block.
+
+    An exception in the block (raise ``TransactionAborted`` to fail without
+    an error log) restores the pre-images before it propagates.
+    Transactions for one user are serialized across threads and processes.
+    """
+    from core.file_locking import file_lock
+
+    journal_path = journal_path_for_user(user_id)
+    paths = sorted({os.path.abspath(path) for path in file_paths if path})
+    with _user_lock(user_id), file_lock(journal_path + ".lock", remove_on_release=True):
+        _recover_journal(journal_path)
+        journal = {
+            "user_id": user_id,
+            "state": "pending",
+            "started_at": now_timestamp_full(),
+            "files": [_read_pre_image(path) for path in paths],
+        }
+        _write_journal(journal_path, journal)
+        try:
+            yield
+        except BaseException:
+            _restore_pre_images(journal)
+            _remove_journal(journal_path)
+            _after_rollback(user_id)
+            logger.info(f"Rolled back transaction for user {user_id} ({len(paths)} files)")
+            raise
+        _write_journal(journal_path, {**journal, "state": "committed", "files": []})
+        _remove_journal(journal_path)
+
+
+@handle_errors("recovering user data transaction", default_return=None)
+def _recover_journal(journal_path: str) -> str | None:
+    """Finish one leftover journal; returns "rolled_back", "rolled_forward" or None"""
+    tmp_path = f"{journal_path}.tmp"
+    if os.path.exists(tmp_path):
+        # The journal never reached its final name, so no document was touched
+        os.remove(tmp_path)
+    if not os.path.exists(journal_path):
+        return None
+    with open(journal_path, encoding="utf-8") as handle:
+        journal = json.load(handle)
+    user_id = str(journal.get("user_id") or Path(journal_path).stem)
+    if journal.get("state") == "committed":
+        _remove_journal(journal_path)
+        logger.info(f"Rolled forward committed transaction for user {user_id}")
+        return "rolled_forward"
+    restored = _restore_pre_images(journal)
+    _remove_journal(journal_path)
+    _after_rollback(user_id)
+    logger.warning(
+        f"Rolled back interrupted transaction for user {user_id} ({restored} files restored)"
+    )
+    return "rolled_back"
+
+
+@handle_errors("recovering pending user data transactions", default_return={})
+def recover_pending_transactions() -> dict[str, str]:
+    """Roll every leftover journal back or forward (run once at startup)"""
+    from core.file_locking import file_lock
+
+    journal_dir = _journal_dir()
+    if not journal_dir.is_dir():
+        return {}
+    outcomes: dict[str, str] = {}
+    for journal_file in sorted(journal_dir.glob(f"*{JOURNAL_SUFFIX}*")):
+        if journal_file.name.endswith(".lock"):
+            continue
+        journal_path = str(journal_file).removesuffix(".tmp")
+        user_id = Path(journal_path).name.removesuffix(JOURNAL_SUFFIX)
+        with _user_lock(user_id), file_lock(journal_path + ".lock", remove_on_release=True):
+            outcome = _recover_journal(journal_path)
+        if outcome:
+            outcomes[user_id] = outcome
+    return outcomes
+
+
+@handle_errors("discarding user data transaction journal", default_return=False)
+def discard_user_journal(user_id: str) -> bool:
+    """
+    Remove a deleted user's journal files, so startup recovery does not
+    restore the files of a user that no longer exists
+    """
+    from core.file_locking import file_lock
+
+    journal_path = journal_path_for_user(user_id)
+    with _user_lock(user_id), file_lock(journal_path + ".lock", remove_on_release=True):
+        for path in (journal_path, f"{journal_path}.tmp"):
+            if os.path.exists(path):
+                os.remove(path)
+    return True
@@ -12,6 +12,7 @@ from typing import Any
 from core.logger import get_component_logger
 from core.error_handling import handle_errors
 from core.config import get_user_file_path
+from core.tracing import traced
 from core.file_operations import load_json_data, save_json_data, determine_file_path
 from core.schemas import (
     validate_account_dict,
@@ -218,6 +219,7 @@ def load_and_ensure_ids(user_id: str) -> None:
 
 
 @handle_errors("getting user data", default_return={})
+@traced("storage_read")
 def get_user_data(
     user_id: str,
     data_types: str | list[str] = "all",
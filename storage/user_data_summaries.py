@@ -545,6 +545,10 @@ def get_user_analytics_summary(user_id: str) -> dict[str, Any]:
             ("chat_interactions", "Chat Activity"),
         ]
 
+        from core.response_tracking import flush_response_log
+
+        # Chat appends wait in a journal until compaction; merge them first
+        flush_response_log(user_id, "chat_interaction")
         for source, _label in interaction_sources:
             file_path = get_user_file_path(user_id, source)
             if not os.path.exists(file_path):
@@ -43,6 +43,7 @@ from core.profile_v2_schemas import (
     validate_account_v2_document,
     validate_chat_interactions_v2_document,
     validate_context_v2_document,
+    validate_conversation_history_v2_document,
     validate_preferences_v2_document,
     validate_schedules_v2_document,
     validate_tags_v2_document,
@@ -93,4 +94,6 @@ def validate_v2_document(document_type: str, data: dict[str, Any]) -> tuple[dict
         return validate_tags_v2_document(data)
     if document_type == "chat_interactions":
         return validate_chat_interactions_v2_document(data)
+    if document_type == "conversation_history":
+        return validate_conversation_history_v2_document(data)
     return data, [f"Unknown v2 document type: {document_type}"]
@@ -72,25 +72,39 @@ def _save_user_data__validate_input(
     return True, result, invalid_types
 
 
-@handle_errors("creating user data backup", default_return=False)
-def _save_user_data__create_backup(
-    user_id: str, valid_types: list[str], create_backup: bool
-) -> bool:
+@handle_errors("resolving transaction file paths", default_return=[])
+def _save_user_data__transaction_paths(user_id: str, data_types: list[str]) -> list[str]:
+    """Files a save of ``data_types`` may write (cross-file invariants can add account)"""
     if not user_id or not isinstance(user_id, str):
-        logger.error(f"Invalid user_id for backup: {user_id}")
-        return False
-    if not isinstance(valid_types, list):
-        logger.error(f"Invalid valid_types: {valid_types}")
-        return False
-    if create_backup and len(valid_types) > 1:
-        try:
-            from storage.user_data_operations import UserDataManager
+        logger.error(f"Invalid user_id for transaction: {user_id}")
+        return []
+    available_types = get_available_data_types()
+    types = [dt for dt in [*data_types, "account"] if dt in available_types]
+    return [get_user_file_path(user_id, dt) for dt in dict.fromkeys(types)]
 
-            backup_path = UserDataManager().backup_user_data(user_id)
-            logger.info(f"Created backup before major data update: {backup_path}")
-        except Exception as e:
-            logger.warning(f"Failed to create backup before data update: {e}")
-    return True
+
+@handle_errors("writing data types in a transaction", default_return={})
+def _save_user_data__write_journaled(
+    user_id: str, merged_data: dict[str, dict[str, Any]], valid_types: list[str]
+) -> dict[str, bool]:
+    """Write all types under the undo journal; any failed write restores every file"""
+    from storage.user_data_journal import TransactionAborted, user_data_transaction
+
+    write_results: dict[str, bool] = {}
+    try:
+        with user_data_transaction(
+            user_id, _save_user_data__transaction_paths(user_id, valid_types)
+        ):
+            write_results = _save_user_data__write_all_types(
+                user_id, merged_data, valid_types
+            )
+            if not write_results or not all(write_results.values()):
+                raise TransactionAborted()
+    except TransactionAborted:
+        failed = [dt for dt, ok in write_results.items() if not ok]
+        logger.error(f"Rolled back update for user {user_id}. Failed types: {failed}")
+        return {dt: False for dt in valid_types}
+    return write_results
 
 
 # not_duplicate: save_user_data_validation_phases
@@ -293,7 +307,10 @@ def _save_user_data__merge_single_type(
 
 @handle_errors("updating user index", default_return=False)
 def _save_user_data__update_index(
-    user_id: str, result: dict[str, bool], update_index: bool
+    user_id: str,
+    result: dict[str, bool],
+    update_index: bool,
+    account: dict[str, Any] | None = None,
 ) -> bool:
     if not user_id or not isinstance(user_id, str):
         logger.error(f"Invalid user_id for index update: {user_id}")
@@ -301,10 +318,11 @@ def _save_user_data__update_index(
     if not isinstance(result, dict):
         logger.error(f"Invalid result: {type(result)}")
         return False
-    if update_index and any(result.values()):
+    # Lookup keys all live in account.json; other saves cannot change the index
+    if update_index and result.get("account"):
         try:
             from storage.user_data_operations import update_user_index
-            update_user_index(user_id)
+            update_user_index(user_id, account=account)
         except Exception as e:
             logger.warning(
                 f"Failed to update user index after data save for user {user_id}: {e}"
@@ -315,6 +333,12 @@ def _save_user_data__update_index(
             logger.debug(f"Cleared cache for user {user_id} after data save")
         except Exception as e:
             logger.warning(f"Failed to clear cache for user {user_id}: {e}")
+        try:
+            from messages.ai_outbox import invalidate_ai_outbox
+
+            invalidate_ai_outbox(user_id)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate AI outbox for user {user_id}: {e}")
     return True
 
 
@@ -427,6 +451,10 @@ def save_user_data(
 ) -> dict[str, bool]:
     """
     Save user data with two-phase approach: merge/validate in Phase 1, write in Phase 2.
+
+    With ``create_backup`` (the default), updates touching more than one type
+    are written under the write-ahead journal in ``storage.user_data_journal``,
+    so they apply completely or not at all.
     """
     is_valid, result, invalid_types = _save_user_data__validate_input(
         user_id, data_updates
@@ -536,13 +564,18 @@ def save_user_data(
     )
 
     logger.debug(f"After invariants: valid_types_to_process={valid_types_to_process}")
-    _save_user_data__create_backup(user_id, valid_types_to_process, create_backup)
-
-    write_results = _save_user_data__write_all_types(
-        user_id, merged_data, valid_types_to_process
-    )
+    if create_backup and len(valid_types_to_process) > 1:
+        write_results = _save_user_data__write_journaled(
+            user_id, merged_data, valid_types_to_process
+        )
+    else:
+        write_results = _save_user_data__write_all_types(
+            user_id, merged_data, valid_types_to_process
+        )
     result.update(write_results)
-    _save_user_data__update_index(user_id, result, update_index)
+    _save_user_data__update_index(
+        user_id, result, update_index, merged_data.get("account")
+    )
     return result
 
 
@@ -550,37 +583,43 @@ def save_user_data(
 def save_user_data_transaction(
     user_id: str, data_updates: dict[str, dict[str, Any]], auto_create: bool = True
 ) -> bool:
-    """Atomic wrapper for user data updates."""
+    """
+    Atomic wrapper for user data updates.
+
+    Pre-images of the affected documents are journaled first; if any type
+    fails validation or writing, every document is restored.
+    """
     if not user_id or not data_updates:
         return False
-    try:
-        from storage.user_data_operations import UserDataManager
+    from storage.user_data_journal import TransactionAborted, user_data_transaction
 
-        backup_path = UserDataManager().backup_user_data(user_id)
-        logger.info(f"Created backup before transaction: {backup_path}")
-    except Exception as e:
-        logger.warning(f"Failed to create backup before transaction: {e}")
-
-    result = save_user_data(
-        user_id=user_id,
-        data_updates=data_updates,
-        auto_create=auto_create,
-        update_index=False,
-        create_backup=False,
-        validate_data=True,
-    )
-    success = all(result.values())
-    if success:
-        try:
-            from storage.user_data_operations import update_user_index
-            update_user_index(user_id)
-        except Exception as e:
-            logger.error(f"Transaction succeeded but failed to update index: {e}")
-            success = False
-    else:
+    result: dict[str, bool] = {}
+    try:
+        with user_data_transaction(
+            user_id, _save_user_data__transaction_paths(user_id, list(data_updates))
+        ):
+            result = save_user_data(
+                user_id=user_id,
+                data_updates=data_updates,
+                auto_create=auto_create,
+                update_index=False,
+                create_backup=False,
+                validate_data=True,
+            )
+            if not result or not all(result.values()):
+                raise TransactionAborted()
+    except TransactionAborted:
         failed = [dt for dt, ok in result.items() if not ok]
         logger.error(f"Transaction failed for user {user_id}. Failed types: {failed}")
-    return success
+        return False
+
+    try:
+        from storage.user_data_operations import update_user_index
+        update_user_index(user_id)
+    except Exception as e:
+        logger.error(f"Transaction succeeded but failed to update index: {e}")
+        return False
+    return True
 
 
 # --- High-level section updates (centralised save_user_data wrappers) ---
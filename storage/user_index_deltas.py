@@ -0,0 +1,254 @@
+"""
+Debounced, batched maintenance of ``user_index.json``.
+
+Every save used to re-read the account (with retry sleeps), read the whole
+global index and rewrite it. Here a save only records a delta when the
+user's lookup entries (username / email / Discord ID / phone) differ from
+the ones last recorded for that user:
+
+- the delta is appended as one JSON line to ``user_index.deltas.jsonl`` beside
+  the index (fsynced, under ``core.file_locking.file_lock``), so it survives
+  a crash and is visible to other processes;
+- ``USER_INDEX_FLUSH_DELAY_SECONDS`` after the first pending delta, all
+  pending deltas are applied to the index in one read-modify-write and the
+  log is truncated (0 applies on every change);
+- lookups in this process see pending entries through
+  ``pending_index_lookup`` before the flush.
+
+The last recorded entries per user are seeded once from the index and
+reseeded when another process rewrites it (``os.stat`` signature), so an
+unchanged save costs no index I/O and save latency does not grow with the
+number of users.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+from core.error_handling import handle_errors
+from core.file_operations import file_signature
+from core.logger import get_component_logger
+from core.time_utilities import now_timestamp_full
+
+logger = get_component_logger("main")
+
+_state_lock = threading.RLock()
+# index path -> {user_id: {lookup key: user_id}} as last recorded
+_known: dict[str, dict[str, dict[str, str]]] = {}
+# index path -> index file signature the known entries match
+_known_signatures: dict[str, tuple] = {}
+# index path -> {user_id: (username, entries)} recorded but not yet applied
+_pending: dict[str, dict[str, tuple[str, dict[str, str]]]] = {}
+_flush_timers: dict[str, threading.Timer] = {}
+
+
+def delta_log_path_for(index_path: str) -> str:
+    """``user_index.json`` -> ``user_index.deltas.jsonl``"""
+    path = Path(index_path)
+    return str(path.with_name(f"{path.stem}.deltas.jsonl"))
+
+
+@handle_errors("reading user index deltas", default_return=[])
+def _read_deltas(log_path: str) -> list[dict[str, Any]]:
+    if not os.path.exists(log_path):
+        return []
+    deltas = []
+    with open(log_path, encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                delta = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # torn final line from a crash mid-append
+            if isinstance(delta, dict) and delta.get("user_id"):
+                deltas.append(delta)
+    return deltas
+
+
+def _apply_delta(index_data: dict[str, Any], delta: dict[str, Any]) -> None:
+    user_id = delta["user_id"]
+    username = delta.get("username") or ""
+    for key in delta.get("remove") or []:
+        if index_data.get(key) == user_id:
+            del index_data[key]
+    for key, mapped in (delta.get("set") or {}).items():
+        # A username already claimed by another user keeps its owner
+        if key == username and index_data.get(key) not in (None, user_id):
+            continue
+        index_data[key] = mapped
+
+
+@handle_errors("applying user index deltas", default_return=False)
+def _apply_pending_locked(index_path: str) -> bool:
+    """Apply the delta log to the index; the caller holds the log lock"""
+    from core.file_locking import safe_json_read, safe_json_write
+
+    log_path = delta_log_path_for(index_path)
+    deltas = _read_deltas(log_path)
+    if not deltas:
+        return True
+    index_data = safe_json_read(index_path, default={"last_updated": None})
+    for delta in deltas:
+        _apply_delta(index_data, delta)
+    index_data["last_updated"] = now_timestamp_full()
+    if not safe_json_write(index_path, index_data, indent=4):
+        logger.error(f"Failed to apply {len(deltas)} user index deltas; keeping log")
+        return False
+    with open(log_path, "w", encoding="utf-8"):
+        pass
+    applied_users = {delta["user_id"] for delta in deltas}
+    with _state_lock:
+        pending = _pending.get(index_path, {})
+        for user_id in applied_users:
+            pending.pop(user_id, None)
+        if index_path in _known:
+            _known_signatures[index_path] = file_signature(index_path)
+    logger.debug(f"Applied {len(deltas)} user index deltas for {len(applied_users)} users")
+    return True
+
+
+@handle_errors("seeding user index entries", default_return={})
+def _known_entries(index_path: str) -> dict[str, dict[str, str]]:
+    """Last recorded entries per user; reseeded if another process rewrote the index"""
+    from core.file_locking import file_lock, safe_json_read
+
+    with _state_lock:
+        known = _known.get(index_path)
+        if known is not None and _known_signatures.get(index_path) == file_signature(index_path):
+            return known
+
+    with file_lock(delta_log_path_for(index_path)):
+        # Leftover deltas (another process, or a crash) are applied first
+        _apply_pending_locked(index_path)
+        signature = file_signature(index_path)
+        index_data = safe_json_read(index_path, default={})
+    known = {}
+    for key, mapped in index_data.items():
+        if key != "last_updated" and isinstance(mapped, str) and mapped:
+            known.setdefault(mapped, {})[key] = mapped
+    with _state_lock:
+        for user_id, (_username, entries) in _pending.get(index_path, {}).items():
+            known[user_id] = dict(entries)
+        _known[index_path] = known
+        _known_signatures[index_path] = signature
+    return known
+
+
+@handle_errors("recording user index change", default_return=False)
+def record_index_entries(
+    user_id: str, username: str, entries: dict[str, str], index_path: str
+) -> bool:
+    """
+    Record a user's current lookup entries; no-op when they are unchanged.
+
+    Returns:
+        bool: True if the index is (or will be, after the debounce) up to date
+    """
+    from core import config
+    from core.file_locking import file_lock
+
+    known = _known_entries(index_path)
+    with _state_lock:
+        previous = known.get(user_id)
+        if previous == entries:
+            return True
+        known[user_id] = dict(entries)
+        _pending.setdefault(index_path, {})[user_id] = (username, dict(entries))
+
+    delta = {
+        "user_id": user_id,
+        "username": username,
+        "set": entries,
+        "remove": sorted(set(previous or {}) - set(entries)),
+        "recorded_at": now_timestamp_full(),
+    }
+    log_path = delta_log_path_for(index_path)
+    with file_lock(log_path):
+        with open(log_path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(delta, ensure_ascii=False) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        if config.USER_INDEX_FLUSH_DELAY_SECONDS <= 0:
+            return _apply_pending_locked(index_path)
+
+    _schedule_flush(index_path, config.USER_INDEX_FLUSH_DELAY_SECONDS)
+    return True
+
+
+@handle_errors("scheduling user index flush", default_return=None)
+def _schedule_flush(index_path: str, delay: float) -> None:
+    with _state_lock:
+        if index_path in _flush_timers:
+            return
+        timer = threading.Timer(delay, _run_scheduled_flush, args=(index_path,))
+        timer.daemon = True
+        _flush_timers[index_path] = timer
+    timer.start()
+
+
+@handle_errors("running scheduled user index flush", default_return=None)
+def _run_scheduled_flush(index_path: str) -> None:
+    with _state_lock:
+        _flush_timers.pop(index_path, None)
+    flush_user_index(index_path)
+
+
+@handle_errors("flushing user index", default_return=False)
+def flush_user_index(index_path: str | None = None) -> bool:
+    """Apply pending deltas now (one index path, or every path with pending deltas)"""
+    from core.file_locking import file_lock
+
+    with _state_lock:
+        paths = [index_path] if index_path else list(
+            set(_pending) | set(_flush_timers)
+        )
+        for path in paths:
+            timer = _flush_timers.pop(path, None)
+            if timer is not None:
+                timer.cancel()
+    ok = True
+    for path in paths:
+        if os.path.exists(delta_log_path_for(path)):
+            with file_lock(delta_log_path_for(path)):
+                ok = _apply_pending_locked(path) and ok
+    return ok
+
+
+@handle_errors("looking up pending user index entry", default_return=None)
+def pending_index_lookup(key: str, index_path: str) -> str | None:
+    """User a lookup key maps to in deltas not yet applied by this process"""
+    with _state_lock:
+        for user_id, (_username, entries) in _pending.get(index_path, {}).items():
+            if entries.get(key) == user_id:
+                return user_id
+    return None
+
+
+@handle_errors("forgetting user index entries", default_return=None)
+def forget_user_index_entries(index_path: str, known: dict[str, dict[str, str]] | None = None) -> None:
+    """Drop pending and recorded state for an index (after a full rebuild)"""
+    with _state_lock:
+        _pending.pop(index_path, None)
+        timer = _flush_timers.pop(index_path, None)
+        if timer is not None:
+            timer.cancel()
+        if known is None:
+            _known.pop(index_path, None)
+            _known_signatures.pop(index_path, None)
+        else:
+            _known[index_path] = known
+            _known_signatures[index_path] = file_signature(index_path)
+
+
+def clear_user_index_state() -> None:
+    """Forget all in-memory index state (tests, or after moving BASE_DATA_DIR)"""
+    with _state_lock:
+        for timer in _flush_timers.values():
+            timer.cancel()
+        _flush_timers.clear()
+        _pending.clear()
+        _known.clear()
+        _known_signatures.clear()
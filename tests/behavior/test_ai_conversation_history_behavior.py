@@ -12,6 +12,14 @@ from ai.context.history import ConversationHistory
 from tests.test_helpers.test_utilities import TestUserFactory
 
 
+@pytest.fixture(autouse=True)
+def fresh_conversation_log():
+    """Sessions persist per user; start each test without an earlier test's log."""
+    ConversationHistory().clear_history("test-user")
+    yield
+    ConversationHistory().clear_history("test-user")
+
+
 @pytest.mark.behavior
 @pytest.mark.ai
 class TestConversationHistoryBehavior:
@@ -0,0 +1,45 @@
+"""
+Smoke test for the core-path benchmark runner (tests/performance).
+
+Runs a tiny population through ``main``, which isolates the workload in a child
+process with its own data directory, and checks the result contract that
+``analyze_core_benchmarks`` depends on.
+"""
+
+import json
+
+import pytest
+
+from tests.performance.core_path_benchmarks import BENCHMARK_NAMES, main
+
+
+@pytest.mark.behavior
+@pytest.mark.slow
+@pytest.mark.core
+@pytest.mark.file_io
+def test_core_path_benchmarks_small_run_reports_every_benchmark(tmp_path):
+    """Every benchmark is timed, passes its sanity check and sizes are reported."""
+    output = tmp_path / "result.json"
+    exit_code = main(
+        [
+            "--users", "2",
+            "--years", "0.1",
+            "--repeat", "1",
+            "--warmup", "0",
+            "--seed", "11",
+            "--output", str(output),
+        ]
+    )
+
+    assert exit_code == 0
+    result = json.loads(output.read_text(encoding="utf-8"))
+    assert result["workload"] == {
+        "users": 2, "years": 0.1, "repeat": 1, "warmup": 0, "seed": 11,
+    }
+    assert list(result["benchmarks"]) == BENCHMARK_NAMES
+    for stats in result["benchmarks"].values():
+        assert stats["calls"] >= 1
+        assert stats["min_ms"] <= stats["median_ms"] <= stats["p95_ms"]
+    assert result["failed_checks"] == []
+    assert result["population"]["rows"]["checkins"] > 0
+    assert result["population"]["rows"]["sent_messages"] > 0
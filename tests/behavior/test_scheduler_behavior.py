@@ -8,15 +8,11 @@ import pytest
 import os
 from uuid import uuid4
 from unittest.mock import patch, Mock
-from datetime import datetime, timedelta
+from datetime import timedelta
 from core import get_user_data
 from scheduler.manager import SchedulerManager, schedule_all_task_reminders
 from core import get_user_categories
-from core.time_utilities import (
-    parse_time_only_minute,
-    parse_timestamp_minute,
-    now_datetime_full,
-)
+from core.time_utilities import now_datetime_full
 
 
 @pytest.fixture
@@ -110,95 +106,6 @@ class TestSchedulerManager:
             )
             assert result is False
 
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    @pytest.mark.critical
-    @pytest.mark.regression
-    def test_get_random_time_within_period_valid_times(self, scheduler_manager):
-        """Test getting random time within a valid time period."""
-        user_id = "test-user"
-        category = "motivational"
-        period_name = "morning"
-        timezone_str = "America/Regina"
-
-        # Mock get_schedule_time_periods to return a valid period
-        with patch("scheduler.manager.get_schedule_time_periods") as mock_get_periods:
-            mock_get_periods.return_value = {
-                period_name: {
-                    "start_time": "09:00",
-                    "end_time": "17:00",
-                    "active": True,
-                    "days": ["ALL"],
-                }
-            }
-
-            result = scheduler_manager.get_random_time_within_period(
-                user_id, category, period_name, timezone_str
-            )
-
-            # Test real behavior: function returns a string, not datetime
-            assert result is not None
-            assert isinstance(result, str)
-
-            # Parse the result to verify it's a valid datetime string
-            result_dt = parse_timestamp_minute(result)
-            assert result_dt is not None
-            assert isinstance(result_dt, datetime)
-
-            # Verify the time is within the specified range (9:00-17:00)
-            result_time = result_dt.time()
-            start_dt_obj = parse_time_only_minute("09:00")
-            assert start_dt_obj is not None
-            start_time = start_dt_obj.time()
-            end_dt_obj = parse_time_only_minute("17:00")
-            assert end_dt_obj is not None
-            end_time = end_dt_obj.time()
-            assert start_time <= result_time <= end_time
-
-            # Verify side effect: function should have called get_schedule_time_periods
-            mock_get_periods.assert_called_once_with(user_id, category)
-
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    @pytest.mark.critical
-    @pytest.mark.regression
-    def test_get_random_time_within_period_invalid_times(self, scheduler_manager):
-        """Test getting random time with invalid time format."""
-        user_id = "test-user"
-        category = "motivational"
-        period_name = "morning"
-        timezone_str = "America/Regina"
-
-        with patch("scheduler.manager.get_schedule_time_periods") as mock_get_periods:
-            mock_get_periods.return_value = {
-                period_name: {
-                    "start_time": "invalid",
-                    "end_time": "17:00",
-                    "active": True,
-                    "days": ["ALL"],
-                }
-            }
-
-            # Test real behavior: function returns None when error occurs (due to @handle_errors decorator)
-            result = scheduler_manager.get_random_time_within_period(
-                user_id, category, period_name, timezone_str
-            )
-            assert result is None
-
-            # Verify side effect: function should have called get_schedule_time_periods
-            mock_get_periods.assert_called_once_with(user_id, category)
-
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    @pytest.mark.critical
-    @pytest.mark.regression
-    def test_is_time_conflict_no_conflicts(self, scheduler_manager):
-        """Test time conflict detection when no conflicts exist."""
-        schedule_datetime = now_datetime_full() + timedelta(hours=1)
-
-        result = scheduler_manager.is_time_conflict("test-user", schedule_datetime)
-        assert result is False
-
     @pytest.mark.behavior
     @pytest.mark.scheduler
     @pytest.mark.critical
@@ -412,55 +319,6 @@ class TestSchedulerEdgeCases:
                 # Should handle gracefully without raising exceptions
                 scheduler.schedule_all_users_immediately()
 
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    def test_random_time_generation_consistency(self, mock_communication_manager):
-        """Test that random time generation is consistent within bounds."""
-        scheduler = SchedulerManager(mock_communication_manager)
-
-        user_id = "test-user"
-        category = "motivational"
-        period_name = "morning"
-        timezone_str = "America/Regina"
-
-        # Mock get_schedule_time_periods to return a valid period
-        with patch("scheduler.manager.get_schedule_time_periods") as mock_get_periods:
-            mock_get_periods.return_value = {
-                period_name: {
-                    "start_time": "10:00",
-                    "end_time": "12:00",
-                    "active": True,
-                    "days": ["ALL"],
-                }
-            }
-
-            # Generate multiple times and verify they're all within bounds
-            times = []
-            for _ in range(10):
-                result = scheduler.get_random_time_within_period(
-                    user_id, category, period_name, timezone_str
-                )
-                if result is not None:  # Only add valid results
-                    times.append(result)
-
-            # All times should be within the specified range
-            start_dt_obj = parse_time_only_minute("10:00")
-            assert start_dt_obj is not None
-            start_dt = start_dt_obj.time()
-            end_dt_obj = parse_time_only_minute("12:00")
-            assert end_dt_obj is not None
-            end_dt = end_dt_obj.time()
-
-            for time_str in times:
-                result_dt = parse_timestamp_minute(time_str)
-                assert result_dt is not None
-                result_time = result_dt.time()
-                assert (
-                    start_dt <= result_time <= end_dt
-                ), f"Time {result_time} not in range {start_dt}-{end_dt}"
-
-            # Verify side effect: function should have been called multiple times
-            assert mock_get_periods.call_count == 10
 @pytest.mark.tasks
 
 
@@ -6,6 +6,7 @@ Focuses on real behavior and side effects to ensure actual functionality works.
 """
 
 import pytest
+import pytz
 import os
 import json
 import time
@@ -22,7 +23,6 @@ from core.time_utilities import (
     DATE_ONLY,
     format_timestamp,
     parse_time_only_minute,
-    parse_timestamp_minute,
     now_datetime_full,
 )
 from communication.core.message_send_result import MessageSendResult
@@ -236,7 +236,7 @@ class TestMessageScheduling:
 
             with patch("scheduler.manager.get_schedule_time_periods") as mock_get_periods, \
                  patch.object(
-                     scheduler_manager, "schedule_daily_message_job"
+                     scheduler_manager, "schedule_user_daily_plan"
                  ) as mock_schedule, \
                  patch.object(
                      scheduler_manager, "schedule_all_task_reminders"
@@ -246,12 +246,8 @@ class TestMessageScheduling:
                 # Test real behavior: function should schedule the new user
                 scheduler_manager.schedule_new_user(user_id)
 
-                # Verify side effects: should have called scheduling methods
-                # The method should call schedule_daily_message_job for each category and checkins
-                # With our mock data, it should call it at least twice (motivational + checkin)
-                assert (
-                    mock_schedule.call_count >= 2
-                ), f"Expected at least 2 calls, got {mock_schedule.call_count}"
+                # Verify side effects: categories and check-ins are planned together
+                mock_schedule.assert_called_once_with(user_id, ["motivational", "checkin"])
                 mock_task_schedule.assert_called_once_with(user_id)
 
     @pytest.mark.behavior
@@ -279,18 +275,18 @@ class TestMessageScheduling:
             }
 
             with patch.object(
-                scheduler_manager, "schedule_message_for_period"
-            ) as mock_schedule_period, patch.object(
+                scheduler_manager, "_schedule_send_plan", return_value=1
+            ) as mock_plan, patch.object(
                 scheduler_manager, "cleanup_old_tasks"
             ) as mock_cleanup:
-                # Test real behavior: function should schedule active periods
+                # Test real behavior: function should plan active periods only
                 scheduler_manager.schedule_daily_message_job(user_id, category)
 
                 # Verify side effects
                 mock_cleanup.assert_called_once_with(user_id, category)
-                mock_schedule_period.assert_called_once_with(
-                    user_id, category, "morning"
-                )
+                mock_plan.assert_called_once()
+                windows = mock_plan.call_args[0][1]
+                assert [w.period_name for w in windows] == ["morning"]
 
     @pytest.mark.behavior
     @pytest.mark.scheduler
@@ -303,13 +299,13 @@ class TestMessageScheduling:
             mock_get_periods.return_value = {}
 
             with patch.object(
-                scheduler_manager, "schedule_message_for_period"
-            ) as mock_schedule_period:
+                scheduler_manager, "_schedule_send_plan"
+            ) as mock_plan:
                 # Test real behavior: function should handle empty periods gracefully
                 scheduler_manager.schedule_daily_message_job(user_id, category)
 
                 # Verify side effect: should not schedule any periods
-                mock_schedule_period.assert_not_called()
+                mock_plan.assert_not_called()
 
     @pytest.mark.behavior
     @pytest.mark.scheduler
@@ -319,88 +315,69 @@ class TestMessageScheduling:
         user_id = "test-user"
         category = "motivational"
         period_name = "morning"
+        now = pytz.timezone("America/Regina").localize(now_datetime_full())
 
-        with patch.object(
-            scheduler_manager, "get_random_time_within_period"
-        ) as mock_get_time:
-            mock_get_time.return_value = "2024-01-15 10:30"
-
-            with patch("scheduler.manager.load_and_localize_datetime") as mock_load_time:
-                mock_load_time.return_value = now_datetime_full() + timedelta(hours=1)
-
-                with patch(
-                    "scheduler.manager.resolve_user_timezone_str",
-                    return_value="America/Regina",
-                ):
-                    with patch.object(
-                        scheduler_manager, "is_time_conflict"
-                    ) as mock_conflict:
-                        mock_conflict.return_value = False
-
-                        with patch.object(scheduler_manager, "set_wake_timer") as mock_wake:
-                            # Test real behavior: function should schedule the message
-                            scheduler_manager.schedule_message_for_period(
-                                user_id, category, period_name
-                            )
-
-                            # Verify side effects - the method calls get_random_time_within_period in a retry loop
-                            # so it may be called multiple times depending on conflicts
-                            assert mock_get_time.call_count >= 1
-                            # Verify it was called with the correct parameters at least once
-                            mock_get_time.assert_any_call(
-                                user_id, category, period_name, "America/Regina"
-                            )
-                            # Verify side effects - the method calls is_time_conflict in a retry loop
-                            # so it may be called multiple times depending on conflicts
-                            assert mock_conflict.call_count >= 1
-                            # The set_wake_timer should be called once when the method succeeds
-                            # However, if the method hits an exception, it might not reach this point
-                            # Let's check if it was called at least once (indicating success)
-                            assert (
-                                mock_wake.call_count >= 0
-                            )  # Allow for the case where it doesn't reach this point
+        with patch(
+            "scheduler.manager.get_schedule_time_periods",
+            return_value={
+                "morning": {"active": True, "start_time": "09:00", "end_time": "12:00"}
+            },
+        ), patch(
+            "scheduler.manager.resolve_user_timezone_str",
+            return_value="America/Regina",
+        ), patch(
+            "scheduler.manager.localized_now_for_user", return_value=now
+        ), patch(
+            "scheduler.manager.schedule"
+        ) as mock_schedule, patch.object(
+            scheduler_manager, "set_wake_timer"
+        ) as mock_wake:
+            mock_schedule.jobs = []
+            # Test real behavior: function should schedule exactly one planned send
+            scheduler_manager.schedule_message_for_period(user_id, category, period_name)
+
+            mock_wake.assert_called_once()
+            send_at, wake_user, wake_category, wake_period = mock_wake.call_args[0]
+            assert (wake_user, wake_category, wake_period) == (user_id, category, period_name)
+            assert send_at > now
+            assert "09:00" <= send_at.strftime("%H:%M") <= "12:00"
+            mock_schedule.every.return_value.day.at.assert_called_once_with(
+                send_at.strftime("%H:%M")
+            )
 
     @pytest.mark.behavior
     @pytest.mark.scheduler
-    def test_schedule_message_for_period_time_conflict_retry(self, scheduler_manager):
-        """Test scheduling with time conflicts and retry logic."""
+    def test_schedule_message_for_period_keeps_spacing_from_planned_sends(
+        self, scheduler_manager
+    ):
+        """A second period is planned around sends already scheduled for the user."""
         user_id = "test-user"
-        category = "motivational"
-        period_name = "morning"
+        now = pytz.timezone("America/Regina").localize(now_datetime_full())
+        periods = {
+            "morning": {"active": True, "start_time": "09:00", "end_time": "12:00"},
+            "late_morning": {"active": True, "start_time": "10:00", "end_time": "14:00"},
+        }
+
+        with patch(
+            "scheduler.manager.get_schedule_time_periods", return_value=periods
+        ), patch(
+            "scheduler.manager.resolve_user_timezone_str",
+            return_value="America/Regina",
+        ), patch(
+            "scheduler.manager.localized_now_for_user", return_value=now
+        ), patch(
+            "scheduler.manager.schedule"
+        ) as mock_schedule, patch.object(
+            scheduler_manager, "set_wake_timer"
+        ) as mock_wake:
+            mock_schedule.jobs = []
+            scheduler_manager.schedule_message_for_period(user_id, "motivational", "morning")
+            scheduler_manager.schedule_message_for_period(user_id, "health", "late_morning")
+
+            first, second = (call[0][0] for call in mock_wake.call_args_list)
+            assert abs(second - first) >= timedelta(hours=2)
+            assert len(scheduler_manager._daily_plans[user_id]) == 2
 
-        with patch.object(
-            scheduler_manager, "get_random_time_within_period"
-        ) as mock_get_time:
-            mock_get_time.return_value = "2024-01-15 10:30"
-
-            with patch("scheduler.manager.load_and_localize_datetime") as mock_load_time:
-                mock_load_time.return_value = now_datetime_full() + timedelta(hours=1)
-
-                with patch.object(
-                    scheduler_manager, "is_time_conflict"
-                ) as mock_conflict:
-                    # First call returns True (conflict), second call returns False (no conflict)
-                    mock_conflict.side_effect = [True, False]
-
-                    with patch.object(scheduler_manager, "set_wake_timer") as mock_wake:
-                        # Test real behavior: function should retry and eventually succeed
-                        scheduler_manager.schedule_message_for_period(
-                            user_id, category, period_name
-                        )
-
-                        # Verify side effects: should have retried
-                        # The method calls get_random_time_within_period in a retry loop up to 10 times
-                        # With our mock setup (first conflict, then success), it should be called at least twice
-                        assert mock_get_time.call_count >= 2
-                        # The method calls is_time_conflict in a retry loop up to 10 times
-                        # With our mock setup (first conflict, then success), it should be called at least twice
-                        assert mock_conflict.call_count >= 2
-                        # The set_wake_timer should be called once when the method succeeds
-                        # However, if the method hits an exception, it might not reach this point
-                        # Let's check if it was called at least once (indicating success)
-                        assert (
-                            mock_wake.call_count >= 0
-                        )  # Allow for the case where it doesn't reach this point
 @pytest.mark.tasks
 
 
@@ -579,125 +556,6 @@ class TestTaskReminderScheduling:
 @pytest.mark.tasks
 
 
-class TestTimeManagement:
-    """Test time management and conflict detection."""
-
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    @pytest.mark.critical
-    def test_is_time_conflict_with_conflict_real_behavior(self, scheduler_manager):
-        """Test time conflict detection when conflicts exist."""
-        user_id = "test-user"
-        schedule_datetime = now_datetime_full() + timedelta(hours=1)
-
-        # Create a mock job that conflicts
-        mock_job = Mock()
-        mock_job.job_func.args = [user_id, "motivational"]
-        mock_job.next_run = schedule_datetime + timedelta(
-            minutes=30
-        )  # Within 2-hour window
-
-        with patch("scheduler.manager.schedule") as mock_schedule:
-            mock_schedule.jobs = [mock_job]
-
-            # Test real behavior: function should detect the conflict
-            result = scheduler_manager.is_time_conflict(user_id, schedule_datetime)
-
-            # Verify side effect
-            assert result is True
-
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    def test_is_time_conflict_no_conflict_different_user(self, scheduler_manager):
-        """Test time conflict detection with different user."""
-        user_id = "test-user"
-        schedule_datetime = now_datetime_full() + timedelta(hours=1)
-
-        # Create a mock job for a different user
-        mock_job = Mock()
-        mock_job.job_func.args = ["other-user", "motivational"]
-        mock_job.next_run = schedule_datetime + timedelta(minutes=30)
-
-        with patch("scheduler.manager.schedule") as mock_schedule:
-            mock_schedule.jobs = [mock_job]
-
-            # Test real behavior: function should not detect conflict for different user
-            result = scheduler_manager.is_time_conflict(user_id, schedule_datetime)
-
-            # Verify side effect
-            assert result is False
-
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    @pytest.mark.critical
-    def test_get_random_time_within_period_future_scheduling(self, scheduler_manager):
-        """Test getting random time for future scheduling."""
-        user_id = "test-user"
-        category = "motivational"
-        period_name = "morning"
-
-        with patch("scheduler.manager.get_schedule_time_periods") as mock_get_periods:
-            mock_get_periods.return_value = {
-                period_name: {
-                    "start_time": "09:00",
-                    "end_time": "17:00",
-                    "active": True,
-                    "days": ["ALL"],
-                }
-            }
-
-            # Test real behavior: function should return a valid datetime string
-            result = scheduler_manager.get_random_time_within_period(
-                user_id, category, period_name
-            )
-
-            # Verify result
-            assert result is not None
-            assert isinstance(result, str)
-
-            # Parse the result
-            result_dt = parse_timestamp_minute(result)
-            assert result_dt is not None
-            assert isinstance(result_dt, datetime)
-
-            # Verify the time is within the specified range
-            result_time = result_dt.time()
-            start_dt_obj = parse_time_only_minute("09:00")
-            assert start_dt_obj is not None
-            start_time = start_dt_obj.time()
-            end_dt_obj = parse_time_only_minute("17:00")
-            assert end_dt_obj is not None
-            end_time = end_dt_obj.time()
-            assert start_time <= result_time <= end_time
-
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    def test_get_random_time_within_period_invalid_period(self, scheduler_manager):
-        """Test getting random time with invalid period."""
-        user_id = "test-user"
-        category = "motivational"
-        period_name = "invalid-period"
-
-        with patch("scheduler.manager.get_schedule_time_periods") as mock_get_periods:
-            mock_get_periods.return_value = {
-                "morning": {
-                    "start_time": "09:00",
-                    "end_time": "17:00",
-                    "active": True,
-                    "days": ["ALL"],
-                }
-            }
-
-            # Test real behavior: function should return None for invalid period
-            result = scheduler_manager.get_random_time_within_period(
-                user_id, category, period_name
-            )
-
-            # Verify side effect
-            assert result is None
-@pytest.mark.tasks
-
-
 class TestMessageHandling:
     """Test message handling and retry logic."""
 
@@ -1089,59 +947,22 @@ class TestErrorHandling:
 
     @pytest.mark.behavior
     @pytest.mark.scheduler
-    def test_get_random_time_within_period_missing_times(self, scheduler_manager):
-        """Test getting random time with missing start/end times."""
-        user_id = "test-user"
-        category = "motivational"
-        period_name = "morning"
-
-        with patch("scheduler.manager.get_schedule_time_periods") as mock_get_periods:
-            mock_get_periods.return_value = {
-                period_name: {
-                    "active": True,
-                    "days": ["ALL"],
-                    # Missing start_time and end_time
-                }
-            }
-
-            # Test real behavior: function should return None for missing times
-            result = scheduler_manager.get_random_time_within_period(
-                user_id, category, period_name
-            )
-
-            # Verify side effect
-            assert result is None
-
-    @pytest.mark.behavior
-    @pytest.mark.scheduler
-    def test_schedule_message_for_period_max_retries_exceeded(self, scheduler_manager):
-        """Test scheduling with max retries exceeded."""
+    def test_schedule_message_for_period_unknown_period(self, scheduler_manager):
+        """Test scheduling for a period the user does not have."""
         user_id = "test-user"
         category = "motivational"
-        period_name = "morning"
-
-        with patch.object(
-            scheduler_manager, "get_random_time_within_period"
-        ) as mock_get_time:
-            mock_get_time.return_value = "2024-01-15 10:30"
-
-            with patch("scheduler.manager.load_and_localize_datetime") as mock_load_time:
-                mock_load_time.return_value = now_datetime_full() + timedelta(hours=1)
-
-                with patch.object(
-                    scheduler_manager, "is_time_conflict"
-                ) as mock_conflict:
-                    # Always return True to force max retries
-                    mock_conflict.return_value = True
-
-                    # Test real behavior: function should handle max retries gracefully
-                    scheduler_manager.schedule_message_for_period(
-                        user_id, category, period_name
-                    )
 
-                    # Verify side effects: should have retried the maximum number of times
-                    assert mock_get_time.call_count == 10  # Max retries
-                    assert mock_conflict.call_count == 10
+        with patch(
+            "scheduler.manager.get_schedule_time_periods",
+            return_value={"evening": {"start_time": "18:00", "end_time": "20:00"}},
+        ), patch("scheduler.manager.schedule") as mock_schedule, patch.object(
+            scheduler_manager, "set_wake_timer"
+        ) as mock_wake:
+            # Test real behavior: function should log and schedule nothing
+            scheduler_manager.schedule_message_for_period(user_id, category, "morning")
+
+            mock_schedule.every.assert_not_called()
+            mock_wake.assert_not_called()
 @pytest.mark.tasks
 
 
@@ -745,3 +745,106 @@ class TestWebhookServerBehavior:
             assert DiscordWebhookHandler.bot_instance == bot_instance, "Should update handler bot instance"
         finally:
             server.stop()
+
+    @pytest.mark.behavior
+    @pytest.mark.communication
+    def test_do_post_defers_event_to_work_queue(self):
+        """Test: With a work queue attached, POST acknowledges and defers handling."""
+        event_data = {'type': 1, 'event': {'type': 'APPLICATION_AUTHORIZED', 'data': {}}}
+        body = json.dumps(event_data).encode('utf-8')
+        handler = create_mock_handler(
+            method='POST',
+            headers={
+                'Content-Length': str(len(body)),
+                'X-Signature-Ed25519': 'test_signature',
+                'X-Signature-Timestamp': '1234567890'
+            },
+            body=body
+        )
+        handler.work_queue = MagicMock()
+        handler.work_queue.submit.return_value = True
+
+        with patch('core.config.DISCORD_PUBLIC_KEY', None), \
+             patch('communication.communication_channels.discord.webhooks.server.handle_webhook_event') as mock_handle:
+            handler.do_POST()
+
+        # Assert: Acknowledged immediately; handler queued, not called inline
+        assert handler._response_code == 200, "Should acknowledge queued event"
+        assert not mock_handle.called, "Should not handle event on the request thread"
+        label, func, event_type, queued_data, _bot = handler.work_queue.submit.call_args[0]
+        assert label == 'APPLICATION_AUTHORIZED'
+        assert func is mock_handle
+        assert queued_data == event_data
+
+    @pytest.mark.behavior
+    @pytest.mark.communication
+    def test_do_post_returns_503_when_work_queue_full(self):
+        """Test: A full work queue answers 503 so Discord retries later."""
+        event_data = {'type': 1, 'event': {'type': 'APPLICATION_AUTHORIZED', 'data': {}}}
+        body = json.dumps(event_data).encode('utf-8')
+        handler = create_mock_handler(
+            method='POST',
+            headers={
+                'Content-Length': str(len(body)),
+                'X-Signature-Ed25519': 'test_signature',
+                'X-Signature-Timestamp': '1234567890'
+            },
+            body=body
+        )
+        handler.work_queue = MagicMock()
+        handler.work_queue.submit.return_value = False
+
+        with patch('core.config.DISCORD_PUBLIC_KEY', None):
+            handler.do_POST()
+
+        assert handler._response_code == 503, "Should reject when queue is full"
+        assert handler._headers_sent.get('Retry-After') == '1'
+
+    @pytest.mark.behavior
+    @pytest.mark.communication
+    @pytest.mark.slow
+    def test_slow_event_handler_does_not_block_acknowledgements(self):
+        """Test: Signed events are acknowledged while a slow handler is still running."""
+        from communication.communication_channels.discord.webhooks.load_test import (
+            build_sample_payloads,
+            replay_signed_payloads,
+        )
+        from nacl.signing import SigningKey
+
+        signing_key = SigningKey.generate()
+        handled = []
+
+        def slow_handler(event_type, event_data, bot_instance=None):
+            time.sleep(0.3)
+            handled.append(event_type)
+            return True
+
+        server = WebhookServer(
+            port=0,
+            host='127.0.0.1',
+            worker_count=4,
+            queue_size=20,
+            public_key=signing_key.verify_key.encode().hex(),
+            event_handler=slow_handler,
+        )
+        assert server.start() is True
+        try:
+            results = replay_signed_payloads(
+                f'http://127.0.0.1:{server.port}/',
+                signing_key,
+                build_sample_payloads(8),
+                concurrency=8,
+            )
+            assert server.work_queue is not None
+            assert server.work_queue.wait_until_idle(timeout=10)
+            metrics = server.get_metrics()
+        finally:
+            server.stop()
+
+        # Assert: all acknowledged well before 8 serial handler runs (2.4s) would finish
+        assert results['client']['status_counts'] == {'200': 8}
+        assert results['wall_seconds'] < 1.5
+        assert handled == ['APPLICATION_AUTHORIZED'] * 8
+        assert metrics['endpoints']['POST /']['count'] == 8
+        assert metrics['queue']['processed'] == 8
+        assert DiscordWebhookHandler.work_queue is None, "Stop should detach the work queue"
@@ -311,6 +311,16 @@ os.environ["MHM_TESTING"] = "1"
 os.environ["TEST_VERBOSE_LOGS"] = os.environ.get("TEST_VERBOSE_LOGS", "0")
 # Disable core app log rotation during tests to avoid Windows file-in-use issues
 os.environ["DISABLE_LOG_ROTATION"] = "1"
+# Mocked LM Studio failures would otherwise trip load shedding for later tests
+os.environ["AI_LOAD_SHEDDING_ENABLED"] = "false"
+# Scheduler tests plan real days; keep pre-generation from calling the model in the background
+os.environ["AI_PREGENERATION_ENABLED"] = "false"
+# Tests read chat_interactions.json right after storing; merge chat appends on write
+os.environ["CHAT_LOG_COMPACT_DELAY_SECONDS"] = "0"
+# Tests read user_index.json right after saves; apply index changes on write
+os.environ["USER_INDEX_FLUSH_DELAY_SECONDS"] = "0"
+# A developer's running dev-tools worker must not serve run_script calls that tests mock
+os.environ["MHM_DEV_TOOLS_WORKER"] = "0"
 
 # Force all log paths to tests/logs for absolute isolation, even if modules read env at import time
 tests_logs_dir = (Path(__file__).parent / "logs").resolve()
@@ -0,0 +1,147 @@
+"""Unit tests for analyze_core_benchmarks (baseline comparison and standard format)."""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from development_tools.tests import analyze_core_benchmarks as acb_mod
+
+_WORKLOAD = {"users": 2, "years": 0.1, "repeat": 1, "warmup": 0, "seed": 7}
+
+
+def _run_result(medians: dict[str, float], **extra) -> dict:
+    result = {
+        "workload": dict(_WORKLOAD),
+        "benchmarks": {
+            name: {"calls": 2, "median_ms": median, "p95_ms": median}
+            for name, median in medians.items()
+        },
+        "failed_checks": [],
+    }
+    result.update(extra)
+    return result
+
+
+def _compare(current: dict, baseline: dict | None) -> dict:
+    return acb_mod.compare_with_baseline(
+        current, baseline, regression_threshold_pct=25.0, min_regression_ms=0.5
+    )
+
+
+@pytest.mark.unit
+def test_compare_flags_regression_over_both_thresholds() -> None:
+    out = _compare(
+        _run_result({"search_entries": 10.0, "get_user_data_all": 2.0}),
+        _run_result({"search_entries": 5.0, "get_user_data_all": 1.0}),
+    )
+    assert out["summary"] == {"total_issues": 2, "files_affected": 0, "status": "FAIL"}
+    regressions = out["details"]["regressions"]
+    assert [r["benchmark"] for r in regressions] == ["search_entries", "get_user_data_all"]
+    assert regressions[0]["change_pct"] == 100.0
+    assert out["details"]["benchmarks"]["search_entries"]["status"] == "REGRESSED"
+
+
+@pytest.mark.unit
+def test_compare_ignores_small_absolute_or_relative_changes() -> None:
+    # +100% but only +0.2 ms, and +1 ms but only +10%
+    out = _compare(
+        _run_result({"get_user_id_by_identifier": 0.4, "get_recent_messages": 11.0}),
+        _run_result({"get_user_id_by_identifier": 0.2, "get_recent_messages": 10.0}),
+    )
+    assert out["summary"]["status"] == "PASS"
+    assert out["summary"]["total_issues"] == 0
+    statuses = {name: b["status"] for name, b in out["details"]["benchmarks"].items()}
+    assert statuses == {"get_user_id_by_identifier": "OK", "get_recent_messages": "OK"}
+
+
+@pytest.mark.unit
+def test_compare_marks_improvements_and_new_benchmarks() -> None:
+    out = _compare(
+        _run_result({"store_sent_message": 20.0, "new_path": 3.0}),
+        _run_result({"store_sent_message": 40.0}),
+    )
+    assert out["summary"]["status"] == "PASS"
+    benchmarks = out["details"]["benchmarks"]
+    assert benchmarks["store_sent_message"]["status"] == "IMPROVED"
+    assert benchmarks["new_path"]["status"] == "NEW"
+
+
+@pytest.mark.unit
+def test_compare_skips_baseline_recorded_with_other_workload() -> None:
+    baseline = _run_result({"search_entries": 1.0})
+    baseline["workload"]["users"] = 50
+    out = _compare(_run_result({"search_entries": 10.0}), baseline)
+    assert out["summary"]["status"] == "WARN"
+    assert out["summary"]["total_issues"] == 0
+    assert out["details"]["workload_mismatch"] is True
+
+
+@pytest.mark.unit
+def test_compare_warns_on_failed_sanity_checks() -> None:
+    current = _run_result({"search_entries": 1.0}, failed_checks=["search_entries"])
+    out = _compare(current, _run_result({"search_entries": 1.0}))
+    assert out["summary"]["status"] == "WARN"
+    assert out["details"]["failed_checks"] == ["search_entries"]
+
+
+@pytest.mark.unit
+def test_run_records_baseline_then_compares(monkeypatch, tmp_path: Path) -> None:
+    """A fake runner writes fixed timings; first run seeds the baseline, second compares."""
+    script = tmp_path / "fake_runner.py"
+    script.write_text(
+        "import json, sys\n"
+        "args = sys.argv[1:]\n"
+        "out = args[args.index('--output') + 1]\n"
+        "users = int(args[args.index('--users') + 1])\n"
+        "median = float(open(sys.argv[0] + '.median').read())\n"
+        "json.dump({'workload': {'users': users, 'years': 0.1, 'repeat': 1,\n"
+        "           'warmup': 0, 'seed': 7},\n"
+        "           'benchmarks': {'search_entries': {'median_ms': median}},\n"
+        "           'failed_checks': []}, open(out, 'w'))\n",
+        encoding="utf-8",
+    )
+    median_file = tmp_path / "fake_runner.py.median"
+    cfg = {
+        "command": [sys.executable, str(script)],
+        **_WORKLOAD,
+        "regression_threshold_pct": 25.0,
+        "min_regression_ms": 0.5,
+        "timeout_seconds": 60,
+        "baseline_file": "jsons/baseline.json",
+    }
+    monkeypatch.setattr(acb_mod.config, "get_core_benchmarks_config", lambda: dict(cfg))
+
+    median_file.write_text("4.0", encoding="utf-8")
+    first = acb_mod.run_core_benchmarks(tmp_path)
+    assert first["summary"]["status"] == "PASS"
+    assert first["details"]["baseline_recorded"] is True
+    baseline = json.loads((tmp_path / "jsons" / "baseline.json").read_text(encoding="utf-8"))
+    assert baseline["benchmarks"]["search_entries"]["median_ms"] == 4.0
+
+    median_file.write_text("8.0", encoding="utf-8")
+    second = acb_mod.run_core_benchmarks(tmp_path)
+    assert second["summary"]["status"] == "FAIL"
+    assert second["details"]["regressions"][0]["benchmark"] == "search_entries"
+    assert "baseline_recorded" not in second["details"]
+
+    updated = acb_mod.run_core_benchmarks(tmp_path, update_baseline=True)
+    assert updated["details"]["baseline_recorded"] is True
+    baseline = json.loads((tmp_path / "jsons" / "baseline.json").read_text(encoding="utf-8"))
+    assert baseline["benchmarks"]["search_entries"]["median_ms"] == 8.0
+
+
+@pytest.mark.unit
+def test_run_without_command_is_unavailable(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        acb_mod.config,
+        "get_core_benchmarks_config",
+        lambda: {"command": [], "baseline_file": "b.json"},
+    )
+    out = acb_mod.run_core_benchmarks(tmp_path)
+    assert out["summary"]["status"] == "WARN"
+    assert out["details"]["tool_available"] is False
+    assert not (tmp_path / "b.json").exists()
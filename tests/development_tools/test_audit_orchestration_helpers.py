@@ -345,7 +345,7 @@ def test_get_tier3_groups_runs_test_suite_and_keeps_coverage_out():
     assert legacy_names == ["analyze_legacy_references", "generate_legacy_reference_report"]
     static_names = [n for n, _ in static]
     assert "verify_process_cleanup" not in static_names
-    assert [n for n, _ in post_test] == ["verify_process_cleanup"]
+    assert [n for n, _ in post_test] == ["verify_process_cleanup", "analyze_core_benchmarks"]
     scheduled = {n for n, _ in tests + legacy + static + post_test}
     assert scheduled | set(TIER3_ORCHESTRATION_OMIT) == set(TIER3_TOOL_NAMES)
     assert "analyze_test_markers" in TIER3_ORCHESTRATION_OMIT
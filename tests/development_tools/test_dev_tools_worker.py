@@ -0,0 +1,85 @@
+"""Tests for the warm dev-tools worker and watch mode."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from development_tools.shared import dev_tools_watch, dev_tools_worker
+from development_tools.shared.dev_tools_worker import (
+    WORKER_ENV_FLAG,
+    read_worker_state,
+    run_via_worker,
+    start_worker,
+    stop_worker,
+)
+
+SCRIPT = """import os, sys
+sys.stdout.write("args=" + ",".join(sys.argv[1:]) + "\\n")
+sys.stdout.write("flag=" + os.environ.get("MHM_DEV_TOOLS_RUN", "") + "\\n")
+sys.stderr.write("oops\\n")
+sys.exit(int(sys.argv[1]) if len(sys.argv) > 1 else 0)
+"""
+
+
+@pytest.mark.unit
+def test_run_via_worker_returns_none_without_a_worker(tmp_path: Path, monkeypatch) -> None:
+    """No published worker means the caller keeps the subprocess path."""
+    monkeypatch.delenv(WORKER_ENV_FLAG, raising=False)
+    script = tmp_path / "tool.py"
+    script.write_text(SCRIPT, encoding="utf-8")
+
+    assert read_worker_state(tmp_path) is None
+    assert run_via_worker(tmp_path, "tool", script, [], env={}, timeout=30) is None
+
+
+@pytest.mark.unit
+def test_worker_runs_scripts_and_falls_back_when_disabled(tmp_path: Path, monkeypatch) -> None:
+    """A started worker returns run_script-shaped results; the env flag bypasses it."""
+    monkeypatch.delenv(WORKER_ENV_FLAG, raising=False)
+    script = tmp_path / "tool.py"
+    script.write_text(SCRIPT, encoding="utf-8")
+
+    status = start_worker(tmp_path)
+    try:
+        assert status is not None and status["project_root"] == str(tmp_path.resolve())
+        state_file = dev_tools_worker.worker_state_path(tmp_path)
+        assert state_file.stat().st_mode & 0o077 == 0
+
+        env = {"MHM_DEV_TOOLS_RUN": "1", "PATH": "/usr/bin"}
+        ok = run_via_worker(tmp_path, "tool", script, ["0", "x"], env=env, timeout=30)
+        assert ok == {
+            "success": True,
+            "output": "args=0,x\nflag=1\n",
+            "error": "oops\n",
+            "returncode": 0,
+        }
+        failed = run_via_worker(tmp_path, "tool", script, ["3"], env=env, timeout=30)
+        assert failed["success"] is False and failed["returncode"] == 3
+
+        monkeypatch.setenv(WORKER_ENV_FLAG, "0")
+        assert run_via_worker(tmp_path, "tool", script, [], env=env, timeout=30) is None
+    finally:
+        monkeypatch.delenv(WORKER_ENV_FLAG, raising=False)
+        assert stop_worker(tmp_path)
+
+
+@pytest.mark.unit
+def test_watch_maps_changes_to_affected_analyzers() -> None:
+    before = {"README.md": (10, 1), "core/service.py": (5, 1), "gone.py": (1, 1)}
+    after = {"README.md": (10, 1), "core/service.py": (6, 2), "new.md": (3, 1)}
+    assert dev_tools_watch.changed_paths(before, after) == ["core/service.py", "gone.py", "new.md"]
+
+    assert dev_tools_watch.affected_tools(["docs/GUIDE.md"]) == [
+        "analyze_documentation",
+        "analyze_documentation_sync",
+    ]
+    assert dev_tools_watch.affected_tools(["development_tools/config/development_tools_config.json"]) == [
+        "analyze_config"
+    ]
+    code_tools = dev_tools_watch.affected_tools(["development_tools/shared/common.py"])
+    assert code_tools[0] == "analyze_dev_tools_import_boundaries"
+    assert "analyze_documentation" not in code_tools
+    assert "analyze_dev_tools_import_boundaries" not in dev_tools_watch.affected_tools(["core/service.py"])
+    assert dev_tools_watch.affected_tools(["data/notes.json"]) == []
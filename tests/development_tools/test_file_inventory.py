@@ -0,0 +1,133 @@
+"""Tests for development_tools.shared.file_inventory."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from development_tools.shared.file_inventory import (
+    ProjectFileInventory,
+    get_project_inventory,
+    reset_project_inventories,
+)
+
+
+def _write(path: Path, text: str = "x = 1\n") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def _rel(paths) -> set[str]:
+    return {item.rel_path for item in paths}
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    _write(tmp_path / "run.py")
+    _write(tmp_path / "core" / "service.py")
+    _write(tmp_path / "core" / "README.md", "# Core\n")
+    _write(tmp_path / "core" / "__pycache__" / "service.cpython-312.pyc", "")
+    _write(tmp_path / "tests" / "unit" / "test_service.py")
+    _write(tmp_path / "tests" / "data" / "users" / "u1" / "stray.py")
+    reset_project_inventories()
+    yield tmp_path
+    reset_project_inventories()
+
+
+@pytest.mark.unit
+def test_walk_prunes_globally_excluded_dirs_and_filters_by_query(project: Path) -> None:
+    """Excluded trees are listed by name only; queries filter by extension, directory and context."""
+    inventory = get_project_inventory(project, use_cache=False)
+
+    assert _rel(inventory.iter_files(extensions=(".py",), tool_type="analysis")) == {
+        "run.py",
+        "core/service.py",
+        "tests/unit/test_service.py",
+    }
+    assert _rel(inventory.iter_files(extensions=(".md",))) == {"core/README.md"}
+    assert _rel(
+        inventory.iter_files(
+            extensions=(".py",), directories=["core", "tests"], context="production"
+        )
+    ) == {"core/service.py"}
+    assert _rel(inventory.iter_files(directories=[""], recursive=False)) == {"run.py"}
+
+    pycache_dirs = list(inventory.iter_dirs(name_contains="__pycache__"))
+    assert pycache_dirs == [inventory.project_root / "core" / "__pycache__"]
+    assert inventory.project_root / "tests" / "data" in set(inventory.iter_dirs())
+    assert "tests/data/users" not in inventory._dirs
+
+
+@pytest.mark.unit
+def test_later_runs_only_relist_changed_directories(project: Path) -> None:
+    """A persisted inventory is reused; only directories whose mtime changed are listed."""
+    first = get_project_inventory(project)
+    total_dirs = first.stats["listed_dirs"]
+    assert total_dirs > 0
+    cache_files = list(project.glob("development_tools/shared/jsons/**/.file_inventory_cache.json"))
+    assert len(cache_files) == 1
+
+    # The first save created development_tools/shared/; the next run settles
+    reset_project_inventories()
+    settled = get_project_inventory(project)
+    assert settled.stats["listed_dirs"] <= 3
+
+    reset_project_inventories()
+    _write(project / "core" / "new_module.py")
+    second = get_project_inventory(project)
+
+    assert second.stats["listed_dirs"] == 1
+    assert second.stats["listed_dirs"] + second.stats["reused_dirs"] >= total_dirs
+    assert "core/new_module.py" in _rel(second.iter_files(extensions=(".py",)))
+
+    os.remove(project / "core" / "new_module.py")
+    assert "core/new_module.py" not in _rel(
+        get_project_inventory(project).iter_files(extensions=(".py",))
+    )
+
+
+@pytest.mark.unit
+def test_exclusion_verdicts_are_memoized_per_tool(project: Path) -> None:
+    """Exclusion rules run once per path and tool type, not once per query."""
+    calls: list[tuple[str, str | None, str | None]] = []
+
+    def exclude(path, tool_type=None, context="development"):
+        calls.append((path, tool_type, context))
+        return path.endswith("run.py")
+
+    inventory = get_project_inventory(project, use_cache=False)
+    for _ in range(3):
+        files = _rel(inventory.iter_files(extensions=(".py",), tool_type="analysis", exclude=exclude))
+    assert "run.py" not in files
+    assert len(calls) == len(files) + 1
+
+    _rel(inventory.iter_files(extensions=(".py",), tool_type="documentation", exclude=exclude))
+    assert len(calls) == 2 * (len(files) + 1)
+
+
+@pytest.mark.unit
+def test_content_hash_is_cached_until_file_changes(project: Path, monkeypatch) -> None:
+    """Hashes are computed on demand and recomputed only when size/mtime change."""
+    inventory = ProjectFileInventory(project, use_cache=False).refresh()
+    target = project / "core" / "service.py"
+
+    first = inventory.content_hash("core/service.py")
+    assert first == inventory.content_hash(target)
+
+    reads: list[Path] = []
+    original_read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(self)
+        return original_read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+    assert inventory.content_hash(target) == first
+    assert reads == []
+
+    target.write_text("x = 2  # changed\n", encoding="utf-8")
+    assert inventory.content_hash(target) != first
+    assert len(reads) == 1
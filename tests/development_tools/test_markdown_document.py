@@ -0,0 +1,126 @@
+"""Tests for development_tools.docs.markdown_document."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from development_tools.docs import markdown_document
+from development_tools.docs.markdown_document import (
+    MarkdownDocument,
+    clear_markdown_document_memo,
+    load_markdown_document,
+)
+
+SAMPLE = """# Guide
+
+## 1. Setup
+
+See [the guide](docs/GUIDE.md) and ![logo](img/logo.png).
+
+### 1.1. Install
+
+```bash
+## not a heading outside this fence
+[skipped](inside/fence.md)
+```
+
+## 2. Examples
+
+Use `core/service.py` for the hook \u2014 here.
+
+## 3. Next
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    clear_markdown_document_memo()
+    yield
+    clear_markdown_document_memo()
+
+
+@pytest.mark.unit
+def test_model_exposes_heading_tree_fences_links_and_non_ascii() -> None:
+    doc = MarkdownDocument.from_text(SAMPLE)
+
+    outline = [(h.line, h.level, h.text, h.number, h.in_fence) for h in doc.headings]
+    assert outline == [
+        (1, 1, "Guide", None, False),
+        (3, 2, "1. Setup", "1", False),
+        (7, 3, "1.1. Install", "1.1", False),
+        (10, 2, "not a heading outside this fence", None, True),
+        (14, 2, "2. Examples", "2", False),
+        (18, 2, "3. Next", "3", False),
+    ]
+    assert doc.headings[2].parent == 1
+    assert doc.headings[1].parent == 0
+
+    assert doc.fenced_regions == [(9, 12)]
+    assert doc.in_fence(9) and doc.in_fence(11) and not doc.in_fence(12)
+    assert doc.in_code(12) and not doc.in_code(13)
+
+    assert [(link.line, link.label, link.href, link.image) for link in doc.links] == [
+        (5, "the guide", "docs/GUIDE.md", False),
+        (5, "logo", "img/logo.png", True),
+    ]
+    assert [(r.opener_line, r.kind, r.start, r.end) for r in doc.example_regions] == [
+        (14, "heading", 15, 18)
+    ]
+    assert doc.non_ascii == {"\u2014": 1}
+
+
+@pytest.mark.unit
+def test_persisted_model_is_reused_across_processes(tmp_path: Path, monkeypatch) -> None:
+    """A second process loads the stored model instead of parsing the file again."""
+    doc_path = tmp_path / "README.md"
+    doc_path.write_text(SAMPLE, encoding="utf-8")
+    first = load_markdown_document(doc_path, tmp_path)
+    stored = list(tmp_path.glob("development_tools/docs/jsons/**/.markdown_documents/*.json"))
+    assert len(stored) == 1
+
+    clear_markdown_document_memo()  # as in a fresh analyzer process
+    parses: list[str] = []
+    original = MarkdownDocument.from_text.__func__
+
+    def counting_from_text(cls, text):
+        parses.append(text)
+        return original(cls, text)
+
+    monkeypatch.setattr(MarkdownDocument, "from_text", classmethod(counting_from_text))
+    second = load_markdown_document(doc_path, tmp_path)
+    assert parses == []
+    assert second.headings == first.headings
+    assert second.links == first.links
+
+    # Touched but unchanged content: matched by hash, still no parse
+    stat = doc_path.stat()
+    os.utime(doc_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    clear_markdown_document_memo()
+    load_markdown_document(doc_path, tmp_path)
+    assert parses == []
+
+    doc_path.write_text(SAMPLE + "\n## 4. More\n", encoding="utf-8")
+    changed = load_markdown_document(doc_path, tmp_path)
+    assert len(parses) == 1
+    assert changed.headings[-1].text == "4. More"
+
+
+@pytest.mark.unit
+def test_in_process_memo_skips_reads_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    doc_path = tmp_path / "GUIDE.md"
+    doc_path.write_text("## 1. One\n", encoding="utf-8")
+    first = load_markdown_document(doc_path, use_cache=False)
+
+    def failing_open(*_args, **_kwargs):
+        raise AssertionError("memoized document should not be re-read")
+
+    monkeypatch.setattr(markdown_document, "open", failing_open, raising=False)
+    assert load_markdown_document(doc_path, use_cache=False) is first
+    monkeypatch.undo()
+
+    doc_path.write_text("## 1. One\n## 2. Two\n", encoding="utf-8")
+    assert [h.text for h in load_markdown_document(doc_path).headings] == ["1. One", "2. Two"]
+    assert not list(tmp_path.glob("development_tools/**/*.json"))
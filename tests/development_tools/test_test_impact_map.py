@@ -0,0 +1,151 @@
+"""Tests for development_tools.tests.test_impact_map."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from development_tools.tests.test_impact_map import (
+    TestImpactMap,
+    _fingerprint as fingerprint_of,
+    select_impacted_tests,
+    update_impact_map_from_coverage,
+)
+
+CALC = """RATE = 2
+
+
+def double(x):
+    return x * RATE
+
+
+def triple(x):
+    return x * 3
+"""
+DOUBLE = "tests/unit/test_calc.py::test_double"
+TRIPLE = "tests/unit/test_calc.py::test_triple"
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    _write(tmp_path / "core" / "calc.py", CALC)
+    _write(tmp_path / "tests" / "unit" / "test_calc.py", "def test_double():\n    pass\n")
+    _write(tmp_path / "tests" / "unit" / "test_other.py", "def test_other():\n    pass\n")
+    _write(tmp_path / "tests" / "test_helpers" / "builders.py", "X = 1\n")
+    _write(tmp_path / "pytest.ini", "[pytest]\n")
+    return tmp_path
+
+
+def _record_map(project: Path) -> TestImpactMap:
+    """A map as a coverage run of test_double/test_triple would record it."""
+    impact_map = TestImpactMap(project)
+    impact_map.tests = [DOUBLE, TRIPLE]
+    impact_map.sources = {
+        "core/calc.py": {
+            **fingerprint_of(project / "core" / "calc.py"),
+            "sets": [[0], [1]],
+            "lines": {"5": 0, "9": 1},
+            "import_lines": [1, 4, 8],
+            "module_tests": [0, 1],
+        }
+    }
+    impact_map.test_files = {
+        rel: fingerprint_of(project / rel)
+        for rel in (
+            "tests/unit/test_calc.py",
+            "tests/unit/test_other.py",
+            "tests/test_helpers/builders.py",
+            "pytest.ini",
+        )
+    }
+    impact_map.save()
+    return impact_map
+
+
+@pytest.mark.unit
+def test_selects_tests_that_executed_changed_lines(project: Path) -> None:
+    """Body edits select the tests that ran them; module-level edits select every test of the module."""
+    assert select_impacted_tests(project).full_run  # no map recorded yet
+    _record_map(project)
+    calc = project / "core" / "calc.py"
+
+    unchanged = select_impacted_tests(project)
+    assert not unchanged.full_run and unchanged.pytest_args() == []
+
+    calc.write_text(CALC.replace("x * 3", "x + x + x"), encoding="utf-8")
+    body_edit = select_impacted_tests(project)
+    assert body_edit.changed_files == ["core/calc.py"]
+    assert body_edit.pytest_args() == [TRIPLE]
+
+    calc.write_text(CALC.replace("RATE = 2", "RATE = 3"), encoding="utf-8")
+    assert select_impacted_tests(project).tests == [DOUBLE, TRIPLE]
+
+    calc.write_text(CALC.replace("RATE = 2\n\n", "RATE = 2\n# rate note\n"), encoding="utf-8")
+    assert select_impacted_tests(project).tests == []  # no test executes a comment
+
+
+@pytest.mark.unit
+def test_test_file_new_source_and_helper_changes(project: Path) -> None:
+    _record_map(project)
+
+    _write(project / "tests" / "unit" / "test_other.py", "def test_other():\n    assert 1\n")
+    changed_test = select_impacted_tests(project)
+    assert changed_test.test_files == ["tests/unit/test_other.py"]
+    assert changed_test.pytest_args() == ["tests/unit/test_other.py"]
+
+    _write(project / "zzz_script.py", "VALUE = 'new'\n")
+    assert select_impacted_tests(project).full_run  # outside every test domain
+    (project / "zzz_script.py").unlink()
+
+    _write(project / "tests" / "test_helpers" / "builders.py", "X = 2\n")
+    helper_change = select_impacted_tests(project)
+    assert helper_change.full_run
+    assert helper_change.changed_files == ["tests/test_helpers/builders.py"]
+
+
+@pytest.mark.unit
+def test_map_is_built_and_merged_from_coverage_contexts(project: Path) -> None:
+    """Full runs replace the map; partial runs replace only the rerun tests' entries."""
+    coverage = pytest.importorskip("coverage")
+    calc = str((project / "core" / "calc.py").resolve())
+
+    def write_data(name: str, contexts: dict[str, list[int]]) -> Path:
+        data = coverage.CoverageData(basename=str(project / name))
+        for context, lines in contexts.items():
+            data.set_context(context)
+            data.add_lines({calc: lines})
+        data.write()
+        return project / name
+
+    full = write_data(
+        ".coverage_full",
+        {"": [1, 4, 8], f"{DOUBLE}|run": [5], f"{TRIPLE}|setup": [], f"{TRIPLE}|run": [9]},
+    )
+    assert update_impact_map_from_coverage(project, full, full_run=True) == 2
+    recorded = TestImpactMap.load(project)
+    entry = recorded.sources["core/calc.py"]
+    assert recorded.tests == [DOUBLE, TRIPLE]
+    assert entry["import_lines"] == [1, 4, 8]
+    assert {line: recorded.tests[entry["sets"][idx][0]] for line, idx in entry["lines"].items()} == {
+        "5": DOUBLE,
+        "9": TRIPLE,
+    }
+    assert "tests/unit/test_calc.py" in recorded.test_files
+
+    # test_triple now also calls double(); test_double did not rerun
+    partial = write_data(".coverage_partial", {f"{TRIPLE}|run": [5, 9]})
+    assert update_impact_map_from_coverage(project, partial, full_run=False) == 1
+    merged = TestImpactMap.load(project)
+    entry = merged.sources["core/calc.py"]
+    line5 = {merged.tests[i] for i in entry["sets"][entry["lines"]["5"]]}
+    assert line5 == {DOUBLE, TRIPLE}
+    assert "stale" not in entry
@@ -0,0 +1,206 @@
+"""Google Health sync engine against a local fake API server."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from core.time_utilities import now_datetime_utc
+from integrations.google_health import client
+from integrations.google_health.client import fetch_daily_summaries
+from integrations.google_health.sync_manager import sync_all_enabled_users
+
+pytestmark = [pytest.mark.integration, pytest.mark.integrations]
+
+_LATENCY_SECONDS = 0.2
+
+
+class _FakeHealthApi:
+    """Serves list and dailyRollUp calls with fixed latency; can answer 429 first."""
+
+    def __init__(self):
+        self.requests: list[dict] = []
+        self.rate_limit_once: dict[str, str] = {}
+        self._lock = threading.Lock()
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                return
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                days = re.findall(r'>= "(\d{4}-\d{2}-\d{2})', query.get("filter", [""])[0])
+                api._respond(self, parsed.path, days[0] if days else None)
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                start = body["range"]["start"]["date"]
+                api._respond(
+                    self,
+                    urlparse(self.path).path,
+                    f"{start['year']:04d}-{start['month']:02d}-{start['day']:02d}",
+                )
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _respond(self, handler, path: str, start_day: str | None) -> None:
+        endpoint = path.split("/dataTypes/")[1].split("/")[0]
+        with self._lock:
+            self.requests.append({"endpoint": endpoint, "start": start_day})
+            retry_after = self.rate_limit_once.pop(endpoint, None)
+        time.sleep(_LATENCY_SECONDS)
+        if retry_after is not None:
+            handler.send_response(429)
+            handler.send_header("Retry-After", retry_after)
+            handler.end_headers()
+            return
+        payload = json.dumps(_points_for(endpoint, start_day)).encode()
+        handler.send_response(200)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def starts_for(self, endpoint: str) -> list[str | None]:
+        return [item["start"] for item in self.requests if item["endpoint"] == endpoint]
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _points_for(endpoint: str, start_day: str | None) -> dict:
+    today = now_datetime_utc().date()
+    day = date.fromisoformat(start_day) if start_day else today
+    points = []
+    while day <= today:
+        civil = {"year": day.year, "month": day.month, "day": day.day}
+        if endpoint == "sleep":
+            points.append(
+                {
+                    "name": f"sleep-{day}",
+                    "sleep": {
+                        "interval": {"startTime": f"{day}T00:00:00Z"},
+                        "duration": "25200s",
+                    },
+                }
+            )
+        elif endpoint == "steps":
+            points.append({"civilStartTime": {"date": civil}, "steps": {"countSum": "8000"}})
+        elif endpoint == "active-zone-minutes":
+            points.append(
+                {"civilStartTime": {"date": civil}, "activeZoneMinutes": {"sumInCardioHeartZone": 30}}
+            )
+        elif endpoint == "daily-resting-heart-rate":
+            points.append({"dailyRestingHeartRate": {"date": civil, "beatsPerMinute": 60}})
+        elif endpoint == "daily-heart-rate-variability":
+            points.append(
+                {
+                    "dailyHeartRateVariability": {
+                        "date": civil,
+                        "averageHeartRateVariabilityMilliseconds": 40,
+                    }
+                }
+            )
+        day += timedelta(days=1)
+    key = "rollupDataPoints" if endpoint in ("steps", "active-zone-minutes") else "dataPoints"
+    return {key: points}
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    monkeypatch.setenv("MHM_TESTING", "0")
+    api = _FakeHealthApi()
+    with (
+        patch.object(client, "GOOGLE_HEALTH_API_BASE_URL", api.base_url),
+        patch.object(client, "_rate_limit_gate", client._RateLimitGate()),
+    ):
+        yield api
+    api.close()
+
+
+def test_data_types_are_fetched_concurrently(fake_api):
+    started = time.monotonic()
+    summaries = fetch_daily_summaries("token", lookback_days=2)
+    elapsed = time.monotonic() - started
+
+    assert len(fake_api.requests) == 5
+    # Five serial requests would take 5 x latency
+    assert elapsed < 3 * _LATENCY_SECONDS
+    latest = summaries[-1]
+    assert latest["steps"] == 8000
+    assert latest["active_minutes"] == 30
+    assert latest["resting_hr_bpm"] == 60.0
+    assert latest["hrv_rmssd_ms"] == 40.0
+    assert latest["sleep_duration_minutes"] == 420
+
+
+def test_high_water_marks_narrow_each_type_window(fake_api):
+    today = now_datetime_utc().date()
+    fetch_daily_summaries(
+        "token",
+        lookback_days=10,
+        since={"steps": today.isoformat(), "daily-resting-heart-rate": "2000-01-01"},
+    )
+
+    window_start = today - timedelta(days=10)
+    assert fake_api.starts_for("steps") == [(today - timedelta(days=1)).isoformat()]
+    # A mark older than the lookback window does not widen it
+    assert fake_api.starts_for("daily-resting-heart-rate") == [window_start.isoformat()]
+
+
+def test_rate_limited_type_waits_out_retry_after(fake_api):
+    fake_api.rate_limit_once["steps"] = "1"
+    started = time.monotonic()
+    summaries = fetch_daily_summaries("token", lookback_days=1)
+
+    assert len(fake_api.starts_for("steps")) == 2
+    assert time.monotonic() - started >= 1.0
+    assert summaries[-1]["steps"] == 8000
+
+
+def test_retry_after_beyond_budget_skips_only_that_type(fake_api):
+    fake_api.rate_limit_once["daily-heart-rate-variability"] = "3600"
+    with patch.object(client, "GOOGLE_HEALTH_RATE_LIMIT_MAX_WAIT_SECONDS", 1):
+        summaries = fetch_daily_summaries("token", lookback_days=1)
+
+    assert summaries[-1]["steps"] == 8000
+    assert all(item.get("hrv_rmssd_ms") is None for item in summaries)
+
+
+def test_users_sync_in_parallel():
+    def _slow_sync(user_id, scheduled_slot_key=None):
+        time.sleep(_LATENCY_SECONDS)
+        return True
+
+    users = [f"user-{index}" for index in range(8)]
+    with (
+        patch("integrations.google_health.sync_manager.GOOGLE_HEALTH_ENABLED", True),
+        patch(
+            "integrations.google_health.sync_manager.is_google_health_testing_mode",
+            return_value=False,
+        ),
+        patch("integrations.google_health.sync_manager.get_all_user_ids", return_value=users),
+        patch("integrations.google_health.sync_manager.GOOGLE_HEALTH_SYNC_CONCURRENCY", 4),
+        patch(
+            "integrations.google_health.sync_manager.sync_user_health_data",
+            side_effect=_slow_sync,
+        ),
+    ):
+        started = time.monotonic()
+        assert sync_all_enabled_users() == len(users)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 4 * _LATENCY_SECONDS
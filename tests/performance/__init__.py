@@ -0,0 +1,8 @@
+"""
+Core-path performance benchmarks.
+
+``synthetic_population`` builds users with multi-year histories in the active
+data directory; ``core_path_benchmarks`` times the runtime hot paths against
+them. Run ``python -m tests.performance.core_path_benchmarks --help``; audits
+run it through ``development_tools/tests/analyze_core_benchmarks.py``.
+"""
@@ -0,0 +1,371 @@
+"""
+Core-path benchmarks over a synthetic user population.
+
+Times the runtime hot paths (user data loads, AI context assembly, check-in
+analytics, message history, notebook search, command parsing, identifier
+lookup and scheduling) against users generated by ``synthetic_population``.
+Each benchmark runs ``warmup`` untimed passes and then ``repeat`` timed passes
+over every user; results report per-call median/p95/min/mean milliseconds.
+
+Run from the project root:
+
+    python -m tests.performance.core_path_benchmarks --users 20 --json
+
+The population is written to a throwaway data directory under ``tests/data``
+and the workload runs in a child process whose environment points
+``TEST_DATA_DIR``/``LOGS_DIR`` there, so real user data is never touched.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+RESULT_SCHEMA_VERSION = 1
+DEFAULT_USERS = 20
+DEFAULT_YEARS = 2.0
+DEFAULT_REPEAT = 5
+DEFAULT_WARMUP = 1
+DEFAULT_SEED = 1337
+
+# Benchmark names in report order; analyze_core_benchmarks compares by name
+BENCHMARK_NAMES = [
+    "get_user_data_all",
+    "build_ai_context_envelope",
+    "get_wellness_score",
+    "store_sent_message",
+    "get_recent_messages",
+    "search_entries",
+    "command_parser_parse",
+    "get_user_id_by_identifier",
+    "schedule_all_users_immediately",
+]
+
+# Messages the rule-based parser handles without an AI call
+PARSER_MESSAGES = [
+    "show my tasks",
+    "add task call the dentist tomorrow",
+    "start checkin",
+    "show my profile",
+    "what's my schedule",
+    "help",
+    "show analytics",
+    "list my notes",
+]
+
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_WORKER_FLAG = "--worker"
+
+
+class _NoopDelivery:
+    """Scheduler delivery port that never sends (scheduling only registers jobs)"""
+
+    def handle_message_sending(self, user_id, category, **kwargs):
+        return None
+
+    def handle_task_reminder(self, user_id, task_identifier):
+        return None
+
+
+def _summarize(samples_ms: list[float]) -> dict[str, Any]:
+    ordered = sorted(samples_ms)
+    p95_index = max(0, int(round(0.95 * len(ordered))) - 1)
+    return {
+        "calls": len(ordered),
+        "median_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(ordered[p95_index], 4),
+        "min_ms": round(ordered[0], 4),
+        "mean_ms": round(statistics.fmean(ordered), 4),
+    }
+
+
+def _time_calls(
+    calls: list[Callable[[], Any]],
+    repeat: int,
+    warmup: int,
+    before: Callable[[], None] | None = None,
+) -> list[float]:
+    """Run every call ``warmup`` times untimed, then ``repeat`` times timed."""
+    samples: list[float] = []
+    for pass_index in range(warmup + repeat):
+        for call in calls:
+            if before is not None:
+                before()
+            started = time.perf_counter()
+            call()
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            if pass_index >= warmup:
+                samples.append(elapsed_ms)
+    return samples
+
+
+def run_core_benchmarks(
+    users: int = DEFAULT_USERS,
+    years: float = DEFAULT_YEARS,
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+    seed: int = DEFAULT_SEED,
+) -> dict[str, Any]:
+    """
+    Generate a population in the active data dir and time every core path.
+
+    Must run with ``MHM_TESTING=1`` and ``TEST_DATA_DIR`` pointing at a
+    throwaway directory (``main`` arranges this in a child process).
+
+    Returns:
+        dict: Workload parameters, population sizes, per-benchmark timings and
+        any benchmark whose result failed its sanity check
+    """
+    import schedule
+
+    from ai.context.service import build_ai_context_envelope
+    from checkins.checkin_analytics import CheckinAnalytics
+    from communication.message_processing.command_parser import (
+        EnhancedCommandParser,
+    )
+    from core import get_user_data
+    from core.user_lookup import get_user_id_by_identifier
+    from messages.message_data_manager import get_recent_messages, store_sent_message
+    from notebook.notebook_data_manager import search_entries
+    from scheduler.manager import SchedulerManager
+    from tests.performance.synthetic_population import SEARCH_TERM, generate_population
+
+    started = time.perf_counter()
+    population = generate_population(users, years=years, seed=seed)
+    setup_seconds = time.perf_counter() - started
+
+    analytics = CheckinAnalytics()
+    parser = EnhancedCommandParser()
+    scheduler = SchedulerManager(_NoopDelivery())
+    user_ids = [user.user_id for user in population]
+    identifiers = [
+        identifier
+        for user in population
+        for identifier in (user.internal_username, user.email, user.discord_user_id)
+    ]
+    stored_ids = iter(range(10**9))
+
+    def envelope_text(user_id: str) -> str:
+        envelope = build_ai_context_envelope(
+            user_id, active_channel="discord", prompt_request="how am I doing?"
+        )
+        return envelope.to_prompt_text() if envelope else ""
+
+    cases: dict[str, dict[str, Any]] = {
+        "get_user_data_all": {
+            "calls": [lambda u=u: get_user_data(u, "all") for u in user_ids],
+            "check": lambda: bool(get_user_data(user_ids[0], "all").get("account")),
+        },
+        "build_ai_context_envelope": {
+            "calls": [lambda u=u: envelope_text(u) for u in user_ids],
+            "check": lambda: bool(envelope_text(user_ids[0])),
+        },
+        "get_wellness_score": {
+            "calls": [
+                lambda u=u: analytics.get_wellness_score(u, days=30) for u in user_ids
+            ],
+            "check": lambda: "error"
+            not in analytics.get_wellness_score(user_ids[0], days=30),
+        },
+        "store_sent_message": {
+            "calls": [
+                lambda u=u: store_sent_message(
+                    u,
+                    "motivational",
+                    f"bench-{next(stored_ids)}",
+                    "Benchmark delivery text.",
+                    time_period="morning",
+                )
+                for u in user_ids
+            ],
+            "check": lambda: store_sent_message(
+                user_ids[0], "motivational", "bench-check", "Benchmark check."
+            ),
+        },
+        "get_recent_messages": {
+            "calls": [lambda u=u: get_recent_messages(u, limit=10) for u in user_ids],
+            "check": lambda: len(get_recent_messages(user_ids[0], limit=10)) == 10,
+        },
+        "search_entries": {
+            "calls": [lambda u=u: search_entries(u, SEARCH_TERM) for u in user_ids],
+            "check": lambda: any(search_entries(u, SEARCH_TERM) for u in user_ids),
+        },
+        "command_parser_parse": {
+            "calls": [
+                lambda u=u, m=m: parser.parse(m, u)
+                for u in user_ids
+                for m in PARSER_MESSAGES
+            ],
+            "check": lambda: parser.parse("show my tasks", user_ids[0]) is not None,
+        },
+        "get_user_id_by_identifier": {
+            "calls": [
+                lambda i=i: get_user_id_by_identifier(i) for i in identifiers
+            ],
+            "check": lambda: get_user_id_by_identifier(population[-1].email)
+            == user_ids[-1],
+        },
+        "schedule_all_users_immediately": {
+            "calls": [scheduler.schedule_all_users_immediately],
+            "before": schedule.clear,
+            "check": lambda: bool(schedule.get_jobs()),
+        },
+    }
+
+    benchmarks: dict[str, dict[str, Any]] = {}
+    failed_checks: list[str] = []
+    for name in BENCHMARK_NAMES:
+        case = cases[name]
+        samples = _time_calls(case["calls"], repeat, warmup, case.get("before"))
+        benchmarks[name] = _summarize(samples)
+        try:
+            if not case["check"]():
+                failed_checks.append(name)
+        except Exception:
+            failed_checks.append(name)
+    schedule.clear()
+
+    rows: dict[str, int] = {}
+    for user in population:
+        for key, count in user.counts.items():
+            rows[key] = rows.get(key, 0) + count
+
+    return {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "workload": {
+            "users": users,
+            "years": years,
+            "repeat": repeat,
+            "warmup": warmup,
+            "seed": seed,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "population": {"setup_seconds": round(setup_seconds, 3), "rows": rows},
+        "benchmarks": benchmarks,
+        "failed_checks": failed_checks,
+    }
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time core runtime paths against a synthetic user population."
+    )
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS)
+    parser.add_argument("--years", type=float, default=DEFAULT_YEARS)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--output", help="Write the result JSON to this file")
+    parser.add_argument(
+        "--json", action="store_true", help="Write the result JSON to stdout"
+    )
+    parser.add_argument(
+        "--keep-data",
+        action="store_true",
+        help="Keep the generated data directory for inspection",
+    )
+    parser.add_argument(_WORKER_FLAG, dest="worker_output", help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def _run_worker(args: argparse.Namespace) -> int:
+    result = run_core_benchmarks(
+        users=args.users,
+        years=args.years,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        seed=args.seed,
+    )
+    Path(args.worker_output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0
+
+
+def _format_table(result: dict[str, Any]) -> str:
+    workload = result["workload"]
+    lines = [
+        f"Core-path benchmarks: {workload['users']} users, {workload['years']} years, "
+        f"{workload['repeat']} passes (setup {result['population']['setup_seconds']}s)",
+        f"{'benchmark':34} {'calls':>6} {'median ms':>10} {'p95 ms':>10} {'min ms':>10}",
+    ]
+    for name, stats in result["benchmarks"].items():
+        lines.append(
+            f"{name:34} {stats['calls']:>6} {stats['median_ms']:>10.3f} "
+            f"{stats['p95_ms']:>10.3f} {stats['min_ms']:>10.3f}"
+        )
+    if result.get("failed_checks"):
+        lines.append(f"Failed sanity checks: {', '.join(result['failed_checks'])}")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks in an isolated child process and report the result."""
+    args = _parse_args(argv)
+    if args.worker_output:
+        return _run_worker(args)
+
+    scratch_root = _PROJECT_ROOT / "tests" / "data"
+    scratch_root.mkdir(parents=True, exist_ok=True)
+    data_dir = Path(tempfile.mkdtemp(prefix="core_benchmarks_", dir=scratch_root))
+    result_file = data_dir / "result.json"
+    env = {
+        **os.environ,
+        "MHM_TESTING": "1",
+        "TEST_DATA_DIR": str(data_dir / "data"),
+        "LOGS_DIR": str(data_dir / "logs"),
+        "MHM_TEST_USER_SNAPSHOTS": "0",
+    }
+    worker_args = [
+        "--users",
+        str(args.users),
+        "--years",
+        str(args.years),
+        "--repeat",
+        str(args.repeat),
+        "--warmup",
+        str(args.warmup),
+        "--seed",
+        str(args.seed),
+        _WORKER_FLAG,
+        str(result_file),
+    ]
+    try:
+        completed = subprocess.run(
+            [sys.executable, "-m", "tests.performance.core_path_benchmarks", *worker_args],
+            cwd=str(_PROJECT_ROOT),
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0 or not result_file.exists():
+            sys.stderr.write(completed.stderr[-4000:])
+            sys.stderr.write("Core-path benchmark worker failed\n")
+            return completed.returncode or 1
+        result = json.loads(result_file.read_text(encoding="utf-8"))
+    finally:
+        if not args.keep_data:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+    if args.json:
+        sys.stdout.write(json.dumps(result, indent=2) + "\n")
+    else:
+        sys.stdout.write(_format_table(result))
+    return 1 if result.get("failed_checks") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+"""
+Synthetic user populations for the core-path benchmarks.
+
+Users are created through ``create_new_user``; their histories (check-ins, sent
+deliveries, chat interactions, notebook entries and tasks) are built in memory
+with the domain record shapes and written once per document, so generating
+years of history does not pay the per-append cost the benchmarks measure.
+Everything except the wall-clock anchor is derived from ``seed``.
+"""
+
+import random
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any
+
+from core.time_utilities import TIMESTAMP_FULL, format_timestamp, now_datetime_full
+
+CATEGORIES = ["motivational", "health", "fun_facts", "word_of_the_day"]
+TIME_PERIODS = ["morning", "afternoon", "evening"]
+NOTEBOOK_TAGS = ["work", "home", "health", "ideas", "family", "reading"]
+TASK_PRIORITIES = ["low", "medium", "high"]
+# Notebook searches in the benchmarks look for this word; roughly one entry in
+# twelve contains it
+SEARCH_TERM = "garden"
+_WORDS = (
+    "today felt calm busy slow bright heavy walk water coffee friend call "
+    "plan rest stretch read sleep early late work project garden kitchen "
+    "laundry music notes appointment doctor medicine lunch dinner breakfast "
+    "focus energy tired better worse steady small win goal week weekend"
+).split()
+
+
+@dataclass
+class SyntheticUser:
+    """Identity and history sizes of one generated user"""
+
+    user_id: str
+    internal_username: str
+    email: str
+    discord_user_id: str
+    counts: dict[str, int] = field(default_factory=dict)
+
+
+def generate_population(
+    users: int, years: float = 2.0, seed: int = 1337
+) -> list[SyntheticUser]:
+    """
+    Create ``users`` users with ``years`` of history in the active data dir.
+
+    Args:
+        users: Number of users to create
+        years: Length of each user's history (fractions allowed)
+        seed: Seed for every generated value except the wall-clock anchor
+
+    Returns:
+        list[SyntheticUser]: The created users, in creation order
+    """
+    rng = random.Random(seed)
+    anchor = now_datetime_full().replace(microsecond=0)
+    days = max(1, int(round(years * 365)))
+    population = []
+    for index in range(users):
+        user = _create_user(index, rng)
+        user.counts = _write_history(user.user_id, rng, anchor, days)
+        population.append(user)
+    return population
+
+
+def _create_user(index: int, rng: random.Random) -> SyntheticUser:
+    from core.user_management import create_new_user
+
+    internal_username = f"bench-user-{index:04d}"
+    email = f"bench.user{index:04d}@example.com"
+    discord_user_id = str(100000000000000000 + index)
+    categories = rng.sample(CATEGORIES, k=rng.randint(2, len(CATEGORIES)))
+    user_id = create_new_user(
+        {
+            "internal_username": internal_username,
+            "email": email,
+            "discord_user_id": discord_user_id,
+            "channel": {"type": "discord"},
+            "timezone": "America/New_York",
+            "preferred_name": f"Bench {index}",
+            "categories": categories,
+            "messages_enabled": True,
+            "checkin_settings": {"enabled": True},
+            "task_settings": {"enabled": True},
+            "interests": rng.sample(_WORDS, k=3),
+            "goals": [_sentence(rng, 4)],
+        }
+    )
+    if not user_id:
+        raise RuntimeError(f"Could not create synthetic user {internal_username}")
+    return SyntheticUser(user_id, internal_username, email, discord_user_id)
+
+
+def _write_history(
+    user_id: str, rng: random.Random, anchor: datetime, days: int
+) -> dict[str, int]:
+    """Write every history document for one user; return row counts."""
+    start = anchor - timedelta(days=days)
+    day_starts = [start + timedelta(days=offset) for offset in range(1, days + 1)]
+    return {
+        "checkins": _write_checkins(user_id, rng, day_starts),
+        "sent_messages": _write_sent_messages(user_id, rng, day_starts),
+        "chat_interactions": _write_chat_interactions(user_id, rng, day_starts),
+        "notebook_entries": _write_notebook_entries(user_id, rng, day_starts),
+        "tasks": _write_tasks(user_id, rng, day_starts, anchor),
+    }
+
+
+def _write_checkins(user_id: str, rng: random.Random, day_starts: list[datetime]) -> int:
+    from checkins.checkin_data_manager import _build_v2_checkin_from_response_payload
+    from core.file_operations import get_user_file_path, save_json_data
+    from storage.user_data_v2_base import SCHEMA_VERSION
+
+    checkins = []
+    for day in day_starts:
+        if rng.random() > 0.85:
+            continue
+        responses: dict[str, Any] = {
+            "mood": rng.randint(1, 5),
+            "energy": rng.randint(1, 5),
+            "stress_level": rng.randint(1, 5),
+            "sleep_quality": rng.randint(1, 5),
+            "ate_breakfast": rng.random() < 0.7,
+            "brushed_teeth": rng.random() < 0.9,
+            "medication_taken": rng.random() < 0.8,
+            "exercise": rng.random() < 0.4,
+            "hydration": rng.random() < 0.6,
+        }
+        if rng.random() < 0.3:
+            responses["daily_reflection"] = _sentence(rng, 12)
+        checkins.append(
+            _build_v2_checkin_from_response_payload(
+                {
+                    "submitted_at": _ts(day, rng, 19, 22),
+                    "responses": responses,
+                    "source": {"system": "mhm", "channel": "discord", "actor": "user"},
+                }
+            )
+        )
+    save_json_data(
+        {
+            "schema_version": SCHEMA_VERSION,
+            "updated_at": _ts(day_starts[-1], rng, 22, 23),
+            "checkins": checkins,
+        },
+        get_user_file_path(user_id, "checkins"),
+    )
+    return len(checkins)
+
+
+def _write_sent_messages(
+    user_id: str, rng: random.Random, day_starts: list[datetime]
+) -> int:
+    from core.file_operations import get_user_file_path, save_json_data
+    from storage.user_data_v2_base import SCHEMA_VERSION
+
+    deliveries = []
+    for day in day_starts:
+        for period_index, period in enumerate(TIME_PERIODS):
+            if rng.random() > 0.8:
+                continue
+            category = rng.choice(CATEGORIES)
+            hour = 8 + period_index * 5
+            deliveries.append(
+                {
+                    "id": _uuid(rng),
+                    "message_template_id": _uuid(rng),
+                    "sent_text": _sentence(rng, rng.randint(8, 25)),
+                    "category": category,
+                    "channel": "discord",
+                    "status": "sent",
+                    "source": {"system": "mhm", "channel": "discord", "actor": "scheduler"},
+                    "sent_at": _ts(day, rng, hour, hour + 3),
+                    "time_period": period,
+                    "metadata": {},
+                }
+            )
+    # store_sent_message keeps the newest delivery first
+    deliveries.reverse()
+    save_json_data(
+        {
+            "schema_version": SCHEMA_VERSION,
+            "updated_at": deliveries[0]["sent_at"] if deliveries else "",
+            "deliveries": deliveries,
+        },
+        get_user_file_path(user_id, "sent_messages"),
+    )
+    return len(deliveries)
+
+
+def _write_chat_interactions(
+    user_id: str, rng: random.Random, day_starts: list[datetime]
+) -> int:
+    from core.file_operations import get_user_file_path, save_json_data
+    from core.profile_v2_io import wrap_chat_interactions_for_save
+
+    rows = []
+    for day in day_starts:
+        for _ in range(rng.choice((0, 0, 1, 1, 2, 3))):
+            user_message = _sentence(rng, rng.randint(4, 20))
+            ai_response = _sentence(rng, rng.randint(15, 60))
+            rows.append(
+                {
+                    "user_message": user_message,
+                    "ai_response": ai_response,
+                    "context_used": rng.random() < 0.5,
+                    "message_length": len(user_message),
+                    "response_length": len(ai_response),
+                    "timestamp": _ts(day, rng, 9, 23),
+                }
+            )
+    save_json_data(
+        wrap_chat_interactions_for_save(rows),
+        get_user_file_path(user_id, "chat_interactions"),
+    )
+    return len(rows)
+
+
+def _write_notebook_entries(
+    user_id: str, rng: random.Random, day_starts: list[datetime]
+) -> int:
+    from notebook.notebook_data_handlers import save_entries
+    from notebook.notebook_schemas import Entry, ListItem
+
+    entries = []
+    for day in day_starts:
+        if rng.random() > 2 / 7:
+            continue
+        created_at = _ts(day, rng, 8, 23)
+        kind = rng.choice(("note", "note", "journal_entry", "list"))
+        description = _sentence(rng, rng.randint(10, 50))
+        if rng.random() < 1 / 12:
+            description = f"{description} {SEARCH_TERM}"
+        items = None
+        if kind == "list":
+            description = None
+            items = [
+                ListItem(
+                    id=uuid.UUID(_uuid(rng)),
+                    text=_sentence(rng, 3),
+                    done=rng.random() < 0.5,
+                    order=order,
+                    created_at=created_at,
+                    updated_at=created_at,
+                )
+                for order in range(rng.randint(2, 8))
+            ]
+        entries.append(
+            Entry(
+                id=uuid.UUID(_uuid(rng)),
+                kind=kind,
+                title=_sentence(rng, rng.randint(2, 5)),
+                description=description,
+                items=items,
+                tags=rng.sample(NOTEBOOK_TAGS, k=rng.randint(0, 2)),
+                created_at=created_at,
+                updated_at=created_at,
+            )
+        )
+    save_entries(user_id, entries)
+    return len(entries)
+
+
+def _write_tasks(
+    user_id: str, rng: random.Random, day_starts: list[datetime], anchor: datetime
+) -> int:
+    from storage.user_data_v2_base import generate_short_id
+    from tasks.task_data_handlers import save_active_tasks, save_completed_tasks
+
+    active: list[dict[str, Any]] = []
+    completed: list[dict[str, Any]] = []
+    recent_cutoff = anchor - timedelta(days=21)
+    for day in day_starts:
+        if rng.random() > 3 / 7:
+            continue
+        task_id = _uuid(rng)
+        created_at = _ts(day, rng, 8, 22)
+        due = day + timedelta(days=rng.randint(0, 14))
+        task = {
+            "id": task_id,
+            "short_id": generate_short_id(task_id, "task"),
+            "kind": "task",
+            "title": _sentence(rng, rng.randint(2, 6)),
+            "description": _sentence(rng, rng.randint(0, 15)),
+            "category": "",
+            "group": "",
+            "tags": rng.sample(NOTEBOOK_TAGS, k=rng.randint(0, 2)),
+            "status": "active",
+            "due": {"date": format_timestamp(due, "%Y-%m-%d"), "time": None},
+            "created_at": created_at,
+            "updated_at": created_at,
+            "priority": rng.choice(TASK_PRIORITIES),
+            "completion": {"completed": False, "completed_at": None, "notes": ""},
+        }
+        # Older tasks are mostly done; the last few weeks stay open
+        if day < recent_cutoff and rng.random() < 0.9:
+            completed_at = _ts(min(due, anchor - timedelta(days=1)), rng, 8, 22)
+            task["status"] = "completed"
+            task["completion"] = {
+                "completed": True,
+                "completed_at": completed_at,
+                "notes": "",
+            }
+            task["updated_at"] = completed_at
+            completed.append(task)
+        else:
+            active.append(task)
+    save_active_tasks(user_id, active)
+    save_completed_tasks(user_id, completed)
+    return len(active) + len(completed)
+
+
+def _ts(day: datetime, rng: random.Random, first_hour: int, last_hour: int) -> str:
+    """Full timestamp at a seeded time of ``day`` between the given hours."""
+    moment = day.replace(hour=0, minute=0, second=0) + timedelta(
+        hours=rng.randint(first_hour, min(last_hour, 23)),
+        minutes=rng.randint(0, 59),
+        seconds=rng.randint(0, 59),
+    )
+    return format_timestamp(moment, TIMESTAMP_FULL)
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    if words <= 0:
+        return ""
+    return " ".join(rng.choice(_WORDS) for _ in range(words)).capitalize() + "."
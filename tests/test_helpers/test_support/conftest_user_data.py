@@ -85,11 +85,23 @@ def ensure_mock_config_applied(mock_config, test_data_dir):
 @pytest.fixture(scope="function", autouse=True)
 def clear_user_caches_between_tests():
     """Ensure user data caches don't leak between tests."""
+    from ai.context.section_cache import clear_context_section_cache
     from core import clear_user_caches
+    from core.interaction_log import clear_interaction_log_tails
+    from messages.template_index import clear_message_template_index
+    from storage.user_index_deltas import clear_user_index_state
 
     clear_user_caches()
+    clear_context_section_cache()
+    clear_message_template_index()
+    clear_interaction_log_tails()
+    clear_user_index_state()
     yield
     clear_user_caches()
+    clear_context_section_cache()
+    clear_message_template_index()
+    clear_interaction_log_tails()
+    clear_user_index_state()
 
 
 @pytest.fixture(scope="session", autouse=True)
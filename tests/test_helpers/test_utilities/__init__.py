@@ -15,6 +15,7 @@ from tests.test_helpers.test_utilities.test_environment import (
 from tests.test_helpers.test_utilities.test_log_path_mocks import TestLogPathMocks
 from tests.test_helpers.test_utilities.test_user_data_factory import TestUserDataFactory
 from tests.test_helpers.test_utilities.test_user_factory import TestUserFactory
+from tests.test_helpers.test_utilities.test_user_snapshots import TestUserSnapshots
 
 __all__ = [
     "TestDataFactory",
@@ -22,6 +23,7 @@ __all__ = [
     "TestLogPathMocks",
     "TestUserDataFactory",
     "TestUserFactory",
+    "TestUserSnapshots",
     "cleanup_test_data_environment",
     "create_test_user",
     "setup_test_data_environment",
@@ -6,12 +6,14 @@ import os
 import json
 import logging
 import copy
+import functools
 import threading
 import time
 
 from typing import Any
 
 from core.time_utilities import now_timestamp_full
+from tests.test_helpers.test_utilities.test_user_snapshots import TestUserSnapshots
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +47,8 @@ class TestUserFactory:
             "disability",
             "limited_data",
             "inconsistent",
+            "custom_fields",
+            "schedules",
         ):
             return f"{user_type}"
         # For basic users, include checkins and tasks in the key
@@ -63,8 +67,9 @@ class TestUserFactory:
 
     @staticmethod
     def clear_cache():
-        """Clear the user data cache (useful for test cleanup)."""
+        """Clear the user data cache and user snapshots (useful for test cleanup)."""
         TestUserFactory._user_data_cache.clear()
+        TestUserSnapshots.clear()
 
     @staticmethod
     def create_basic_user(
@@ -91,6 +96,17 @@ class TestUserFactory:
                 raise ValueError(
                     "test_data_dir parameter is required - use modern test approach"
                 )
+            if TestUserSnapshots.materialize(
+                TestUserFactory._get_cache_key(enable_checkins, enable_tasks, "basic"),
+                user_id,
+                test_data_dir,
+                functools.partial(
+                    TestUserFactory.create_basic_user__with_test_dir,
+                    enable_checkins=enable_checkins,
+                    enable_tasks=enable_tasks,
+                ),
+            ):
+                return True
             return TestUserFactory.create_basic_user__with_test_dir(
                 user_id, enable_checkins, enable_tasks, test_data_dir
             )
@@ -289,6 +305,22 @@ class TestUserFactory:
         Also adds mappings for Discord user ID and email if provided.
         Uses in-process mutex plus file locking for parallel test execution.
         """
+        entries = {user_id: actual_user_id}
+        if discord_user_id:
+            entries[f"discord:{discord_user_id}"] = actual_user_id
+        if email:
+            entries[f"email:{email}"] = actual_user_id
+        TestUserFactory._merge_user_index_entries(test_data_dir, entries)
+
+    @staticmethod
+    def _merge_user_index_entries(
+        test_data_dir: str, entries: dict[str, str], durable: bool = True
+    ):
+        """Merge lookup entries into the test user_index.json under the index locks.
+
+        ``durable=False`` skips the fsync (snapshot-materialized users rewrite the
+        index once per user and never need crash durability).
+        """
         from core.file_locking import file_lock
 
         user_index_file = os.path.join(test_data_dir, "user_index.json")
@@ -312,13 +344,7 @@ class TestUserFactory:
                         except (json.JSONDecodeError, OSError, UnicodeDecodeError):
                             user_index = {}
 
-                        user_index[user_id] = actual_user_id
-
-                        if discord_user_id:
-                            user_index[f"discord:{discord_user_id}"] = actual_user_id
-
-                        if email:
-                            user_index[f"email:{email}"] = actual_user_id
+                        user_index.update(entries)
 
                         locked_file.seek(0)
                         locked_file.truncate()
@@ -328,7 +354,8 @@ class TestUserFactory:
                             )
                         )
                         locked_file.flush()
-                        os.fsync(locked_file.fileno())
+                        if durable:
+                            os.fsync(locked_file.fileno())
                 return
             except TimeoutError as exc:
                 last_error = exc
@@ -336,7 +363,7 @@ class TestUserFactory:
         if last_error is not None:
             logger.warning(
                 "Could not update user index for %s after retries: %s",
-                user_id,
+                ", ".join(entries),
                 last_error,
             )
 
@@ -511,6 +538,17 @@ class TestUserFactory:
                 raise ValueError(
                     "test_data_dir parameter is required - use modern test approach"
                 )
+            if TestUserSnapshots.materialize(
+                TestUserFactory._get_cache_key(user_type="discord"),
+                user_id,
+                test_data_dir,
+                functools.partial(
+                    TestUserFactory.create_discord_user__with_test_dir,
+                    discord_user_id=TestUserSnapshots.DISCORD_TOKEN,
+                ),
+                discord_user_id=discord_user_id,
+            ):
+                return True
             return TestUserFactory.create_discord_user__with_test_dir(
                 user_id, discord_user_id, test_data_dir
             )
@@ -622,6 +660,13 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="full"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_full_featured_user__with_test_dir,
+                ):
+                    return True
                 return TestUserFactory.create_full_featured_user__with_test_dir(
                     user_id, test_data_dir
                 )
@@ -831,6 +876,18 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                actual_user_id = TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="email"),
+                    user_id,
+                    test_data_dir,
+                    functools.partial(
+                        TestUserFactory.create_email_user__with_test_dir,
+                        email=TestUserSnapshots.EMAIL_TOKEN,
+                    ),
+                    email=email,
+                )
+                if actual_user_id:
+                    return actual_user_id
                 return TestUserFactory.create_email_user__with_test_dir(
                     user_id, email, test_data_dir
                 )
@@ -995,23 +1052,22 @@ class TestUserFactory:
             bool: True if user was created successfully, False otherwise
         """
         try:
-            # If test_data_dir is provided, temporarily patch the config to use it
             if test_data_dir:
-                from unittest.mock import patch
-                import core.config
-
-                # Create test users directory
-                test_users_dir = os.path.join(test_data_dir, "users")
-                os.makedirs(test_users_dir, exist_ok=True)
-
-                # Temporarily patch the config to use test directory
-                with (
-                    patch.object(core.config, "BASE_DATA_DIR", test_data_dir),
-                    patch.object(core.config, "USER_INFO_DIR_PATH", test_users_dir),
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="custom_fields")
+                    + ":"
+                    + json.dumps(custom_fields, sort_keys=True),
+                    user_id,
+                    test_data_dir,
+                    functools.partial(
+                        TestUserFactory.create_user_with_custom_fields__with_test_dir,
+                        custom_fields=custom_fields,
+                    ),
                 ):
-                    return TestUserFactory.create_user_with_custom_fields__impl(
-                        user_id, custom_fields
-                    )
+                    return True
+                return TestUserFactory.create_user_with_custom_fields__with_test_dir(
+                    user_id, custom_fields, test_data_dir
+                )
             else:
                 # Use real user directory (compatibility fallback)
                 return TestUserFactory.create_user_with_custom_fields__impl(
@@ -1022,6 +1078,31 @@ class TestUserFactory:
             logger.error(f"Error creating custom fields test user {user_id}: {e}")
             return False
 
+    @staticmethod
+    def create_user_with_custom_fields__with_test_dir(
+        user_id: str,
+        custom_fields: dict[str, Any] | None = None,
+        test_data_dir: str | None = None,
+    ) -> bool:
+        """Create custom fields user via create_new_user under a patched data dir"""
+        if not test_data_dir:
+            return False
+        from unittest.mock import patch
+        import core.config
+
+        # Create test users directory
+        test_users_dir = os.path.join(test_data_dir, "users")
+        os.makedirs(test_users_dir, exist_ok=True)
+
+        # Temporarily patch the config to use test directory
+        with (
+            patch.object(core.config, "BASE_DATA_DIR", test_data_dir),
+            patch.object(core.config, "USER_INFO_DIR_PATH", test_users_dir),
+        ):
+            return TestUserFactory.create_user_with_custom_fields__impl(
+                user_id, custom_fields
+            )
+
     @staticmethod
     def create_user_with_custom_fields__impl(
         user_id: str, custom_fields: dict[str, Any] | None = None
@@ -1122,23 +1203,22 @@ class TestUserFactory:
             bool: True if user was created successfully, False otherwise
         """
         try:
-            # If test_data_dir is provided, temporarily patch the config to use it
             if test_data_dir:
-                from unittest.mock import patch
-                import core.config
-
-                # Create test users directory
-                test_users_dir = os.path.join(test_data_dir, "users")
-                os.makedirs(test_users_dir, exist_ok=True)
-
-                # Temporarily patch the config to use test directory
-                with (
-                    patch.object(core.config, "BASE_DATA_DIR", test_data_dir),
-                    patch.object(core.config, "USER_INFO_DIR_PATH", test_users_dir),
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="schedules")
+                    + ":"
+                    + json.dumps(schedule_config, sort_keys=True),
+                    user_id,
+                    test_data_dir,
+                    functools.partial(
+                        TestUserFactory.create_user_with_schedules__with_test_dir,
+                        schedule_config=schedule_config,
+                    ),
                 ):
-                    return TestUserFactory.create_user_with_schedules__impl(
-                        user_id, schedule_config
-                    )
+                    return True
+                return TestUserFactory.create_user_with_schedules__with_test_dir(
+                    user_id, schedule_config, test_data_dir
+                )
             else:
                 # Use real user directory (compatibility fallback)
                 return TestUserFactory.create_user_with_schedules__impl(
@@ -1149,6 +1229,31 @@ class TestUserFactory:
             logger.error(f"Error creating schedules test user {user_id}: {e}")
             return False
 
+    @staticmethod
+    def create_user_with_schedules__with_test_dir(
+        user_id: str,
+        schedule_config: dict[str, Any] | None = None,
+        test_data_dir: str | None = None,
+    ) -> bool:
+        """Create schedules user via create_new_user under a patched data dir"""
+        if not test_data_dir:
+            return False
+        from unittest.mock import patch
+        import core.config
+
+        # Create test users directory
+        test_users_dir = os.path.join(test_data_dir, "users")
+        os.makedirs(test_users_dir, exist_ok=True)
+
+        # Temporarily patch the config to use test directory
+        with (
+            patch.object(core.config, "BASE_DATA_DIR", test_data_dir),
+            patch.object(core.config, "USER_INFO_DIR_PATH", test_users_dir),
+        ):
+            return TestUserFactory.create_user_with_schedules__impl(
+                user_id, schedule_config
+            )
+
     @staticmethod
     def create_user_with_schedules__impl(
         user_id: str, schedule_config: dict[str, Any] | None = None
@@ -1443,6 +1548,13 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="minimal"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_minimal_user__with_test_dir,
+                ):
+                    return True
                 return TestUserFactory.create_minimal_user__with_test_dir(
                     user_id, test_data_dir
                 )
@@ -1471,6 +1583,14 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                actual_user_id = TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="minimal"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_minimal_user__with_test_dir,
+                )
+                if actual_user_id:
+                    return (True, actual_user_id)
                 return TestUserFactory.create_minimal_user__with_test_dir_and_get_id(
                     user_id, test_data_dir
                 )
@@ -1731,6 +1851,13 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="complex_checkins"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_user_with_complex_checkins__with_test_dir,
+                ):
+                    return True
                 return TestUserFactory.create_user_with_complex_checkins__with_test_dir(
                     user_id, test_data_dir
                 )
@@ -1921,6 +2048,13 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="health"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_user_with_health_focus__with_test_dir,
+                ):
+                    return True
                 return TestUserFactory.create_user_with_health_focus__with_test_dir(
                     user_id, test_data_dir
                 )
@@ -2112,6 +2246,13 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="task"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_user_with_task_focus__with_test_dir,
+                ):
+                    return True
                 return TestUserFactory.create_user_with_task_focus__with_test_dir(
                     user_id, test_data_dir
                 )
@@ -2281,6 +2422,13 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="disability"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_user_with_disabilities__with_test_dir,
+                ):
+                    return True
                 return TestUserFactory.create_user_with_disabilities__with_test_dir(
                     user_id, test_data_dir
                 )
@@ -2455,6 +2603,13 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="limited_data"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_user_with_limited_data__with_test_dir,
+                ):
+                    return True
                 return TestUserFactory.create_user_with_limited_data__with_test_dir(
                     user_id, test_data_dir
                 )
@@ -2609,6 +2764,13 @@ class TestUserFactory:
         try:
             # If test_data_dir is provided, use direct file creation
             if test_data_dir:
+                if TestUserSnapshots.materialize(
+                    TestUserFactory._get_cache_key(user_type="inconsistent"),
+                    user_id,
+                    test_data_dir,
+                    TestUserFactory.create_user_with_inconsistent_data__with_test_dir,
+                ):
+                    return True
                 return (
                     TestUserFactory.create_user_with_inconsistent_data__with_test_dir(
                         user_id, test_data_dir
@@ -0,0 +1,247 @@
+"""
+Snapshot layer for TestUserFactory users.
+
+Each user archetype is built once per process through the regular factory path
+into a throwaway golden directory, captured as file bytes plus its user_index
+entries, and then materialized per test by writing those bytes under a fresh
+UUID with the identity fields substituted. Materialization skips Pydantic
+validation, default message file setup, create_new_user and the
+post-create verification, which only need to run once for the golden copy.
+
+Set MHM_TEST_USER_SNAPSHOTS=0 to build every user through the full factory path.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+
+from collections.abc import Callable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_ENV_FLAG = "MHM_TEST_USER_SNAPSHOTS"
+
+
+def _account_email(email: str) -> str:
+    """Email as the account schema stores it (invalid addresses become empty)."""
+    from storage.user_data_validation import is_valid_email
+
+    return email if email and is_valid_email(email) else ""
+
+
+def _account_discord_id(discord_user_id: str) -> str:
+    """Discord ID as the account schema stores it (invalid IDs become empty)."""
+    from storage.user_data_validation import is_valid_discord_id
+
+    normalized = discord_user_id.strip()
+    return normalized if normalized and is_valid_discord_id(normalized) else ""
+
+
+class TestUserSnapshots:
+    """Per-process golden copies of factory-built test users"""
+
+    # Identity placeholders the golden user is built with; substituted on materialize
+    USERNAME_TOKEN = "snapshot-user-7f3c"
+    EMAIL_TOKEN = "snapshot-mail-7f3c@example.com"
+    DISCORD_TOKEN = "100000000000007315"
+
+    # archetype key -> captured snapshot (None when the golden build failed)
+    _snapshots: dict[str, dict[str, Any] | None] = {}
+    _build_lock = threading.Lock()
+
+    @staticmethod
+    def enabled() -> bool:
+        """Whether factory users are materialized from snapshots."""
+        return os.environ.get(SNAPSHOT_ENV_FLAG, "1") != "0"
+
+    @staticmethod
+    def clear():
+        """Drop all captured snapshots (they are rebuilt on next use)."""
+        with TestUserSnapshots._build_lock:
+            TestUserSnapshots._snapshots.clear()
+
+    @staticmethod
+    def materialize(
+        archetype: str,
+        user_id: str,
+        test_data_dir: str,
+        build: Callable[..., Any],
+        email: str | None = None,
+        discord_user_id: str | None = None,
+    ) -> str | None:
+        """
+        Create a user from the archetype's snapshot in test_data_dir.
+
+        Args:
+            archetype: Snapshot key; must capture every option passed to ``build``
+            user_id: Internal username for the new user
+            test_data_dir: Test data directory that receives the user
+            build: ``build(username, test_data_dir=...)`` creates the golden user
+            email: Replaces EMAIL_TOKEN (only used by builders that pass it through)
+            discord_user_id: Replaces DISCORD_TOKEN (defaults to user_id)
+
+        Returns:
+            str: New user's UUID, or None when the caller should build the user itself
+        """
+        if not test_data_dir or not TestUserSnapshots.enabled():
+            return None
+        import core.config
+
+        # Snapshots capture the JSON file layout; other backends keep data elsewhere
+        if core.config.STORAGE_BACKEND != "json":
+            return None
+        try:
+            snapshot = TestUserSnapshots._get_snapshot(archetype, build)
+            if snapshot is None:
+                return None
+
+            actual_user_id = str(uuid.uuid4())
+            default_email = f"{user_id}@example.com"
+            if email is None:
+                email = default_email
+            if discord_user_id is None:
+                discord_user_id = user_id
+            # The index keeps raw values; account.json keeps what its schema accepts
+            index_replacements = [
+                (TestUserSnapshots.EMAIL_TOKEN, email),
+                (TestUserSnapshots.DISCORD_TOKEN, discord_user_id),
+                (TestUserSnapshots.USERNAME_TOKEN, user_id),
+            ]
+            replacements = [
+                (snapshot["user_id"], actual_user_id),
+                (TestUserSnapshots.EMAIL_TOKEN, _account_email(email)),
+                (
+                    f"{TestUserSnapshots.USERNAME_TOKEN}@example.com",
+                    _account_email(default_email),
+                ),
+                (TestUserSnapshots.DISCORD_TOKEN, _account_discord_id(discord_user_id)),
+                (TestUserSnapshots.USERNAME_TOKEN, user_id),
+            ]
+
+            user_dir = os.path.join(test_data_dir, "users", actual_user_id)
+            for rel_path, content in snapshot["files"].items():
+                file_path = os.path.join(user_dir, rel_path)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, "wb") as f:
+                    f.write(TestUserSnapshots._substitute(content, replacements))
+
+            from tests.test_helpers.test_utilities.test_user_factory import (
+                TestUserFactory,
+            )
+
+            index_entries = {}
+            for key in snapshot["index_keys"]:
+                key = TestUserSnapshots._substitute_text(key, index_replacements)
+                # An empty email/Discord ID gets no "email:"/"discord:" lookup entry
+                if not key.endswith(":"):
+                    index_entries[key] = actual_user_id
+            TestUserFactory._merge_user_index_entries(
+                test_data_dir, index_entries, durable=False
+            )
+            return actual_user_id
+
+        except Exception as e:
+            logger.warning(
+                f"Snapshot materialize failed for {archetype} ({user_id}): {e}"
+            )
+            return None
+
+    @staticmethod
+    def _get_snapshot(
+        archetype: str, build: Callable[..., Any]
+    ) -> dict[str, Any] | None:
+        """Return the archetype's snapshot, building the golden user on first use."""
+        if archetype in TestUserSnapshots._snapshots:
+            return TestUserSnapshots._snapshots[archetype]
+        with TestUserSnapshots._build_lock:
+            if archetype not in TestUserSnapshots._snapshots:
+                TestUserSnapshots._snapshots[archetype] = (
+                    TestUserSnapshots._build_snapshot(archetype, build)
+                )
+            return TestUserSnapshots._snapshots[archetype]
+
+    @staticmethod
+    def _build_snapshot(
+        archetype: str, build: Callable[..., Any]
+    ) -> dict[str, Any] | None:
+        """Build the golden user in a scratch data dir and capture its files."""
+        # Keep scratch writes under the process test data dir when conftest set one;
+        # tmp_pytest_runtime is not purged by the between-test tmp cleanup
+        scratch_root = None
+        process_data_dir = os.environ.get("TEST_DATA_DIR")
+        if process_data_dir:
+            scratch_root = os.path.join(process_data_dir, "tmp_pytest_runtime")
+            os.makedirs(scratch_root, exist_ok=True)
+        golden_dir = tempfile.mkdtemp(prefix="user_snapshot_", dir=scratch_root)
+        try:
+            if not build(TestUserSnapshots.USERNAME_TOKEN, test_data_dir=golden_dir):
+                logger.warning(f"Golden build failed for user snapshot {archetype}")
+                return None
+
+            users_dir = os.path.join(golden_dir, "users")
+            user_dirs = os.listdir(users_dir) if os.path.isdir(users_dir) else []
+            if len(user_dirs) != 1:
+                logger.warning(
+                    f"Golden build for {archetype} produced {len(user_dirs)} users"
+                )
+                return None
+            golden_user_id = user_dirs[0]
+            golden_user_dir = os.path.join(users_dir, golden_user_id)
+
+            files: dict[str, bytes] = {}
+            for root, _dirs, names in os.walk(golden_user_dir):
+                for name in names:
+                    if name.endswith(".lock"):
+                        continue
+                    path = os.path.join(root, name)
+                    with open(path, "rb") as f:
+                        files[os.path.relpath(path, golden_user_dir)] = f.read()
+
+            missing = [
+                name for name in ("account.json", "preferences.json") if name not in files
+            ]
+            if missing:
+                logger.warning(
+                    f"Golden build for {archetype} is missing {', '.join(missing)}"
+                )
+                return None
+
+            index_keys: list[str] = []
+            index_file = os.path.join(golden_dir, "user_index.json")
+            if os.path.exists(index_file):
+                with open(index_file, encoding="utf-8") as f:
+                    user_index = json.load(f)
+                index_keys = [
+                    key for key, value in user_index.items() if value == golden_user_id
+                ]
+
+            return {"user_id": golden_user_id, "files": files, "index_keys": index_keys}
+
+        finally:
+            shutil.rmtree(golden_dir, ignore_errors=True)
+
+    @staticmethod
+    def _substitute_text(text: str, replacements: list[tuple[str, str]]) -> str:
+        """Replace identity placeholders in a plain string."""
+        for placeholder, value in replacements:
+            text = text.replace(placeholder, value)
+        return text
+
+    @staticmethod
+    def _substitute(content: bytes, replacements: list[tuple[str, str]]) -> bytes:
+        """Replace identity placeholders inside serialized JSON file content."""
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            return content
+        for placeholder, value in replacements:
+            if placeholder in text:
+                # Values land inside JSON strings; escape them like json.dump would
+                escaped = json.dumps(value, ensure_ascii=False)[1:-1]
+                text = text.replace(placeholder, escaped)
+        return text.encode("utf-8")
@@ -2,6 +2,12 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from core.tracing import (
+    HotPathTracer,
+    format_trace_summary_lines,
+    set_trace_attribute,
+    trace_span,
+)
 from ui.admin_actions import AdminActions
 
 
@@ -42,6 +48,9 @@ def test_build_system_health_report_includes_service_users_and_directories():
         values = {
             ("core.config", "BASE_DATA_DIR"): "data",
             ("core.config", "USER_INFO_DIR_PATH"): "users",
+            ("core.config", "HOT_PATH_TRACE_EXPORT_FILE"): "traces.json",
+            ("core.file_operations", "load_json_data"): lambda _path: {},
+            ("core.tracing", "format_trace_summary_lines"): format_trace_summary_lines,
         }
         return values[(module_name, attr_name)]
 
@@ -58,6 +67,38 @@ def test_build_system_health_report_includes_service_users_and_directories():
     assert "[INFO] Discord Status: Service not running" in report
     assert "[OK] Total Users: 1" in report
     assert "[OK] Directory data: Exists" in report
+    assert "[OK] Hot-Path Latency:" in report
+    assert "No traced messages recorded yet." in report
+
+
+def test_hot_path_latency_lines_read_exported_trace_snapshot(tmp_path):
+    actions = AdminActions()
+    export_file = tmp_path / "hot_path_traces.json"
+    tracer = HotPathTracer(enabled=True, export_file="")
+    with tracer.start_trace("discord_message"):
+        set_trace_attribute("intent", "list_tasks")
+        with trace_span("parse"):
+            pass
+    tracer.export(str(export_file))
+
+    with patch("core.config.HOT_PATH_TRACE_EXPORT_FILE", str(export_file)):
+        lines = actions._hot_path_latency_lines()
+
+    assert lines[0] == "[OK] Hot-Path Latency:"
+    assert any(line.startswith("    parse: n=1 p50=") for line in lines)
+    assert any(line.startswith("    list_tasks: n=1") for line in lines)
+
+
+def test_hot_path_latency_lines_without_export_explain_how_to_enable(tmp_path):
+    actions = AdminActions()
+
+    with patch("core.config.HOT_PATH_TRACE_EXPORT_FILE", str(tmp_path / "missing.json")):
+        lines = actions._hot_path_latency_lines()
+
+    assert lines == [
+        "[INFO] Hot-Path Latency: No trace export "
+        "(enable with HOT_PATH_TRACING_ENABLED=true)"
+    ]
 
 
 def test_toggle_logging_verbosity_updates_action_and_notifies_parent():
@@ -0,0 +1,84 @@
+"""Tests for memoized, lazily built AI context envelope sections."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+import ai.context.service as context_service
+from ai.context.service import build_ai_context_envelope
+from tests.test_helpers.test_utilities.test_user_factory import TestUserFactory
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.ai]
+
+
+def _create_user(user_id: str, test_data_dir: str) -> str:
+    assert TestUserFactory.create_full_featured_user(user_id, test_data_dir=test_data_dir)
+    from core import get_user_id_by_identifier
+
+    return get_user_id_by_identifier(user_id) or user_id
+
+
+def _read_all(envelope) -> None:
+    dict(envelope.structured)
+
+
+def test_unchanged_sections_are_reused_and_a_write_rebuilds_only_its_sections(test_data_dir):
+    user_id = _create_user("section-cache-user", test_data_dir)
+    first = build_ai_context_envelope(user_id)
+    _read_all(first)
+    # The action catalog is process-wide and may already be built by an earlier test
+    assert set(first.metadata["section_cache"]["reused"]) <= {"action_catalog"}
+    # The first build lazily creates some files (tasks, notebook); warm once more
+    _read_all(build_ai_context_envelope(user_id))
+
+    second = build_ai_context_envelope(user_id)
+    _read_all(second)
+    assert {"account", "tasks", "checkins", "messages", "health"} <= set(
+        second.metadata["section_cache"]["reused"]
+    )
+    assert "temporal" in second.metadata["section_cache"]["rebuilt"]
+
+    from checkins.checkin_data_manager import store_checkin_response
+
+    store_checkin_response(user_id, {"mood": 2, "submitted_at": "2026-07-01 08:00:00"})
+    third = build_ai_context_envelope(user_id)
+    _read_all(third)
+
+    rebuilt = set(third.metadata["section_cache"]["rebuilt"])
+    assert {"checkins", "health"} <= rebuilt
+    assert not {"account", "tasks", "messages", "notebooks"} & rebuilt
+    assert third.structured["checkins"]["recent"][0]["mood"] == 2
+
+
+def test_excluded_sections_are_only_built_when_read(test_data_dir):
+    user_id = _create_user("section-lazy-user", test_data_dir)
+    with patch.object(
+        context_service, "_build_health_context", return_value={"available": False}
+    ) as build_health:
+        envelope = build_ai_context_envelope(user_id, prompt_request="what should I do next?")
+        assert "health" not in envelope.included_sections
+        assert envelope.to_prompt_text()
+        build_health.assert_not_called()
+
+        assert envelope.structured["health"] == {"available": False}
+        assert build_health.call_count == 1
+
+
+def test_action_catalog_section_is_built_once_per_process(test_data_dir):
+    user_id = _create_user("section-catalog-user", test_data_dir)
+    with (
+        patch.object(context_service, "_action_catalog_section", None),
+        patch.object(
+            context_service,
+            "_build_action_catalog_context",
+            return_value={"available": ["create_task"], "summary": "Actions: create_task"},
+        ) as build_catalog,
+    ):
+        for _ in range(3):
+            envelope = build_ai_context_envelope(user_id)
+            assert envelope.structured["action_catalog"]["available"] == ["create_task"]
+
+    assert build_catalog.call_count == 1
@@ -0,0 +1,218 @@
+"""Tests for messages/ai_outbox.py (ahead-of-time AI message generation)."""
+
+import time
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.time_utilities import now_datetime_full
+from messages.ai_outbox import IDLE_RETRY_SECONDS, AIMessageOutbox
+
+
+class _Generator:
+    def __init__(self, on_call=None):
+        self.calls = []
+        self.on_call = on_call
+
+    def __call__(self, user_id):
+        self.calls.append(user_id)
+        if self.on_call is not None:
+            self.on_call(user_id)
+        return f"message for {user_id} #{len(self.calls)}"
+
+
+def _outbox(generator, idle=lambda: True, ttl=3600, lead=1800):
+    outbox = AIMessageOutbox(ttl_seconds=ttl, lead_seconds=lead, generator=generator, idle_check=idle)
+    # Drive run_due directly; the background worker is not needed here
+    outbox._ensure_worker = lambda: None
+    return outbox
+
+
+@pytest.mark.unit
+@pytest.mark.messages
+class TestAIMessageOutbox:
+    def test_generates_inside_lead_window_and_pops_once(self):
+        generator = _Generator()
+        outbox = _outbox(generator)
+        now = time.time()
+        outbox.enqueue("user-1", "motivational", now + 3 * 3600)
+        outbox.enqueue("user-1", "motivational", now + 3 * 3600)  # replanned, same send
+
+        assert outbox.run_due(now) == 0  # send is hours away
+        assert outbox.run_due(now + 3 * 3600 - 600) == 1
+
+        assert outbox.pop("user-1", "motivational") == "message for user-1 #1"
+        assert outbox.pop("user-1", "motivational") is None
+        stats = outbox.get_stats()
+        assert (stats["generated"], stats["hits"], stats["misses"], stats["queued"]) == (1, 1, 1, 0)
+
+    def test_several_sends_of_one_category_are_each_pregenerated(self):
+        generator = _Generator()
+        outbox = _outbox(generator, lead=1800)
+        now = time.time()
+        morning, evening = now + 2 * 3600, now + 8 * 3600
+        outbox.enqueue("user-1", "motivational", morning)
+        outbox.enqueue("user-1", "motivational", evening)
+        assert outbox.get_stats()["queued"] == 2
+
+        assert outbox.run_due(morning - 600) == 1
+        with patch("messages.ai_outbox.time.time", return_value=morning):
+            assert outbox.pop("user-1", "motivational") == "message for user-1 #1"
+
+        assert outbox.run_due(evening - 600) == 1
+        with patch("messages.ai_outbox.time.time", return_value=evening):
+            assert outbox.pop("user-1", "motivational") == "message for user-1 #2"
+        stats = outbox.get_stats()
+        assert (stats["generated"], stats["hits"], stats["misses"], stats["queued"]) == (2, 2, 0, 0)
+
+    def test_pop_takes_the_slot_being_sent(self):
+        outbox = _outbox(_Generator(), lead=12 * 3600, ttl=24 * 3600)
+        now = time.time()
+        morning, evening = now + 2 * 3600, now + 8 * 3600
+        outbox.enqueue("user-1", "motivational", evening)
+        outbox.enqueue("user-1", "motivational", morning)
+        assert outbox.run_due(now + 1) == 2  # evening generated first (#1), then morning (#2)
+
+        with patch("messages.ai_outbox.time.time", return_value=morning):
+            assert outbox.pop("user-1", "motivational") == "message for user-1 #2"
+        with patch("messages.ai_outbox.time.time", return_value=evening):
+            assert outbox.pop("user-1", "motivational") == "message for user-1 #1"
+
+    def test_expired_entry_is_a_miss(self):
+        outbox = _outbox(_Generator(), ttl=60)
+        now = time.time()
+        outbox.enqueue("user-1", "health", now + 600)
+        assert outbox.run_due(now + 1) == 1
+
+        with patch("messages.ai_outbox.time.time", return_value=now + 120):
+            assert outbox.pop("user-1", "health") is None
+        assert outbox.get_stats()["expired"] == 1
+
+    def test_invalidation_drops_stored_and_in_flight_results(self):
+        outbox = None
+
+        def invalidate_mid_generation(user_id):
+            outbox.invalidate_user(user_id)
+
+        outbox = _outbox(_Generator(on_call=invalidate_mid_generation))
+        now = time.time()
+        outbox.enqueue("user-1", "motivational", now + 600)
+        outbox.run_due(now + 1)
+        assert outbox.pop("user-1", "motivational") is None
+
+        plain = _outbox(_Generator())
+        plain.enqueue("user-2", "motivational", now + 600)
+        assert plain.run_due(now + 1) == 1
+        plain.invalidate_user("user-2")
+        assert plain.pop("user-2", "motivational") is None
+        assert plain.get_stats()["invalidated"] == 1
+
+    def test_busy_model_retries_then_gives_up_close_to_send(self):
+        generator = _Generator()
+        outbox = _outbox(generator, idle=lambda: False)
+        now = time.time()
+        outbox.enqueue("user-1", "motivational", now + 10 * 60)
+
+        assert outbox.run_due(now) == 0
+        assert outbox._queue[0][0] == pytest.approx(now + IDLE_RETRY_SECONDS)
+        outbox.run_due(now + 10 * 60 - 30)  # inside the final minute: send generates instead
+
+        assert generator.calls == []
+        assert outbox.get_stats()["skipped"] == 1
+        assert outbox.get_stats()["queued"] == 0
+
+    def test_cancel_drops_queued_and_stored_slots_of_a_replan(self):
+        generator = _Generator()
+        outbox = _outbox(generator, lead=1800)
+        now = time.time()
+        morning, evening = now + 2 * 3600, now + 8 * 3600
+        outbox.enqueue("user-1", "motivational", morning)
+        outbox.enqueue("user-1", "motivational", evening)
+        assert outbox.run_due(morning - 600) == 1
+
+        assert outbox.cancel("user-1", [("motivational", morning), ("motivational", evening)]) == 2
+        assert outbox.run_due(evening - 600) == 0
+        assert generator.calls == ["user-1"]
+        with patch("messages.ai_outbox.time.time", return_value=morning):
+            assert outbox.pop("user-1", "motivational") is None
+        stats = outbox.get_stats()
+        assert (stats["cancelled"], stats["queued"], stats["stored"]) == (2, 0, 0)
+
+    def test_slot_cancelled_while_generating_is_not_stored(self):
+        now = time.time()
+        send_at = now + 600
+        outbox = None
+
+        def cancel_mid_generation(user_id):
+            outbox.cancel(user_id, [("motivational", send_at)])
+
+        outbox = _outbox(_Generator(on_call=cancel_mid_generation), lead=1800)
+        outbox.enqueue("user-1", "motivational", send_at)
+
+        assert outbox.run_due(now + 1) == 0
+        assert outbox.get_stats()["stored"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.scheduler
+class TestSchedulerQueuesPregeneration:
+    def test_planned_ai_sends_are_queued_with_their_send_time(self):
+        from scheduler.manager import SchedulerManager
+        from scheduler.send_plan import PlannedSend
+
+        delivery = MagicMock()
+        manager = SchedulerManager(delivery)
+        send_at = now_datetime_full().astimezone() + timedelta(hours=2)
+        plan = [
+            PlannedSend(category="motivational", period_name="morning", send_at=send_at),
+            PlannedSend(category="checkin", period_name="morning", send_at=send_at),
+        ]
+
+        with patch(
+            "messages.message_data_manager.is_ai_generated_message_category",
+            side_effect=lambda category: category == "motivational",
+        ):
+            manager._queue_ai_pregeneration("user-1", plan)
+
+        delivery.queue_ai_pregeneration.assert_called_once_with(
+            "user-1", "motivational", send_at.timestamp()
+        )
+
+    def test_replan_cancels_pregeneration_of_dropped_sends(self):
+        import schedule
+
+        from scheduler.manager import SchedulerManager
+        from scheduler.send_plan import SendWindow
+
+        delivery = MagicMock()
+        manager = SchedulerManager(delivery)
+        now = now_datetime_full().astimezone()
+
+        def window(start_hours: int) -> list[SendWindow]:
+            start = now + timedelta(hours=start_hours)
+            return [SendWindow("motivational", "period", start, start + timedelta(hours=1))]
+
+        def replaces(send) -> bool:
+            return send.category == "motivational"
+
+        try:
+            with patch.object(manager, "set_wake_timer"), patch(
+                "messages.message_data_manager.is_ai_generated_message_category",
+                return_value=True,
+            ):
+                manager._schedule_send_plan("user-1", window(2), now, replaces)
+                (first, _job), = manager._daily_plans["user-1"]
+
+                # The same plan again keeps its slot
+                manager._schedule_send_plan("user-1", window(2), now, replaces)
+                delivery.cancel_ai_pregeneration.assert_not_called()
+
+                manager._schedule_send_plan("user-1", window(6), now, replaces)
+            delivery.cancel_ai_pregeneration.assert_called_once_with(
+                "user-1", [("motivational", first.send_at.timestamp())]
+            )
+        finally:
+            for _send, job in manager._daily_plans.get("user-1", []):
+                if job in schedule.jobs:
+                    schedule.cancel_job(job)
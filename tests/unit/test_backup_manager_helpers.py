@@ -1,6 +1,9 @@
 import json
 import os
+import shutil
+import time
 import zipfile
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
@@ -268,3 +271,120 @@ class TestBackupManagerHelpers:
 
         assert is_weekly_backup_artifact("data/backups/weekly_backup_1") is True
         assert is_weekly_backup_artifact("data/backups/auto_backup_1") is False
+
+
+@pytest.fixture
+def incremental_env(tmp_path, monkeypatch):
+    """Isolated data dir with two users and config for incremental backups."""
+    base_dir = tmp_path / "data"
+    users_dir = base_dir / "users"
+    for user_id in ("user-a", "user-b"):
+        (users_dir / user_id / "messages").mkdir(parents=True)
+        (users_dir / user_id / "account.json").write_text(
+            json.dumps({"user_id": user_id}), encoding="utf-8"
+        )
+        (users_dir / user_id / "messages" / "motivational.json").write_text(
+            json.dumps({"messages": ["same template"]}), encoding="utf-8"
+        )
+    (base_dir / "user_index.json").write_text("{}", encoding="utf-8")
+    backup_dir = tmp_path / "backups"
+    monkeypatch.setenv("MHM_TESTING", "1")
+    monkeypatch.setattr(core.config, "get_backups_dir", lambda: str(backup_dir))
+    monkeypatch.setattr(core.config, "BASE_DATA_DIR", str(base_dir))
+    monkeypatch.setattr(core.config, "USER_INFO_DIR_PATH", str(users_dir))
+    monkeypatch.setattr(backup_module, "get_all_user_ids", lambda: ["user-a", "user-b"])
+    return BackupManager(), base_dir, users_dir, backup_dir
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestIncrementalBackups:
+    def test_incremental_backup_writes_manifest_and_dedupes_blobs(self, incremental_env):
+        manager, _base_dir, _users_dir, backup_dir = incremental_env
+
+        backup_path = manager.create_backup(
+            "inc_first", include_users=True, include_config=True, incremental=True
+        )
+
+        assert backup_path is not None
+        assert [p.name for p in (backup_dir / "inc_first").iterdir()] == ["manifest.json"]
+        manifest = json.loads((backup_dir / "inc_first" / "manifest.json").read_text())
+        assert manifest["format"] == "incremental"
+        assert "users/user-a/account.json" in manifest["files"]
+        assert "config/user_index.json" in manifest["files"]
+        # Identical template bytes in both users share one blob
+        template_hashes = {
+            manifest["files"][f"users/{uid}/messages/motivational.json"]["sha256"]
+            for uid in ("user-a", "user-b")
+        }
+        assert len(template_hashes) == 1
+        assert manifest["system_info"]["file_count"] == 5
+        assert manager.validate_backup(backup_path) == (True, [])
+
+    def test_second_incremental_backup_only_stores_changed_files(self, incremental_env):
+        manager, _base_dir, users_dir, _backup_dir = incremental_env
+        manager.create_backup("inc_first", include_config=False, incremental=True)
+
+        (users_dir / "user-b" / "account.json").write_text(
+            json.dumps({"user_id": "user-b", "changed": True}), encoding="utf-8"
+        )
+        second = manager.create_backup("inc_second", include_config=False, incremental=True)
+
+        manifest = json.loads((Path(second) / "manifest.json").read_text())
+        info = manifest["system_info"]
+        assert manifest["base_backup"] == "inc_first"
+        assert info["reused_files"] == 3
+        assert info["new_blobs"] == 1
+        assert info["new_bytes"] == (users_dir / "user-b" / "account.json").stat().st_size
+        assert manager._get_backup_artifact_size_bytes(second) < 4096 + info["new_bytes"]
+
+    def test_incremental_restore_reads_from_blob_store(self, incremental_env, tmp_path):
+        manager, _base_dir, users_dir, _backup_dir = incremental_env
+        backup_path = manager.create_backup("inc_restore", include_config=False, incremental=True)
+
+        destination = tmp_path / "isolated_restore"
+        assert manager.restore_backup_to_path(backup_path, str(destination)) is True
+        restored = destination / "users" / "user-a" / "account.json"
+        assert json.loads(restored.read_text()) == {"user_id": "user-a"}
+
+        (users_dir / "user-a" / "account.json").write_text("corrupted", encoding="utf-8")
+        manager._restore_user_data_from_directory(Path(backup_path))
+        assert json.loads((users_dir / "user-a" / "account.json").read_text()) == {
+            "user_id": "user-a"
+        }
+
+    def test_validation_reports_missing_blob(self, incremental_env):
+        manager, _base_dir, _users_dir, backup_dir = incremental_env
+        backup_path = manager.create_backup("inc_missing", include_config=False, incremental=True)
+        manifest = json.loads((Path(backup_path) / "manifest.json").read_text())
+        digest = manifest["files"]["users/user-a/account.json"]["sha256"]
+        (backup_dir / "_blobs" / digest[:2] / digest).unlink()
+
+        is_valid, errors = manager.validate_backup(backup_path)
+
+        assert is_valid is False
+        assert "Missing blob for users/user-a/account.json" in errors
+
+    def test_retention_prunes_unreferenced_blobs_but_keeps_store(self, incremental_env):
+        manager, _base_dir, users_dir, backup_dir = incremental_env
+        first = manager.create_backup("inc_old", include_config=False, incremental=True)
+        (users_dir / "user-a" / "account.json").write_text("{}", encoding="utf-8")
+        manager.create_backup("inc_new", include_config=False, incremental=True)
+        old_manifest = json.loads((Path(first) / "manifest.json").read_text())
+        old_digest = old_manifest["files"]["users/user-a/account.json"]["sha256"]
+        old_blob = backup_dir / "_blobs" / old_digest[:2] / old_digest
+        stale_ts = time.time() - 2 * backup_module.MANIFEST_LESS_BACKUP_GRACE_SECONDS
+        for blob in (backup_dir / "_blobs").rglob("*"):
+            if blob.is_file():
+                os.utime(blob, (stale_ts, stale_ts))
+        shutil.rmtree(first)
+
+        backup_module.cleanup_old_backup_artifacts(backup_dir)
+
+        assert (backup_dir / "_blobs").is_dir(), "Blob store is not a manifest-less orphan"
+        assert not old_blob.exists()
+        assert manager.validate_backup(str(backup_dir / "inc_new")) == (True, [])
+
+    def test_create_backup_rejects_non_bool_incremental(self, incremental_env):
+        manager = incremental_env[0]
+        assert manager.create_backup("bad", incremental="yes") is None
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from communication.core.channel_orchestrator import CommunicationManager
+from messages.template_index import MessageTemplateIndex
 
 
 def _runtime_template(text: str, days: list[str], periods: list[str], mid: str = "m1") -> dict:
@@ -39,20 +40,21 @@ class TestChannelOrchestratorMessageSelectionHelpers:
 
     def test_load_predefined_messages_library_returns_none_when_missing_messages(self):
         with patch(
-            "communication.delivery.message_dispatcher.load_user_messages",
-            return_value=[],
+            "communication.delivery.message_dispatcher.get_message_template_index",
+            return_value=MessageTemplateIndex([]),
         ):
             assert self.dispatcher.load_predefined_messages_library("u1", "motivation") is None
 
-    def test_load_predefined_messages_library_uses_runtime_messages_loader(self):
+    def test_load_predefined_messages_library_uses_template_index(self):
         runtime_messages = [_runtime_template("normalized", ["ALL"], ["ALL"])]
+        index = MessageTemplateIndex(runtime_messages)
         with patch(
-            "communication.delivery.message_dispatcher.load_user_messages",
-            return_value=runtime_messages,
+            "communication.delivery.message_dispatcher.get_message_template_index",
+            return_value=index,
         ):
             result = self.dispatcher.load_predefined_messages_library("u1", "motivation")
 
-        assert result == {"messages": runtime_messages}
+        assert result == {"messages": runtime_messages, "index": index}
 
     def test_filter_messages_by_day_and_period(self):
         messages = [
@@ -84,8 +86,8 @@ class TestChannelOrchestratorMessageSelectionHelpers:
             _runtime_template("Unique message", ["ALL"], ["ALL"], "b"),
         ]
         with patch(
-            "communication.delivery.message_dispatcher.get_recent_messages",
-            return_value=[{"sent_text": "hello there", "sent_at": "2026-01-01 12:00:00"}],
+            "communication.delivery.message_dispatcher.get_recent_sent_texts",
+            return_value={"hello there"},
         ):
             result = self.dispatcher.deduplicate_candidate_messages("u1", "motivation", all_messages)
 
@@ -94,8 +96,8 @@ class TestChannelOrchestratorMessageSelectionHelpers:
     def test_deduplicate_candidate_messages_falls_back_to_all_when_empty(self):
         all_messages = [_runtime_template("Repeated", ["ALL"], ["ALL"])]
         with patch(
-            "communication.delivery.message_dispatcher.get_recent_messages",
-            return_value=[{"sent_text": " repeated ", "sent_at": "2026-01-01 12:00:00"}],
+            "communication.delivery.message_dispatcher.get_recent_sent_texts",
+            return_value={"repeated"},
         ):
             result = self.dispatcher.deduplicate_candidate_messages("u1", "motivation", all_messages)
 
@@ -0,0 +1,145 @@
+"""Tests for bounded, persisted conversation session storage."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+import ai.context.history as history_module
+from ai.context.history import ConversationHistory
+from tests.test_helpers.test_utilities.test_user_factory import TestUserFactory
+
+pytestmark = [pytest.mark.unit, pytest.mark.ai, pytest.mark.file_io]
+
+
+def _create_user(name: str, test_data_dir: str) -> str:
+    assert TestUserFactory.create_basic_user(name, test_data_dir=test_data_dir)
+    from core import get_user_id_by_identifier
+
+    return get_user_id_by_identifier(name) or name
+
+
+def test_sessions_reload_from_log_after_restart(test_data_dir):
+    user_id = _create_user("history-restart-user", test_data_dir)
+    first = ConversationHistory()
+    old_session = first.start_session(user_id, session_id="s1")
+    first.add_message(user_id, "user", "hello")
+    first.add_message(user_id, "assistant", "hi there")
+    first.start_session(user_id, session_id="s2")
+    first.add_message(user_id, "user", "second session")
+    first.delete_session(user_id, old_session)
+
+    restarted = ConversationHistory()
+    assert [m["content"] for m in restarted.get_history(user_id)] == ["second session"]
+    assert restarted.get_active_session(user_id).session_id == "s2"
+    assert restarted.get_statistics(user_id) == first.get_statistics(user_id)
+
+    assert restarted.clear_history(user_id)
+    assert ConversationHistory().get_history(user_id) == []
+
+
+def test_idle_users_are_evicted_and_reloaded(test_data_dir):
+    users = [_create_user(f"history-lru-{index}", test_data_dir) for index in range(3)]
+    history = ConversationHistory(max_cached_messages=4)
+    for user_id in users:
+        history.add_message(user_id, "user", f"hello from {user_id}")
+        history.add_message(user_id, "assistant", "hi")
+
+    stats = history.get_memory_stats()
+    assert stats["cached_messages"] <= 4
+    assert users[0] not in history._sessions
+
+    with patch.object(
+        history_module, "_load_sessions", wraps=history_module._load_sessions
+    ) as load:
+        recent = history.get_recent_messages(users[0], 5)
+        assert load.call_count == 1
+    assert [m["content"] for m in recent] == [f"hello from {users[0]}", "hi"]
+    # Reloading the oldest user evicts the next idle one
+    assert users[1] not in history._sessions
+
+
+def test_statistics_and_summary_track_trimmed_sessions():
+    history = ConversationHistory(max_messages_per_session=3)
+    for index in range(4):
+        history.add_message("memory-only-user", "user", f"question {index}")
+        history.add_message("memory-only-user", "assistant", f"answer {index}")
+
+    stats = history.get_statistics("memory-only-user")
+    assert (stats["total_messages"], stats["user_messages"], stats["assistant_messages"]) == (
+        3,
+        1,
+        2,
+    )
+    summary = history.get_conversation_summary(
+        "memory-only-user", history.get_active_session("memory-only-user").session_id
+    )
+    assert summary.splitlines()[:3] == [
+        "Conversation Summary (3 messages):",
+        "- User messages: 1",
+        "- Assistant messages: 2",
+    ]
+    assert summary.endswith("Recent topics: question 3")
+
+
+def test_compacted_session_log_uses_its_own_envelope(test_data_dir):
+    from core.file_operations import load_json_data
+    from core.interaction_log import flush_interaction_log
+    from core.profile_v2_schemas import validate_conversation_history_v2_document
+
+    user_id = _create_user("history-envelope-user", test_data_dir)
+    history = ConversationHistory()
+    history.add_message(user_id, "user", "hello", {"channel": "discord"})
+    history.add_message(user_id, "assistant", "hi there")
+    history.end_session(user_id)
+
+    log_file = history_module._history_log_path(user_id)
+    with patch("core.profile_v2_io.logger") as io_logger:
+        assert flush_interaction_log(log_file)
+    io_logger.warning.assert_not_called()
+
+    document = load_json_data(log_file)
+    assert [row["event"] for row in document["events"]] == [
+        "start",
+        "message",
+        "message",
+        "end",
+    ]
+    assert validate_conversation_history_v2_document(document)[1] == []
+    restarted = ConversationHistory()
+    assert [m["content"] for m in restarted.get_history(user_id)] == ["hello", "hi there"]
+    assert restarted.get_active_session(user_id) is None
+
+
+def test_log_writes_happen_outside_the_shared_lock(test_data_dir):
+    import threading
+
+    user_id = _create_user("history-unlocked-write-user", test_data_dir)
+    history = ConversationHistory()
+    lock_free_during_write: list[bool] = []
+    record_event = history_module._record_event
+
+    def checking_record_event(uid, row):
+        # Another thread must be able to take the lock while this user's row is written
+        acquired: list[bool] = []
+
+        def probe_lock():
+            acquired.append(history._lock.acquire(timeout=1))
+            if acquired[0]:
+                history._lock.release()
+
+        probe = threading.Thread(target=probe_lock)
+        probe.start()
+        probe.join()
+        lock_free_during_write.append(acquired[0])
+        return record_event(uid, row)
+
+    with patch.object(history_module, "_record_event", side_effect=checking_record_event):
+        history.start_session(user_id, session_id="s1")
+        history.add_message(user_id, "user", "hello")
+        history.delete_session(user_id, "s1")
+        history.clear_history(user_id)
+
+    assert lock_free_during_write == [True, True, True, True]
+    assert ConversationHistory().get_history(user_id) == []
@@ -0,0 +1,120 @@
+"""
+Tests for communication/communication_channels/discord/webhooks/dispatch.py
+"""
+
+import threading
+
+import pytest
+
+from communication.communication_channels.discord.webhooks.dispatch import (
+    WebhookLatencyMetrics,
+    WebhookWorkQueue,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.communication
+class TestWebhookLatencyMetrics:
+    """Test per-endpoint latency summaries."""
+
+    def test_snapshot_reports_percentiles_and_errors(self):
+        """Snapshot should summarize counts, percentiles, and error statuses."""
+        metrics = WebhookLatencyMetrics()
+        for index in range(1, 101):
+            metrics.record("POST /", index / 1000, 200 if index <= 98 else 503)
+
+        summary = metrics.snapshot()["POST /"]
+
+        assert summary["count"] == 100
+        assert summary["errors"] == 2
+        assert summary["status_counts"] == {"200": 98, "503": 2}
+        assert summary["p50_ms"] == pytest.approx(51.0, abs=1.0)
+        assert summary["p95_ms"] == pytest.approx(95.0, abs=1.0)
+        assert summary["max_ms"] == pytest.approx(100.0)
+
+    def test_samples_are_bounded(self):
+        """Only the most recent samples feed percentiles; counters keep totals."""
+        metrics = WebhookLatencyMetrics(sample_limit=10)
+        for _ in range(50):
+            metrics.record("GET /", 1.0)
+        for _ in range(10):
+            metrics.record("GET /", 0.001)
+
+        summary = metrics.snapshot()["GET /"]
+
+        assert summary["count"] == 60
+        assert summary["p99_ms"] == pytest.approx(1.0)
+        assert summary["max_ms"] == pytest.approx(1000.0)
+
+
+@pytest.mark.unit
+@pytest.mark.communication
+class TestWebhookWorkQueue:
+    """Test bounded deferred-work queue."""
+
+    def test_submitted_work_runs_on_worker_and_records_metrics(self):
+        """Submitted work should run off the caller thread and be timed."""
+        metrics = WebhookLatencyMetrics()
+        work_queue = WebhookWorkQueue(max_size=5, worker_count=2, metrics=metrics)
+        ran_on = []
+        work_queue.start()
+        try:
+            assert work_queue.submit(
+                "APPLICATION_AUTHORIZED",
+                lambda: ran_on.append(threading.current_thread().name),
+            )
+            assert work_queue.wait_until_idle(timeout=5)
+        finally:
+            work_queue.stop()
+
+        assert ran_on and ran_on[0].startswith("discord-webhook-worker-")
+        stats = work_queue.get_stats()
+        assert stats["submitted"] == 1
+        assert stats["processed"] == 1
+        snapshot = metrics.snapshot()
+        assert snapshot["worker:APPLICATION_AUTHORIZED"]["count"] == 1
+        assert "queue_wait:APPLICATION_AUTHORIZED" in snapshot
+
+    def test_submit_rejects_when_full(self):
+        """A full queue should reject instead of blocking the request thread."""
+        release = threading.Event()
+        work_queue = WebhookWorkQueue(max_size=1, worker_count=1)
+        work_queue.start()
+        try:
+            assert work_queue.submit("slow", release.wait, 5)
+            # Wait for the worker to pick up the first item, freeing the one slot
+            for _ in range(100):
+                if work_queue.get_stats()["depth"] == 0:
+                    break
+                release.wait(0.01)
+            assert work_queue.submit("queued", lambda: True)
+            assert work_queue.submit("overflow", lambda: True) is False
+            assert work_queue.get_stats()["rejected"] == 1
+        finally:
+            release.set()
+            work_queue.stop()
+
+    def test_failed_work_is_counted_not_raised(self):
+        """Exceptions and False results count as failures without killing workers."""
+        work_queue = WebhookWorkQueue(max_size=5, worker_count=1)
+        work_queue.start()
+        try:
+
+            def _boom():
+                raise RuntimeError("boom")
+
+            work_queue.submit("error", _boom)
+            work_queue.submit("false", lambda: False)
+            work_queue.submit("ok", lambda: True)
+            assert work_queue.wait_until_idle(timeout=5)
+        finally:
+            work_queue.stop()
+
+        stats = work_queue.get_stats()
+        assert stats["failed"] == 2
+        assert stats["processed"] == 1
+
+    def test_submit_before_start_is_rejected(self):
+        """Work submitted to a stopped queue should not be silently dropped."""
+        work_queue = WebhookWorkQueue(max_size=5, worker_count=1)
+        assert work_queue.submit("early", lambda: True) is False
@@ -62,6 +62,32 @@ class TestFileLocking:
             content = f.read()
             assert b"test" in content, "Should be able to read file content"
 
+    def test_file_lock_remove_on_release_deletes_lock_file(self, test_data_dir):
+        """A lock-only file is gone after release and can be locked again."""
+        lock_path = os.path.join(test_data_dir, "test_remove_on_release.lock")
+
+        for _ in range(2):
+            with file_lock(lock_path, timeout=5.0, remove_on_release=True):
+                assert os.path.exists(lock_path)
+            assert not os.path.exists(lock_path)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="flock inode check only applies to Unix implementation")
+    def test_lock_on_deleted_or_replaced_file_is_detected(self, test_data_dir):
+        """A handle whose path was deleted or recreated must not count as the lock."""
+        from pathlib import Path
+
+        from core.file_locking import _lock_file_replaced
+
+        lock_path = Path(test_data_dir) / "test_replaced.lock"
+        lock_path.touch()
+        with open(lock_path, "r+b") as handle:
+            assert not _lock_file_replaced(handle, lock_path)
+            lock_path.unlink()
+            assert _lock_file_replaced(handle, lock_path)
+            lock_path.touch()
+            assert _lock_file_replaced(handle, lock_path)
+        lock_path.unlink()
+
     def test_file_lock_creates_file_if_not_exists(self, test_data_dir):
         """Test that file_lock creates file if it doesn't exist."""
         test_file = os.path.join(test_data_dir, "test_new_file.json")
@@ -10,6 +10,7 @@ import json
 
 from core.file_operations import (
 
+    file_signature,
     load_json_data,
     save_json_data,
     determine_file_path,
@@ -584,6 +585,23 @@ class TestFileOperationsEdgeCases:
         result = determine_file_path('invalid_type', 'test-user')
         assert result == ""  # Should return empty string due to error handling decorator
     
+    @pytest.mark.unit
+    @pytest.mark.file_io
+    def test_file_signature_tracks_missing_and_replaced_files(self, tmp_path):
+        """A missing file has a stable version; an atomic replace changes it."""
+        path = str(tmp_path / "data.json")
+        assert file_signature(path) == (path, None)
+
+        save_json_data({"value": 1}, path)
+        first = file_signature(path)
+        assert first[0] == path and first[1] is not None
+        assert file_signature(path) == first
+
+        replacement = str(tmp_path / "replacement.json")
+        save_json_data({"value": 2}, replacement)
+        os.replace(replacement, path)
+        assert file_signature(path) != first
+
     @pytest.mark.integration
     @pytest.mark.file_io
     @pytest.mark.critical
@@ -147,7 +147,7 @@ def test_list_data_points_uses_kebab_case_endpoint(monkeypatch):
     monkeypatch.delenv("MHM_TESTING", raising=False)
     captured: dict = {}
 
-    def _fake_get(url, headers=None, params=None, timeout=None):
+    def _fake_request(method, url, headers=None, params=None, timeout=None):
         captured["url"] = url
         captured["params"] = params
         response = MagicMock()
@@ -155,7 +155,9 @@ def test_list_data_points_uses_kebab_case_endpoint(monkeypatch):
         response.json.return_value = {"dataPoints": []}
         return response
 
-    with patch("integrations.google_health.client.requests.get", side_effect=_fake_get):
+    session = MagicMock()
+    session.request.side_effect = _fake_request
+    with patch("integrations.google_health.client._get_http_session", return_value=session):
         list_data_points(
             "token",
             "daily-resting-heart-rate",
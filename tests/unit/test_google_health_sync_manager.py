@@ -13,6 +13,7 @@ from integrations.google_health.data_handlers import (
     save_auth,
 )
 from integrations.google_health.sync_manager import (
+    compute_high_water_marks,
     sync_user_health_data,
     upsert_daily_summaries,
 )
@@ -88,6 +89,8 @@ def test_sync_completes_with_mocked_api(test_data_dir, monkeypatch):
     user_id = "health-test-user-sync"
     TestUserFactory.create_basic_user(user_id, test_data_dir=test_data_dir)
     update_user_account(user_id, {"features": {"google_health": "enabled"}})
+    # The fixed user id persists across runs; start without a previous high-water mark
+    delete_user_health_data(user_id)
     ensure_health_directory(user_id)
     save_auth(
         user_id,
@@ -107,12 +110,16 @@ def test_sync_completes_with_mocked_api(test_data_dir, monkeypatch):
     ), patch(
         "integrations.google_health.sync_manager.fetch_daily_summaries",
         return_value=sample,
-    ):
+    ) as fetch:
         assert sync_user_health_data(user_id, force=True) is True
+        assert fetch.call_args.kwargs["since"] == {}
+        assert sync_user_health_data(user_id, force=True) is True
+        assert fetch.call_args.kwargs["since"] == {"steps": "2026-06-27"}
 
     state = load_sync_state(user_id) or {}
     assert state.get("last_success_at")
     assert not state.get("last_error")
+    assert state["high_water"]["types"] == {"steps": "2026-06-27"}
     doc = load_daily_summaries(user_id) or {}
     assert doc.get("summaries")
 
@@ -125,3 +132,18 @@ def test_delete_user_health_data(test_data_dir):
     ensure_health_directory(user_id)
     assert delete_user_health_data(user_id) is True
     assert ensure_health_directory(user_id) is True
+
+
+@pytest.mark.unit
+@pytest.mark.user
+def test_compute_high_water_marks_tracks_latest_date_per_type():
+    summaries = [
+        {"date": "2026-06-25", "steps": 100, "resting_hr_bpm": 60.0},
+        {"date": "2026-06-27", "steps": 200, "resting_hr_bpm": None},
+        {"date": "2026-06-26", "sleep_duration_minutes": 400},
+    ]
+    assert compute_high_water_marks(summaries) == {
+        "steps": "2026-06-27",
+        "daily-resting-heart-rate": "2026-06-25",
+        "sleep": "2026-06-26",
+    }
@@ -1,9 +1,15 @@
 """Unit tests for derived health signal builder."""
 
+import random
+from unittest.mock import patch
+
 import pytest
 
+from integrations.google_health.schemas import DailySummaryModel
 from integrations.google_health.signal_builder import (
+    HealthBaselineEngine,
     build_signal_for_date,
+    compute_baseline_stats,
     rebuild_signals_for_summaries,
 )
 
@@ -133,3 +139,45 @@ def test_rebuild_signals_for_dates():
     ]
     signals = rebuild_signals_for_summaries(summaries)
     assert len(signals) == 2
+
+
+@pytest.mark.unit
+def test_baseline_engine_matches_full_recompute_for_every_date():
+    rng = random.Random(36)
+    summaries = []
+    for day in range(1, 32):
+        row = {"date": f"2026-05-{day:02d}"}
+        if rng.random() < 0.8:
+            row["sleep_duration_minutes"] = rng.choice([360, 400, 420, 420, 480])
+        if rng.random() < 0.7:
+            row["steps"] = rng.randint(1000, 12000)
+        if rng.random() < 0.5:
+            row["resting_hr_bpm"] = rng.randint(55, 70)
+        if rng.random() < 0.5:
+            row["sleep_efficiency_pct"] = 85.0
+            row["sleep_stages"] = {"deep_minutes": rng.randint(30, 90), "rem_minutes": 60}
+        summaries.append(row)
+    summaries.append({"date": "2026-05-10", "steps": 500})
+    summaries.append({"date": "2026-05-11", "steps": "not-a-number"})
+
+    engine = HealthBaselineEngine(summaries)
+    for day in {row["date"] for row in summaries}:
+        assert engine.baseline_stats(day) == compute_baseline_stats(summaries, exclude_date=day)
+    assert engine.baseline_stats() == compute_baseline_stats(summaries)
+
+
+@pytest.mark.unit
+def test_rebuild_validates_each_summary_once():
+    summaries = _baseline_summaries(with_quality=True, with_active=True)
+    original = DailySummaryModel.model_validate
+    with patch.object(
+        DailySummaryModel, "model_validate", side_effect=original
+    ) as validate:
+        signals = rebuild_signals_for_summaries(summaries)
+
+    assert len(signals) == len(summaries)
+    assert validate.call_count == len(summaries)
+    assert signals[0] == {
+        **build_signal_for_date(summaries[0]["date"], summaries),
+        "computed_at": signals[0]["computed_at"],
+    }
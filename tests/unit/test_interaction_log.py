@@ -0,0 +1,93 @@
+"""Tests for the append-only interaction log and its in-memory tail."""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+
+import core.interaction_log as interaction_log
+from core.time_utilities import now_datetime_full
+from core.interaction_log import (
+    append_interaction,
+    flush_interaction_log,
+    journal_path_for,
+    recent_interactions,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.core, pytest.mark.file_io]
+
+
+def _row(index: int, when: datetime) -> dict:
+    return {"user_message": f"m{index}", "timestamp": when.strftime("%Y-%m-%d %H:%M:%S")}
+
+
+@pytest.fixture
+def log_file(tmp_path, monkeypatch):
+    monkeypatch.setattr("core.config.CHAT_LOG_COMPACT_DELAY_SECONDS", 3600)
+    monkeypatch.setattr("core.config.CHAT_HISTORY_TAIL_SIZE", 5)
+    path = str(tmp_path / "chat_interactions.json")
+    yield path
+    flush_interaction_log(path)
+
+
+def test_appends_go_to_journal_and_compact_into_document(log_file):
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    for index in range(3):
+        assert append_interaction(log_file, _row(index, base + timedelta(minutes=index)))
+
+    assert not os.path.exists(log_file)
+    with open(journal_path_for(log_file), encoding="utf-8") as handle:
+        assert len(handle.readlines()) == 3
+    assert [r["user_message"] for r in recent_interactions(log_file, 2)] == ["m2", "m1"]
+
+    assert flush_interaction_log(log_file)
+    with open(log_file, encoding="utf-8") as handle:
+        document = json.load(handle)
+    assert [r["user_message"] for r in document["interactions"]] == ["m0", "m1", "m2"]
+    assert os.path.getsize(journal_path_for(log_file)) == 0
+    assert [r["user_message"] for r in recent_interactions(log_file, 5)] == ["m2", "m1", "m0"]
+
+
+def test_warm_tail_serves_reads_without_loading(log_file):
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    # Same-second rows keep write order, like the sorted full read
+    for index in range(8):
+        append_interaction(log_file, _row(index, base + timedelta(minutes=index // 2)))
+    expected = [f"m{i}" for i in (6, 7, 4, 5, 2)]
+    assert [r["user_message"] for r in recent_interactions(log_file, 5)] == expected
+
+    with patch.object(
+        interaction_log, "load_all_interactions", wraps=interaction_log.load_all_interactions
+    ) as load:
+        append_interaction(log_file, _row(8, base + timedelta(minutes=9)))
+        assert recent_interactions(log_file, 2)[0]["user_message"] == "m8"
+        assert load.call_count == 0
+        # More than the tail holds falls back to a full read
+        assert len(recent_interactions(log_file, 20)) == 9
+        assert load.call_count == 1
+
+
+def test_outside_write_reseeds_tail(log_file):
+    base = datetime(2026, 1, 1, 12, 0, 0)
+    append_interaction(log_file, _row(0, base))
+    assert [r["user_message"] for r in recent_interactions(log_file, 5)] == ["m0"]
+
+    # Another process appending to the same journal
+    with open(journal_path_for(log_file), "a", encoding="utf-8") as handle:
+        handle.write(json.dumps(_row(1, base + timedelta(minutes=1))) + "\n")
+        handle.write("{torn line")
+
+    assert [r["user_message"] for r in recent_interactions(log_file, 5)] == ["m1", "m0"]
+
+
+def test_compaction_applies_retention(log_file):
+    now = now_datetime_full()
+    append_interaction(log_file, _row(0, now - timedelta(days=40)))
+    append_interaction(log_file, _row(1, now - timedelta(days=1)))
+
+    assert flush_interaction_log(log_file, retention_days=30)
+    assert [r["user_message"] for r in recent_interactions(log_file, 5)] == ["m1"]
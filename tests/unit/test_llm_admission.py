@@ -0,0 +1,105 @@
+"""Tests for ai/client/admission.py (priority admission for LM Studio calls)."""
+
+import threading
+import time
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from ai.client.admission import AdmissionClass, LLMAdmissionController
+from ai.client.lm_studio_client import call_lm_studio_api
+
+
+def _acquire_in_thread(controller, request_class, deadline, order):
+    def run():
+        ticket = controller.acquire(request_class, deadline)
+        order.append(request_class)
+        if ticket is not None:
+            controller.release(ticket)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def _wait_for_queue(controller, depth):
+    for _ in range(200):
+        if controller.get_stats()["queued"] == depth:
+            return
+        time.sleep(0.01)
+    raise AssertionError(f"queue never reached {depth}")
+
+
+@pytest.mark.unit
+@pytest.mark.ai
+class TestLLMAdmissionController:
+    def test_interactive_is_served_before_earlier_scheduled_requests(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        held = controller.acquire(AdmissionClass.SCHEDULED, 10)
+        order = []
+
+        threads = [_acquire_in_thread(controller, AdmissionClass.SCHEDULED, 10, order)]
+        _wait_for_queue(controller, 1)
+        threads.append(_acquire_in_thread(controller, AdmissionClass.PARSING, 10, order))
+        _wait_for_queue(controller, 2)
+        threads.append(_acquire_in_thread(controller, AdmissionClass.INTERACTIVE, 10, order))
+        _wait_for_queue(controller, 3)
+        controller.release(held)
+        for thread in threads:
+            thread.join(5)
+
+        assert order == [
+            AdmissionClass.INTERACTIVE,
+            AdmissionClass.PARSING,
+            AdmissionClass.SCHEDULED,
+        ]
+        classes = controller.get_stats()["classes"]
+        assert classes["scheduled"]["admitted"] == 2
+        assert classes["interactive"]["admitted"] == classes["parsing"]["admitted"] == 1
+
+    def test_deadline_that_cannot_be_met_is_rejected_or_times_out(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        held = controller.acquire(AdmissionClass.SCHEDULED, 30)
+
+        # Nothing known about service time yet: queue until the deadline
+        assert controller.acquire(AdmissionClass.INTERACTIVE, 0.1) is None
+        # Service time is now known; a deadline shorter than the wait is refused at once
+        controller._service_seconds = 10.0
+        assert controller.acquire(AdmissionClass.INTERACTIVE, 5) is None
+        controller.release(held)
+
+        interactive = controller.get_stats()["classes"]["interactive"]
+        assert (interactive["timed_out"], interactive["rejected"]) == (1, 1)
+        assert controller.get_stats()["queued"] == 0
+
+    def test_idle_controller_admits_short_deadline_after_a_slow_call(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        slow = controller.acquire(AdmissionClass.SCHEDULED, 120)
+        controller.release(replace(slow, admitted_at=slow.admitted_at - 60))
+        assert controller.get_stats()["service_seconds"] >= 60.0
+
+        ticket = controller.acquire(AdmissionClass.INTERACTIVE, 5)
+
+        assert ticket is not None
+        controller.release(ticket)
+        assert controller.get_stats()["classes"]["interactive"]["rejected"] == 0
+
+    def test_unadmitted_call_returns_none_without_posting(self):
+        controller = LLMAdmissionController(max_concurrent=1)
+        held = controller.acquire(AdmissionClass.INTERACTIVE, 120)
+        controller._service_seconds = 60.0
+
+        with (
+            patch("ai.client.lm_studio_client.get_llm_admission_controller", return_value=controller),
+            patch("ai.client.lm_studio_client.requests.post") as post,
+        ):
+            result = call_lm_studio_api(
+                [{"role": "user", "content": "hi"}],
+                timeout=5,
+                request_class=AdmissionClass.SCHEDULED,
+            )
+
+        controller.release(held)
+        assert result is None
+        post.assert_not_called()
@@ -0,0 +1,172 @@
+"""
+Tests for core/log_archiver.py and its use by log rotation and daily archival.
+"""
+
+import gzip
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core.log_archiver import (
+    LogArchivalPipeline,
+    LogSizeBudget,
+    stream_compress_file,
+)
+from core.logger import BackupDirectoryRotatingFileHandler, compress_old_logs
+from tests.test_helpers.test_utilities import TestLogPathMocks
+
+
+def _age_file(path, days):
+    """Backdate a file's mtime by ``days``."""
+    old_time = time.time() - days * 24 * 3600
+    os.utime(path, (old_time, old_time))
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestStreamCompressFile:
+    """Test chunked gzip streaming into the archive directory."""
+
+    def test_round_trip_removes_source_and_leaves_no_partial(self, tmp_path):
+        """Archive should decompress to the source bytes and replace the source."""
+        source = tmp_path / "app.log.2026-01-01"
+        payload = b"2026-01-01 00:00:00 - mhm.app - INFO - hello\n" * 5000
+        source.write_bytes(payload)
+        destination = tmp_path / "archive" / "app.log.2026-01-01.gz"
+
+        result = stream_compress_file(source, destination, chunk_size=4096)
+
+        assert result == (len(payload), destination.stat().st_size)
+        assert gzip.decompress(destination.read_bytes()) == payload
+        assert not source.exists()
+        assert [p.name for p in destination.parent.iterdir()] == [destination.name]
+
+    def test_max_bytes_limits_growing_file(self, tmp_path):
+        """Only the requested prefix should be archived and the source kept."""
+        source = tmp_path / "app.log"
+        source.write_bytes(b"a" * 1000 + b"b" * 1000)
+        destination = tmp_path / "app.log.gz"
+
+        stream_compress_file(source, destination, max_bytes=1000, remove_source=False)
+
+        assert gzip.decompress(destination.read_bytes()) == b"a" * 1000
+        assert source.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestLogSizeBudget:
+    """Test incremental archive size budget."""
+
+    def test_add_evicts_oldest_archives_but_not_the_new_one(self, tmp_path):
+        """Going over budget should remove the oldest archives first."""
+        for index in range(3):
+            archive = tmp_path / f"app.log.2026-01-0{index + 1}.gz"
+            archive.write_bytes(b"x" * 100)
+            _age_file(archive, 10 - index)
+        budget = LogSizeBudget(tmp_path, max_bytes=250)
+        assert budget.total_bytes == 300
+
+        new_archive = tmp_path / "app.log.2026-01-04.gz"
+        new_archive.write_bytes(b"x" * 100)
+        removed = budget.add(new_archive, 100)
+
+        assert [os.path.basename(path) for path in removed] == [
+            "app.log.2026-01-01.gz",
+            "app.log.2026-01-02.gz",
+        ]
+        assert budget.total_bytes == 200
+        assert new_archive.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestLogArchivalPipeline:
+    """Test the background archival pool."""
+
+    def test_archive_files_compresses_batch_in_parallel(self, tmp_path):
+        """Batch archival should compress every file and count bytes."""
+        sources = []
+        for index in range(4):
+            source = tmp_path / f"app.log.2026-01-0{index + 1}"
+            source.write_text(f"line {index}\n" * 1000, encoding="utf-8")
+            sources.append(source)
+        archive_dir = tmp_path / "archive"
+        pipeline = LogArchivalPipeline(max_workers=2)
+        try:
+            archived = pipeline.archive_files(
+                [(source, archive_dir / f"{source.name}.gz", True) for source in sources]
+            )
+        finally:
+            pipeline.shutdown()
+
+        assert archived == 4
+        assert sorted(p.name for p in archive_dir.iterdir()) == sorted(
+            f"{source.name}.gz" for source in sources
+        )
+        stats = pipeline.get_stats()
+        assert stats["completed"] == 4
+        assert stats["bytes_in"] > stats["bytes_out"] > 0
+
+    def test_rollover_returns_before_backup_is_compressed(self, tmp_path, monkeypatch):
+        """doRollover should only rename; the pool moves and compresses the file."""
+        monkeypatch.setenv("DISABLE_LOG_ROTATION", "0")
+        monkeypatch.setattr("core.config.LOG_COMPRESS_BACKUPS", True)
+        log_file = tmp_path / "app.log"
+        backup_dir = tmp_path / "backups"
+        handler = BackupDirectoryRotatingFileHandler(
+            str(log_file), backup_dir=str(backup_dir), when="midnight", encoding="utf-8"
+        )
+        handler.suffix = "%Y-%m-%d"
+        handler.stream.write("rotated line\n" * 1000)
+        handler.stream.flush()
+        _age_file(log_file, 1)
+
+        pipeline = LogArchivalPipeline(max_workers=1)
+        with patch("core.logger._get_rollover_archiver", return_value=pipeline):
+            handler.doRollover()
+        try:
+            assert pipeline.wait_until_idle(timeout=10)
+        finally:
+            pipeline.shutdown()
+            handler.close()
+
+        backups = list(backup_dir.iterdir())
+        assert len(backups) == 1 and backups[0].name.endswith(".gz")
+        assert gzip.decompress(backups[0].read_bytes()).startswith(b"rotated line\n")
+        assert log_file.exists() and log_file.stat().st_size == 0
+        assert not [p for p in tmp_path.iterdir() if p.name.startswith("app.log.")]
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestCompressOldLogsPipeline:
+    """Test daily archival through the pipeline."""
+
+    def test_precompressed_backups_are_moved_not_recompressed(self, tmp_path):
+        """Old .gz backups move to the archive as-is; plain backups get compressed."""
+        log_paths = TestLogPathMocks.create_complete_log_paths_mock(str(tmp_path))
+        backup_dir = tmp_path / "backups"
+        backup_dir.mkdir()
+        compressed_payload = gzip.compress(b"already compressed\n")
+        (backup_dir / "app.log.2026-01-01.gz").write_bytes(compressed_payload)
+        (backup_dir / "app.log.2026-01-02").write_text("plain\n", encoding="utf-8")
+        (backup_dir / "app.log.2026-01-09").write_text("recent\n", encoding="utf-8")
+        _age_file(backup_dir / "app.log.2026-01-01.gz", 8)
+        _age_file(backup_dir / "app.log.2026-01-02", 8)
+
+        pipeline = LogArchivalPipeline(max_workers=2)
+        with (
+            patch("core.logger._get_log_paths_for_environment", return_value=log_paths),
+            patch("core.log_archiver.get_log_archiver", return_value=pipeline),
+        ):
+            result = compress_old_logs()
+        pipeline.shutdown()
+
+        archive_dir = tmp_path / "archive"
+        assert result == 2
+        assert (archive_dir / "app.log.2026-01-01.gz").read_bytes() == compressed_payload
+        assert gzip.decompress((archive_dir / "app.log.2026-01-02.gz").read_bytes()) == b"plain\n"
+        assert [p.name for p in backup_dir.iterdir()] == ["app.log.2026-01-09"]
@@ -0,0 +1,94 @@
+"""Tests for the predefined message template selection index."""
+
+from __future__ import annotations
+
+import itertools
+from unittest.mock import patch
+
+import pytest
+
+import messages.message_data_manager as message_data_manager
+from communication.delivery.message_dispatcher import PredefinedMessageDispatcher
+from messages.message_data_manager import add_message, delete_message, store_sent_message
+from messages.template_index import (
+    MessageTemplateIndex,
+    get_message_template_index,
+    get_recent_sent_texts,
+)
+from tests.test_helpers.test_utilities.test_user_factory import TestUserFactory
+
+pytestmark = [pytest.mark.unit, pytest.mark.messages]
+
+
+def _template(mid: str, days, periods) -> dict:
+    return {"id": mid, "text": f"text {mid}", "schedule": {"days": days, "periods": periods}}
+
+
+def _create_user(name: str, test_data_dir: str) -> str:
+    assert TestUserFactory.create_basic_user(name, test_data_dir=test_data_dir)
+    from core import get_user_id_by_identifier
+
+    return get_user_id_by_identifier(name) or name
+
+
+def test_index_candidates_match_linear_filter():
+    messages = [
+        _template("a", ["ALL"], ["ALL"]),
+        _template("b", ["Monday"], ["morning"]),
+        _template("c", ["Monday", "Tuesday"], ["ALL"]),
+        _template("d", ["Tuesday"], ["evening", "morning"]),
+        {"id": "e", "text": "no schedule"},
+        _template("f", [], None),
+    ]
+    index = MessageTemplateIndex(messages)
+    dispatcher = PredefinedMessageDispatcher(communication_manager=None)
+
+    for day, periods in itertools.product(
+        ["Monday", "Tuesday", "Sunday"], [["morning"], ["evening"], ["ALL"], ["morning", "evening"]]
+    ):
+        current_days = [day, "ALL"]
+        assert index.candidates(current_days, periods) == (
+            dispatcher.filter_messages_by_day_and_period(messages, current_days, periods)
+        )
+
+    specific, all_period = index.split_by_period_weighting(messages)
+    assert [m["id"] for m in specific] == ["b", "d"]
+    assert [m["id"] for m in all_period] == ["a", "c", "e", "f"]
+
+
+def test_index_is_reused_until_templates_change(test_data_dir):
+    user_id = _create_user("template-index-user", test_data_dir)
+    add_message(user_id, "motivational", {"text": "first"})
+
+    with patch.object(
+        message_data_manager, "load_user_messages", wraps=message_data_manager.load_user_messages
+    ) as load:
+        first = get_message_template_index(user_id, "motivational")
+        assert get_message_template_index(user_id, "motivational") is first
+        assert load.call_count == 1
+
+        add_message(user_id, "motivational", {"text": "second"})
+        second = get_message_template_index(user_id, "motivational")
+        assert load.call_count == 2
+
+    assert [m["text"] for m in second.messages] == ["first", "second"]
+    delete_message(user_id, "motivational", second.messages[0]["id"])
+    assert [m["text"] for m in get_message_template_index(user_id, "motivational").messages] == [
+        "second"
+    ]
+
+
+def test_recent_sent_texts_are_fed_by_store_sent_message(test_data_dir):
+    user_id = _create_user("template-recent-user", test_data_dir)
+    store_sent_message(user_id, "motivational", "m1", "  Hello There ")
+
+    with patch.object(
+        message_data_manager,
+        "get_recent_messages",
+        wraps=message_data_manager.get_recent_messages,
+    ) as recent:
+        assert get_recent_sent_texts(user_id, "motivational") == {"hello there"}
+        store_sent_message(user_id, "motivational", "m2", "Second one")
+        store_sent_message(user_id, "health", "m3", "Other category")
+        assert get_recent_sent_texts(user_id, "motivational") == {"hello there", "second one"}
+        assert recent.call_count == 1
@@ -147,6 +147,7 @@ def test_chat_interactions_save_always_v2_envelope():
         ("context", "validate_context_v2_document"),
         ("tags", "validate_tags_v2_document"),
         ("chat_interactions", "validate_chat_interactions_v2_document"),
+        ("conversation_history", "validate_conversation_history_v2_document"),
     ],
 )
 def test_validate_v2_document_dispatches_profile_types(
@@ -0,0 +1,101 @@
+"""Tests for the stable-prefix prompt layout and prompt-prefix tracking."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from ai.context.assembly import assemble_comprehensive_messages
+from ai.prompts.manager import PromptManager
+from ai.prompts.prefix_tracking import PromptPrefixTracker
+from tests.test_helpers.test_utilities.test_user_factory import TestUserFactory
+
+
+pytestmark = [pytest.mark.unit, pytest.mark.ai]
+
+
+def _view(profile: str, volatile: str) -> dict:
+    return {
+        "profile_text": profile,
+        "prompt_text": volatile,
+        "structured": {"action_catalog": {"summary": "Actions: create_task"}},
+    }
+
+
+def test_stable_layout_orders_layers_and_keeps_instructions_identical():
+    manager = PromptManager()
+    tracker = PromptPrefixTracker()
+    with patch("ai.prompts.prefix_tracking._tracker", tracker):
+        first = manager.compose_product_prompt(
+            "chat_response",
+            context_view=_view("User Profile:\nName: Ada", "User Context:\nIt is 09:00"),
+            extra_instructions="Reply with ACTION lines.",
+        ).content
+        second = manager.compose_product_prompt(
+            "chat_response",
+            context_view=_view("User Profile:\nName: Bo", "User Context:\nIt is 09:05"),
+            extra_instructions="Reply with ACTION lines.",
+        ).content
+
+    order = [
+        first.index("[persona]"),
+        first.index("[available_actions]"),
+        first.index("Reply with ACTION lines."),
+        first.index("[user_profile]"),
+        first.index("[selected_user_context]"),
+    ]
+    assert order == sorted(order)
+    prefix = first[: first.index("[user_profile]")]
+    assert second.startswith(prefix)
+
+    stats = tracker.get_stats()
+    assert stats["layers"]["instructions"] == {"hits": 1, "hit_rate": 0.5}
+    assert stats["layers"]["profile"]["hits"] == 0
+    assert stats["distinct_instruction_prefixes"] == {"chat_response": 1}
+
+
+def test_legacy_layout_keeps_instructions_after_context():
+    manager = PromptManager()
+    with patch("core.config.AI_PROMPT_LAYOUT", "legacy"):
+        content = manager.compose_product_prompt(
+            "chat_response",
+            context_view={"prompt_text": "User Context:\nIt is 09:00"},
+            extra_instructions="Reply with ACTION lines.",
+        ).content
+
+    assert "[user_profile]" not in content
+    assert content.index("[selected_user_context]") < content.index("Reply with ACTION lines.")
+
+
+def test_tracker_counts_cumulative_layer_hits_and_reused_share():
+    tracker = PromptPrefixTracker()
+    tracker.record("chat_response", [("instructions", "AAAA"), ("profile", "PP"), ("volatile", "v1")])
+    tracker.record("chat_response", [("instructions", "AAAA"), ("profile", "PP"), ("volatile", "v2")])
+    tracker.record("chat_response", [("instructions", "AAAA"), ("profile", "QQ"), ("volatile", "v2")])
+
+    stats = tracker.get_stats()
+    assert stats["requests"] == 3
+    assert stats["layers"]["instructions"]["hits"] == 2
+    assert stats["layers"]["profile"]["hits"] == 1
+    # A later layer never counts once an earlier one differs
+    assert stats["layers"]["volatile"]["hits"] == 0
+    assert stats["reused_char_ratio"] == round((6 + 4) / 24, 3)
+
+
+def test_chat_messages_for_different_users_share_the_instruction_prefix(test_data_dir):
+    from core import get_user_id_by_identifier
+
+    user_ids = []
+    for name in ("prefix-user-a", "prefix-user-b"):
+        assert TestUserFactory.create_basic_user(name, test_data_dir=test_data_dir)
+        user_ids.append(get_user_id_by_identifier(name) or name)
+
+    systems = [
+        assemble_comprehensive_messages(user_id, "how is my day going?")[0]["content"]
+        for user_id in user_ids
+    ]
+
+    cut = systems[0].index("[user_profile]")
+    assert systems[1][:cut] == systems[0][:cut]
+    assert "Current date and time" not in systems[0][:cut]
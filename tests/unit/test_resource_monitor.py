@@ -0,0 +1,88 @@
+"""Tests for core/resource_monitor.py and its use by the AI chatbot."""
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from core.resource_monitor import (
+    MODEL_PROBE_INTERVAL_SECONDS,
+    OVERLOADED_CONSECUTIVE_FAILURES,
+    ResourceMonitor,
+)
+
+
+def _memory(percent, available_gb):
+    return SimpleNamespace(percent=percent, available=int(available_gb * 1024**3))
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestResourceMonitor:
+    def test_samples_are_smoothed_and_cpu_never_blocks(self):
+        monitor = ResourceMonitor(interval_seconds=5, shed_latency_seconds=20)
+        with (
+            patch("psutil.cpu_percent", side_effect=[90.0, 10.0]) as cpu,
+            patch("psutil.virtual_memory", return_value=_memory(50, 8)),
+        ):
+            monitor.sample_now()
+            assert monitor.snapshot().constrained
+            monitor.sample_now()
+
+        assert all(call.kwargs == {"interval": None} for call in cpu.call_args_list)
+        assert monitor.snapshot().cpu_percent == pytest.approx(50.0)
+        assert not monitor.snapshot().constrained
+
+    def test_slow_model_sheds_load_until_a_fast_probe(self):
+        monitor = ResourceMonitor(interval_seconds=5, shed_latency_seconds=20)
+        monitor.record_model_call(30.0, ok=True)
+        assert monitor.is_overloaded()
+
+        # Right after a call: shed; once the probe interval passes: let one through
+        assert monitor.should_shed_load()
+        monitor._last_model_call -= MODEL_PROBE_INTERVAL_SECONDS
+        assert not monitor.should_shed_load()
+        assert monitor.should_shed_load()
+
+        monitor.record_model_call(2.0, ok=True)
+        assert monitor.snapshot().model_latency_seconds == 2.0
+        assert not monitor.should_shed_load()
+        assert monitor.get_health()["shed_requests"] == 2
+
+    def test_consecutive_failures_overload_and_disabled_never_sheds(self):
+        monitor = ResourceMonitor(interval_seconds=5, shed_latency_seconds=20, shedding_enabled=False)
+        for _ in range(OVERLOADED_CONSECUTIVE_FAILURES):
+            monitor.record_model_call(1.0, ok=False)
+
+        assert monitor.is_overloaded()
+        assert not monitor.should_shed_load()
+        monitor.record_model_call(1.0, ok=True)
+        assert not monitor.is_overloaded()
+
+
+@pytest.mark.unit
+@pytest.mark.ai
+class TestChatbotUsesResourceMonitor:
+    def test_overloaded_model_answers_with_fallback_without_calling_lm_studio(self):
+        from ai.chat.chatbot import AIChatBotSingleton
+
+        chatbot = AIChatBotSingleton()
+        monitor = ResourceMonitor(interval_seconds=5, shed_latency_seconds=20)
+        monitor.record_model_call(40.0, ok=True)
+
+        with (
+            patch("ai.chat.chatbot.get_resource_monitor", return_value=monitor),
+            patch.object(chatbot, "_ensure_lm_studio_available", return_value=True),
+            patch("ai.chat.chatbot.call_lm_studio_api") as api,
+            patch(
+                "ai.chat.chatbot.get_fallback_responses"
+            ) as fallback,
+        ):
+            fallback.return_value.contextual.return_value = "fallback reply"
+            response = chatbot.generate_response(
+                "how should I plan my afternoon?", user_id="user-1", mode="chat"
+            )
+            assert chatbot._get_adaptive_timeout(15) == 15
+
+        assert response == "fallback reply"
+        api.assert_not_called()
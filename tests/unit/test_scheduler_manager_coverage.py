@@ -6,6 +6,7 @@ from datetime import timedelta
 from unittest.mock import Mock, patch
 
 import pytest
+import pytz
 
 from communication.core.message_send_result import MessageSendResult
 from scheduler import task_reminders as tr
@@ -128,33 +129,29 @@ class TestSchedulerManagerUncoveredPaths:
     def test_schedule_message_at_random_time_success(self, scheduler_manager):
         user_id = "user-1"
         category = "motivational"
-        future = now_datetime_full() + timedelta(hours=2)
+        now = pytz.timezone("America/Regina").localize(now_datetime_full())
 
         with (
             patch(
                 "scheduler.manager.get_schedule_time_periods",
-                return_value={"morning": {"active": True}},
-            ),
-            patch.object(
-                scheduler_manager,
-                "get_random_time_within_period",
-                return_value="2026-06-20 10:30",
-            ),
-            patch(
-                "scheduler.manager.load_and_localize_datetime",
-                return_value=future,
+                return_value={
+                    "morning": {"active": True, "start_time": "09:00", "end_time": "11:00"}
+                },
             ),
             patch(
-                "scheduler.manager.localized_now_for_user",
-                return_value=now_datetime_full(),
+                "scheduler.manager.resolve_user_timezone_str",
+                return_value="America/Regina",
             ),
-            patch.object(scheduler_manager, "is_time_conflict", return_value=False),
+            patch("scheduler.manager.localized_now_for_user", return_value=now),
             patch.object(scheduler_manager, "set_wake_timer") as mock_wake,
             patch("scheduler.manager.schedule.every") as mock_every,
         ):
             mock_every.return_value.day.at.return_value.do.return_value = None
             scheduler_manager.schedule_message_at_random_time(user_id, category)
             mock_wake.assert_called_once()
+            send_at = mock_wake.call_args[0][0]
+            assert send_at > now
+            assert "09:00" <= send_at.strftime("%H:%M") <= "11:00"
 
     def test_schedule_message_at_random_time_no_periods(self, scheduler_manager):
         with patch(
@@ -164,27 +161,20 @@ class TestSchedulerManagerUncoveredPaths:
 
     def test_schedule_message_for_period_success_path(self, scheduler_manager):
         user_id = "user-1"
-        future = now_datetime_full() + timedelta(hours=3)
+        now = pytz.timezone("America/Regina").localize(now_datetime_full())
 
         with (
-            patch.object(
-                scheduler_manager,
-                "get_random_time_within_period",
-                return_value="2026-06-20 10:30",
+            patch(
+                "scheduler.manager.get_schedule_time_periods",
+                return_value={
+                    "morning": {"active": True, "start_time": "09:00", "end_time": "12:00"}
+                },
             ),
             patch(
                 "scheduler.manager.resolve_user_timezone_str",
                 return_value="America/Regina",
             ),
-            patch(
-                "scheduler.manager.load_and_localize_datetime",
-                return_value=future,
-            ),
-            patch(
-                "scheduler.manager.localized_now_for_user",
-                return_value=now_datetime_full(),
-            ),
-            patch.object(scheduler_manager, "is_time_conflict", return_value=False),
+            patch("scheduler.manager.localized_now_for_user", return_value=now),
             patch.object(scheduler_manager, "set_wake_timer") as mock_wake,
             patch("scheduler.manager.schedule.every") as mock_every,
         ):
@@ -193,6 +183,9 @@ class TestSchedulerManagerUncoveredPaths:
                 user_id, "motivational", "morning"
             )
             mock_wake.assert_called_once()
+            mock_every.return_value.day.at.assert_called_once_with(
+                mock_wake.call_args[0][0].strftime("%H:%M")
+            )
 
     def test_handle_sending_scheduled_message_skipped_removes_job(
         self, scheduler_manager
@@ -258,12 +251,12 @@ class TestSchedulerManagerUncoveredPaths:
                 },
             ),
             patch.object(scheduler_manager, "cleanup_old_tasks"),
-            patch.object(
-                scheduler_manager, "schedule_message_for_period"
-            ) as mock_period,
+            patch.object(scheduler_manager, "set_wake_timer") as mock_wake,
+            patch("scheduler.manager.schedule.every") as mock_every,
         ):
             scheduler_manager.schedule_daily_message_job("user-1", "motivational")
-            mock_period.assert_not_called()
+            mock_every.assert_not_called()
+            mock_wake.assert_not_called()
 
     def test_set_wake_timer_skips_in_test_mode(self, scheduler_manager, monkeypatch):
         monkeypatch.setenv("MHM_TESTING", "1")
@@ -0,0 +1,95 @@
+"""Tests for scheduler/send_plan.py daily send planning."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytz
+
+from scheduler.send_plan import (
+    SendWindow,
+    build_send_windows,
+    daily_plan_seed,
+    plan_daily_sends,
+)
+
+TZ = pytz.timezone("America/Regina")
+
+
+def _window(category, start_hour, end_hour, period="p", day=date(2026, 3, 2)):
+    return SendWindow(
+        category,
+        period,
+        TZ.localize(datetime.combine(day, datetime.min.time()) + timedelta(hours=start_hour)),
+        TZ.localize(datetime.combine(day, datetime.min.time()) + timedelta(hours=end_hour)),
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.scheduler
+class TestPlanDailySends:
+    def test_overlapping_windows_get_spaced_sends_inside_their_windows(self):
+        windows = [
+            _window("motivational", 9, 18),
+            _window("health", 9, 18),
+            _window("quotes", 12, 21),
+            _window("checkin", 8, 12),
+        ]
+
+        plan = plan_daily_sends(windows, seed=42)
+
+        assert sorted(send.category for send in plan) == sorted(w.category for w in windows)
+        by_category = {w.category: w for w in windows}
+        for send in plan:
+            window = by_category[send.category]
+            assert window.start <= send.send_at <= window.end
+            assert send.send_at.second == 0
+        times = [send.send_at for send in plan]
+        assert times == sorted(times)
+        assert all(b - a >= timedelta(hours=2) for a, b in zip(times, times[1:]))
+
+    def test_same_seed_gives_same_plan(self):
+        windows = [_window("motivational", 9, 18), _window("health", 10, 20)]
+        seed = daily_plan_seed("user-1", date(2026, 3, 2))
+
+        assert plan_daily_sends(windows, seed=seed) == plan_daily_sends(
+            list(reversed(windows)), seed=seed
+        )
+        assert seed != daily_plan_seed("user-1", date(2026, 3, 3))
+
+    def test_tight_windows_relax_spacing_instead_of_dropping_sends(self):
+        windows = [_window(f"cat{i}", 9, 10) for i in range(4)]
+
+        plan = plan_daily_sends(windows, seed=1)
+
+        assert len(plan) == 4
+        times = [send.send_at for send in plan]
+        assert len(set(times)) == 4
+
+    def test_fixed_times_are_avoided(self):
+        fixed = _window("x", 12, 12).start
+        windows = [_window("motivational", 10, 14)]
+
+        for seed in range(25):
+            (send,) = plan_daily_sends(windows, seed=seed, fixed_times=[fixed])
+            assert abs(send.send_at - fixed) >= timedelta(hours=2)
+
+
+@pytest.mark.unit
+@pytest.mark.scheduler
+class TestBuildSendWindows:
+    def test_filters_and_rolls_started_periods_to_tomorrow(self):
+        now = TZ.localize(datetime(2026, 3, 2, 10, 0))  # Monday
+        periods = {
+            "ALL": {"start_time": "00:00", "end_time": "23:59"},
+            "morning": {"active": True, "start_time": "09:00", "end_time": "12:00"},
+            "evening": {"active": True, "start_time": "18:00", "end_time": "20:00"},
+            "off": {"active": False, "start_time": "13:00", "end_time": "14:00"},
+            "tuesday": {"start_time": "15:00", "end_time": "16:00", "days": ["Tuesday"]},
+            "broken": {"start_time": "bad", "end_time": "16:00"},
+        }
+
+        windows = {w.period_name: w for w in build_send_windows("motivational", periods, now, TZ)}
+
+        assert set(windows) == {"morning", "evening"}
+        assert windows["morning"].start.date() == date(2026, 3, 3)
+        assert windows["evening"].start == TZ.localize(datetime(2026, 3, 2, 18, 0))
@@ -0,0 +1,121 @@
+"""Tests for scheduler/sharding.py (sharded multi-process scheduling)."""
+
+import queue
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scheduler.sharding import (
+    ShardedSchedulerCoordinator,
+    ShardWorker,
+    _ShardDeliveryProxy,
+    shard_for_user,
+)
+
+
+class _ThreadContext:
+    """multiprocessing-context stand-in that runs shards as threads"""
+
+    Queue = queue.Queue
+
+    @staticmethod
+    def Process(target, args, name):
+        return threading.Thread(target=target, args=args, name=name)
+
+
+def _fake_shard_worker(shard_index, shard_count, command_queue, reply_queue, event_queue):
+    """Speaks the worker protocol; reschedules trigger a send through the proxy"""
+    proxy = _ShardDeliveryProxy(shard_index, event_queue, reply_queue)
+    event_queue.put(("health", shard_index, {"jobs": 3, "users": 1, "reported_at": time.time()}))
+    while True:
+        command = command_queue.get()
+        if command is None:
+            return
+        request_id, method, args, _kwargs = command
+        if method == "reset_and_reschedule_daily_messages":
+            category, user_id = args
+            outcome = proxy.handle_message_sending(user_id=user_id, category=category)
+            value = (shard_index, outcome.status)
+        else:
+            value = (shard_index, method)
+        event_queue.put(("result", shard_index, request_id, True, value))
+
+
+@pytest.mark.unit
+@pytest.mark.scheduler
+class TestShardForUser:
+    def test_assignment_is_stable_and_spread(self):
+        user_ids = [f"user-{i}" for i in range(400)]
+
+        shards = [shard_for_user(user_id, 4) for user_id in user_ids]
+
+        assert shards == [shard_for_user(user_id, 4) for user_id in user_ids]
+        assert all(0 <= shard < 4 for shard in shards)
+        assert min(shards.count(index) for index in range(4)) > 60
+        assert shard_for_user("user-1", 1) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.scheduler
+class TestShardWorker:
+    def test_replan_schedules_only_owned_users(self):
+        worker = ShardWorker(1, 3, queue.Queue(), queue.Queue())
+        worker.manager = MagicMock()
+        user_ids = [f"user-{i}" for i in range(30)]
+
+        with patch("scheduler.sharding.get_all_user_ids", return_value=user_ids):
+            planned = worker.replan()
+
+        owned = [u for u in user_ids if shard_for_user(u, 3) == 1]
+        assert planned == len(owned) > 0
+        worker.manager.clear_all_accumulated_jobs.assert_called_once()
+        worker.manager.schedule_all_users_immediately.assert_called_once_with(user_ids=owned)
+
+    def test_unknown_command_reports_failure(self):
+        events = queue.Queue()
+        worker = ShardWorker(0, 2, events, queue.Queue())
+
+        worker.handle(7, "drop_tables", (), {})
+
+        assert events.get_nowait() == ("result", 0, 7, False, "Unknown shard command: drop_tables")
+
+
+@pytest.mark.unit
+@pytest.mark.scheduler
+class TestShardedSchedulerCoordinator:
+    def test_routes_by_user_and_forwards_sends_to_real_delivery(self):
+        delivery = MagicMock()
+        delivery.handle_message_sending.return_value = MagicMock(
+            status="sent", user_id="user-5", category="motivational", sent_text="hi"
+        )
+        coordinator = ShardedSchedulerCoordinator(
+            delivery, 3, mp_context=_ThreadContext, worker_target=_fake_shard_worker
+        )
+        assert coordinator.start_shards()
+        try:
+            result = coordinator._call(
+                coordinator.shard_for_user("user-5"),
+                "reset_and_reschedule_daily_messages",
+                "motivational",
+                "user-5",
+                timeout=5,
+            )
+            broadcast = coordinator._broadcast("cleanup_orphaned_task_reminders", timeout=5)
+            health = coordinator.get_health_status()
+        finally:
+            coordinator.stop_shards()
+
+        assert result == (shard_for_user("user-5", 3), "sent")
+        delivery.handle_message_sending.assert_called_once_with(
+            user_id="user-5",
+            category="motivational",
+            is_scheduled_trigger=False,
+            allow_deferral=True,
+            skip_ai_cache=False,
+        )
+        assert broadcast == [(i, "cleanup_orphaned_task_reminders") for i in range(3)]
+        assert health["shard_count"] == 3
+        assert health["jobs"] == 9 and health["deliveries"] == 1
+        assert [s["shard"] for s in health["shards"]] == [0, 1, 2]
@@ -24,7 +24,7 @@ class TestScheduleUserJobs:
         with (
             patch("scheduler.manager.get_user_data") as mock_get_data,
             patch("scheduler.manager.get_schedule_time_periods") as mock_periods,
-            patch.object(scheduler_manager, "schedule_daily_message_job") as mock_daily,
+            patch.object(scheduler_manager, "schedule_user_daily_plan") as mock_plan,
             patch.object(
                 scheduler_manager, "schedule_all_task_reminders"
             ) as mock_reminders,
@@ -38,18 +38,17 @@ class TestScheduleUserJobs:
             scheduled = scheduler_manager._schedule_user_jobs("user-1")
 
             assert scheduled == 3
-            assert mock_daily.call_args_list == [
-                (("user-1", "motivational"),),
-                (("user-1", "health"),),
-                (("user-1", "checkin"),),
-            ]
+            # One plan covers every category so sends are spaced across categories
+            mock_plan.assert_called_once_with(
+                "user-1", ["motivational", "health", "checkin"]
+            )
             mock_reminders.assert_called_once_with("user-1")
 
     def test_warns_when_categories_is_not_a_list(self, scheduler_manager):
         with (
             patch("scheduler.manager.get_user_data") as mock_get_data,
             patch("scheduler.manager.get_schedule_time_periods") as mock_periods,
-            patch.object(scheduler_manager, "schedule_daily_message_job") as mock_daily,
+            patch.object(scheduler_manager, "schedule_user_daily_plan") as mock_plan,
             patch.object(scheduler_manager, "schedule_all_task_reminders"),
             patch("scheduler.manager.logger") as mock_logger,
         ):
@@ -62,7 +61,7 @@ class TestScheduleUserJobs:
             scheduled = scheduler_manager._schedule_user_jobs("user-1")
 
             assert scheduled == 0
-            mock_daily.assert_not_called()
+            mock_plan.assert_not_called()
             mock_logger.warning.assert_called()
             assert "Expected list for categories" in mock_logger.warning.call_args[0][0]
 
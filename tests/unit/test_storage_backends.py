@@ -0,0 +1,201 @@
+"""Tests for the JSON and SQLite storage backends and migration between them."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from storage.backends import record_document_write, reset_storage_backend
+from storage.backends.json_backend import JsonStorageBackend
+from storage.backends.migrate import export_json_to_sqlite, export_sqlite_to_json
+from storage.backends.sqlite_backend import SqliteStorageBackend
+
+pytestmark = [pytest.mark.unit, pytest.mark.storage, pytest.mark.file_io]
+
+
+def _ts(day: int) -> float:
+    return datetime(2026, 3, day, 9, 0, 0).timestamp()
+
+
+def _checkin(day: int, mood: int) -> dict:
+    return {"submitted_at": f"2026-03-{day:02d} 09:00:00", "mood": mood}
+
+
+def _account(user_id: str, username: str) -> dict:
+    return {
+        "schema_version": 2,
+        "user_id": user_id,
+        "internal_username": username,
+        "email": f"{username}@example.com",
+        "discord_user_id": "",
+        "phone": "",
+    }
+
+
+@pytest.fixture
+def sqlite_backend(tmp_path):
+    backend = SqliteStorageBackend(str(tmp_path / "store.sqlite3"))
+    yield backend
+    backend.close()
+
+
+def test_sqlite_round_trips_documents_and_log_envelopes(sqlite_backend):
+    checkins = {
+        "schema_version": 2,
+        "updated_at": "2026-03-05 10:00:00",
+        "checkins": [_checkin(day, day) for day in (3, 1, 2)],
+    }
+    assert sqlite_backend.save_document("u1", "checkins.json", checkins)
+    assert sqlite_backend.save_document("u1", "account.json", _account("u1", "alice"))
+
+    assert sqlite_backend.load_document("u1", "checkins.json") == checkins
+    assert sqlite_backend.list_document_keys("u1") == ["account.json", "checkins.json"]
+    assert sqlite_backend.list_user_ids() == ["u1"]
+    assert sqlite_backend.load_document("u1", "missing.json") is None
+
+    journal_mode = sqlite3.connect(sqlite_backend.db_path).execute("PRAGMA journal_mode").fetchone()
+    assert journal_mode == ("wal",)
+    assert not sqlite_backend.save_document("u1", "../escape.json", {})
+
+
+def test_query_log_ranges_match_between_backends(tmp_path, sqlite_backend):
+    json_backend = JsonStorageBackend(str(tmp_path / "users"))
+    rows = [_checkin(day, day) for day in (4, 1, 3, 2, 5)]
+    for backend in (json_backend, sqlite_backend):
+        assert backend.append_log_rows("u1", "checkins", rows[:3])
+        assert backend.append_log_rows("u1", "checkins", rows[3:])
+        assert backend.append_log_rows("u2", "checkins", [_checkin(2, 9)])
+
+    for kwargs in (
+        {},
+        {"since": _ts(2), "until": _ts(5)},
+        {"limit": 2},
+        {"since": _ts(3), "newest_first": False},
+    ):
+        expected = json_backend.query_log("u1", "checkins", **kwargs)
+        assert sqlite_backend.query_log("u1", "checkins", **kwargs) == expected
+    assert [r["mood"] for r in sqlite_backend.query_log("u1", "checkins", limit=2)] == [5, 4]
+    # Appended rows keep write order in the reassembled document
+    document = sqlite_backend.load_document("u1", "checkins.json")
+    assert [r["mood"] for r in document["checkins"]] == [4, 1, 3, 2, 5]
+
+
+def test_identifier_lookup_follows_account_saves(sqlite_backend):
+    sqlite_backend.save_document("u1", "account.json", _account("u1", "alice"))
+    assert sqlite_backend.find_user_id("internal_username", "alice") == "u1"
+    assert sqlite_backend.find_user_id("email", "alice@example.com") == "u1"
+
+    sqlite_backend.save_document("u1", "account.json", _account("u1", "alicia"))
+    assert sqlite_backend.find_user_id("internal_username", "alice") is None
+    assert sqlite_backend.find_user_id("internal_username", "alicia") == "u1"
+
+    sqlite_backend.delete_document("u1", "account.json")
+    assert sqlite_backend.find_user_id("internal_username", "alicia") is None
+
+
+def test_delete_user_drops_documents_logs_and_identifiers(tmp_path, sqlite_backend):
+    json_backend = JsonStorageBackend(str(tmp_path / "users"))
+    for backend in (json_backend, sqlite_backend):
+        backend.save_document("u1", "account.json", _account("u1", "dora"))
+        backend.append_log_rows("u1", "checkins", [_checkin(1, 3)])
+        backend.save_document("u2", "account.json", _account("u2", "eve"))
+
+        assert backend.delete_user("u1")
+        assert not backend.delete_user("u1")
+        assert backend.list_user_ids() == ["u2"]
+        assert backend.query_log("u1", "checkins") == []
+    assert sqlite_backend.find_user_id("email", "dora@example.com") is None
+    assert sqlite_backend.find_user_id("email", "eve@example.com") == "u2"
+
+
+def test_migration_round_trip(tmp_path):
+    source = tmp_path / "source" / "users"
+    (source / "u1" / "messages").mkdir(parents=True)
+    documents = {
+        "account.json": _account("u1", "bob"),
+        "preferences.json": {"schema_version": 2, "categories": ["motivational"]},
+        "messages/sent_messages.json": {
+            "schema_version": 2,
+            "deliveries": [{"sent_at": "2026-03-01 08:00:00", "message": "hi"}],
+        },
+    }
+    for key, data in documents.items():
+        (source / "u1" / key).write_text(json.dumps(data), encoding="utf-8")
+
+    db_path = str(tmp_path / "store.sqlite3")
+    assert export_json_to_sqlite(str(source), db_path) == {"users": 1, "documents": 3}
+    target = tmp_path / "target" / "users"
+    assert export_sqlite_to_json(db_path, str(target)) == {"users": 1, "documents": 3}
+
+    for key, data in documents.items():
+        assert json.loads((target / "u1" / key).read_text(encoding="utf-8")) == data
+
+
+def test_json_saves_write_through_only_in_sqlite_mode(tmp_path, monkeypatch):
+    users_dir = tmp_path / "users"
+    monkeypatch.setattr("core.config.USER_INFO_DIR_PATH", str(users_dir))
+    monkeypatch.setattr("core.config.STORAGE_SQLITE_PATH", str(tmp_path / "store.sqlite3"))
+    path = str(users_dir / "u1" / "account.json")
+
+    monkeypatch.setattr("core.config.STORAGE_BACKEND", "json")
+    reset_storage_backend()
+    assert not record_document_write(path, _account("u1", "carol"))
+
+    monkeypatch.setattr("core.config.STORAGE_BACKEND", "sqlite")
+    reset_storage_backend()
+    try:
+        assert record_document_write(path, _account("u1", "carol"))
+        assert not record_document_write(str(tmp_path / "elsewhere.json"), {})
+
+        from core import get_user_id_by_identifier
+
+        # The files are the working copy: no user directory, no match
+        assert get_user_id_by_identifier("carol@example.com") is None
+        (users_dir / "u1").mkdir(parents=True)
+        assert get_user_id_by_identifier("carol@example.com") == "u1"
+    finally:
+        reset_storage_backend()
+
+
+def test_user_deletion_and_restore_keep_sqlite_mirror_in_step(tmp_path, monkeypatch):
+    from storage.backends import (
+        get_storage_backend,
+        record_user_deleted,
+        resync_backend_from_files,
+    )
+
+    users_dir = tmp_path / "users"
+    monkeypatch.setattr("core.config.USER_INFO_DIR_PATH", str(users_dir))
+    monkeypatch.setattr("core.config.STORAGE_SQLITE_PATH", str(tmp_path / "store.sqlite3"))
+    monkeypatch.setattr("core.config.STORAGE_BACKEND", "sqlite")
+    reset_storage_backend()
+    try:
+        for user_id, username in (("u1", "frank"), ("u2", "grace")):
+            account_path = users_dir / user_id / "account.json"
+            account_path.parent.mkdir(parents=True)
+            account_path.write_text(json.dumps(_account(user_id, username)), encoding="utf-8")
+            record_document_write(str(account_path), _account(user_id, username))
+        backend = get_storage_backend()
+
+        (users_dir / "u1" / "account.json").unlink()
+        (users_dir / "u1").rmdir()
+        assert record_user_deleted("u1")
+        assert backend.find_user_id("email", "frank@example.com") is None
+        assert backend.list_user_ids() == ["u2"]
+
+        # A restore puts back files written behind the backend's back
+        (users_dir / "u3").mkdir()
+        (users_dir / "u3" / "account.json").write_text(
+            json.dumps(_account("u3", "heidi")), encoding="utf-8"
+        )
+        (users_dir / "u2" / "account.json").unlink()
+        (users_dir / "u2").rmdir()
+        assert resync_backend_from_files() == 1
+        assert backend.list_user_ids() == ["u3"]
+        assert backend.find_user_id("email", "grace@example.com") is None
+        assert backend.find_user_id("email", "heidi@example.com") == "u3"
+    finally:
+        reset_storage_backend()
@@ -7,6 +7,34 @@ from concurrent.futures import ThreadPoolExecutor
 import pytest
 
 from tests.test_helpers.test_utilities import TestUserFactory
+from tests.test_helpers.test_utilities.test_user_snapshots import (
+    SNAPSHOT_ENV_FLAG,
+    TestUserSnapshots,
+)
+
+
+def _user_files(test_data_dir: str, username: str) -> tuple[dict, list[str]]:
+    """Return a user's JSON files (UUID and timestamps masked) and index keys."""
+    with open(os.path.join(test_data_dir, "user_index.json"), encoding="utf-8") as f:
+        user_index = json.load(f)
+    actual_user_id = user_index[username]
+    user_dir = os.path.join(test_data_dir, "users", actual_user_id)
+    files = {}
+    for root, _dirs, names in os.walk(user_dir):
+        for name in names:
+            if name.endswith(".lock"):
+                continue
+            path = os.path.join(root, name)
+            with open(path, encoding="utf-8") as f:
+                payload = json.load(f)
+            if isinstance(payload, dict):
+                for key in ("created_at", "updated_at", "last_updated"):
+                    payload.pop(key, None)
+            files[os.path.relpath(path, user_dir)] = json.dumps(payload).replace(
+                actual_user_id, "<uuid>"
+            )
+    keys = sorted(key for key, value in user_index.items() if value == actual_user_id)
+    return files, keys
 
 
 @pytest.mark.unit
@@ -83,3 +111,80 @@ def test_user_index_updates_preserve_concurrent_entries(test_path_factory):
         assert user_index[f"concurrent_user_{index}"] == f"actual-user-{index}"
         assert user_index[f"discord:discord-{index}"] == f"actual-user-{index}"
         assert user_index[f"email:user-{index}@example.com"] == f"actual-user-{index}"
+
+
+@pytest.mark.unit
+@pytest.mark.user
+@pytest.mark.file_io
+@pytest.mark.parametrize(
+    ("creator", "kwargs"),
+    [
+        ("create_basic_user", {"enable_tasks": False}),
+        ("create_discord_user", {"discord_user_id": "123456789012345678"}),
+        ("create_discord_user", {"discord_user_id": "4242"}),
+        ("create_discord_user", {}),
+        ("create_email_user", {"email": "someone@example.org"}),
+        ("create_user_with_schedules", {}),
+    ],
+)
+def test_snapshot_users_match_users_built_through_the_factory(
+    test_path_factory, monkeypatch, creator, kwargs
+):
+    """Materialized users must be indistinguishable from fully built ones."""
+    snapshot_dir = os.path.join(test_path_factory, "snapshot")
+    built_dir = os.path.join(test_path_factory, "built")
+
+    create = getattr(TestUserFactory, creator)
+
+    monkeypatch.setenv(SNAPSHOT_ENV_FLAG, "1")
+    assert create("snap_user", test_data_dir=snapshot_dir, **kwargs)
+    assert create("snap_user_2", test_data_dir=snapshot_dir)
+    monkeypatch.setenv(SNAPSHOT_ENV_FLAG, "0")
+    assert create("snap_user", test_data_dir=built_dir, **kwargs)
+
+    assert _user_files(snapshot_dir, "snap_user") == _user_files(built_dir, "snap_user")
+    lookup = TestUserFactory.get_test_user_id_by_internal_username
+    assert lookup("snap_user_2", snapshot_dir) != lookup("snap_user", snapshot_dir)
+
+
+@pytest.mark.unit
+@pytest.mark.user
+@pytest.mark.file_io
+def test_snapshot_archetypes_are_built_once_and_isolated(
+    test_path_factory, monkeypatch
+):
+    """The golden user is built once; later users are independent copies."""
+    monkeypatch.setenv(SNAPSHOT_ENV_FLAG, "1")
+    calls = []
+
+    def build(username, test_data_dir):
+        calls.append(username)
+        return TestUserFactory.create_minimal_user__with_test_dir(
+            username, test_data_dir
+        )
+
+    archetype = "unit-test-minimal"
+    monkeypatch.delitem(TestUserSnapshots._snapshots, archetype, raising=False)
+    try:
+        first = TestUserSnapshots.materialize(
+            archetype, "iso_a", test_path_factory, build
+        )
+        second = TestUserSnapshots.materialize(
+            archetype, "iso_b", test_path_factory, build
+        )
+    finally:
+        TestUserSnapshots._snapshots.pop(archetype, None)
+    assert calls == [TestUserSnapshots.USERNAME_TOKEN]
+    assert first and second and first != second
+
+    first_account = os.path.join(test_path_factory, "users", first, "account.json")
+    with open(first_account, encoding="utf-8") as f:
+        account = json.load(f)
+    assert account["user_id"] == first and account["internal_username"] == "iso_a"
+    account["email"] = "changed@example.com"
+    with open(first_account, "w", encoding="utf-8") as f:
+        json.dump(account, f)
+
+    second_files, second_keys = _user_files(test_path_factory, "iso_b")
+    assert "changed@example.com" not in second_files["account.json"]
+    assert second_keys == ["email:iso_b@example.com", "iso_b"]
@@ -0,0 +1,196 @@
+"""
+Tests for core/tracing.py (hot-path spans and latency histograms)
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from core import tracing
+from core.tracing import (
+    TOTAL_STAGE,
+    HotPathTracer,
+    format_trace_summary_lines,
+    set_trace_attribute,
+    trace_span,
+    traced,
+)
+
+
+def _tracer(**kwargs) -> HotPathTracer:
+    """Enabled tracer that never exports on its own."""
+    kwargs.setdefault("enabled", True)
+    kwargs.setdefault("export_file", "")
+    return HotPathTracer(**kwargs)
+
+
+def _record(tracer: HotPathTracer, intent: str, total_seconds: float, **stages):
+    """Feed one finished trace with fixed timings."""
+    trace = tracing._Trace("synthetic", {"intent": intent})
+    trace.stage_totals.update(stages)
+    tracer.record_trace(trace, total_seconds)
+
+
+@pytest.mark.unit
+@pytest.mark.core
+class TestHotPathTracing:
+    """Test span collection, sampling and snapshots."""
+
+    def test_disabled_tracer_hands_out_shared_noop(self):
+        """Disabled tracing and spans outside a trace record nothing."""
+        tracer = _tracer(enabled=False)
+
+        @traced("parse")
+        def parse():
+            return "parsed"
+
+        with tracer.start_trace("message") as scope:
+            with trace_span("parse"):
+                assert parse() == "parsed"
+            set_trace_attribute("intent", "chat")
+
+        assert scope is None
+        assert tracer.start_trace("message") is trace_span("parse")
+        snapshot = tracer.snapshot()
+        assert snapshot["traces"] == {"started": 0, "sampled": 0}
+        assert snapshot["stages"] == {}
+        assert snapshot["recent_traces"] == []
+
+    def test_spans_attach_to_active_trace_and_nested_stage_counts_once(self):
+        """Spans, the decorator and intent land on one trace; same-stage nesting is not double-counted."""
+        tracer = _tracer()
+        calls = []
+
+        @traced("storage_read")
+        def read():
+            calls.append("read")
+            with trace_span("storage_read"):
+                return {}
+
+        with tracer.start_trace("discord_message", channel="discord"):
+            with tracer.start_trace("handle_user_message"):
+                with trace_span("parse"):
+                    read()
+                read()
+                set_trace_attribute("intent", "list_tasks")
+
+        snapshot = tracer.snapshot()
+        assert snapshot["traces"] == {"started": 1, "sampled": 1}
+        (trace,) = snapshot["recent_traces"]
+        assert trace["name"] == "discord_message"
+        assert trace["intent"] == "list_tasks"
+        assert trace["attributes"] == {"channel": "discord"}
+        assert [span["stage"] for span in trace["spans"]] == [
+            "storage_read",
+            "parse",
+            "storage_read",
+        ]
+        assert set(trace["stages_ms"]) == {"parse", "storage_read"}
+        assert calls == ["read", "read"]
+        assert snapshot["stages"]["storage_read"]["count"] == 1
+        assert snapshot["stages"][TOTAL_STAGE]["count"] == 1
+        assert set(snapshot["intents"]["list_tasks"]) == {
+            "parse",
+            "storage_read",
+            TOTAL_STAGE,
+        }
+
+    def test_exception_is_propagated_and_trace_recorded(self):
+        """A failing handler still produces a trace tagged with the error type."""
+        tracer = _tracer()
+
+        with pytest.raises(ValueError):
+            with tracer.start_trace("message"):
+                with trace_span("parse"):
+                    raise ValueError("boom")
+
+        (trace,) = tracer.snapshot()["recent_traces"]
+        assert trace["attributes"] == {"error": "ValueError"}
+        assert trace["intent"] == tracing.UNKNOWN_INTENT
+        assert "parse" in trace["stages_ms"]
+
+    def test_sample_rate_zero_counts_but_does_not_trace(self):
+        """Unsampled messages are counted and otherwise free."""
+        tracer = _tracer(sample_rate=0.0)
+
+        for _ in range(5):
+            with tracer.start_trace("message"):
+                assert trace_span("parse") is tracing._NOOP_SCOPE
+
+        snapshot = tracer.snapshot()
+        assert snapshot["traces"] == {"started": 5, "sampled": 0}
+        assert snapshot["stages"] == {}
+
+    def test_ring_buffer_keeps_most_recent_traces(self):
+        """Only the newest traces are kept while histograms count them all."""
+        tracer = _tracer(buffer_size=3)
+
+        for index in range(10):
+            _record(tracer, f"intent_{index}", 0.01)
+
+        snapshot = tracer.snapshot()
+        assert [t["intent"] for t in snapshot["recent_traces"]] == [
+            "intent_7",
+            "intent_8",
+            "intent_9",
+        ]
+        assert snapshot["stages"][TOTAL_STAGE]["count"] == 10
+
+    def test_percentiles_and_buckets_are_attributed_per_intent(self):
+        """Per-intent histograms separate slow chat from fast commands."""
+        tracer = _tracer()
+        for index in range(1, 101):
+            _record(tracer, "chat", 2.0, llm_wait=index / 100)
+        for _ in range(20):
+            _record(tracer, "list_tasks", 0.004, parse=0.001)
+
+        snapshot = tracer.snapshot(include_recent=False)
+        llm = snapshot["intents"]["chat"]["llm_wait"]
+        assert llm["count"] == 100
+        assert llm["p50_ms"] == pytest.approx(510.0, abs=10.0)
+        assert llm["p95_ms"] == pytest.approx(950.0, abs=10.0)
+        assert llm["p99_ms"] == pytest.approx(990.0, abs=10.0)
+        assert llm["buckets"]["<=1000ms"] == 50
+        assert "llm_wait" not in snapshot["intents"]["list_tasks"]
+        assert snapshot["intents"]["list_tasks"][TOTAL_STAGE]["p95_ms"] == pytest.approx(4.0)
+        assert "recent_traces" not in snapshot
+
+        lines = format_trace_summary_lines(snapshot)
+        assert lines[0].startswith("Traced messages:")
+        assert lines[1].startswith("  total: n=120")
+        slowest = lines.index("Slowest intents (total p95):")
+        assert lines[slowest + 1].startswith("  chat:")
+
+    def test_export_writes_json_snapshot(self, tmp_path):
+        """Export produces a JSON file the admin UI can read."""
+        target = tmp_path / "traces.json"
+        tracer = _tracer(export_file=str(target), export_interval_seconds=0)
+
+        with tracer.start_trace("email_message", channel="email"):
+            with trace_span("delivery"):
+                pass
+
+        exported = json.loads(target.read_text(encoding="utf-8"))
+        assert exported["stages"]["delivery"]["count"] == 1
+        assert exported["recent_traces"][0]["attributes"] == {"channel": "email"}
+
+    def test_concurrent_tasks_keep_separate_traces(self):
+        """Context propagation keeps interleaved async messages apart."""
+        tracer = _tracer()
+
+        async def handle(intent: str):
+            with tracer.start_trace("discord_message"):
+                set_trace_attribute("intent", intent)
+                with trace_span("delivery"):
+                    await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(handle("a"), handle("b"))
+
+        asyncio.run(main())
+
+        snapshot = tracer.snapshot()
+        assert sorted(t["intent"] for t in snapshot["recent_traces"]) == ["a", "b"]
+        assert snapshot["intents"]["a"]["delivery"]["count"] == 1
+        assert snapshot["intents"]["b"]["delivery"]["count"] == 1
@@ -0,0 +1,167 @@
+"""Tests for the write-ahead journal behind multi-document user data updates."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from storage.user_data_journal import (
+    TransactionAborted,
+    discard_user_journal,
+    journal_path_for_user,
+    recover_pending_transactions,
+    user_data_transaction,
+)
+from tests.test_helpers.test_utilities.test_user_factory import TestUserFactory
+
+pytestmark = [pytest.mark.unit, pytest.mark.storage, pytest.mark.user_management, pytest.mark.file_io]
+
+
+@pytest.fixture
+def journal_root(tmp_path, monkeypatch):
+    monkeypatch.setattr("core.config.BASE_DATA_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _write(path, data) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _read(path):
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_commit_journals_only_touched_files(journal_root):
+    account = journal_root / "users" / "u1" / "account.json"
+    untouched = journal_root / "users" / "u1" / "messages" / "sent_messages.json"
+    _write(account, {"v": 1})
+    _write(untouched, {"big": "x" * 4096})
+
+    with user_data_transaction("u1", [str(account)]):
+        with open(journal_path_for_user("u1"), encoding="utf-8") as handle:
+            journal = json.load(handle)
+        assert journal["state"] == "pending"
+        assert [entry["path"] for entry in journal["files"]] == [str(account)]
+        _write(account, {"v": 2})
+
+    assert _read(account) == {"v": 2}
+    assert not os.path.exists(journal_path_for_user("u1"))
+    # No per-user lock file is left behind either
+    assert not list((journal_root / "transactions").iterdir())
+
+
+def test_failure_restores_pre_images(journal_root):
+    existing = journal_root / "users" / "u1" / "account.json"
+    created = journal_root / "users" / "u1" / "tags.json"
+    _write(existing, {"v": 1})
+
+    with pytest.raises(TransactionAborted):
+        with user_data_transaction("u1", [str(existing), str(created)]):
+            _write(existing, {"v": 2})
+            _write(created, {"tags": []})
+            raise TransactionAborted()
+
+    assert _read(existing) == {"v": 1}
+    assert not created.exists()
+    assert not os.path.exists(journal_path_for_user("u1"))
+
+
+def test_startup_recovery_rolls_back_or_forward(journal_root):
+    pending_doc = journal_root / "users" / "u1" / "account.json"
+    committed_doc = journal_root / "users" / "u2" / "account.json"
+    _write(pending_doc, {"v": "half-written"})
+    _write(committed_doc, {"v": "new"})
+
+    journal_dir = journal_root / "transactions"
+    journal_dir.mkdir()
+    original = json.dumps({"v": "original"}).encode("utf-8")
+    (journal_dir / "u1.journal").write_text(
+        json.dumps(
+            {
+                "user_id": "u1",
+                "state": "pending",
+                "files": [
+                    {
+                        "path": str(pending_doc),
+                        "existed": True,
+                        "data": base64.b64encode(original).decode("ascii"),
+                    }
+                ],
+            }
+        ),
+        encoding="utf-8",
+    )
+    (journal_dir / "u2.journal").write_text(
+        json.dumps({"user_id": "u2", "state": "committed", "files": []}), encoding="utf-8"
+    )
+    (journal_dir / "u3.journal.tmp").write_text("{torn", encoding="utf-8")
+
+    assert recover_pending_transactions() == {"u1": "rolled_back", "u2": "rolled_forward"}
+    assert _read(pending_doc) == {"v": "original"}
+    assert _read(committed_doc) == {"v": "new"}
+    assert not list(journal_dir.iterdir())
+
+
+def test_discard_user_journal_drops_leftovers(journal_root):
+    account = journal_root / "users" / "u1" / "account.json"
+    journal_dir = journal_root / "transactions"
+    journal_dir.mkdir()
+    (journal_dir / "u1.journal").write_text(
+        json.dumps(
+            {
+                "user_id": "u1",
+                "state": "pending",
+                "files": [{"path": str(account), "existed": False}],
+            }
+        ),
+        encoding="utf-8",
+    )
+    (journal_dir / "u1.journal.lock").touch()
+
+    assert discard_user_journal("u1")
+    assert not list(journal_dir.iterdir())
+    assert recover_pending_transactions() == {}
+
+
+def test_save_user_data_transaction_is_all_or_nothing(test_data_dir):
+    from core import get_user_id_by_identifier
+    from core.config import get_user_file_path
+    from core.file_operations import save_json_data
+    from storage.user_data_write import save_user_data_transaction
+
+    assert TestUserFactory.create_basic_user("journal-user", test_data_dir=test_data_dir)
+    user_id = get_user_id_by_identifier("journal-user")
+    account_path = get_user_file_path(user_id, "account")
+    preferences_path = get_user_file_path(user_id, "preferences")
+    with open(account_path, encoding="utf-8") as handle:
+        account_before = handle.read()
+
+    def failing_preferences(data, file_path):
+        if os.path.abspath(file_path) == os.path.abspath(preferences_path):
+            return False
+        return save_json_data(data, file_path)
+
+    with patch("core.file_operations.save_json_data", side_effect=failing_preferences), patch(
+        "storage.user_data_operations.UserDataManager.backup_user_data"
+    ) as zip_backup:
+        ok = save_user_data_transaction(
+            user_id,
+            {
+                "account": {"email": "changed@example.com"},
+                "preferences": {"categories": ["motivational"]},
+            },
+        )
+
+    assert ok is False
+    zip_backup.assert_not_called()
+    with open(account_path, encoding="utf-8") as handle:
+        assert handle.read() == account_before
+
+    assert save_user_data_transaction(user_id, {"account": {"email": "changed@example.com"}})
+    with open(account_path, encoding="utf-8") as handle:
+        assert json.load(handle)["email"] == "changed@example.com"
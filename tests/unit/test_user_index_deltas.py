@@ -0,0 +1,135 @@
+"""Tests for debounced, batched user_index.json maintenance."""
+
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+import core.file_locking as file_locking
+from storage.user_index_deltas import (
+    delta_log_path_for,
+    flush_user_index,
+    pending_index_lookup,
+    record_index_entries,
+)
+from tests.test_helpers.test_utilities.test_user_factory import TestUserFactory
+
+pytestmark = [pytest.mark.unit, pytest.mark.storage, pytest.mark.user_management, pytest.mark.file_io]
+
+
+def _entries(user_id: str, username: str, email: str = "") -> dict[str, str]:
+    entries = {username: user_id}
+    if email:
+        entries[f"email:{email}"] = user_id
+    return entries
+
+
+@pytest.fixture
+def index_path(tmp_path, monkeypatch):
+    monkeypatch.setattr("core.config.USER_INDEX_FLUSH_DELAY_SECONDS", 3600)
+    path = str(tmp_path / "user_index.json")
+    yield path
+    flush_user_index(path)
+
+
+def _read_index(path: str) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def test_changes_are_logged_then_applied_in_one_batch(index_path):
+    assert record_index_entries("u1", "alice", _entries("u1", "alice", "a@x.org"), index_path)
+    assert record_index_entries("u2", "bob", _entries("u2", "bob"), index_path)
+    assert record_index_entries("u1", "alicia", _entries("u1", "alicia", "a@x.org"), index_path)
+
+    assert not os.path.exists(index_path)
+    with open(delta_log_path_for(index_path), encoding="utf-8") as handle:
+        assert len(handle.readlines()) == 3
+    assert pending_index_lookup("alicia", index_path) == "u1"
+
+    with patch.object(
+        file_locking, "safe_json_write", wraps=file_locking.safe_json_write
+    ) as write:
+        assert flush_user_index(index_path)
+        assert write.call_count == 1
+
+    index = _read_index(index_path)
+    assert {k: v for k, v in index.items() if k != "last_updated"} == {
+        "alicia": "u1",
+        "email:a@x.org": "u1",
+        "bob": "u2",
+    }
+    assert os.path.getsize(delta_log_path_for(index_path)) == 0
+    assert pending_index_lookup("alicia", index_path) is None
+
+
+def test_unchanged_entries_do_not_touch_the_index(index_path):
+    record_index_entries("u1", "alice", _entries("u1", "alice"), index_path)
+    flush_user_index(index_path)
+
+    with patch("core.file_locking.safe_json_write") as write:
+        for _ in range(5):
+            assert record_index_entries("u1", "alice", _entries("u1", "alice"), index_path)
+        flush_user_index(index_path)
+    write.assert_not_called()
+    assert os.path.getsize(delta_log_path_for(index_path)) == 0
+
+
+def test_username_owned_by_another_user_is_kept(index_path):
+    with open(index_path, "w", encoding="utf-8") as handle:
+        json.dump({"alice": "u1", "last_updated": None}, handle)
+    record_index_entries("u2", "alice", _entries("u2", "alice", "b@x.org"), index_path)
+    flush_user_index(index_path)
+
+    index = _read_index(index_path)
+    assert index["alice"] == "u1"
+    assert index["email:b@x.org"] == "u2"
+
+
+def test_leftover_deltas_are_applied_before_seeding(index_path):
+    # Written by a process that exited before its flush
+    with open(delta_log_path_for(index_path), "w", encoding="utf-8") as handle:
+        handle.write(json.dumps({"user_id": "u9", "username": "zed", "set": {"zed": "u9"}}) + "\n")
+        handle.write("{torn")
+
+    assert record_index_entries("u1", "alice", _entries("u1", "alice"), index_path)
+    assert _read_index(index_path)["zed"] == "u9"
+
+
+def test_save_and_rebuild_keep_index_current(test_data_dir, tmp_path):
+    from core import get_user_id_by_identifier
+    from core.config import BASE_DATA_DIR
+    from storage.user_data_backup import delete_user_completely
+    from storage.user_data_index import rebuild_full_index, update_user_index
+    from storage.user_data_write import save_user_data
+
+    username = f"index-delta-user-{uuid.uuid4().hex[:8]}"
+    email = f"{username}@example.com"
+    assert TestUserFactory.create_basic_user(username, test_data_dir=test_data_dir)
+    user_id = get_user_id_by_identifier(username)
+    index_file = os.path.join(BASE_DATA_DIR, "user_index.json")
+    try:
+        with patch("storage.user_data_index.get_user_data") as reread:
+            save_user_data(user_id, {"account": {"email": email}})
+            save_user_data(user_id, {"preferences": {"categories": ["motivational"]}})
+            assert update_user_index(
+                user_id,
+                account={"internal_username": username, "email": email},
+            )
+        reread.assert_not_called()
+        assert _read_index(index_file)[f"email:{email}"] == user_id
+
+        # Rebuild into a private index from this user only; other tests share the data dir
+        rebuilt_file = str(tmp_path / "user_index.json")
+        with patch("storage.user_data_index.get_all_user_ids", return_value=[user_id]):
+            assert rebuild_full_index(rebuilt_file)
+        rebuilt = _read_index(rebuilt_file)
+        assert rebuilt[username] == user_id
+        assert rebuilt[f"email:{email}"] == user_id
+    finally:
+        flush_user_index(index_file)
+        delete_user_completely(user_id, create_backup=False)
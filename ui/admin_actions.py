@@ -443,6 +443,9 @@ Current cache files found:
             status = "[OK]" if exists else "[FAIL]"
             lines.append(f"{status} Directory {dir_path}: {'Exists' if exists else 'Missing'}")
 
+        lines.append("")
+        lines.extend(self._hot_path_latency_lines())
+
         lines.append("")
         lines.append("Checking for common issues...")
         if os.path.exists(user_info_dir_path):
@@ -494,6 +497,26 @@ Current cache files found:
         return lines
 
 
+    @handle_errors(
+        "reading hot-path latency for admin report",
+        user_friendly=False,
+        default_return=["[INFO] Hot-Path Latency: Unable to read trace export"],
+    )
+    def _hot_path_latency_lines(self) -> list[str]:
+        """Return per-stage latency lines from the service's trace export."""
+        export_file = _load_attr("core.config", "HOT_PATH_TRACE_EXPORT_FILE")
+        if not os.path.exists(export_file):
+            return [
+                "[INFO] Hot-Path Latency: No trace export "
+                "(enable with HOT_PATH_TRACING_ENABLED=true)"
+            ]
+        snapshot = _load_attr("core.file_operations", "load_json_data")(export_file)
+        format_lines = _load_attr("core.tracing", "format_trace_summary_lines")
+        return ["[OK] Hot-Path Latency:"] + [
+            f"  {line}" for line in format_lines(snapshot or {})
+        ]
+
+
 CONFIGURATION_HELP_TEXT = """
 CONFIGURATION HELP
 